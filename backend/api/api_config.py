@@ -1,15 +1,39 @@
 from ninja import NinjaAPI
 from ninja.errors import ValidationError
-from django.http import Http404
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
 
+from api.renderers import FastRenderer
 from api.schemas.common import ErrorResponse
 
+
+class SelfOrderAPI(NinjaAPI):
+    """
+    レスポンスのContent-TypeをリクエストのAcceptヘッダーに応じて決定するNinjaAPI
+    """
+    
+    def create_response(self, request: HttpRequest, data, *, status: int = None, temporal_response: HttpResponse = None) -> HttpResponse:
+        """レンダラーの形式に合わせたContent-Typeでレスポンスを作成"""
+        if temporal_response is None:
+            temporal_response = self.create_temporal_response(request)
+            temporal_response.status_code = status
+        return super().create_response(request, data, temporal_response=temporal_response)
+    
+    def create_temporal_response(self, request: HttpRequest) -> HttpResponse:
+        """レンダラーの形式に合わせたContent-Typeの仮のレスポンスを作成"""
+        response = HttpResponse("", content_type=self.renderer.get_content_type(request))
+        if self.renderer.msgpack_enabled:
+            patch_vary_headers(response, ['Accept'])
+        return response
+
+
 # NinjaAPIインスタンスの作成
-api = NinjaAPI(
+api = SelfOrderAPI(
     title="セルフオーダーシステムAPI",
     description="飲食店向けセルフオーダーシステムのAPI",
     version="1.0.0",
     docs_url="/docs",
+    renderer=FastRenderer(),
 )
 
 # エラーハンドラー
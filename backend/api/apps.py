@@ -1,6 +1,43 @@
+import os
+import sys
+from typing import List
 from django.apps import AppConfig
 
+# 管理コマンドとして実行される場合のスクリプト名
+MANAGEMENT_SCRIPTS = ('manage.py', 'django-admin', 'django-admin.py')
+
+
+def serves_requests(argv: List[str]) -> bool:
+    """
+    このプロセスがリクエストを処理するかどうかを起動時の引数から判定
+    
+    管理コマンド（migrate、test など）では False を返す。manage.py serve も gunicorn の
+    マスタープロセスのため False とし、fork後の各ワーカーで起動処理を行う（config.server.post_fork）。
+    
+    Args:
+        argv: 起動時の引数（sys.argv）
+        
+    Returns:
+        リクエストを処理するプロセスの場合はTrue
+    """
+    if not argv or os.path.basename(argv[0]) not in MANAGEMENT_SCRIPTS:
+        # gunicorn・uvicorn などからWSGI・ASGIアプリケーションとして読み込まれた場合
+        return True
+    if len(argv) > 1 and argv[1] == 'runserver':
+        # 自動リロードの監視プロセスでは起動せず、リクエストを処理する子プロセスでのみ起動する
+        return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in argv
+    return False
+
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'api'
\ No newline at end of file
+    name = 'api'
+
+    def ready(self):
+        # メニューキャッシュ無効化のシグナルを登録
+        from api import signals  # noqa: F401
+        
+        # ジャーナルモードでは、起動前に受け付けた未反映の注文を反映するワーカーを起動する
+        if serves_requests(sys.argv):
+            from api.services.order_ingestion_service import start_ingestion_worker_on_startup
+            start_ingestion_worker_on_startup()
\ No newline at end of file
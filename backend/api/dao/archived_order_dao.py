@@ -0,0 +1,192 @@
+from datetime import datetime
+from typing import Iterable, List, Optional
+from django.db.models import QuerySet
+from django.shortcuts import get_object_or_404
+
+from core.models import ArchivedOrder, ArchivedOrderItem, Order, OrderItem
+from api.dao.base_dao import BaseDAO, aget_object_or_404
+
+
+class ArchivedOrderDAO(BaseDAO[ArchivedOrder]):
+    """
+    アーカイブ済み注文モデルのデータアクセスオブジェクト
+    """
+    
+    model_class = ArchivedOrder
+    
+    # 注文テーブルから移動する列（注文明細は order_id を含む）
+    ORDER_FIELDS = ('id', 'table_number', 'status', 'total_price', 'created_at', 'updated_at')
+    ITEM_FIELDS = ('id', 'order_id', 'product_id', 'quantity', 'price', 'created_at')
+    # 需要分析で読み込む列（OrderItemDAO.ANALYTICS_FIELDS と同じ）
+    ANALYTICS_FIELDS = ('product_id', 'quantity', 'price', 'created_at', 'id')
+    
+    def get_orders_with_items(self) -> QuerySet[ArchivedOrder]:
+        """
+        注文明細を含むアーカイブ済み注文一覧を取得
+        
+        Returns:
+            注文明細と商品を取得済みのQuerySet
+        """
+        return ArchivedOrder.objects.prefetch_related('items__product')
+    
+    def get_order_with_items(self, order_id: int) -> ArchivedOrder:
+        """
+        注文明細を含むアーカイブ済み注文を取得
+        
+        Args:
+            order_id: 注文ID
+            
+        Returns:
+            注文明細を含むアーカイブ済み注文
+            
+        Raises:
+            Http404: アーカイブ済み注文が存在しない場合
+        """
+        return get_object_or_404(self.get_orders_with_items(), id=order_id)
+    
+    async def aget_order_with_items(self, order_id: int) -> ArchivedOrder:
+        """
+        注文明細を含むアーカイブ済み注文を取得（非同期版）
+        
+        Args:
+            order_id: 注文ID
+            
+        Returns:
+            注文明細を含むアーカイブ済み注文
+            
+        Raises:
+            Http404: アーカイブ済み注文が存在しない場合
+        """
+        return await aget_object_or_404(self.get_orders_with_items(), id=order_id)
+    
+    def filter_orders(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> QuerySet[ArchivedOrder]:
+        """
+        条件によるアーカイブ済み注文の絞り込み
+        
+        Args:
+            statuses: 注文ステータスのリスト
+            created_from: 作成日時の開始（この日時を含む）
+            created_to: 作成日時の終了（この日時を含まない）
+            
+        Returns:
+            条件に一致するアーカイブ済み注文QuerySet
+        """
+        query = ArchivedOrder.objects.all()
+        if statuses:
+            query = query.filter(status__in=list(statuses))
+        if created_from is not None:
+            query = query.filter(created_at__gte=created_from)
+        if created_to is not None:
+            query = query.filter(created_at__lt=created_to)
+        return query
+    
+    def get_items_by_orders(self, order_ids: Iterable[int]) -> QuerySet[ArchivedOrderItem]:
+        """
+        複数のアーカイブ済み注文の注文明細を取得
+        
+        Args:
+            order_ids: 注文IDのリスト
+            
+        Returns:
+            指定された注文の注文明細QuerySet（ID順）
+        """
+        return ArchivedOrderItem.objects.filter(order_id__in=list(order_ids)).order_by('id')
+    
+    def get_item_rows_after(
+        self,
+        after_id: int,
+        limit: int,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[tuple]:
+        """
+        キャンセルされていないアーカイブ済み注文の注文明細をID順に取得（需要分析用）
+        
+        Args:
+            after_id: このIDより後の注文明細を取得する
+            limit: 取得する最大件数
+            created_from: 作成日時の下限（この日時を含む）
+            created_to: 作成日時の上限（この日時を含まない）
+            
+        Returns:
+            ANALYTICS_FIELDS の順の値のタプルのリスト
+        """
+        query = ArchivedOrderItem.objects.filter(id__gt=after_id).exclude(order__status='cancelled')
+        if created_from is not None:
+            query = query.filter(created_at__gte=created_from)
+        if created_to is not None:
+            query = query.filter(created_at__lt=created_to)
+        return list(query.order_by('id').values_list(*self.ANALYTICS_FIELDS)[:limit])
+    
+    def get_archivable_query(self, statuses: Iterable[str], created_before: datetime) -> QuerySet[Order]:
+        """
+        アーカイブ対象の注文を取得するQuerySetを作成
+        
+        Args:
+            statuses: 対象の注文ステータス
+            created_before: この日時より前に作成された注文を対象とする
+            
+        Returns:
+            注文ID順のQuerySet
+        """
+        return Order.objects.filter(
+            status__in=list(statuses), created_at__lt=created_before
+        ).order_by('id')
+    
+    def get_archivable_ids(
+        self, statuses: Iterable[str], created_before: datetime, after_id: int, limit: int
+    ) -> List[int]:
+        """
+        アーカイブ対象の注文IDを取得（ロックは取得しない）
+        
+        Args:
+            statuses: 対象の注文ステータス
+            created_before: この日時より前に作成された注文を対象とする
+            after_id: この注文IDより後の注文を取得する（前回のチャンクの最後のID）
+            limit: 最大件数
+            
+        Returns:
+            注文IDのリスト（昇順）
+        """
+        return list(
+            self.get_archivable_query(statuses, created_before)
+            .filter(id__gt=after_id)
+            .values_list('id', flat=True)[:limit]
+        )
+    
+    def move_orders(self, order_ids: List[int], statuses: Iterable[str], created_before: datetime) -> int:
+        """
+        注文と注文明細をアーカイブテーブルへ移動（トランザクション内で呼び出す）
+        
+        対象の注文の行だけをロックし、条件を再確認してから移動する
+        （IDの取得後にステータスが変わった注文は移動しない）
+        
+        Args:
+            order_ids: 移動する注文IDのリスト
+            statuses: 対象の注文ステータス
+            created_before: この日時より前に作成された注文を対象とする
+            
+        Returns:
+            移動した注文の件数
+        """
+        orders = list(
+            self.get_archivable_query(statuses, created_before)
+            .select_for_update()
+            .filter(id__in=order_ids)
+            .values(*self.ORDER_FIELDS)
+        )
+        if not orders:
+            return 0
+        moved_ids = [order['id'] for order in orders]
+        items = list(OrderItem.objects.filter(order_id__in=moved_ids).values(*self.ITEM_FIELDS))
+        
+        ArchivedOrder.objects.bulk_create([ArchivedOrder(**order) for order in orders])
+        ArchivedOrderItem.objects.bulk_create([ArchivedOrderItem(**item) for item in items])
+        # 注文明細はCASCADEで削除される
+        Order.objects.filter(id__in=moved_ids).delete()
+        return len(moved_ids)
\ No newline at end of file
@@ -1,10 +1,31 @@
 from typing import List, Optional, TypeVar, Generic, Type
 from django.db.models import Model, QuerySet
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 # ジェネリック型の定義
 T = TypeVar('T', bound=Model)
 
+
+async def aget_object_or_404(queryset: QuerySet[T], **kwargs) -> T:
+    """
+    非同期ORMで条件に一致するオブジェクトを取得（get_object_or_404の非同期版）
+    
+    Args:
+        queryset: 検索対象のQuerySet
+        **kwargs: 検索条件
+        
+    Returns:
+        条件に一致するオブジェクト
+        
+    Raises:
+        Http404: オブジェクトが存在しない場合
+    """
+    try:
+        return await queryset.aget(**kwargs)
+    except queryset.model.DoesNotExist:
+        raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
 class BaseDAO(Generic[T]):
     """
     データアクセスオブジェクトの基底クラス
@@ -18,12 +39,12 @@ class BaseDAO(Generic[T]):
     
     def get_all(self) -> QuerySet[T]:
         """
-        すべてのオブジェクトを取得
+        すべてのオブジェクトを取得（読み取りレプリカがある場合はレプリカから読み取る）
         
         Returns:
             すべてのオブジェクトのQuerySet
         """
-        return self.model_class.objects.all()
+        return self.model_class.objects.db_manager(hints={'read_replica': True}).all()
     
     def get_by_id(self, id: int) -> T:
         """
@@ -40,6 +61,21 @@ class BaseDAO(Generic[T]):
         """
         return get_object_or_404(self.model_class, id=id)
     
+    async def aget_by_id(self, id: int) -> T:
+        """
+        IDによるオブジェクト取得（非同期版）
+        
+        Args:
+            id: オブジェクトのID
+            
+        Returns:
+            指定されたIDのオブジェクト
+            
+        Raises:
+            Http404: オブジェクトが存在しない場合
+        """
+        return await aget_object_or_404(self.model_class.objects.all(), id=id)
+    
     def create(self, **kwargs) -> T:
         """
         オブジェクトの作成
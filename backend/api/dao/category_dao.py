@@ -1,5 +1,5 @@
 from typing import List, Optional
-from django.db.models import QuerySet
+from django.db.models import QuerySet, Value
 
 from core.models import Category
 from api.dao.base_dao import BaseDAO
@@ -19,4 +19,5 @@ class CategoryDAO(BaseDAO[Category]):
         Returns:
             有効なカテゴリのQuerySet
         """
-        return Category.objects.filter(is_active=True)
\ No newline at end of file
+        # 真偽値を比較式にして、SQLiteでも (is_active, order, id) のインデックスを使えるようにする
+        return Category.objects.filter(is_active=Value(True))
\ No newline at end of file
@@ -0,0 +1,65 @@
+from typing import Iterable, List, Optional
+from django.utils import timezone
+
+from core.models import IdempotencyKey
+from api.dao.base_dao import BaseDAO
+
+
+class IdempotencyKeyDAO(BaseDAO[IdempotencyKey]):
+    """
+    冪等キーモデルのデータアクセスオブジェクト
+    """
+    
+    model_class = IdempotencyKey
+    
+    def get_valid_key(self, key: str) -> Optional[IdempotencyKey]:
+        """
+        有効期限内の冪等キーを取得
+        
+        Args:
+            key: 冪等キー
+            
+        Returns:
+            有効期限内の冪等キー（存在しない場合はNone）
+        """
+        return IdempotencyKey.objects.filter(key=key, expires_at__gt=timezone.now()).first()
+    
+    def get_valid_keys(self, keys: Iterable[str]) -> List[IdempotencyKey]:
+        """
+        有効期限内の冪等キーを一括取得
+        
+        Args:
+            keys: 冪等キーのリスト
+            
+        Returns:
+            有効期限内の冪等キーのリスト
+        """
+        return list(IdempotencyKey.objects.filter(key__in=list(keys), expires_at__gt=timezone.now()))
+    
+    def bulk_create_keys(self, keys: List[IdempotencyKey]) -> List[IdempotencyKey]:
+        """
+        冪等キーの一括作成
+        
+        Args:
+            keys: 保存前の冪等キーのリスト
+            
+        Returns:
+            作成された冪等キーのリスト
+        """
+        return IdempotencyKey.objects.bulk_create(keys)
+    
+    def delete_expired(self, keys: Optional[Iterable[str]] = None) -> int:
+        """
+        有効期限切れの冪等キーを削除
+        
+        Args:
+            keys: 削除対象とする冪等キーのリスト（省略時はすべての期限切れのキー）
+            
+        Returns:
+            削除した件数
+        """
+        queryset = IdempotencyKey.objects.filter(expires_at__lte=timezone.now())
+        if keys is not None:
+            queryset = queryset.filter(key__in=list(keys))
+        deleted, _ = queryset.delete()
+        return deleted
\ No newline at end of file
@@ -0,0 +1,72 @@
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.db.models import F, QuerySet
+
+from core.models import MenuVersion
+from api.dao.base_dao import BaseDAO
+
+
+class MenuVersionDAO(BaseDAO[MenuVersion]):
+    """
+    メニューバージョンモデルのデータアクセスオブジェクト
+    """
+    
+    model_class = MenuVersion
+    
+    # メニューバージョンは1行のみ保持する
+    SINGLETON_ID = 1
+    
+    def get_version(self, primary: bool = True) -> int:
+        """
+        現在のメニューバージョンを取得
+        
+        Args:
+            primary: プライマリから読み取るかどうか
+                （Falseの場合はルーターの振り分けに従い、レプリカの反映状況の確認に使う）
+            
+        Returns:
+            メニューバージョン（未作成の場合は0）
+        """
+        version = self._version_query(primary).first()
+        return version or 0
+    
+    async def aget_version(self, primary: bool = True) -> int:
+        """
+        現在のメニューバージョンを取得（非同期版）
+        
+        Args:
+            primary: プライマリから読み取るかどうか
+            
+        Returns:
+            メニューバージョン（未作成の場合は0）
+        """
+        version = await self._version_query(primary).afirst()
+        return version or 0
+    
+    def _version_query(self, primary: bool) -> QuerySet:
+        """
+        メニューバージョンを取得するQuerySetを作成
+        
+        Args:
+            primary: プライマリから読み取るかどうか
+            
+        Returns:
+            メニューバージョンの値のQuerySet
+        """
+        queryset = MenuVersion.objects.using(DEFAULT_DB_ALIAS) if primary else MenuVersion.objects
+        return queryset.filter(id=self.SINGLETON_ID).values_list('version', flat=True)
+    
+    def increment(self) -> None:
+        """
+        メニューバージョンを加算
+        
+        呼び出し元のトランザクションがコミットされた時点で他のプロセスから見えるようになる
+        """
+        updated = MenuVersion.objects.filter(id=self.SINGLETON_ID).update(version=F('version') + 1)
+        if updated:
+            return
+        try:
+            with transaction.atomic():
+                MenuVersion.objects.create(id=self.SINGLETON_ID, version=1)
+        except IntegrityError:
+            # 並行して作成された場合は加算し直す
+            MenuVersion.objects.filter(id=self.SINGLETON_ID).update(version=F('version') + 1)
\ No newline at end of file
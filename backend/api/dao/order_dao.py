@@ -1,8 +1,11 @@
-from typing import List, Optional
-from django.db.models import QuerySet, Prefetch
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from django.db import connections, router
+from django.db.models import Q, QuerySet, Prefetch
+from django.shortcuts import get_object_or_404
 
 from core.models import Order, OrderItem
-from api.dao.base_dao import BaseDAO
+from api.dao.base_dao import BaseDAO, aget_object_or_404
 
 
 class OrderDAO(BaseDAO[Order]):
@@ -23,6 +26,130 @@ class OrderDAO(BaseDAO[Order]):
             'items__product'
         )
     
+    def filter_orders(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        table_number: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> QuerySet[Order]:
+        """
+        条件による注文の絞り込み（注文明細と商品は取得済み）
+        
+        Args:
+            statuses: 注文ステータスのリスト
+            table_number: テーブル番号
+            created_from: 作成日時の開始（この日時を含む）
+            created_to: 作成日時の終了（この日時を含まない）
+            
+        Returns:
+            条件に一致する注文QuerySet
+        """
+        query = self.get_orders_with_items()
+        if statuses:
+            query = query.filter(status__in=list(statuses))
+        if table_number is not None:
+            query = query.filter(table_number=table_number)
+        if created_from is not None:
+            query = query.filter(created_at__gte=created_from)
+        if created_to is not None:
+            query = query.filter(created_at__lt=created_to)
+        return query
+    
+    def get_page_after(
+        self,
+        query: QuerySet[Order],
+        after: Optional[Tuple[datetime, int]],
+        limit: int
+    ) -> List[Order]:
+        """
+        作成日時の新しい順に、指定した位置より後の注文を取得（キーセットページネーション）
+        
+        Args:
+            query: 注文QuerySet
+            after: 前ページ最後の注文の (作成日時, ID)。先頭ページの場合はNone
+            limit: 取得する最大件数
+            
+        Returns:
+            注文のリスト
+        """
+        return list(self.get_page_query(query, after, limit))
+    
+    def get_page_query(
+        self,
+        query: QuerySet[Order],
+        after: Optional[Tuple[datetime, int]],
+        limit: int
+    ) -> QuerySet[Order]:
+        """
+        作成日時の新しい順に、指定した位置より後の注文を取得するQuerySetを作成
+        
+        Args:
+            query: 注文QuerySet
+            after: 前ページ最後の注文の (作成日時, ID)。先頭ページの場合はNone
+            limit: 取得する最大件数
+            
+        Returns:
+            注文QuerySet（非同期ORMでの取得にも使用する）
+        """
+        if after is not None:
+            created_at, order_id = after
+            query = query.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=order_id)
+            )
+        return query.order_by('-created_at', '-id')[:limit]
+    
+    def get_created_after(
+        self,
+        query: QuerySet,
+        after: Optional[Tuple[datetime, int]],
+        limit: int
+    ) -> QuerySet:
+        """
+        作成日時の古い順に、指定した位置より後の注文を取得するQuerySetを作成（エクスポート用）
+        
+        Args:
+            query: 注文またはアーカイブ済み注文のQuerySet
+            after: 前回最後の注文の (作成日時, ID)。先頭から取得する場合はNone
+            limit: 取得する最大件数
+            
+        Returns:
+            (created_at, id) の昇順のQuerySet
+        """
+        if after is not None:
+            created_at, order_id = after
+            # 範囲条件を先頭に置き、(created_at, id) インデックスの順に走査させる
+            query = query.filter(created_at__gte=created_at).filter(
+                Q(created_at__gt=created_at) | Q(id__gt=order_id)
+            )
+        return query.order_by('created_at', 'id')[:limit]
+    
+    def get_changed_after(
+        self,
+        after: Optional[Tuple[datetime, int]],
+        updated_before: Optional[datetime] = None
+    ) -> QuerySet[Order]:
+        """
+        指定した位置より後に作成・更新された注文を更新日時の古い順に取得
+        
+        Args:
+            after: 前回最後の注文の (更新日時, ID)。最初から取得する場合はNone
+            updated_before: 更新日時の上限（この日時を含まない）
+            
+        Returns:
+            (更新日時, ID) の昇順の注文QuerySet
+        """
+        query = Order.objects.all()
+        if after is not None:
+            updated_at, order_id = after
+            # 範囲条件を先頭に置き、(updated_at, id) インデックスの順に走査させる（ORだけだと並び替えが発生する）
+            query = query.filter(updated_at__gte=updated_at).filter(
+                Q(updated_at__gt=updated_at) | Q(id__gt=order_id)
+            )
+        if updated_before is not None:
+            query = query.filter(updated_at__lt=updated_before)
+        return query.order_by('updated_at', 'id')
+    
     def get_orders_by_table(self, table_number: int) -> QuerySet[Order]:
         """
         テーブル番号による注文の取得
@@ -33,7 +160,7 @@ class OrderDAO(BaseDAO[Order]):
         Returns:
             指定されたテーブルの注文QuerySet
         """
-        return Order.objects.filter(table_number=table_number)
+        return self.get_orders_with_items().filter(table_number=table_number)
     
     def get_order_with_items(self, order_id: int) -> Order:
         """
@@ -44,8 +171,41 @@ class OrderDAO(BaseDAO[Order]):
             
         Returns:
             注文明細を含む注文オブジェクト
+            
+        Raises:
+            Http404: 注文が存在しない場合
         """
-        return self.get_by_id(order_id)
+        return get_object_or_404(self.get_orders_with_items(), id=order_id)
+    
+    def get_for_update(self, order_id: int) -> Order:
+        """
+        注文を行ロックして取得（トランザクション内で呼び出す）
+        
+        Args:
+            order_id: 注文ID
+            
+        Returns:
+            注文オブジェクト
+            
+        Raises:
+            Http404: 注文が存在しない場合
+        """
+        return get_object_or_404(Order.objects.select_for_update(), id=order_id)
+    
+    async def aget_order_with_items(self, order_id: int) -> Order:
+        """
+        注文明細を含む注文を取得（非同期版）
+        
+        Args:
+            order_id: 注文ID
+            
+        Returns:
+            注文明細を含む注文オブジェクト
+            
+        Raises:
+            Http404: 注文が存在しない場合
+        """
+        return await aget_object_or_404(self.get_orders_with_items(), id=order_id)
     
     def create_order(self, table_number: int, status: str = 'pending', total_price: int = 0) -> Order:
         """
@@ -63,4 +223,47 @@ class OrderDAO(BaseDAO[Order]):
             table_number=table_number,
             status=status,
             total_price=total_price
-        )
\ No newline at end of file
+        )
+    
+    def bulk_create_orders(self, orders: List[Order]) -> List[Order]:
+        """
+        注文の一括作成
+        
+        主キーを返せるDBではbulk_createで1クエリにまとめる。
+        MySQLのように主キーを返せないDBでは注文明細を紐付けられないため、
+        1件ずつ登録する。
+        
+        Args:
+            orders: 保存前の注文オブジェクトのリスト
+            
+        Returns:
+            作成された注文のリスト
+        """
+        connection = connections[router.db_for_write(Order)]
+        if connection.features.can_return_rows_from_bulk_insert:
+            return Order.objects.bulk_create(orders)
+        for order in orders:
+            order.save(force_insert=True)
+        return orders
+    
+    def set_prefetched_items(self, order: Order, items: List[OrderItem]) -> Order:
+        """
+        取得済みの注文明細を注文に紐付ける
+        
+        prefetch_relatedと同じキャッシュに格納するため、
+        以降の order.items.all() はクエリを発行しない
+        
+        Args:
+            order: 注文オブジェクト
+            items: 注文明細のリスト
+            
+        Returns:
+            注文明細が紐付けられた注文
+        """
+        queryset = order.items.all()
+        queryset._result_cache = list(items)
+        queryset._prefetch_done = True
+        if not hasattr(order, '_prefetched_objects_cache'):
+            order._prefetched_objects_cache = {}
+        order._prefetched_objects_cache['items'] = queryset
+        return order
\ No newline at end of file
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from django.db.models import Max, Min, QuerySet
+
+from core.models import OrderEvent
+from api.dao.base_dao import BaseDAO
+
+
+class OrderEventDAO(BaseDAO[OrderEvent]):
+    """
+    注文イベントモデルのデータアクセスオブジェクト
+    """
+    
+    model_class = OrderEvent
+    
+    def get_events_after(self, event_id: int, limit: int) -> QuerySet[OrderEvent]:
+        """
+        指定したIDより後の注文イベントをID順に取得
+        
+        Args:
+            event_id: 最後に受信したイベントID
+            limit: 取得する最大件数
+            
+        Returns:
+            注文イベントQuerySet
+        """
+        return OrderEvent.objects.filter(id__gt=event_id).order_by('id')[:limit]
+    
+    def get_id_range(self) -> Dict[str, Optional[int]]:
+        """
+        保持している注文イベントのIDの範囲を取得
+        
+        Returns:
+            {'first_id': 最小のID, 'last_id': 最大のID}（イベントがない場合はそれぞれNone）
+        """
+        return OrderEvent.objects.aggregate(first_id=Min('id'), last_id=Max('id'))
+    
+    def get_created_at(self, event_id: int) -> Optional[datetime]:
+        """
+        注文イベントの作成日時を取得
+        
+        Args:
+            event_id: 注文イベントID
+            
+        Returns:
+            作成日時（イベントが存在しない場合はNone）
+        """
+        return OrderEvent.objects.filter(id=event_id).values_list('created_at', flat=True).first()
+    
+    def get_first_id_created_after(self, created_after: datetime) -> Optional[int]:
+        """
+        指定日時より後に作成された注文イベントの最小のIDを取得
+        
+        Args:
+            created_after: この日時より後に作成されたイベントを対象とする
+            
+        Returns:
+            最小のID（該当するイベントがない場合はNone）
+        """
+        return OrderEvent.objects.filter(created_at__gt=created_after).aggregate(first_id=Min('id'))['first_id']
+    
+    def get_ids_after(self, event_id: int) -> List[int]:
+        """
+        指定したIDより後の注文イベントのIDを取得
+        
+        Args:
+            event_id: 基準のイベントID
+            
+        Returns:
+            注文イベントIDのリスト
+        """
+        return list(OrderEvent.objects.filter(id__gt=event_id).values_list('id', flat=True))
+    
+    def bulk_create_events(self, events: List[OrderEvent]) -> List[OrderEvent]:
+        """
+        注文イベントの一括作成
+        
+        Args:
+            events: 保存前の注文イベントオブジェクトのリスト
+            
+        Returns:
+            作成された注文イベントのリスト
+        """
+        return OrderEvent.objects.bulk_create(events)
+    
+    def delete_before(self, created_before: datetime) -> int:
+        """
+        指定日時より前の注文イベントを削除
+        
+        Args:
+            created_before: この日時より前に作成されたイベントを削除する
+            
+        Returns:
+            削除件数
+        """
+        deleted, _ = OrderEvent.objects.filter(created_at__lt=created_before).delete()
+        return deleted
\ No newline at end of file
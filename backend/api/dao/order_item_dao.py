@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional
 from django.db.models import QuerySet
 
 from core.models import OrderItem, Order, Product
@@ -12,6 +13,9 @@ class OrderItemDAO(BaseDAO[OrderItem]):
     
     model_class = OrderItem
     
+    # 需要分析で読み込む列（末尾のIDは次のチャンクの取得に使用する）
+    ANALYTICS_FIELDS = ('product_id', 'quantity', 'price', 'created_at', 'id')
+    
     def get_items_by_order(self, order_id: int) -> QuerySet[OrderItem]:
         """
         注文IDによる注文明細の取得
@@ -24,6 +28,44 @@ class OrderItemDAO(BaseDAO[OrderItem]):
         """
         return OrderItem.objects.filter(order_id=order_id)
     
+    def get_items_by_orders(self, order_ids: Iterable[int]) -> QuerySet[OrderItem]:
+        """
+        複数の注文IDによる注文明細の一括取得
+        
+        Args:
+            order_ids: 注文IDのリスト
+            
+        Returns:
+            指定された注文の注文明細QuerySet
+        """
+        return OrderItem.objects.filter(order_id__in=list(order_ids)).order_by('id')
+    
+    def get_item_rows_after(
+        self,
+        after_id: int,
+        limit: int,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[tuple]:
+        """
+        キャンセルされていない注文の注文明細をID順に取得（需要分析用）
+        
+        Args:
+            after_id: このIDより後の注文明細を取得する
+            limit: 取得する最大件数
+            created_from: 作成日時の下限（この日時を含む）
+            created_to: 作成日時の上限（この日時を含まない）
+            
+        Returns:
+            ANALYTICS_FIELDS の順の値のタプルのリスト
+        """
+        query = OrderItem.objects.filter(id__gt=after_id).exclude(order__status='cancelled')
+        if created_from is not None:
+            query = query.filter(created_at__gte=created_from)
+        if created_to is not None:
+            query = query.filter(created_at__lt=created_to)
+        return list(query.order_by('id').values_list(*self.ANALYTICS_FIELDS)[:limit])
+    
     def create_order_item(self, order: Order, product: Product, quantity: int, price: int) -> OrderItem:
         """
         注文明細の作成
@@ -42,4 +84,17 @@ class OrderItemDAO(BaseDAO[OrderItem]):
             product=product,
             quantity=quantity,
             price=price
-        )
\ No newline at end of file
+        )
+    
+    def bulk_create_order_items(self, items: List[OrderItem]) -> List[OrderItem]:
+        """
+        注文明細の一括作成
+        
+        Args:
+            items: 保存前の注文明細オブジェクトのリスト
+            
+        Returns:
+            作成された注文明細のリスト
+            （主キーが返されないDB（MySQL）ではidがNoneのまま返される）
+        """
+        return OrderItem.objects.bulk_create(items)
\ No newline at end of file
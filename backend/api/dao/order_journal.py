@@ -0,0 +1,239 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class OrderJournal:
+    """
+    受け付けた注文を保持するローカルジャーナル
+    
+    SQLite（WALモード、synchronous=FULL）の追記専用ストアで、
+    MySQLへ書き込む前の注文をプロセスのクラッシュ後も失わないように保持する。
+    
+    エントリのステータス:
+        accepted: 受付済み（MySQLへ未反映）
+        completed: MySQLへの反映完了
+        failed: 反映できなかった（商品が存在しない、試行回数が上限に達した等）
+    """
+    
+    STATUS_ACCEPTED = 'accepted'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    
+    def __init__(self, path: str):
+        """
+        コンストラクタ
+        
+        Args:
+            path: ジャーナルファイルのパス
+        """
+        self.path = path
+        self._initialize()
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        ジャーナルへの接続を開く（スレッド間で共有しないよう操作ごとに接続する）
+        
+        Yields:
+            SQLiteの接続
+        """
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=FULL')
+            yield connection
+        finally:
+            connection.close()
+    
+    def _initialize(self) -> None:
+        """ジャーナルのテーブルを作成"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS order_journal ('
+                ' ticket TEXT PRIMARY KEY,'
+                ' payload TEXT NOT NULL,'
+                ' status TEXT NOT NULL,'
+                ' order_id INTEGER,'
+                ' detail TEXT,'
+                ' attempts INTEGER NOT NULL DEFAULT 0,'
+                ' lease_until REAL,'
+                ' created_at REAL NOT NULL,'
+                ' updated_at REAL NOT NULL'
+                ')'
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS order_journal_status_created'
+                ' ON order_journal (status, created_at)'
+            )
+    
+    def append(self, ticket: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        注文をジャーナルに追記
+        
+        同じチケットが既に存在する場合は追記せず、既存のエントリを返す
+        
+        Args:
+            ticket: 受付チケット
+            payload: 注文データ
+            
+        Returns:
+            ジャーナルのエントリ
+        """
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                'INSERT OR IGNORE INTO order_journal'
+                ' (ticket, payload, status, created_at, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (ticket, json.dumps(payload), self.STATUS_ACCEPTED, now, now)
+            )
+        return self.get(ticket)
+    
+    def get(self, ticket: str) -> Optional[Dict[str, Any]]:
+        """
+        チケットによるエントリの取得
+        
+        Args:
+            ticket: 受付チケット
+            
+        Returns:
+            ジャーナルのエントリ（存在しない場合はNone）
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT * FROM order_journal WHERE ticket = ?', (ticket,)
+            ).fetchone()
+        return self._to_entry(row) if row else None
+    
+    def claim_pending(self, limit: int, lease_seconds: float, max_attempts: int) -> List[Dict[str, Any]]:
+        """
+        未反映のエントリを取得し、一定時間の処理権（リース）を設定する
+        
+        リースが切れたエントリ（処理中にクラッシュしたもの）も再取得の対象になる。
+        試行回数が上限に達したエントリは再取得せず、失敗として記録する（デッドレター）
+        
+        Args:
+            limit: 取得する最大件数
+            lease_seconds: リースの秒数
+            max_attempts: 反映を試行する最大回数
+            
+        Returns:
+            受付順のエントリのリスト
+        """
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'UPDATE order_journal SET status = ?, detail = ?, lease_until = NULL, updated_at = ?'
+                    ' WHERE status = ? AND (lease_until IS NULL OR lease_until < ?) AND attempts >= ?',
+                    (
+                        self.STATUS_FAILED,
+                        f'反映の試行回数が上限（{max_attempts}回）に達しました',
+                        now,
+                        self.STATUS_ACCEPTED,
+                        now,
+                        max_attempts,
+                    )
+                )
+                rows = connection.execute(
+                    'SELECT * FROM order_journal'
+                    ' WHERE status = ? AND (lease_until IS NULL OR lease_until < ?)'
+                    ' ORDER BY created_at LIMIT ?',
+                    (self.STATUS_ACCEPTED, now, limit)
+                ).fetchall()
+                connection.executemany(
+                    'UPDATE order_journal SET lease_until = ?, attempts = attempts + 1, updated_at = ?'
+                    ' WHERE ticket = ?',
+                    [(now + lease_seconds, now, row['ticket']) for row in rows]
+                )
+                connection.execute('COMMIT')
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+        return [self._to_entry(row) for row in rows]
+    
+    def mark(self, outcomes: List[Dict[str, Any]]) -> None:
+        """
+        エントリの処理結果を記録
+        
+        Args:
+            outcomes: 処理結果のリスト
+            [
+                {
+                    'ticket': str,
+                    'status': str,            # completed / failed
+                    'order_id': int or None,
+                    'detail': str or None,
+                },
+                ...
+            ]
+        """
+        now = time.time()
+        with self._connect() as connection:
+            connection.executemany(
+                'UPDATE order_journal'
+                ' SET status = ?, order_id = ?, detail = ?, lease_until = NULL, updated_at = ?'
+                ' WHERE ticket = ?',
+                [
+                    (outcome['status'], outcome['order_id'], outcome['detail'], now, outcome['ticket'])
+                    for outcome in outcomes
+                ]
+            )
+    
+    def count_pending(self) -> int:
+        """
+        未反映のエントリ数を取得
+        
+        Returns:
+            未反映のエントリ数
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                'SELECT COUNT(*) FROM order_journal WHERE status = ?', (self.STATUS_ACCEPTED,)
+            ).fetchone()[0]
+    
+    def purge(self, older_than_seconds: float) -> int:
+        """
+        反映済み・失敗したエントリのうち古いものを削除
+        
+        Args:
+            older_than_seconds: 削除対象とする経過秒数
+            
+        Returns:
+            削除した件数
+        """
+        threshold = time.time() - older_than_seconds
+        with self._connect() as connection:
+            cursor = connection.execute(
+                'DELETE FROM order_journal WHERE status != ? AND updated_at < ?',
+                (self.STATUS_ACCEPTED, threshold)
+            )
+            return cursor.rowcount
+    
+    def _to_entry(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """
+        行をエントリの辞書に変換
+        
+        Args:
+            row: ジャーナルの行
+            
+        Returns:
+            エントリの辞書
+        """
+        return {
+            'ticket': row['ticket'],
+            'payload': json.loads(row['payload']),
+            'status': row['status'],
+            'order_id': row['order_id'],
+            'detail': row['detail'],
+            'attempts': row['attempts'],
+        }
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from django.db.models import QuerySet
+from typing import Dict, Iterable, List, Optional
+from django.db.models import QuerySet, Value
 
 from core.models import Product
 from api.dao.base_dao import BaseDAO
@@ -19,7 +19,8 @@ class ProductDAO(BaseDAO[Product]):
         Returns:
             販売可能な商品のQuerySet
         """
-        return Product.objects.filter(is_available=True)
+        # 真偽値を比較式にして、SQLiteでも複合インデックスを使えるようにする
+        return Product.objects.filter(is_available=Value(True))
     
     def get_products_by_category(self, category_id: int, available_only: bool = True) -> QuerySet[Product]:
         """
@@ -34,5 +35,38 @@ class ProductDAO(BaseDAO[Product]):
         """
         query = Product.objects.filter(category_id=category_id)
         if available_only:
-            query = query.filter(is_available=True)
-        return query
\ No newline at end of file
+            query = query.filter(is_available=Value(True))
+        return query
+    
+    def get_menu_products(self) -> QuerySet[Product]:
+        """
+        メニューに表示する商品（有効なカテゴリの販売可能な商品）を取得
+        
+        Returns:
+            カテゴリの表示順・商品の表示順に並んだ商品QuerySet
+        """
+        return Product.objects.filter(is_available=Value(True), category__is_active=Value(True))
+    
+    def get_by_ids(self, product_ids: Iterable[int]) -> Dict[int, Product]:
+        """
+        複数のIDによる商品の一括取得
+        
+        Args:
+            product_ids: 商品IDのリスト
+            
+        Returns:
+            商品IDをキーとした商品の辞書（存在しないIDは含まれない）
+        """
+        return Product.objects.in_bulk(set(product_ids))
+    
+    def filter_by_ids(self, product_ids: Iterable[int]) -> QuerySet[Product]:
+        """
+        複数のIDによる商品の絞り込み
+        
+        Args:
+            product_ids: 商品IDのリスト
+            
+        Returns:
+            指定されたIDの商品QuerySet（ID順）
+        """
+        return Product.objects.filter(id__in=list(product_ids)).order_by('id')
\ No newline at end of file
@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from django.db.models import Max, Min
+
+from core.models import ArchivedOrder, ArchivedOrderItem, Order, OrderItem, ProductPair, RecommendationSnapshot
+
+
+class RecommendationDAO:
+    """
+    おすすめ商品（同時に注文された商品の組）のデータアクセスオブジェクト
+    """
+    
+    def get_orders_after(self, archived: bool, after_id: int, limit: int) -> List[Tuple[int, datetime]]:
+        """
+        注文をID順に取得
+        
+        Args:
+            archived: アーカイブ済み注文から取得するかどうか
+            after_id: このIDより後の注文を取得する
+            limit: 取得する最大件数
+        
+        Returns:
+            (注文ID, 作成日時) のリスト
+        """
+        model = ArchivedOrder if archived else Order
+        return list(
+            model.objects.filter(id__gt=after_id).order_by('id').values_list('id', 'created_at')[:limit]
+        )
+    
+    def get_order_products(self, archived: bool, first_id: int, last_id: int) -> List[Tuple[int, int]]:
+        """
+        注文IDの範囲の注文明細の商品を取得
+        
+        Args:
+            archived: アーカイブ済み注文明細から取得するかどうか
+            first_id: 注文IDの下限（このIDを含む）
+            last_id: 注文IDの上限（このIDを含む）
+        
+        Returns:
+            (注文ID, 商品ID) のリスト（注文ID順）
+        """
+        model = ArchivedOrderItem if archived else OrderItem
+        return list(
+            model.objects.filter(order__id__gte=first_id, order__id__lte=last_id)
+            .order_by('order_id')
+            .values_list('order_id', 'product_id')
+        )
+    
+    def get_settled_order_id(self, created_before: datetime) -> int:
+        """
+        指定日時より前に作成された注文だけが続く範囲の最後の注文IDを取得
+        
+        Args:
+            created_before: この日時より前に作成された注文を確定済みとする
+        
+        Returns:
+            この注文ID以前の注文はすべて created_before より前に作成されている注文ID（注文がない場合は0）
+        """
+        first_unsettled_id = Order.objects.filter(created_at__gte=created_before).aggregate(
+            first_id=Min('id')
+        )['first_id']
+        if first_unsettled_id is not None:
+            return first_unsettled_id - 1
+        # すべての注文がアーカイブ済みの場合もあるため、アーカイブ済み注文のIDも含める
+        return max(
+            Order.objects.aggregate(last_id=Max('id'))['last_id'] or 0,
+            ArchivedOrder.objects.aggregate(last_id=Max('id'))['last_id'] or 0,
+        )
+    
+    def get_snapshot(self) -> Optional[RecommendationSnapshot]:
+        """
+        最新のスナップショットの作成記録を取得
+        
+        Returns:
+            作成記録（スナップショットがない場合はNone）
+        """
+        return RecommendationSnapshot.objects.order_by('-id').first()
+    
+    def get_pairs(self) -> List[Tuple[int, int, int]]:
+        """
+        スナップショットの商品の組をすべて取得
+        
+        Returns:
+            (商品ID, 同時に注文された商品ID, 注文数) のリスト
+        """
+        return list(ProductPair.objects.values_list('product_id', 'other_product_id', 'order_count'))
+    
+    def replace_snapshot(
+        self, pairs: Iterable[Tuple[int, int, int]], last_order_id: int, order_count: int, batch_size: int = 1000
+    ) -> RecommendationSnapshot:
+        """
+        スナップショットを置き換える（トランザクション内で呼び出す）
+        
+        Args:
+            pairs: (商品ID, 同時に注文された商品ID, 注文数) のリスト（商品IDの小さい方を先にする）
+            last_order_id: 集計済みの最後の注文ID
+            order_count: 集計した注文数
+            batch_size: 1回のINSERTで作成する行数
+        
+        Returns:
+            作成記録
+        """
+        ProductPair.objects.all().delete()
+        ProductPair.objects.bulk_create([
+            ProductPair(product_id=product_id, other_product_id=other_id, order_count=count)
+            for product_id, other_id, count in pairs
+        ], batch_size=batch_size)
+        # 各プロセスが読み込み直すよう、作成記録のIDが前回より大きくなるように作成してから古い記録を削除する
+        snapshot = RecommendationSnapshot.objects.create(last_order_id=last_order_id, order_count=order_count)
+        RecommendationSnapshot.objects.filter(id__lt=snapshot.id).delete()
+        return snapshot
\ No newline at end of file
@@ -0,0 +1,173 @@
+from datetime import date
+from typing import Any, Dict, Iterable, List, Tuple, Type
+from django.db import IntegrityError, transaction
+from django.db.models import F, Model, QuerySet, Sum
+
+from core.models import ArchivedOrder, ArchivedOrderItem, HourlySales, Order, OrderItem, ProductSales
+
+
+# 集計のキー（売上日, 時, テーブル番号 または 商品ID）と加算する値
+SalesDeltas = Dict[Tuple[date, int, int], Dict[str, Any]]
+
+
+class SalesRollupDAO:
+    """
+    売上集計モデル（HourlySales・ProductSales）のデータアクセスオブジェクト
+    """
+    
+    HOURLY_KEY_FIELDS = ('sales_date', 'hour', 'table_number')
+    PRODUCT_KEY_FIELDS = ('sales_date', 'hour', 'product_id')
+    
+    # 集計の再作成で読み込む列
+    ORDER_FIELDS = ('id', 'table_number', 'total_price', 'created_at')
+    ITEM_FIELDS = ('order_id', 'product_id', 'quantity', 'price')
+    
+    def add_hourly_sales(self, deltas: SalesDeltas) -> None:
+        """
+        時間帯・テーブル別の売上に加算（負の値で減算）
+        
+        Args:
+            deltas: (売上日, 時, テーブル番号) をキーとした order_count・quantity・revenue の増減
+        """
+        self._add(HourlySales, self.HOURLY_KEY_FIELDS, deltas, 'order_count')
+    
+    def add_product_sales(self, deltas: SalesDeltas) -> None:
+        """
+        時間帯・商品別の売上に加算（負の値で減算）
+        
+        Args:
+            deltas: (売上日, 時, 商品ID) をキーとした quantity・revenue の増減
+        """
+        self._add(ProductSales, self.PRODUCT_KEY_FIELDS, deltas, 'quantity')
+    
+    def replace_all(self, hourly: SalesDeltas, product: SalesDeltas, batch_size: int = 1000) -> None:
+        """
+        売上集計をすべて削除して作成し直す（トランザクション内で呼び出す）
+        
+        Args:
+            hourly: (売上日, 時, テーブル番号) をキーとした時間帯・テーブル別の売上
+            product: (売上日, 時, 商品ID) をキーとした時間帯・商品別の売上
+            batch_size: 1回のINSERTで作成する行数
+        """
+        HourlySales.objects.all().delete()
+        ProductSales.objects.all().delete()
+        HourlySales.objects.bulk_create([
+            HourlySales(**dict(zip(self.HOURLY_KEY_FIELDS, key)), **values)
+            for key, values in sorted(hourly.items())
+        ], batch_size=batch_size)
+        ProductSales.objects.bulk_create([
+            ProductSales(**dict(zip(self.PRODUCT_KEY_FIELDS, key)), **values)
+            for key, values in sorted(product.items())
+        ], batch_size=batch_size)
+    
+    def get_completed_orders(self, archived: bool, after_id: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        完了した注文をID順に取得（集計の再作成用）
+        
+        Args:
+            archived: アーカイブ済み注文から取得するかどうか
+            after_id: このIDより後の注文を取得する
+            limit: 取得する最大件数
+        
+        Returns:
+            ORDER_FIELDS の辞書のリスト
+        """
+        model = ArchivedOrder if archived else Order
+        return list(
+            model.objects.filter(status='completed', id__gt=after_id)
+            .order_by('id')
+            .values(*self.ORDER_FIELDS)[:limit]
+        )
+    
+    def count_completed_orders(self, archived: bool) -> int:
+        """
+        完了した注文数を取得
+        
+        Args:
+            archived: アーカイブ済み注文の件数を取得するかどうか
+        
+        Returns:
+            注文数
+        """
+        model = ArchivedOrder if archived else Order
+        return model.objects.filter(status='completed').count()
+    
+    def get_order_items(self, archived: bool, order_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        注文の注文明細を取得（集計の再作成用）
+        
+        Args:
+            archived: アーカイブ済み注文明細から取得するかどうか
+            order_ids: 注文IDのリスト
+        
+        Returns:
+            ITEM_FIELDS の辞書のリスト
+        """
+        model = ArchivedOrderItem if archived else OrderItem
+        return list(model.objects.filter(order_id__in=list(order_ids)).values(*self.ITEM_FIELDS))
+    
+    def get_sales_by(self, group_by: str, date_from: date, date_to: date) -> QuerySet:
+        """
+        時間帯・テーブル別の売上を集計
+        
+        Args:
+            group_by: 集計する列（sales_date / hour / table_number）
+            date_from: 売上日の開始（この日を含む）
+            date_to: 売上日の終了（この日を含む）
+        
+        Returns:
+            group_by・order_count・quantity・revenue の辞書のQuerySet（group_byの昇順）
+        """
+        return (
+            HourlySales.objects.filter(sales_date__range=(date_from, date_to))
+            .values(group_by)
+            .annotate(order_count=Sum('order_count'), quantity=Sum('quantity'), revenue=Sum('revenue'))
+            .order_by(group_by)
+        )
+    
+    def get_product_sales(self, date_from: date, date_to: date) -> QuerySet:
+        """
+        商品別の売上を集計
+        
+        Args:
+            date_from: 売上日の開始（この日を含む）
+            date_to: 売上日の終了（この日を含む）
+        
+        Returns:
+            product_id・product_name・quantity・revenue の辞書のQuerySet（売上の多い順）
+        """
+        return (
+            ProductSales.objects.filter(sales_date__range=(date_from, date_to))
+            .values('product_id', product_name=F('product__name'))
+            .annotate(quantity=Sum('quantity'), revenue=Sum('revenue'))
+            .order_by('-revenue', 'product_id')
+        )
+    
+    def _add(self, model: Type[Model], key_fields: Tuple[str, ...], deltas: SalesDeltas, count_field: str) -> None:
+        """
+        集計の行に加算し、行がない場合は作成する
+        
+        Args:
+            model: 集計モデル
+            key_fields: キーの列
+            deltas: キーごとの増減
+            count_field: 0になった行を削除する判定に使用する列
+        """
+        # 同時に更新するトランザクションとのデッドロックを避けるため、キーの順に更新する
+        for key in sorted(deltas):
+            values = deltas[key]
+            lookup = dict(zip(key_fields, key))
+            increments = {field: F(field) + value for field, value in values.items()}
+            if model.objects.filter(**lookup).update(**increments):
+                if values[count_field] < 0:
+                    model.objects.filter(**lookup, **{f'{count_field}__lte': 0}).delete()
+                continue
+            if values[count_field] < 0:
+                # 集計の作成前に完了した注文の取り消しなど、減算する行がない場合は何もしない
+                continue
+            try:
+                with transaction.atomic():
+                    model.objects.create(**lookup, **values)
+            except IntegrityError:
+                # 同時に作成された場合はその行に加算する
+                model.objects.filter(**lookup).update(**increments)
\ No newline at end of file
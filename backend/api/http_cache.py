@@ -0,0 +1,172 @@
+import gzip
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from api.api_config import api
+from api.services.menu_cache import menu_cache
+
+
+def cached_menu_response(request: HttpRequest, key: Hashable, load_data: Callable[[], Any]) -> HttpResponse:
+    """
+    メニューのレスポンスをエンコード済みのバイト列でキャッシュして返す
+    
+    レスポンスはメニューバージョンごとにキャッシュし、
+    If-None-MatchのETagが一致する場合は本文なしの304を返す。
+    
+    Args:
+        request: リクエスト
+        key: レスポンスのキャッシュキー（クエリパラメータを含めること）
+        load_data: レスポンスのデータ（JSONに変換可能な値）を作成する関数
+        
+    Returns:
+        レスポンス
+    """
+    version = menu_cache.get_version()
+    etag, cache_key, use_gzip = _response_key(request, key, version)
+    
+    if etag in _parse_etags(request.headers.get('If-None-Match', '')):
+        return _build_response(request, etag, None, use_gzip)
+    content = menu_cache.get(
+        cache_key,
+        lambda: _render(request, load_data(), use_gzip),
+        check_version=False
+    )
+    return _build_response(request, etag, content, use_gzip)
+
+
+async def acached_menu_response(
+    request: HttpRequest, key: Hashable, load_data: Callable[[], Awaitable[Any]]
+) -> HttpResponse:
+    """
+    メニューのレスポンスをエンコード済みのバイト列でキャッシュして返す（非同期版）
+    
+    Args:
+        request: リクエスト
+        key: レスポンスのキャッシュキー（クエリパラメータを含めること）
+        load_data: レスポンスのデータ（JSONに変換可能な値）を作成するコルーチン関数
+        
+    Returns:
+        レスポンス
+    """
+    version = await menu_cache.aget_version()
+    etag, cache_key, use_gzip = _response_key(request, key, version)
+    
+    if etag in _parse_etags(request.headers.get('If-None-Match', '')):
+        return _build_response(request, etag, None, use_gzip)
+    
+    async def load_content() -> bytes:
+        return _render(request, await load_data(), use_gzip)
+    
+    content = await menu_cache.aget(cache_key, load_content, check_version=False)
+    return _build_response(request, etag, content, use_gzip)
+
+
+def _response_key(request: HttpRequest, key: Hashable, version: int) -> Tuple[str, Hashable, bool]:
+    """
+    リクエストに対するETagとレスポンスのキャッシュキーを作成
+    
+    Args:
+        request: リクエスト
+        key: レスポンスのキャッシュキー
+        version: メニューバージョン
+        
+    Returns:
+        (ETag, メニューキャッシュのキー, gzip圧縮するかどうか)
+    """
+    use_gzip = settings.MENU_RESPONSE_GZIP and _accepts_gzip(request.headers.get('Accept-Encoding', ''))
+    response_format = api.renderer.get_format(request)
+    digest = hashlib.md5(repr(key).encode('utf-8')).hexdigest()[:12]
+    etag = f'"menu-{version}-{digest}-{response_format}{"-gzip" if use_gzip else ""}"'
+    return etag, ('response', key, response_format, use_gzip), use_gzip
+
+
+def _build_response(request: HttpRequest, etag: str, content: Optional[bytes], use_gzip: bool) -> HttpResponse:
+    """
+    キャッシュ用のヘッダーを付けたレスポンスを作成
+    
+    Args:
+        request: リクエスト
+        etag: ETag
+        content: エンコード済みのレスポンス本文（Noneの場合は304）
+        use_gzip: 本文がgzip圧縮されているかどうか
+        
+    Returns:
+        レスポンス
+    """
+    if content is None:
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(content, content_type=api.renderer.get_content_type(request))
+        if use_gzip:
+            response['Content-Encoding'] = 'gzip'
+    
+    response['ETag'] = etag
+    patch_vary_headers(response, ['Accept-Encoding', 'Accept'])
+    # 端末には保存させつつ、毎回ETagで更新を確認させる
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _render(request: HttpRequest, data: Any, use_gzip: bool) -> bytes:
+    """
+    データをAPIのレンダラーでエンコード
+    
+    Args:
+        request: リクエスト
+        data: JSONに変換可能な値
+        use_gzip: gzip圧縮するかどうか
+        
+    Returns:
+        エンコード済みのレスポンス本文
+    """
+    content = api.renderer.render(request, data, response_status=200)
+    if isinstance(content, str):
+        content = content.encode(api.renderer.charset)
+    if use_gzip:
+        content = gzip.compress(content, compresslevel=settings.MENU_RESPONSE_GZIP_LEVEL)
+    return content
+
+
+def _parse_etags(header: str) -> set:
+    """
+    If-None-Matchヘッダーを解析
+    
+    Args:
+        header: If-None-Matchヘッダーの値
+        
+    Returns:
+        ETagの集合（弱いETagの W/ は除く）
+    """
+    return {
+        tag.strip()[2:] if tag.strip().startswith('W/') else tag.strip()
+        for tag in header.split(',')
+        if tag.strip()
+    }
+
+
+def _accepts_gzip(header: str) -> bool:
+    """
+    Accept-Encodingヘッダーがgzipを受け入れるかどうかを判定
+    
+    Args:
+        header: Accept-Encodingヘッダーの値
+        
+    Returns:
+        gzipのトークンがあり、q=0 で拒否されていない場合はTrue
+    """
+    for coding in header.split(','):
+        name, *params = coding.split(';')
+        if name.strip().lower() != 'gzip':
+            continue
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
\ No newline at end of file
@@ -0,0 +1,262 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.db.routers import routing_request
+
+logger = logging.getLogger(__name__)
+
+# SQLの正規化に使う正規表現
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN \((?:\s*(?:%s|\?)\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    SQLをパラメータの値や件数によらない形に正規化
+    
+    Args:
+        sql: SQL
+        
+    Returns:
+        正規化されたSQL
+    """
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = sql.replace('%s', '?')
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+class QueryInspector:
+    """リクエスト中に実行されたSQLを正規化して集計するクラス"""
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.statements: Counter = Counter()
+        self.total = 0
+        self.duration = 0.0
+    
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+        """
+        connection.execute_wrapper から呼び出され、SQLを記録して実行する
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.total += 1
+            self.statements[normalize_sql(sql)] += 1
+    
+    def capture(self) -> ExitStack:
+        """
+        すべてのDB接続で実行されるSQLを記録するコンテキストマネージャを返す
+        
+        Returns:
+            コンテキストマネージャ
+        """
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+        return stack
+    
+    def repeated(self, threshold: int) -> List[Dict[str, Any]]:
+        """
+        しきい値以上繰り返し実行されたSQLを取得
+        
+        Args:
+            threshold: 繰り返し回数のしきい値
+            
+        Returns:
+            実行回数の多い順のSQLと実行回数のリスト
+        """
+        return [
+            {'sql': sql, 'count': count}
+            for sql, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryInspectorMiddleware:
+    """
+    リクエストごとに実行されたSQLを集計し、N+1クエリの可能性がある
+    繰り返しパターンをルーター関数名とともにログに出力するミドルウェア（開発・検証環境用）
+    
+    QUERY_INSPECTOR_ENABLED が有効な場合のみ動作する。
+    非同期のビューをスレッドで実行し直さないよう、同期・非同期の両方に対応する
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        """コンストラクタ"""
+        if not settings.QUERY_INSPECTOR_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """SQLを記録しながらリクエストを処理し、繰り返しパターンを報告する"""
+        if self.async_mode:
+            return self.__acall__(request)
+        inspector = QueryInspector()
+        with inspector.capture():
+            response = self.get_response(request)
+        return self._report(request, response, inspector)
+    
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """SQLを記録しながらリクエストを処理し、繰り返しパターンを報告する（非同期版）"""
+        inspector = QueryInspector()
+        # DB接続はスレッドごとのため、ORMの非同期APIがSQLを実行するスレッドで記録を開始・終了する
+        capture = await sync_to_async(inspector.capture)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(capture.close)()
+        return self._report(request, response, inspector)
+    
+    def _report(self, request: HttpRequest, response: HttpResponse, inspector: QueryInspector) -> HttpResponse:
+        """
+        繰り返しパターンをログに出力し、SQLの件数と実行時間をレスポンスヘッダーに付ける
+        
+        Args:
+            request: リクエスト
+            response: レスポンス
+            inspector: リクエスト中のSQLを記録したQueryInspector
+            
+        Returns:
+            レスポンス
+        """
+        repeated = inspector.repeated(settings.QUERY_INSPECTOR_THRESHOLD)
+        view_name = getattr(request, 'query_inspector_view', None) or request.path
+        for pattern in repeated:
+            logger.warning(
+                'N+1クエリの可能性: %s %s (%s) で同じクエリが%d回実行されました: %s',
+                request.method, request.path, view_name, pattern['count'], pattern['sql'],
+            )
+        
+        response['X-Query-Count'] = str(inspector.total)
+        response['X-Query-Time'] = f'{inspector.duration * 1000:.1f}ms'
+        return response
+    
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: Any, view_kwargs: Any) -> None:
+        """報告用にリクエストを処理するルーター関数名を記録"""
+        request.query_inspector_view = get_view_name(request, view_func)
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """
+    書き込みを行ったクライアントの読み取りを一定時間プライマリに固定するミドルウェア
+    
+    書き込みを行ったレスポンスに DATABASE_REPLICA_PIN_COOKIE のCookieを付け、
+    有効期限（DATABASE_REPLICA_PIN_SECONDS 秒後）までのリクエストはレプリカを使用しない。
+    DATABASE_REPLICAS が設定されている場合のみ動作する。
+    非同期のビューをスレッドで実行し直さないよう、同期・非同期の両方に対応する
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        """コンストラクタ"""
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Cookieからプライマリへの固定を判定してリクエストを処理し、書き込みがあれば固定する"""
+        if self.async_mode:
+            return self.__acall__(request)
+        now = time.time()
+        with routing_request(pinned=self._is_pinned(request, now)) as state:
+            response = self.get_response(request)
+        return self._pin(response, state.wrote, now)
+    
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Cookieからプライマリへの固定を判定してリクエストを処理し、書き込みがあれば固定する（非同期版）"""
+        now = time.time()
+        with routing_request(pinned=self._is_pinned(request, now)) as state:
+            response = await self.get_response(request)
+        return self._pin(response, state.wrote, now)
+    
+    def _is_pinned(self, request: HttpRequest, now: float) -> bool:
+        """
+        Cookieの有効期限からプライマリに固定するかどうかを判定
+        
+        Args:
+            request: リクエスト
+            now: 現在時刻（time.time()）
+            
+        Returns:
+            プライマリに固定する場合はTrue
+        """
+        try:
+            pinned_until = float(request.COOKIES.get(settings.DATABASE_REPLICA_PIN_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0.0
+        return pinned_until > now
+    
+    def _pin(self, response: HttpResponse, wrote: bool, now: float) -> HttpResponse:
+        """
+        書き込みを行った場合はプライマリへの固定のCookieを付ける
+        
+        Args:
+            response: レスポンス
+            wrote: リクエスト内で書き込みを行ったかどうか
+            now: リクエストの開始時刻（time.time()）
+            
+        Returns:
+            レスポンス
+        """
+        if wrote:
+            pin_seconds = settings.DATABASE_REPLICA_PIN_SECONDS
+            response.set_cookie(
+                settings.DATABASE_REPLICA_PIN_COOKIE,
+                f'{now + pin_seconds:.3f}',
+                max_age=pin_seconds,
+                samesite='Lax',
+            )
+        return response
+
+
+def get_view_name(request: HttpRequest, view_func: Callable) -> Optional[str]:
+    """
+    リクエストを処理する関数名を取得
+    
+    django-ninjaのビューの場合は、HTTPメソッドに対応するルーター関数の名前を返す
+    
+    Args:
+        request: リクエスト
+        view_func: URLに対応するビュー関数
+        
+    Returns:
+        "モジュール名.関数名" 形式の関数名
+    """
+    path_view = getattr(view_func, '__self__', None)
+    for operation in getattr(path_view, 'operations', []):
+        if request.method in operation.methods:
+            view_func = operation.view_func
+            break
+    module = getattr(view_func, '__module__', None)
+    name = getattr(view_func, '__qualname__', None) or getattr(view_func, '__name__', None)
+    if name is None:
+        return None
+    return f'{module}.{name}' if module else name
\ No newline at end of file
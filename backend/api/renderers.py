@@ -0,0 +1,135 @@
+import json
+from datetime import datetime
+from typing import Any, Optional
+from django.http import HttpRequest
+from ninja.renderers import JSONRenderer
+from ninja.responses import NinjaJSONEncoder
+
+# 高速なエンコーダーは任意の依存関係（インストールされていない場合は標準のjsonを使用）
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+JSON_FORMAT = 'json'
+MSGPACK_FORMAT = 'msgpack'
+MSGPACK_MEDIA_TYPES = ('application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack')
+
+# orjson・msgpackが対応していない型（Decimal等）はninjaのJSONエンコーダーと同じ方法で変換する
+_fallback_encoder = NinjaJSONEncoder()
+
+# 日時は標準のJSONRendererや保存済みの冪等レスポンスと同じ表記（ミリ秒まで、UTCは"Z"）にするため、
+# orjsonの日時エンコードを使わずに _default で変換する
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """
+    エンコーダーが対応していない型の値を変換
+    
+    Args:
+        obj: 変換する値
+        
+    Returns:
+        エンコード可能な値
+        
+    Raises:
+        TypeError: 変換できない型の場合
+    """
+    # 件数の多い日時は DjangoJSONEncoder と同じ変換をここで直接行う
+    if isinstance(obj, datetime):
+        value = obj.isoformat()
+        if obj.microsecond:
+            value = value[:23] + value[26:]
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return _fallback_encoder.default(obj)
+
+
+class FastRenderer(JSONRenderer):
+    """
+    orjsonがインストールされていればorjsonでJSONをエンコードし、
+    AcceptヘッダーでMessagePackが要求された場合はMessagePackで返すレンダラー
+    
+    orjsonがない場合はninja標準のJSONRendererと同じ出力になる
+    """
+    
+    msgpack_media_type = 'application/msgpack'
+    
+    @property
+    def msgpack_enabled(self) -> bool:
+        """MessagePackで返せるかどうか"""
+        return msgpack is not None
+    
+    def get_format(self, request: Optional[HttpRequest]) -> str:
+        """
+        リクエストのAcceptヘッダーからレスポンスの形式を決定
+        
+        Args:
+            request: リクエスト
+            
+        Returns:
+            'msgpack' または 'json'
+        """
+        if request is None or not self.msgpack_enabled:
+            return JSON_FORMAT
+        for media_range in request.headers.get('Accept', '').split(','):
+            media_type, _, params = media_range.partition(';')
+            if media_type.strip().lower() in MSGPACK_MEDIA_TYPES and 'q=0' not in params.replace(' ', ''):
+                return MSGPACK_FORMAT
+        return JSON_FORMAT
+    
+    def get_content_type(self, request: Optional[HttpRequest]) -> str:
+        """
+        リクエストに対するレスポンスのContent-Typeを取得
+        
+        Args:
+            request: リクエスト
+            
+        Returns:
+            Content-Type
+        """
+        if self.get_format(request) == MSGPACK_FORMAT:
+            return self.msgpack_media_type
+        return f'{self.media_type}; charset={self.charset}'
+    
+    def render(self, request: Optional[HttpRequest], data: Any, *, response_status: int) -> Any:
+        """
+        データをリクエストに応じた形式でエンコード
+        
+        Args:
+            request: リクエスト
+            data: エンコードするデータ
+            response_status: レスポンスのステータスコード
+            
+        Returns:
+            エンコード済みのレスポンス本文
+        """
+        if self.get_format(request) == MSGPACK_FORMAT:
+            return msgpack.packb(data, default=_default, use_bin_type=True)
+        if orjson is not None:
+            return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+        return super().render(request, data, response_status=response_status)
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    データをJSONにエンコード（FastRenderer のJSONレスポンスと同じ表記）
+    
+    Args:
+        data: エンコードするデータ
+        
+    Returns:
+        JSONのバイト列
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(data, cls=NinjaJSONEncoder).encode()
\ No newline at end of file
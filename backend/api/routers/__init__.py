@@ -1,5 +1,8 @@
 from .category import category_router
 from .product import product_router
 from .order import order_router
+from .menu import menu_router
+from .metrics import metrics_router
+from .report import report_router
 
-__all__ = ['category_router', 'product_router', 'order_router']
\ No newline at end of file
+__all__ = ['category_router', 'product_router', 'order_router', 'menu_router', 'metrics_router', 'report_router']
\ No newline at end of file
@@ -1,21 +1,29 @@
 from typing import List
 from ninja import Router
 
+from core.db.routers import reads_from_replica
+
 from api.schemas.category import CategoryOut, CategoryCreate, CategoryUpdate
 from api.services.category_service import CategoryService
+from api.http_cache import acached_menu_response
 
 # カテゴリルーター
 category_router = Router(tags=["カテゴリ"])
 
 @category_router.get("", response=List[CategoryOut])
-def list_categories(request):
-    """カテゴリ一覧を取得"""
-    return CategoryService().get_active_categories()
+@reads_from_replica
+async def list_categories(request):
+    """カテゴリ一覧を取得（ETagによる条件付きGETに対応）"""
+    async def load_categories():
+        categories = await CategoryService().aget_active_categories()
+        return [CategoryOut.from_orm(category).dict() for category in categories]
+    
+    return await acached_menu_response(request, 'categories', load_categories)
 
 @category_router.get("/{category_id}", response=CategoryOut)
-def get_category(request, category_id: int):
+async def get_category(request, category_id: int):
     """カテゴリ詳細を取得"""
-    return CategoryService().get_category_by_id(category_id)
+    return await CategoryService().aget_category_by_id(category_id)
 
 @category_router.post("", response={201: CategoryOut})
 def create_category(request, payload: CategoryCreate):
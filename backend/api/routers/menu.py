@@ -0,0 +1,17 @@
+from typing import List
+from ninja import Router
+
+from core.db.routers import reads_from_replica
+
+from api.schemas.menu import MenuCategoryOut
+from api.services.menu_service import MenuService
+from api.http_cache import cached_menu_response
+
+# メニュールーター
+menu_router = Router(tags=["メニュー"])
+
+@menu_router.get("", response=List[MenuCategoryOut])
+@reads_from_replica
+def get_menu(request):
+    """有効なカテゴリと販売可能な商品をまとめて取得（ETagによる条件付きGETに対応）"""
+    return cached_menu_response(request, 'menu', lambda: MenuService().get_menu())
\ No newline at end of file
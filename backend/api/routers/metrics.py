@@ -0,0 +1,19 @@
+from typing import List
+from ninja import Router
+
+from api.schemas.metrics import DBPoolStatsOut, MenuCacheStatsOut
+from api.services.menu_cache import menu_cache
+from core.db.pool import all_pools
+
+# メトリクスルーター
+metrics_router = Router(tags=["メトリクス"])
+
+@metrics_router.get("/menu-cache", response=MenuCacheStatsOut)
+def get_menu_cache_stats(request):
+    """このプロセスのメニューキャッシュの統計情報を取得"""
+    return menu_cache.stats()
+
+@metrics_router.get("/db-pool", response=List[DBPoolStatsOut])
+def get_db_pool_stats(request):
+    """このプロセスのDB接続プールの統計情報を取得（待機回数・上限到達回数など）"""
+    return [pool.stats() for pool in all_pools()]
\ No newline at end of file
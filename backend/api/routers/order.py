@@ -1,27 +1,163 @@
-from typing import List
-from ninja import Router
+from datetime import date, datetime
+from typing import List, Literal
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from ninja import Query, Router
+from ninja.errors import HttpError
 
-from api.schemas.order import OrderOut, OrderCreate, OrderUpdate
+from core.db.routers import reads_from_replica
+
+from api.api_config import api
+from api.schemas.order import (
+    OrderOut, OrderChangesOut, OrderCreate, OrderUpdate, OrderBatchCreate, OrderBatchResult,
+    OrderTicketOut,
+)
 from api.services.order_service import OrderService
+from api.services.order_event_service import OrderEventService
+from api.services.order_export_service import OrderExportService
+from api.services.idempotency_service import IdempotencyService
+from api.services.order_ingestion_service import OrderIngestionService
 
 # 注文ルーター
 order_router = Router(tags=["注文"])
 
 @order_router.get("", response=List[OrderOut])
-def list_orders(request, table_number: int = None):
-    """注文一覧を取得"""
-    if table_number:
-        return OrderService().get_orders_by_table(table_number)
-    return OrderService().get_all_orders()
+@reads_from_replica
+async def list_orders(
+    request,
+    response: HttpResponse,
+    table_number: int = None,
+    status: List[str] = Query(None),
+    created_from: datetime = None,
+    created_to: datetime = None,
+    cursor: str = None,
+    limit: int = Query(None, ge=1),
+):
+    """注文一覧を新しい順に取得（次ページのカーソルは X-Next-Cursor ヘッダーで返す）"""
+    orders, next_cursor = await OrderService().aget_orders_page_data(
+        statuses=status,
+        table_number=table_number,
+        created_from=created_from,
+        created_to=created_to,
+        cursor=cursor,
+        limit=limit,
+    )
+    if next_cursor:
+        response['X-Next-Cursor'] = next_cursor
+    # OrderOutと同じ構造の辞書を組み立て済みのため、スキーマの検証を通さずにそのままレンダリングする
+    return api.create_response(request, orders, temporal_response=response)
+
+# 固定パスのエンドポイントは "/{order_id}" より前に定義する
+@order_router.post("/batch", response=List[OrderBatchResult])
+def create_orders(request, payload: OrderBatchCreate):
+    """注文を一括作成（再接続時に端末で保留していた注文の送信用）"""
+    orders_data = [
+        {
+            'table_number': order.table_number,
+            'status': order.status,
+            'items': [item.dict() for item in order.items]
+        }
+        for order in payload.orders
+    ]
+    
+    results = OrderService().create_orders(orders_data)
+    return [
+        {
+            'index': index,
+            'success': result['order'] is not None,
+            'order': result['order'],
+            'detail': result['detail'],
+        }
+        for index, result in enumerate(results)
+    ]
+
+@order_router.get("/changes", response=OrderChangesOut)
+def list_order_changes(
+    request,
+    since: str = None,
+    limit: int = Query(None, ge=1),
+    wait: float = Query(None, ge=0),
+):
+    """
+    前回のトークン以降に作成・更新された注文を取得（差分同期）
+    
+    waitを指定すると、変更があるかwait秒が経過するまで応答を待機する（ロングポーリング）
+    """
+    orders, next_token, has_more = OrderService().get_order_changes(since=since, limit=limit, wait=wait)
+    return api.create_response(
+        request,
+        {'orders': orders, 'next_token': next_token, 'has_more': has_more},
+        status=200
+    )
+
+@order_router.get("/events")
+def order_events(request, last_event_id: int = None):
+    """
+    注文の作成・ステータス変更イベントをServer-Sent Eventsで配信（キッチン画面用）
+    
+    再接続時は Last-Event-ID ヘッダー（またはlast_event_idパラメータ）の次のイベントから再開する
+    """
+    header = request.headers.get('Last-Event-ID')
+    if header:
+        try:
+            last_event_id = int(header)
+        except ValueError:
+            raise HttpError(400, "Last-Event-IDが不正です")
+    
+    stream = OrderEventService().open_stream(last_event_id)
+    # ASGIでは待機中にワーカーを占有しない非同期イテレーターで送信する
+    response = StreamingHttpResponse(
+        stream if isinstance(request, ASGIRequest) else iter(stream),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # リバースプロキシでのバッファリングを無効化
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+@order_router.get("/export")
+def export_orders(
+    request,
+    export_format: Literal['ndjson', 'csv'] = Query('ndjson', alias='format'),
+    date_from: date = None,
+    date_to: date = None,
+    status: List[str] = Query(None),
+    gzip: bool = True,
+):
+    """
+    注文履歴をNDJSONまたはCSVでストリーミング出力（会計システムへの連携用。既定はgzip圧縮）
+    
+    date_from・date_to は作成日（両端を含む）。アーカイブ済みの注文も含む
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HttpError(400, "date_fromはdate_to以前の日付を指定してください")
+    
+    service = OrderExportService()
+    stream = service.export(export_format, date_from, date_to, status, compress=gzip)
+    # ASGIでは1チャンクずつ送信する非同期イテレーターを渡す（同期イテレーターは全体を読み込んでから送信される。
+    # StreamingHttpResponse は同期イテレーターを優先するため、__aiter__() の戻り値を渡す）
+    response = StreamingHttpResponse(
+        stream.__aiter__() if isinstance(request, ASGIRequest) else iter(stream),
+        content_type=service.get_content_type(export_format, gzip)
+    )
+    filename = service.get_filename(export_format, gzip, date_from, date_to)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+@order_router.get("/tickets/{ticket}", response=OrderTicketOut)
+def get_order_ticket(request, ticket: str):
+    """注文の受付チケットの状態を取得（ジャーナルモード）"""
+    return OrderIngestionService().get_ticket(ticket)
 
 @order_router.get("/{order_id}", response=OrderOut)
-def get_order(request, order_id: int):
+async def get_order(request, order_id: int):
     """注文詳細を取得"""
-    return OrderService().get_order_by_id(order_id)
+    return await OrderService().aget_order_by_id(order_id)
 
-@order_router.post("", response={201: OrderOut})
+@order_router.post("", response={201: OrderOut, 202: OrderTicketOut})
 def create_order(request, payload: OrderCreate):
-    """注文を作成"""
+    """注文を作成（ジャーナルモードでは受付チケットを返す）"""
     # OrderCreateスキーマをディクショナリに変換
     order_data = {
         'table_number': payload.table_number,
@@ -29,6 +165,21 @@ def create_order(request, payload: OrderCreate):
         'items': [item.dict() for item in payload.items]
     }
     
+    idempotency_key = request.headers.get('Idempotency-Key')
+    
+    # ジャーナルモードでは追記のみ行い、MySQLへの反映はバックグラウンドで行う
+    # （Idempotency-Keyが指定された場合はチケットとして使い、再送時は同じチケットを返す）
+    if settings.ORDER_INGESTION_MODE == 'journal':
+        return 202, OrderIngestionService().enqueue(order_data, ticket=idempotency_key)
+    
+    # Idempotency-Keyが指定された場合は、再送時に保存済みのレスポンスを返す
+    if idempotency_key:
+        return IdempotencyService().execute(
+            idempotency_key,
+            order_data,
+            lambda: (201, OrderOut.from_orm(OrderService().create_order(order_data)).dict()),
+        )
+    
     order = OrderService().create_order(order_data)
     return 201, order
 
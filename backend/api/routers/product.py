@@ -1,23 +1,43 @@
 from typing import List
-from ninja import Router
+from django.conf import settings
+from ninja import Query, Router
 
-from api.schemas.product import ProductOut, ProductCreate, ProductUpdate
+from core.db.routers import reads_from_replica
+
+from api.schemas.product import ProductOut, ProductCreate, ProductUpdate, ProductRecommendationOut
 from api.services.product_service import ProductService
+from api.services.recommendation_service import RecommendationService
+from api.http_cache import acached_menu_response
 
 # 商品ルーター
 product_router = Router(tags=["商品"])
 
 @product_router.get("", response=List[ProductOut])
-def list_products(request, category_id: int = None):
-    """商品一覧を取得"""
-    if category_id:
-        return ProductService().get_products_by_category(category_id)
-    return ProductService().get_all_products()
+@reads_from_replica
+async def list_products(request, category_id: int = None):
+    """商品一覧を取得（ETagによる条件付きGETに対応）"""
+    async def load_products():
+        if category_id:
+            products = await ProductService().aget_products_by_category(category_id)
+        else:
+            products = await ProductService().aget_all_products()
+        return [ProductOut.from_orm(product).dict() for product in products]
+    
+    return await acached_menu_response(request, ('products', category_id), load_products)
 
 @product_router.get("/{product_id}", response=ProductOut)
-def get_product(request, product_id: int):
+async def get_product(request, product_id: int):
     """商品詳細を取得"""
-    return ProductService().get_product_by_id(product_id)
+    return await ProductService().aget_product_by_id(product_id)
+
+@product_router.get("/{product_id}/recommendations", response=List[ProductRecommendationOut])
+async def get_product_recommendations(
+    request,
+    product_id: int,
+    limit: int = Query(5, ge=1, le=settings.RECOMMENDATION_MAX_RESULTS),
+):
+    """商品と一緒に注文されている販売可能な商品を取得（プロセス内のインデックスから返す）"""
+    return await RecommendationService().aget_recommendations(product_id, limit)
 
 @product_router.post("", response={201: ProductOut})
 def create_product(request, payload: ProductCreate):
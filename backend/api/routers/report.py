@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+from typing import List
+from django.conf import settings
+from django.utils import timezone
+from ninja import Query, Router
+from ninja.errors import HttpError
+
+from core.db.routers import reads_from_replica
+
+from api.schemas.report import (
+    DailySalesOut, HourlySalesOut, TableSalesOut, ProductSalesOut, DemandAnalyticsOut,
+)
+from api.services.order_analytics_service import OrderAnalyticsService
+from api.services.sales_rollup_service import SalesRollupService
+
+# レポートルーター（売上レポートは売上集計のみから作成し、注文テーブルは走査しない）
+report_router = Router(tags=["レポート"])
+
+@report_router.get("/sales/daily", response=List[DailySalesOut])
+@reads_from_replica
+def get_daily_sales(request, date_from: date = None, date_to: date = None):
+    """日別の売上を取得（期間の省略時は今日）"""
+    return SalesRollupService().get_daily_sales(date_from, date_to)
+
+@report_router.get("/sales/hourly", response=List[HourlySalesOut])
+@reads_from_replica
+def get_hourly_sales(request, date_from: date = None, date_to: date = None):
+    """時間帯別の売上を取得（期間の省略時は今日）"""
+    return SalesRollupService().get_hourly_sales(date_from, date_to)
+
+@report_router.get("/sales/tables", response=List[TableSalesOut])
+@reads_from_replica
+def get_table_sales(request, date_from: date = None, date_to: date = None):
+    """テーブル別の売上を取得（期間の省略時は今日）"""
+    return SalesRollupService().get_table_sales(date_from, date_to)
+
+@report_router.get("/sales/products", response=List[ProductSalesOut])
+@reads_from_replica
+def get_product_sales(request, date_from: date = None, date_to: date = None):
+    """商品別の売上を売上の多い順に取得（期間の省略時は今日）"""
+    return SalesRollupService().get_product_sales(date_from, date_to)
+
+@report_router.get("/analytics", response=DemandAnalyticsOut)
+@reads_from_replica
+def get_demand_analytics(
+    request,
+    date_from: date = None,
+    date_to: date = None,
+    top: int = Query(20, ge=1),
+):
+    """
+    商品の人気順位・曜日と時間帯別の需要・カテゴリ別の売上構成比を取得
+    
+    date_from・date_to は作成日（両端を含む。省略時は今日までの ORDER_ANALYTICS_MAX_DAYS 日間）。
+    アーカイブ済みの注文を含み、キャンセルされた注文を除く。
+    期間は ORDER_ANALYTICS_MAX_DAYS 日以内とし、それより長い期間は analyze_demand コマンドで分析する
+    """
+    max_days = settings.ORDER_ANALYTICS_MAX_DAYS
+    date_to = date_to or timezone.localdate()
+    date_from = date_from or date_to - timedelta(days=max_days - 1)
+    if date_from > date_to:
+        raise HttpError(400, "date_fromはdate_to以前の日付を指定してください")
+    if (date_to - date_from).days >= max_days:
+        raise HttpError(422, f"期間は{max_days}日以内で指定してください（長い期間はanalyze_demandコマンドで分析できます）")
+    return OrderAnalyticsService().analyze(date_from, date_to, top=top)
\ No newline at end of file
@@ -1,13 +1,27 @@
 from .common import ErrorResponse
 from .category import CategoryBase, CategoryCreate, CategoryUpdate, CategoryOut
-from .product import ProductBase, ProductCreate, ProductUpdate, ProductOut
+from .product import ProductBase, ProductCreate, ProductUpdate, ProductOut, ProductRecommendationOut
 from .order_item import OrderItemBase, OrderItemCreate, OrderItemOut
-from .order import OrderBase, OrderCreate, OrderUpdate, OrderOut
+from .order import (
+    OrderBase, OrderCreate, OrderUpdate, OrderOut, OrderChangesOut, OrderBatchCreate,
+    OrderBatchResult, OrderTicketOut,
+)
+from .menu import MenuProductOut, MenuCategoryOut
+from .metrics import MenuCacheStatsOut, DBPoolStatsOut
+from .report import (
+    DailySalesOut, HourlySalesOut, TableSalesOut, ProductSalesOut, ProductRankingOut, CategoryShareOut,
+    DemandAnalyticsOut,
+)
 
 __all__ = [
     'ErrorResponse',
     'CategoryBase', 'CategoryCreate', 'CategoryUpdate', 'CategoryOut',
-    'ProductBase', 'ProductCreate', 'ProductUpdate', 'ProductOut',
+    'ProductBase', 'ProductCreate', 'ProductUpdate', 'ProductOut', 'ProductRecommendationOut',
     'OrderItemBase', 'OrderItemCreate', 'OrderItemOut',
-    'OrderBase', 'OrderCreate', 'OrderUpdate', 'OrderOut',
+    'OrderBase', 'OrderCreate', 'OrderUpdate', 'OrderOut', 'OrderChangesOut',
+    'OrderBatchCreate', 'OrderBatchResult', 'OrderTicketOut',
+    'MenuProductOut', 'MenuCategoryOut',
+    'MenuCacheStatsOut', 'DBPoolStatsOut',
+    'DailySalesOut', 'HourlySalesOut', 'TableSalesOut', 'ProductSalesOut',
+    'ProductRankingOut', 'CategoryShareOut', 'DemandAnalyticsOut',
 ]
\ No newline at end of file
@@ -0,0 +1,19 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+# メニュースキーマ（端末が一度に読み込むための最小限の項目のみ）
+class MenuProductOut(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    price: int
+    image: Optional[str] = None
+
+
+class MenuCategoryOut(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    image: Optional[str] = None
+    products: List[MenuProductOut] = []
\ No newline at end of file
@@ -0,0 +1,31 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+# メニューキャッシュ統計スキーマ
+class MenuCacheStatsOut(BaseModel):
+    version: Optional[int] = None
+    entries: int
+    hits: int
+    misses: int
+    hit_rate: float
+    invalidations: int
+
+
+# DB接続プール統計スキーマ
+class DBPoolStatsOut(BaseModel):
+    alias: str
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    idle: int
+    max_in_use: int
+    checkouts: int
+    waits: int
+    wait_time_total_ms: float
+    max_wait_ms: float
+    exhaustions: int
+    connections_created: int
+    connections_closed: int
+    health_check_failures: int
\ No newline at end of file
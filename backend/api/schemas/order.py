@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from .order_item import OrderItemCreate, OrderItemOut
 
@@ -14,6 +14,10 @@ class OrderCreate(OrderBase):
     items: List[OrderItemCreate]
 
 
+class OrderBatchCreate(BaseModel):
+    orders: List[OrderCreate] = Field(..., min_items=1, max_items=100)
+
+
 class OrderUpdate(BaseModel):
     status: Optional[str] = None
 
@@ -43,4 +47,24 @@ class OrderOut(OrderBase):
                 # 明示的にリストに変換
                 items=[OrderItemOut.from_orm(item) for item in obj.items.all()]
             )
-        return super().from_orm(obj)
\ No newline at end of file
+        return super().from_orm(obj)
+
+
+class OrderChangesOut(BaseModel):
+    orders: List[OrderOut]
+    next_token: Optional[str] = None
+    has_more: bool = False
+
+
+class OrderBatchResult(BaseModel):
+    index: int
+    success: bool
+    order: Optional[OrderOut] = None
+    detail: Optional[str] = None
+
+
+class OrderTicketOut(BaseModel):
+    ticket: str
+    status: str
+    order_id: Optional[int] = None
+    detail: Optional[str] = None
\ No newline at end of file
@@ -34,4 +34,9 @@ class ProductOut(ProductBase):
     updated_at: datetime
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+# おすすめ商品スキーマ（一緒に注文された件数の多い順）
+class ProductRecommendationOut(ProductOut):
+    order_count: int
\ No newline at end of file
@@ -0,0 +1,66 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+# 日別売上スキーマ
+class DailySalesOut(BaseModel):
+    sales_date: date
+    order_count: int
+    quantity: int
+    revenue: int
+
+
+# 時間帯別売上スキーマ
+class HourlySalesOut(BaseModel):
+    hour: int
+    order_count: int
+    quantity: int
+    revenue: int
+
+
+# テーブル別売上スキーマ
+class TableSalesOut(BaseModel):
+    table_number: int
+    order_count: int
+    quantity: int
+    revenue: int
+
+
+# 商品別売上スキーマ
+class ProductSalesOut(BaseModel):
+    product_id: int
+    product_name: str
+    quantity: int
+    revenue: int
+
+
+# 商品の人気順位スキーマ
+class ProductRankingOut(BaseModel):
+    rank: int
+    product_id: int
+    product_name: str
+    quantity: int
+    revenue: int
+
+
+# カテゴリ別売上構成比スキーマ
+class CategoryShareOut(BaseModel):
+    category_id: int
+    category_name: str
+    revenue: int
+    share: float
+
+
+# 需要分析スキーマ
+class DemandAnalyticsOut(BaseModel):
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    item_count: int
+    total_quantity: int
+    total_revenue: int
+    products: List[ProductRankingOut]
+    categories: List[CategoryShareOut]
+    weekdays: List[str]
+    # 曜日（weekdays の順）× 時（0〜23）の数量
+    hour_of_week: List[List[int]]
\ No newline at end of file
@@ -0,0 +1,6 @@
+# シリアライザーパッケージ
+from .order import OrderSerializer, ArchivedOrderSerializer
+
+__all__ = [
+    'OrderSerializer', 'ArchivedOrderSerializer',
+]
\ No newline at end of file
@@ -0,0 +1,147 @@
+from typing import Any, Dict, List
+from django.db.models import QuerySet
+
+from api.dao.archived_order_dao import ArchivedOrderDAO
+from api.dao.order_item_dao import OrderItemDAO
+from api.dao.product_dao import ProductDAO
+
+
+class OrderSerializer:
+    """
+    注文をレスポンス用の辞書に変換するシリアライザー
+    
+    モデルインスタンスやpydanticオブジェクトを経由せず、values() で取得した行から
+    OrderOut と同じ構造（同じキーと順序）の辞書を組み立てる
+    """
+    
+    # キーの順序は OrderOut / OrderItemOut / ProductOut のフィールド順に合わせる
+    ORDER_FIELDS = ('table_number', 'status', 'id', 'total_price', 'created_at', 'updated_at')
+    ITEM_FIELDS = ('order_id', 'product_id', 'quantity', 'id', 'price', 'created_at')
+    PRODUCT_FIELDS = (
+        'name', 'description', 'price', 'image', 'is_available', 'order', 'category_id',
+        'id', 'created_at', 'updated_at',
+    )
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.order_item_dao = OrderItemDAO()
+        self.product_dao = ProductDAO()
+    
+    def serialize(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        注文の行に注文明細と商品を入れ子にして、レスポンス用の辞書に変換
+        
+        注文明細と商品はそれぞれ1クエリで取得する（非同期版は aserialize）
+        
+        Args:
+            orders: ORDER_FIELDS を values() で取得した注文の行
+            
+        Returns:
+            OrderOut と同じ構造の辞書のリスト
+        """
+        if not orders:
+            return []
+        items = list(self._items_query(orders))
+        products = list(self._products_query(items))
+        return self._assemble(orders, items, products)
+    
+    async def aserialize(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        注文の行に注文明細と商品を入れ子にして、レスポンス用の辞書に変換（非同期版）
+        
+        Args:
+            orders: ORDER_FIELDS を values() で取得した注文の行
+            
+        Returns:
+            OrderOut と同じ構造の辞書のリスト
+        """
+        if not orders:
+            return []
+        items = [item async for item in self._items_query(orders)]
+        products = [product async for product in self._products_query(items)]
+        return self._assemble(orders, items, products)
+    
+    def _items_query(self, orders: List[Dict[str, Any]]) -> QuerySet:
+        """
+        注文の注文明細を取得するQuerySetを作成
+        
+        Args:
+            orders: 注文の行
+            
+        Returns:
+            ITEM_FIELDS の値のQuerySet
+        """
+        return self.order_item_dao.get_items_by_orders(
+            order['id'] for order in orders
+        ).values(*self.ITEM_FIELDS)
+    
+    def _products_query(self, items: List[Dict[str, Any]]) -> QuerySet:
+        """
+        注文明細の商品を取得するQuerySetを作成
+        
+        Args:
+            items: 注文明細の行
+            
+        Returns:
+            PRODUCT_FIELDS の値のQuerySet
+        """
+        return self.product_dao.filter_by_ids(
+            {item['product_id'] for item in items}
+        ).values(*self.PRODUCT_FIELDS)
+    
+    def _assemble(
+        self, orders: List[Dict[str, Any]], items: List[Dict[str, Any]], products: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        注文・注文明細・商品の行を入れ子の辞書に組み立てる
+        
+        Args:
+            orders: 注文の行
+            items: 注文明細の行
+            products: 商品の行
+            
+        Returns:
+            OrderOut と同じ構造の辞書のリスト
+        """
+        results = []
+        items_by_order = {}
+        for order in orders:
+            order = dict(order, total_price=int(order['total_price']), items=[])
+            items_by_order[order['id']] = order['items']
+            results.append(order)
+        
+        products_by_id = {}
+        for product in products:
+            product['price'] = int(product['price'])
+            products_by_id[product['id']] = product
+        
+        for item in items:
+            item['price'] = int(item['price'])
+            item['product'] = products_by_id[item['product_id']]
+            items_by_order[item.pop('order_id')].append(item)
+        return results
+
+
+class ArchivedOrderSerializer(OrderSerializer):
+    """
+    アーカイブ済み注文をレスポンス用の辞書に変換するシリアライザー（OrderSerializer と同じ構造）
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        super().__init__()
+        self.archived_order_dao = ArchivedOrderDAO()
+    
+    def _items_query(self, orders: List[Dict[str, Any]]) -> QuerySet:
+        """
+        アーカイブ済み注文の注文明細を取得するQuerySetを作成
+        
+        Args:
+            orders: アーカイブ済み注文の行
+            
+        Returns:
+            ITEM_FIELDS の値のQuerySet
+        """
+        return self.archived_order_dao.get_items_by_orders(
+            order['id'] for order in orders
+        ).values(*self.ITEM_FIELDS)
\ No newline at end of file
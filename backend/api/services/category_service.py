@@ -3,6 +3,7 @@ from django.db.models import QuerySet
 
 from core.models import Category
 from api.dao.category_dao import CategoryDAO
+from api.services.menu_cache import menu_cache
 
 
 class CategoryService:
@@ -23,14 +24,29 @@ class CategoryService:
         """
         return self.category_dao.get_all()
     
-    def get_active_categories(self) -> QuerySet[Category]:
+    def get_active_categories(self) -> List[Category]:
         """
-        有効なカテゴリのみを取得
+        有効なカテゴリのみを取得（メニューキャッシュを使用）
         
         Returns:
-            有効なカテゴリのQuerySet
+            有効なカテゴリのリスト
         """
-        return self.category_dao.get_active_categories()
+        return menu_cache.get(
+            'active_categories',
+            lambda: list(self.category_dao.get_active_categories())
+        )
+    
+    async def aget_active_categories(self) -> List[Category]:
+        """
+        有効なカテゴリのみを取得（非同期版、メニューキャッシュを使用）
+        
+        Returns:
+            有効なカテゴリのリスト
+        """
+        async def load_categories() -> List[Category]:
+            return [category async for category in self.category_dao.get_active_categories()]
+        
+        return await menu_cache.aget('active_categories', load_categories)
     
     def get_category_by_id(self, category_id: int) -> Category:
         """
@@ -44,6 +60,18 @@ class CategoryService:
         """
         return self.category_dao.get_by_id(category_id)
     
+    async def aget_category_by_id(self, category_id: int) -> Category:
+        """
+        IDによるカテゴリ取得（非同期版）
+        
+        Args:
+            category_id: カテゴリID
+            
+        Returns:
+            指定されたIDのカテゴリ
+        """
+        return await self.category_dao.aget_by_id(category_id)
+    
     def create_category(self, data: Dict[str, Any]) -> Category:
         """
         カテゴリの作成
@@ -0,0 +1,176 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from core.models import IdempotencyKey
+from api.dao.idempotency_key_dao import IdempotencyKeyDAO
+
+
+class IdempotencyService:
+    """
+    冪等キーによるリクエストの重複排除を提供するサービスクラス
+    
+    同じキーで再送されたリクエストには、処理を再実行せず
+    保存済みのレスポンスを返す
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.idempotency_key_dao = IdempotencyKeyDAO()
+    
+    def execute(
+        self,
+        key: str,
+        request_data: Any,
+        handler: Callable[[], Tuple[int, Dict[str, Any]]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        冪等キー付きで処理を実行
+        
+        Args:
+            key: 冪等キー
+            request_data: リクエストデータ（同じキーで異なる内容が送られていないかの確認に使う）
+            handler: 処理本体。(ステータスコード, レスポンスボディ) を返す
+            
+        Returns:
+            (ステータスコード, レスポンスボディ)
+            
+        Raises:
+            HttpError: キーが不正な場合、または同じキーで異なるリクエストが送られた場合
+        """
+        if len(key) > 255:
+            raise HttpError(400, "Idempotency-Keyは255文字以内で指定してください")
+        
+        request_hash = self._hash_request(request_data)
+        
+        # 保存済みのレスポンスがあればそのまま返す
+        stored = self.idempotency_key_dao.get_valid_key(key)
+        if stored:
+            return self._replay(stored, request_hash)
+        
+        try:
+            return self._execute_and_store(key, request_hash, handler)
+        except IntegrityError:
+            stored = self.idempotency_key_dao.get_valid_key(key)
+            if stored is not None:
+                # 同じキーのリクエストが並行して処理された場合は、先に保存された結果を返す
+                return self._replay(stored, request_hash)
+            # 期限切れのキーが削除前（purge_idempotency_keys の実行前）で残っている場合は、削除して処理し直す
+            if not self.idempotency_key_dao.delete_expired(keys=[key]):
+                raise
+            return self._execute_and_store(key, request_hash, handler)
+    
+    def _execute_and_store(
+        self,
+        key: str,
+        request_hash: str,
+        handler: Callable[[], Tuple[int, Dict[str, Any]]]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        処理本体とキーの保存を同一トランザクションで行う
+        
+        Args:
+            key: 冪等キー
+            request_hash: リクエストのハッシュ
+            handler: 処理本体。(ステータスコード, レスポンスボディ) を返す
+            
+        Returns:
+            (ステータスコード, レスポンスボディ)
+            
+        Raises:
+            IntegrityError: 同じキーが既に保存されている場合
+        """
+        with transaction.atomic():
+            status_code, response_body = handler()
+            self.idempotency_key_dao.create(
+                key=key,
+                request_hash=request_hash,
+                status_code=status_code,
+                response_body=response_body,
+                expires_at=timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+            )
+        return status_code, response_body
+    
+    def get_stored_responses(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        複数の冪等キーの保存済みレスポンスを一括取得
+        
+        Args:
+            keys: 冪等キーのリスト
+            
+        Returns:
+            冪等キーをキーとしたレスポンスボディの辞書（保存済みのもののみ）
+        """
+        return {
+            stored.key: stored.response_body
+            for stored in self.idempotency_key_dao.get_valid_keys(keys)
+        }
+    
+    def store_responses(self, responses: List[Tuple[str, Any, int, Dict[str, Any]]]) -> None:
+        """
+        複数のレスポンスを一括保存
+        
+        呼び出し側のトランザクション内で実行し、処理結果と同時にコミットすること
+        
+        Args:
+            responses: (冪等キー, リクエストデータ, ステータスコード, レスポンスボディ) のリスト
+        """
+        expires_at = timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+        # 保存するキーのうち、期限切れで削除前のものだけを削除する
+        self.idempotency_key_dao.delete_expired(keys=[key for key, _, _, _ in responses])
+        self.idempotency_key_dao.bulk_create_keys([
+            IdempotencyKey(
+                key=key,
+                request_hash=self._hash_request(request_data),
+                status_code=status_code,
+                response_body=response_body,
+                expires_at=expires_at,
+            )
+            for key, request_data, status_code, response_body in responses
+        ])
+    
+    def purge_expired(self) -> int:
+        """
+        有効期限切れの冪等キーを削除（定期実行用。期限切れのキーは削除前も参照されない）
+        
+        Returns:
+            削除件数
+        """
+        return self.idempotency_key_dao.delete_expired()
+    
+    def _replay(self, stored, request_hash: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        保存済みのレスポンスを返す
+        
+        Args:
+            stored: 冪等キー
+            request_hash: 今回のリクエストのハッシュ
+            
+        Returns:
+            (ステータスコード, レスポンスボディ)
+            
+        Raises:
+            HttpError: 同じキーで異なるリクエストが送られた場合
+        """
+        if stored.request_hash != request_hash:
+            raise HttpError(422, "同じIdempotency-Keyで異なるリクエストが送信されました")
+        return stored.status_code, stored.response_body
+    
+    def _hash_request(self, request_data: Any) -> str:
+        """
+        リクエストデータのハッシュを計算
+        
+        Args:
+            request_data: リクエストデータ
+            
+        Returns:
+            SHA-256ハッシュ（16進数）
+        """
+        payload = json.dumps(request_data, sort_keys=True, cls=DjangoJSONEncoder)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
\ No newline at end of file
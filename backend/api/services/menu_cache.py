@@ -0,0 +1,228 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from django.conf import settings
+
+from core.db.routers import primary_reads
+from api.dao.menu_version_dao import MenuVersionDAO
+
+
+class MenuCache:
+    """
+    メニュー（カテゴリ・商品）のプロセス内キャッシュ
+    
+    DBに保存したメニューバージョンを定期的に確認し、
+    他のプロセスで更新された場合もキャッシュを破棄する。
+    共有キャッシュサーバーは使用しない。
+    
+    メニューバージョンはプライマリから確認し、読み取りレプリカがそのバージョンに追いついていない場合は
+    データもプライマリから読み込む（遅れているレプリカの古いメニューをキャッシュしないため）。
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Any] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        # invalidate() のたびに加算し、読み込み中に破棄されたデータを格納しないようにする
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get(self, key: Hashable, loader: Callable[[], Any], check_version: bool = True) -> Any:
+        """
+        キャッシュからデータを取得（存在しない場合は読み込んで格納）
+        
+        Args:
+            key: キャッシュキー
+            loader: キャッシュにない場合にデータを読み込む関数
+            check_version: メニューバージョンを確認するかどうか
+                （直前に get_version() を呼び出した場合はFalseにする）
+            
+        Returns:
+            キャッシュされたデータ
+        """
+        if check_version:
+            self.get_version()
+        found, value, generation = self._lookup(key)
+        if found:
+            return value
+        if settings.DATABASE_REPLICAS and self._is_behind(MenuVersionDAO().get_version(primary=False)):
+            with primary_reads():
+                return self._store(key, loader(), generation)
+        return self._store(key, loader(), generation)
+    
+    async def aget(self, key: Hashable, loader: Callable[[], Awaitable[Any]], check_version: bool = True) -> Any:
+        """
+        キャッシュからデータを取得（非同期版。loaderはコルーチン関数）
+        
+        Args:
+            key: キャッシュキー
+            loader: キャッシュにない場合にデータを読み込むコルーチン関数
+            check_version: メニューバージョンを確認するかどうか
+                （直前に aget_version() を呼び出した場合はFalseにする）
+            
+        Returns:
+            キャッシュされたデータ
+        """
+        if check_version:
+            await self.aget_version()
+        found, value, generation = self._lookup(key)
+        if found:
+            return value
+        if settings.DATABASE_REPLICAS and self._is_behind(await MenuVersionDAO().aget_version(primary=False)):
+            with primary_reads():
+                return self._store(key, await loader(), generation)
+        return self._store(key, await loader(), generation)
+    
+    def get_version(self) -> int:
+        """
+        メニューバージョンを取得
+        
+        前回の確認から MENU_CACHE_VERSION_CHECK_INTERVAL 秒以上経過している場合のみプライマリを参照し、
+        バージョンが変わっていればキャッシュを破棄する
+        
+        Returns:
+            メニューバージョン
+        """
+        now = time.monotonic()
+        version, generation = self._cached_version(now)
+        if version is not None:
+            return version
+        return self._apply_version(MenuVersionDAO().get_version(), generation, now)
+    
+    async def aget_version(self) -> int:
+        """
+        メニューバージョンを取得（非同期版）
+        
+        Returns:
+            メニューバージョン
+        """
+        now = time.monotonic()
+        version, generation = self._cached_version(now)
+        if version is not None:
+            return version
+        return self._apply_version(await MenuVersionDAO().aget_version(), generation, now)
+    
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any, int]:
+        """
+        キャッシュを検索し、ヒット・ミスを記録
+        
+        Args:
+            key: キャッシュキー
+            
+        Returns:
+            (ヒットしたかどうか, キャッシュされたデータ, 検索時の世代)
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return True, self._entries[key], self._generation
+            self.misses += 1
+            return False, None, self._generation
+    
+    def _is_behind(self, read_version: int) -> bool:
+        """
+        読み取り先（レプリカ）のメニューバージョンが確認済みのバージョンより古いかどうか
+        
+        Args:
+            read_version: ルーターの振り分けに従って読み取ったメニューバージョン
+            
+        Returns:
+            古い場合はTrue
+        """
+        with self._lock:
+            return self._version is not None and read_version < self._version
+    
+    def _store(self, key: Hashable, value: Any, generation: int) -> Any:
+        """
+        読み込んだデータを格納（読み込み中に破棄された場合は格納しない）
+        
+        Args:
+            key: キャッシュキー
+            value: 読み込んだデータ
+            generation: 検索時の世代
+            
+        Returns:
+            読み込んだデータ
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = value
+        return value
+    
+    def _cached_version(self, now: float) -> Tuple[Optional[int], int]:
+        """
+        確認間隔内であれば確認済みのメニューバージョンを取得
+        
+        Args:
+            now: 現在時刻（time.monotonic()）
+            
+        Returns:
+            (確認済みのバージョン。DBの確認が必要な場合はNone, 現在の世代)
+        """
+        with self._lock:
+            if self._version is not None and now - self._checked_at < settings.MENU_CACHE_VERSION_CHECK_INTERVAL:
+                return self._version, self._generation
+            return None, self._generation
+    
+    def _apply_version(self, version: int, generation: int, now: float) -> int:
+        """
+        DBから取得したメニューバージョンを反映し、変わっていればキャッシュを破棄
+        
+        Args:
+            version: DBのメニューバージョン
+            generation: 確認開始時の世代
+            now: 確認開始時刻（time.monotonic()）
+            
+        Returns:
+            メニューバージョン
+        """
+        with self._lock:
+            if generation != self._generation:
+                # 確認中に破棄された場合は次回もDBを確認する
+                return version
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = now
+        return version
+    
+    def invalidate(self) -> None:
+        """キャッシュを破棄し、次回アクセス時にメニューバージョンを確認し直す"""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._generation += 1
+            self.invalidations += 1
+    
+    def reset_stats(self) -> None:
+        """ヒット・ミスの件数をリセット"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        キャッシュの統計情報を取得
+        
+        Returns:
+            統計情報
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'version': self._version,
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'invalidations': self.invalidations,
+            }
+
+
+# プロセス全体で共有するメニューキャッシュ
+menu_cache = MenuCache()
\ No newline at end of file
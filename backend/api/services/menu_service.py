@@ -0,0 +1,48 @@
+from typing import Any, Dict, List
+
+from api.dao.category_dao import CategoryDAO
+from api.dao.product_dao import ProductDAO
+from api.services.menu_cache import menu_cache
+
+
+class MenuService:
+    """
+    メニュー全体（カテゴリと商品）に関するビジネスロジックを提供するサービスクラス
+    """
+    
+    CATEGORY_FIELDS = ('id', 'name', 'description', 'image')
+    PRODUCT_FIELDS = ('id', 'category_id', 'name', 'description', 'price', 'image')
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.category_dao = CategoryDAO()
+        self.product_dao = ProductDAO()
+    
+    def get_menu(self) -> List[Dict[str, Any]]:
+        """
+        有効なカテゴリと、カテゴリごとの販売可能な商品を取得（メニューキャッシュを使用）
+        
+        Returns:
+            商品を入れ子にしたカテゴリのリスト
+        """
+        return menu_cache.get('menu', self._load_menu)
+    
+    def _load_menu(self) -> List[Dict[str, Any]]:
+        """
+        カテゴリと商品をそれぞれ1クエリで取得し、入れ子の構造に組み立てる
+        
+        Returns:
+            商品を入れ子にしたカテゴリのリスト
+        """
+        categories = [
+            dict(category, products=[])
+            for category in self.category_dao.get_active_categories().values(*self.CATEGORY_FIELDS)
+        ]
+        categories_by_id = {category['id']: category for category in categories}
+        
+        for product in self.product_dao.get_menu_products().values(*self.PRODUCT_FIELDS):
+            category = categories_by_id.get(product.pop('category_id'))
+            if category is not None:
+                product['price'] = int(product['price'])
+                category['products'].append(product)
+        return categories
\ No newline at end of file
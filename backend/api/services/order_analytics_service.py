@@ -0,0 +1,270 @@
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from api.dao.archived_order_dao import ArchivedOrderDAO
+from api.dao.order_item_dao import OrderItemDAO
+from api.dao.product_dao import ProductDAO
+
+
+class OrderItemColumns(NamedTuple):
+    """注文明細の列（行ごとの値を列ごとの配列にまとめたもの）"""
+    product_id: np.ndarray
+    quantity: np.ndarray
+    price: np.ndarray
+    # 作成日時（UNIX時間の秒）
+    created_at: np.ndarray
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> 'OrderItemColumns':
+        """
+        DAOから取得した (商品ID, 数量, 価格, 作成日時, ...) のタプルのリストを列に変換
+        
+        Args:
+            rows: ANALYTICS_FIELDS の順の値のタプルのリスト
+        
+        Returns:
+            注文明細の列
+        """
+        count = len(rows)
+        return cls(
+            product_id=np.fromiter((row[0] for row in rows), dtype=np.int64, count=count),
+            quantity=np.fromiter((row[1] for row in rows), dtype=np.int64, count=count),
+            price=np.fromiter((int(row[2]) for row in rows), dtype=np.int64, count=count),
+            created_at=np.fromiter((row[3].timestamp() for row in rows), dtype=np.int64, count=count),
+        )
+
+
+class DemandAccumulator:
+    """
+    注文明細の列から商品別の数量・売上と、曜日・時間帯別の数量を集計
+    
+    集計はチャンクごとに bincount でまとめて行い、行ごとのPythonのループを使用しない。
+    商品別の集計は商品IDを添字とする配列に加算する。
+    """
+    
+    # 曜日（月曜始まり）。1970-01-01（UNIX時間の0日目）は木曜日
+    WEEKDAYS = ('月', '火', '水', '木', '金', '土', '日')
+    _EPOCH_WEEKDAY = 3
+    
+    def __init__(self, tz: Optional[Any] = None):
+        """
+        コンストラクタ
+        
+        Args:
+            tz: 曜日・時間帯を求めるタイムゾーン（省略時はTIME_ZONE）
+        """
+        self.tz = tz or timezone.get_current_timezone()
+        self.item_count = 0
+        self.product_quantity = np.zeros(0, dtype=np.int64)
+        self.product_revenue = np.zeros(0, dtype=np.int64)
+        # 曜日 × 時（0〜23）の数量
+        self.hour_of_week = np.zeros((7, 24), dtype=np.int64)
+        # UNIX時間の時（秒 // 3600）ごとのUTCからの時差（秒）
+        self._offsets: Dict[int, int] = {}
+    
+    def add(self, columns: OrderItemColumns) -> None:
+        """
+        注文明細の列を集計に加える
+        
+        Args:
+            columns: 注文明細の列
+        """
+        if not len(columns.product_id):
+            return
+        self.item_count += len(columns.product_id)
+        revenue = columns.quantity * columns.price
+        
+        size = max(len(self.product_quantity), int(columns.product_id.max()) + 1)
+        self.product_quantity = self._grow(self.product_quantity, size)
+        self.product_revenue = self._grow(self.product_revenue, size)
+        # bincount の重みは浮動小数点数になるため、整数に丸めて加算する
+        self.product_quantity += self._bincount(columns.product_id, columns.quantity, size)
+        self.product_revenue += self._bincount(columns.product_id, revenue, size)
+        
+        local = columns.created_at + self._utc_offsets(columns.created_at)
+        days, seconds = np.divmod(local, 86400)
+        slots = (days + self._EPOCH_WEEKDAY) % 7 * 24 + seconds // 3600
+        self.hour_of_week += self._bincount(slots, columns.quantity, 7 * 24).reshape(7, 24)
+    
+    def ranking(self, top: Optional[int] = None) -> List[Tuple[int, int, int]]:
+        """
+        数量の多い順の商品
+        
+        Args:
+            top: 取得する商品数（省略時はすべて）
+        
+        Returns:
+            (商品ID, 数量, 売上) のリスト（数量が同じ場合は売上の多い順）
+        """
+        product_ids = np.flatnonzero(self.product_quantity)
+        # lexsort は最後のキーを優先する
+        order = np.lexsort((product_ids, -self.product_revenue[product_ids], -self.product_quantity[product_ids]))
+        product_ids = product_ids[order][:top]
+        return [
+            (int(product_id), int(self.product_quantity[product_id]), int(self.product_revenue[product_id]))
+            for product_id in product_ids
+        ]
+    
+    def revenue_by_group(self, group_of_product: Dict[int, int]) -> Dict[int, int]:
+        """
+        商品のグループ（カテゴリなど）別の売上
+        
+        Args:
+            group_of_product: 商品IDをキーとしたグループID
+        
+        Returns:
+            グループIDをキーとした売上（グループが不明な商品は含まない）
+        """
+        groups = np.full(len(self.product_revenue), -1, dtype=np.int64)
+        for product_id, group_id in group_of_product.items():
+            if product_id < len(groups):
+                groups[product_id] = group_id
+        known = groups >= 0
+        if not known.any():
+            return {}
+        totals = self._bincount(groups[known], self.product_revenue[known], int(groups.max()) + 1)
+        return {int(group_id): int(totals[group_id]) for group_id in np.flatnonzero(totals)}
+    
+    def _utc_offsets(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        UNIX時間ごとのタイムゾーンの時差（秒）
+        
+        時差は時単位で変わるため、チャンク内の異なる時（数千程度）についてのみ計算する。
+        """
+        hours, inverse = np.unique(timestamps // 3600, return_inverse=True)
+        offsets = np.empty(len(hours), dtype=np.int64)
+        for index, hour in enumerate(hours.tolist()):
+            offset = self._offsets.get(hour)
+            if offset is None:
+                moment = datetime.fromtimestamp(hour * 3600, dt_timezone.utc)
+                offset = self._offsets[hour] = int(moment.astimezone(self.tz).utcoffset().total_seconds())
+            offsets[index] = offset
+        return offsets[inverse.reshape(-1)]
+    
+    @staticmethod
+    def _bincount(indices: np.ndarray, weights: np.ndarray, size: int) -> np.ndarray:
+        """添字ごとの重みの合計（整数）"""
+        return np.rint(np.bincount(indices, weights=weights, minlength=size)).astype(np.int64)
+    
+    @staticmethod
+    def _grow(values: np.ndarray, size: int) -> np.ndarray:
+        """配列を size まで0で延長"""
+        if len(values) >= size:
+            return values
+        return np.concatenate([values, np.zeros(size - len(values), dtype=values.dtype)])
+
+
+class OrderAnalyticsService:
+    """
+    注文明細の需要分析（商品の人気順位、曜日・時間帯別の需要、カテゴリ別の売上構成比）を提供するサービスクラス
+    
+    注文明細（アーカイブ済みを含み、キャンセルされた注文を除く）を ORDER_ANALYTICS_CHUNK_SIZE 件ずつ
+    NumPyの配列に読み込んで集計するため、メモリ使用量は期間の長さによらず一定になる。
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.order_item_dao = OrderItemDAO()
+        self.archived_order_dao = ArchivedOrderDAO()
+        self.product_dao = ProductDAO()
+    
+    def analyze(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        top: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        期間内の注文明細を分析
+        
+        Args:
+            date_from: 作成日の開始（この日を含む。TIME_ZONEの日付）
+            date_to: 作成日の終了（この日を含む）
+            top: 人気順位に含める商品数（省略時はすべて）
+            chunk_size: 1回に読み込む注文明細数（省略時はORDER_ANALYTICS_CHUNK_SIZE）
+        
+        Returns:
+            DemandAnalyticsOut と同じ構造の辞書
+        """
+        accumulator = DemandAccumulator()
+        for columns in self.iter_columns(date_from, date_to, chunk_size):
+            accumulator.add(columns)
+        
+        ranking = accumulator.ranking(top)
+        products = self.product_dao.filter_by_ids(
+            np.flatnonzero(accumulator.product_quantity).tolist()
+        ).values('id', 'name', 'category_id', 'category__name')
+        products = {product['id']: product for product in products}
+        category_names = {product['category_id']: product['category__name'] for product in products.values()}
+        category_revenue = accumulator.revenue_by_group(
+            {product_id: product['category_id'] for product_id, product in products.items()}
+        )
+        total_revenue = int(accumulator.product_revenue.sum())
+        
+        return {
+            'date_from': date_from,
+            'date_to': date_to,
+            'item_count': accumulator.item_count,
+            'total_quantity': int(accumulator.product_quantity.sum()),
+            'total_revenue': total_revenue,
+            'products': [
+                {
+                    'rank': rank,
+                    'product_id': product_id,
+                    'product_name': products[product_id]['name'] if product_id in products else '',
+                    'quantity': quantity,
+                    'revenue': revenue,
+                }
+                for rank, (product_id, quantity, revenue) in enumerate(ranking, start=1)
+            ],
+            'categories': [
+                {
+                    'category_id': category_id,
+                    'category_name': category_names[category_id],
+                    'revenue': revenue,
+                    'share': round(revenue / total_revenue, 4) if total_revenue else 0.0,
+                }
+                for category_id, revenue in sorted(category_revenue.items(), key=lambda item: (-item[1], item[0]))
+            ],
+            'weekdays': list(DemandAccumulator.WEEKDAYS),
+            'hour_of_week': accumulator.hour_of_week.tolist(),
+        }
+    
+    def iter_columns(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[OrderItemColumns]:
+        """
+        注文明細とアーカイブ済み注文明細を chunk_size 件ずつ列に変換して取得
+        
+        Args:
+            date_from: 作成日の開始（この日を含む）
+            date_to: 作成日の終了（この日を含む）
+            chunk_size: 1回に読み込む注文明細数
+        
+        Returns:
+            注文明細の列のイテレーター
+        """
+        chunk_size = chunk_size or settings.ORDER_ANALYTICS_CHUNK_SIZE
+        created_from = self._start_of_day(date_from) if date_from else None
+        created_to = self._start_of_day(date_to + timedelta(days=1)) if date_to else None
+        for dao in (self.order_item_dao, self.archived_order_dao):
+            after_id = 0
+            while True:
+                rows = dao.get_item_rows_after(after_id, chunk_size, created_from, created_to)
+                if not rows:
+                    break
+                yield OrderItemColumns.from_rows(rows)
+                if len(rows) < chunk_size:
+                    break
+                after_id = rows[-1][-1]
+    
+    def _start_of_day(self, day: date) -> datetime:
+        """TIME_ZONEでの日付の開始日時"""
+        return timezone.make_aware(datetime.combine(day, time.min))
\ No newline at end of file
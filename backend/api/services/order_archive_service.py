@@ -0,0 +1,89 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from api.dao.archived_order_dao import ArchivedOrderDAO
+
+
+class OrderArchiveService:
+    """
+    古い注文をアーカイブテーブルへ移動するサービスクラス
+    
+    注文テーブルを当日分の未完了の注文が中心の小さなテーブルに保ち、インデックスと並び替えを軽くする。
+    移動は一定件数ずつの短いトランザクションで行い、長時間のロックを取得しない。
+    """
+    
+    # アーカイブの対象とする注文ステータス（これ以上変更されない注文）
+    ARCHIVABLE_STATUSES = ('completed', 'cancelled')
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.archived_order_dao = ArchivedOrderDAO()
+    
+    def count_archivable(self, older_than_days: int) -> int:
+        """
+        アーカイブ対象の注文数を取得
+        
+        Args:
+            older_than_days: この日数より前に作成された注文を対象とする
+            
+        Returns:
+            注文数
+        """
+        return self.archived_order_dao.get_archivable_query(
+            self.ARCHIVABLE_STATUSES, self._created_before(older_than_days)
+        ).count()
+    
+    def archive(
+        self,
+        older_than_days: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        pause: Optional[float] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        完了・キャンセル済みの古い注文を注文明細とともにアーカイブテーブルへ移動
+        
+        Args:
+            older_than_days: この日数より前に作成された注文を対象とする（省略時はORDER_ARCHIVE_DAYS）
+            chunk_size: 1トランザクションで移動する注文数（省略時はORDER_ARCHIVE_CHUNK_SIZE）
+            pause: チャンクごとの待機秒数（省略時はORDER_ARCHIVE_PAUSE）。他の書き込みとレプリカの遅延に余裕を与える
+            progress: チャンクごとに（移動済みの件数, 対象の件数）を受け取る関数
+            
+        Returns:
+            移動した注文数
+        """
+        older_than_days = settings.ORDER_ARCHIVE_DAYS if older_than_days is None else older_than_days
+        chunk_size = chunk_size or settings.ORDER_ARCHIVE_CHUNK_SIZE
+        pause = settings.ORDER_ARCHIVE_PAUSE if pause is None else pause
+        # 実行中に対象が増えないよう、開始時点で基準日時を固定する
+        created_before = self._created_before(older_than_days)
+        total = self.archived_order_dao.get_archivable_query(self.ARCHIVABLE_STATUSES, created_before).count()
+        
+        archived = 0
+        after_id = 0
+        while True:
+            order_ids = self.archived_order_dao.get_archivable_ids(
+                self.ARCHIVABLE_STATUSES, created_before, after_id, chunk_size
+            )
+            if not order_ids:
+                break
+            with transaction.atomic():
+                archived += self.archived_order_dao.move_orders(
+                    order_ids, self.ARCHIVABLE_STATUSES, created_before
+                )
+            after_id = order_ids[-1]
+            if progress is not None:
+                progress(archived, total)
+            if len(order_ids) < chunk_size:
+                break
+            if pause:
+                time.sleep(pause)
+        return archived
+    
+    def _created_before(self, older_than_days: int) -> datetime:
+        """アーカイブ対象とする作成日時の基準"""
+        return timezone.now() - timedelta(days=older_than_days)
\ No newline at end of file
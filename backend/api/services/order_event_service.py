@@ -0,0 +1,246 @@
+import asyncio
+import json
+import time
+from datetime import timedelta
+from typing import AsyncIterator, Iterator, List, Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from core.models import Order, OrderEvent
+from api.dao.order_event_dao import OrderEventDAO
+from api.schemas.order import OrderOut
+
+
+class OrderEventService:
+    """
+    注文イベント（注文の作成・ステータス変更）の記録と取得を提供するサービスクラス
+    
+    イベントは注文と同じトランザクションで記録するため、コミットされた変更のみが配信される
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.order_event_dao = OrderEventDAO()
+    
+    def record_created(self, orders: List[Order]) -> None:
+        """
+        注文作成イベントを記録
+        
+        Args:
+            orders: 作成された注文のリスト（注文明細と商品を取得済み）
+        """
+        self.order_event_dao.bulk_create_events([
+            OrderEvent(
+                order_id=order.id,
+                event_type=OrderEvent.EVENT_CREATED,
+                payload=OrderOut.from_orm(order).dict()
+            )
+            for order in orders
+        ])
+    
+    def record_status_changed(self, order: Order, previous_status: str) -> None:
+        """
+        ステータス変更イベントを記録
+        
+        Args:
+            order: 更新された注文
+            previous_status: 変更前のステータス
+        """
+        self.order_event_dao.create(
+            order_id=order.id,
+            event_type=OrderEvent.EVENT_STATUS_CHANGED,
+            payload={
+                'id': order.id,
+                'table_number': order.table_number,
+                'status': order.status,
+                'previous_status': previous_status,
+                'total_price': int(order.total_price),
+                'updated_at': order.updated_at,
+            }
+        )
+    
+    def get_events_after(self, event_id: int, limit: Optional[int] = None) -> List[OrderEvent]:
+        """
+        指定したIDより後の注文イベントを取得
+        
+        Args:
+            event_id: 最後に受信したイベントID
+            limit: 取得する最大件数（省略時はORDER_EVENT_BATCH_SIZE）
+            
+        Returns:
+            ID順の注文イベントのリスト
+        """
+        return list(self.order_event_dao.get_events_after(event_id, limit or settings.ORDER_EVENT_BATCH_SIZE))
+    
+    def purge(self) -> int:
+        """
+        保持期間を過ぎた注文イベントを削除
+        
+        Returns:
+            削除件数
+        """
+        created_before = timezone.now() - timedelta(seconds=settings.ORDER_EVENT_RETENTION_SECONDS)
+        return self.order_event_dao.delete_before(created_before)
+    
+    def open_stream(self, last_event_id: Optional[int] = None) -> 'OrderEventStream':
+        """
+        Server-Sent Events形式の注文イベントのストリームを作成
+        
+        Args:
+            last_event_id: 最後に受信したイベントID（指定した場合はその次のイベントから再開する）
+            
+        Returns:
+            注文イベントのストリーム
+        """
+        return OrderEventStream(self, last_event_id)
+
+
+class OrderEventStream:
+    """
+    注文イベントをServer-Sent Events形式で送信するストリーム
+    
+    ASGIでは非同期イテレーター、WSGIでは同期イテレーターとして使用する。
+    ORDER_EVENT_STREAM_TIMEOUT 秒（WSGIではワーカーを占有しないよう ORDER_EVENT_WSGI_STREAM_TIMEOUT 秒）で終了し、
+    クライアントは Last-Event-ID を付けて再接続する。
+    
+    イベントIDはコミット順に並ぶとは限らないため、作成から ORDER_CHANGES_SETTLE_SECONDS 秒以内のイベントは
+    読み取り位置（cursor）を進めずに次回も読み直し、送信済みのIDで重複を除く。
+    再接続時は Last-Event-ID の直前の同じ時間幅のイベントを再送するため、配信は少なくとも1回となる。
+    """
+    
+    # 保持期間を過ぎて再開できない場合に送るイベント（クライアントは注文一覧を取得し直す）
+    EVENT_RESYNC = 'resync'
+    
+    def __init__(self, service: OrderEventService, last_event_id: Optional[int] = None):
+        """
+        コンストラクタ
+        
+        Args:
+            service: 注文イベントサービス
+            last_event_id: 最後に受信したイベントID
+        """
+        self.service = service
+        self.last_event_id = last_event_id
+        # このID以下のイベントはすべて送信済みで、今後コミットされるイベントもない
+        self.cursor = 0
+        # cursorより後の送信済みのイベントID
+        self.sent_ids = set()
+    
+    def __iter__(self) -> Iterator[str]:
+        """WSGI用：イベントを同期的に送信"""
+        yield from self._open()
+        timeout = min(settings.ORDER_EVENT_STREAM_TIMEOUT, settings.ORDER_EVENT_WSGI_STREAM_TIMEOUT)
+        deadline = time.monotonic() + timeout
+        last_sent = time.monotonic()
+        while time.monotonic() < deadline:
+            chunks = self._poll()
+            if chunks:
+                yield from chunks
+                last_sent = time.monotonic()
+                continue
+            if time.monotonic() - last_sent >= settings.ORDER_EVENT_HEARTBEAT_INTERVAL:
+                yield ': keep-alive\n\n'
+                last_sent = time.monotonic()
+            time.sleep(settings.ORDER_EVENT_POLL_INTERVAL)
+    
+    async def __aiter__(self) -> AsyncIterator[str]:
+        """ASGI用：待機中にワーカーを占有せずにイベントを送信"""
+        for chunk in await sync_to_async(self._open)():
+            yield chunk
+        deadline = time.monotonic() + settings.ORDER_EVENT_STREAM_TIMEOUT
+        last_sent = time.monotonic()
+        while time.monotonic() < deadline:
+            chunks = await sync_to_async(self._poll)()
+            if chunks:
+                for chunk in chunks:
+                    yield chunk
+                last_sent = time.monotonic()
+                continue
+            if time.monotonic() - last_sent >= settings.ORDER_EVENT_HEARTBEAT_INTERVAL:
+                yield ': keep-alive\n\n'
+                last_sent = time.monotonic()
+            await asyncio.sleep(settings.ORDER_EVENT_POLL_INTERVAL)
+    
+    def _open(self) -> List[str]:
+        """
+        送信を開始する位置を決定
+        
+        Returns:
+            最初に送信するチャンクのリスト
+        """
+        chunks = [f'retry: {settings.ORDER_EVENT_RETRY_MILLISECONDS}\n\n']
+        order_event_dao = self.service.order_event_dao
+        id_range = order_event_dao.get_id_range()
+        last_id = id_range['last_id'] or 0
+        
+        if self.last_event_id is None:
+            # 新規接続は現在以降のイベントのみを送信する
+            self._skip_existing(last_id)
+        elif id_range['first_id'] is not None and self.last_event_id < id_range['first_id'] - 1:
+            # 未受信のイベントが削除済みの場合は再同期を要求する
+            chunks.append(self._format(last_id, self.EVENT_RESYNC, {}))
+            self._skip_existing(last_id)
+        else:
+            # 最後に受信したイベントより前にコミットが遅れたイベントがあり得るため、その時間幅から読み直す
+            self.cursor = self.last_event_id
+            created_at = order_event_dao.get_created_at(self.last_event_id)
+            if created_at is not None:
+                settle = timedelta(seconds=settings.ORDER_CHANGES_SETTLE_SECONDS)
+                first_id = order_event_dao.get_first_id_created_after(created_at - settle)
+                if first_id is not None:
+                    self.cursor = min(self.last_event_id, first_id - 1)
+        return chunks
+    
+    def _skip_existing(self, last_id: int) -> None:
+        """
+        既存のイベントを送信済みとして扱う
+        
+        Args:
+            last_id: 現在の最大のイベントID
+        """
+        settled_before = timezone.now() - timedelta(seconds=settings.ORDER_CHANGES_SETTLE_SECONDS)
+        first_id = self.service.order_event_dao.get_first_id_created_after(settled_before)
+        if first_id is None:
+            self.cursor = last_id
+            return
+        # 確定していない時間幅は読み直し、既存のイベントだけを送信済みにする
+        self.cursor = first_id - 1
+        self.sent_ids = set(self.service.order_event_dao.get_ids_after(self.cursor))
+    
+    def _poll(self) -> List[str]:
+        """
+        未送信のイベントを取得
+        
+        Returns:
+            送信するチャンクのリスト
+        """
+        settled_before = timezone.now() - timedelta(seconds=settings.ORDER_CHANGES_SETTLE_SECONDS)
+        events = self.service.get_events_after(self.cursor)
+        chunks = []
+        settled = True
+        for event in events:
+            if event.id not in self.sent_ids:
+                chunks.append(self._format(event.id, event.event_type, event.payload))
+                self.sent_ids.add(event.id)
+            # 確定したイベントが途切れずに続く範囲だけ読み取り位置を進める
+            settled = settled and event.created_at < settled_before
+            if settled:
+                self.cursor = event.id
+        self.sent_ids = {event_id for event_id in self.sent_ids if event_id > self.cursor}
+        return chunks
+    
+    def _format(self, event_id: int, event_type: str, payload: dict) -> str:
+        """
+        イベントをServer-Sent Events形式に変換
+        
+        Args:
+            event_id: イベントID
+            event_type: イベント種別
+            payload: イベントの内容
+            
+        Returns:
+            Server-Sent Events形式の文字列
+        """
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        return f'id: {event_id}\nevent: {event_type}\ndata: {data}\n\n'
\ No newline at end of file
@@ -0,0 +1,283 @@
+import csv
+import heapq
+import io
+import zlib
+from datetime import date, datetime, time, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from api.dao.archived_order_dao import ArchivedOrderDAO
+from api.dao.order_dao import OrderDAO
+from api.renderers import encode_json
+from api.serializers.order import ArchivedOrderSerializer, OrderSerializer
+
+
+class OrderExportService:
+    """
+    注文履歴をgzip圧縮したNDJSON・CSVとして出力するサービスクラス（会計システムへの連携用）
+    
+    注文は (作成日時, ID) のキーセットで ORDER_EXPORT_CHUNK_SIZE 件ずつ取得し、
+    変換・圧縮したものから順に出力するため、期間の長さによらずメモリ使用量は一定になる。
+    アーカイブ済みの注文も作成日時の順に合わせて出力する。
+    """
+    
+    FORMAT_NDJSON = 'ndjson'
+    FORMAT_CSV = 'csv'
+    CONTENT_TYPES = {
+        FORMAT_NDJSON: 'application/x-ndjson; charset=utf-8',
+        FORMAT_CSV: 'text/csv; charset=utf-8',
+    }
+    GZIP_CONTENT_TYPE = 'application/gzip'
+    
+    # CSVは注文明細1件を1行とし、注文の列を繰り返す
+    CSV_COLUMNS = (
+        'order_id', 'table_number', 'status', 'total_price', 'created_at', 'updated_at',
+        'item_id', 'product_id', 'product_name', 'quantity', 'price', 'subtotal',
+    )
+    
+    # 出力をまとめて書き出すサイズ（バイト）
+    WRITE_BUFFER_SIZE = 64 * 1024
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.order_dao = OrderDAO()
+        self.archived_order_dao = ArchivedOrderDAO()
+    
+    def export(
+        self,
+        export_format: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        statuses: Optional[Iterable[str]] = None,
+        compress: bool = True,
+        chunk_size: Optional[int] = None,
+    ) -> 'OrderExportStream':
+        """
+        注文履歴のエクスポートを作成
+        
+        Args:
+            export_format: 出力形式（ndjson / csv）
+            date_from: 作成日の開始（この日を含む。TIME_ZONEの日付）
+            date_to: 作成日の終了（この日を含む）
+            statuses: 注文ステータスのリスト
+            compress: gzip圧縮するかどうか
+            chunk_size: 1回に取得する注文数（省略時はORDER_EXPORT_CHUNK_SIZE）
+        
+        Returns:
+            出力するバイト列のストリーム
+        
+        Raises:
+            ValueError: 出力形式が不正な場合
+        """
+        if export_format not in self.CONTENT_TYPES:
+            raise ValueError(f'出力形式が不正です: {export_format}')
+        orders = self.iter_orders(date_from, date_to, statuses, chunk_size)
+        if export_format == self.FORMAT_NDJSON:
+            chunks = self.encode_ndjson(orders)
+        else:
+            chunks = self.encode_csv(orders)
+        if compress:
+            chunks = self.gzip(chunks)
+        return OrderExportStream(chunks)
+    
+    def get_content_type(self, export_format: str, compress: bool) -> str:
+        """
+        出力のContent-Typeを取得
+        
+        Args:
+            export_format: 出力形式（ndjson / csv）
+            compress: gzip圧縮するかどうか
+        
+        Returns:
+            Content-Type
+        """
+        return self.GZIP_CONTENT_TYPE if compress else self.CONTENT_TYPES[export_format]
+    
+    def get_filename(
+        self, export_format: str, compress: bool, date_from: Optional[date], date_to: Optional[date]
+    ) -> str:
+        """
+        出力のファイル名を作成
+        
+        Args:
+            export_format: 出力形式（ndjson / csv）
+            compress: gzip圧縮するかどうか
+            date_from: 作成日の開始
+            date_to: 作成日の終了
+        
+        Returns:
+            ファイル名（例: orders_20240101-20240131.csv.gz）
+        """
+        period = '-'.join(day.strftime('%Y%m%d') if day else '' for day in (date_from, date_to))
+        suffix = '.gz' if compress else ''
+        return f"orders_{period.strip('-') or 'all'}.{export_format}{suffix}"
+    
+    def iter_orders(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        statuses: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        注文とアーカイブ済み注文を作成日時の古い順に取得
+        
+        Args:
+            date_from: 作成日の開始（この日を含む）
+            date_to: 作成日の終了（この日を含む）
+            statuses: 注文ステータスのリスト
+            chunk_size: 1回に取得する注文数
+        
+        Returns:
+            OrderOut と同じ構造の辞書のイテレーター
+        """
+        chunk_size = chunk_size or settings.ORDER_EXPORT_CHUNK_SIZE
+        statuses = list(statuses) if statuses else None
+        created_from = self._start_of_day(date_from) if date_from else None
+        created_to = self._start_of_day(date_to + timedelta(days=1)) if date_to else None
+        
+        live = self.order_dao.filter_orders(statuses, None, created_from, created_to).prefetch_related(None)
+        archived = self.archived_order_dao.filter_orders(statuses, created_from, created_to)
+        return heapq.merge(
+            self._iter_rows(live, OrderSerializer(), chunk_size),
+            self._iter_rows(archived, ArchivedOrderSerializer(), chunk_size),
+            key=lambda order: (order['created_at'], order['id']),
+        )
+    
+    def encode_ndjson(self, orders: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """
+        注文を1行に1件のJSON（NDJSON）に変換
+        
+        Args:
+            orders: OrderOut と同じ構造の辞書
+        
+        Returns:
+            NDJSONのバイト列のイテレーター
+        """
+        buffer: List[bytes] = []
+        size = 0
+        for order in orders:
+            line = encode_json(order) + b'\n'
+            buffer.append(line)
+            size += len(line)
+            if size >= self.WRITE_BUFFER_SIZE:
+                yield b''.join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield b''.join(buffer)
+    
+    def encode_csv(self, orders: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """
+        注文をCSV（注文明細1件を1行、日時はTIME_ZONEの時刻）に変換
+        
+        Args:
+            orders: OrderOut と同じ構造の辞書
+        
+        Returns:
+            UTF-8（BOM付き。表計算ソフトで文字化けしないようにする）のCSVのバイト列のイテレーター
+        """
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(self.CSV_COLUMNS)
+        yield b'\xef\xbb\xbf'
+        for order in orders:
+            order_columns = [
+                order['id'], order['table_number'], order['status'], order['total_price'],
+                self._format_datetime(order['created_at']), self._format_datetime(order['updated_at']),
+            ]
+            if not order['items']:
+                writer.writerow(order_columns + [''] * 6)
+            for item in order['items']:
+                writer.writerow(order_columns + [
+                    item['id'], item['product_id'], item['product']['name'], item['quantity'],
+                    item['price'], item['price'] * item['quantity'],
+                ])
+            if output.tell() >= self.WRITE_BUFFER_SIZE:
+                yield output.getvalue().encode()
+                output.seek(0)
+                output.truncate()
+        if output.tell():
+            yield output.getvalue().encode()
+    
+    def gzip(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        バイト列を順にgzip圧縮
+        
+        Args:
+            chunks: 圧縮するバイト列
+        
+        Returns:
+            gzip形式のバイト列のイテレーター
+        """
+        # wbits=31: gzipヘッダーとトレーラーを付ける
+        compressor = zlib.compressobj(settings.ORDER_EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+    
+    def _iter_rows(self, query: QuerySet, serializer: OrderSerializer, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """
+        (作成日時, ID) の昇順にchunk_size件ずつ取得して変換
+        
+        Args:
+            query: 注文またはアーカイブ済み注文のQuerySet
+            serializer: 注文明細と商品を入れ子にするシリアライザー
+            chunk_size: 1回に取得する注文数
+        
+        Returns:
+            OrderOut と同じ構造の辞書のイテレーター
+        """
+        after = None
+        while True:
+            rows = list(
+                self.order_dao.get_created_after(query, after, chunk_size).values(*OrderSerializer.ORDER_FIELDS)
+            )
+            if not rows:
+                return
+            yield from serializer.serialize(rows)
+            if len(rows) < chunk_size:
+                return
+            after = (rows[-1]['created_at'], rows[-1]['id'])
+    
+    def _start_of_day(self, day: date) -> datetime:
+        """TIME_ZONEでの日付の開始日時"""
+        return timezone.make_aware(datetime.combine(day, time.min))
+    
+    def _format_datetime(self, value: datetime) -> str:
+        """CSVに出力する日時（TIME_ZONEの時刻、秒まで）"""
+        return timezone.localtime(value).isoformat(timespec='seconds')
+
+
+class OrderExportStream:
+    """
+    エクスポートのバイト列のストリーム
+    
+    ASGIでは非同期イテレーター、WSGIでは同期イテレーターとして使用する。
+    ASGIでも1チャンクずつ取得して送信し、全体をメモリに読み込まない。
+    """
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        """
+        コンストラクタ
+        
+        Args:
+            chunks: 出力するバイト列のイテレーター
+        """
+        self.chunks = chunks
+    
+    def __iter__(self) -> Iterator[bytes]:
+        """WSGI用：バイト列を同期的に出力"""
+        return self.chunks
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """ASGI用：DBの読み込みと変換をスレッドで行いながらバイト列を出力"""
+        while True:
+            chunk = await sync_to_async(next)(self.chunks, None)
+            if chunk is None:
+                return
+            yield chunk
\ No newline at end of file
@@ -0,0 +1,288 @@
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.http import Http404
+from ninja.errors import HttpError
+
+from core.models import IdempotencyKey
+from api.dao.order_journal import OrderJournal
+from api.schemas.order import OrderOut
+from api.services.idempotency_service import IdempotencyService
+from api.services.order_service import OrderService
+
+logger = logging.getLogger(__name__)
+
+# ジャーナルはファイルパスごとに1インスタンスを共有する
+_journals: Dict[str, OrderJournal] = {}
+_journals_lock = threading.Lock()
+
+# バックグラウンドワーカー（プロセスごとに1つ）
+_worker: Optional['OrderIngestionWorker'] = None
+_worker_pid: Optional[int] = None
+_worker_lock = threading.Lock()
+
+
+def get_order_journal() -> OrderJournal:
+    """
+    設定されたパスの注文ジャーナルを取得
+    
+    Returns:
+        注文ジャーナル
+    """
+    path = settings.ORDER_JOURNAL_PATH
+    with _journals_lock:
+        if path not in _journals:
+            _journals[path] = OrderJournal(path)
+        return _journals[path]
+
+
+class OrderIngestionService:
+    """
+    注文の非同期取り込み（ライトビハインド）を提供するサービスクラス
+    
+    注文はローカルジャーナルに追記した時点で受付とし、
+    バックグラウンドワーカーがまとめてMySQLへ反映する
+    """
+    
+    # MySQLへの反映済みチケットを記録する冪等キーの接頭辞
+    IDEMPOTENCY_KEY_PREFIX = 'journal:'
+    # 接頭辞を付けて冪等キーに保存できるチケットの最大長
+    MAX_TICKET_LENGTH = IdempotencyKey._meta.get_field('key').max_length - len(IDEMPOTENCY_KEY_PREFIX)
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.journal = get_order_journal()
+        self.order_service = OrderService()
+        self.idempotency_service = IdempotencyService()
+    
+    def enqueue(self, data: Dict[str, Any], ticket: Optional[str] = None) -> Dict[str, Any]:
+        """
+        注文をジャーナルに追記して受付チケットを発行
+        
+        Args:
+            data: OrderService.create_orderと同じ形式の注文データ
+            ticket: 受付チケット（省略時は自動採番。再送時は同じチケットを指定する）
+            
+        Returns:
+            受付チケットの状態
+            
+        Raises:
+            HttpError: チケットが長すぎる場合、または同じチケットで異なる注文が送られた場合
+        """
+        if ticket is not None and len(ticket) > self.MAX_TICKET_LENGTH:
+            raise HttpError(422, f"Idempotency-Keyは{self.MAX_TICKET_LENGTH}文字以内で指定してください")
+        
+        entry = self.journal.append(ticket or uuid.uuid4().hex, data)
+        # ジャーナルにはJSONで保存されるため、同じ形式に変換して比較する
+        if entry['payload'] != json.loads(json.dumps(data)):
+            raise HttpError(422, "同じIdempotency-Keyで異なる注文が送信されました")
+        if settings.ORDER_INGESTION_START_WORKER:
+            start_ingestion_worker()
+        return self._to_ticket(entry)
+    
+    def get_ticket(self, ticket: str) -> Dict[str, Any]:
+        """
+        受付チケットの状態を取得
+        
+        Args:
+            ticket: 受付チケット
+            
+        Returns:
+            受付チケットの状態
+            
+        Raises:
+            Http404: チケットが存在しない場合
+        """
+        entry = self.journal.get(ticket)
+        if entry is None:
+            raise Http404(f"受付チケットが見つかりません: {ticket}")
+        return self._to_ticket(entry)
+    
+    def drain(self, batch_size: Optional[int] = None) -> int:
+        """
+        ジャーナルの未反映の注文をMySQLへまとめて反映
+        
+        反映したチケットは注文と同じトランザクションで冪等キーとして記録するため、
+        反映後ジャーナル更新前にクラッシュしても、再実行時に注文が重複しない。
+        一括での反映に失敗した場合は1件ずつセーブポイント内で反映し、
+        失敗したエントリはリースが切れた後に再試行する（ORDER_INGESTION_MAX_ATTEMPTS 回で失敗とする）
+        
+        Args:
+            batch_size: 1回で反映する最大件数（省略時は設定値）
+            
+        Returns:
+            処理したエントリ数
+        """
+        entries = self.journal.claim_pending(
+            batch_size or settings.ORDER_INGESTION_BATCH_SIZE,
+            settings.ORDER_INGESTION_LEASE_SECONDS,
+            settings.ORDER_INGESTION_MAX_ATTEMPTS,
+        )
+        if not entries:
+            return 0
+        
+        keys = {entry['ticket']: self.IDEMPOTENCY_KEY_PREFIX + entry['ticket'] for entry in entries}
+        outcomes = []
+        with transaction.atomic():
+            # クラッシュ前に反映済みだったチケットは再作成しない
+            applied = self.idempotency_service.get_stored_responses(keys.values())
+            pending = [entry for entry in entries if keys[entry['ticket']] not in applied]
+            results = self._create_orders(pending)
+            
+            responses = []
+            for entry, result in zip(pending, results):
+                if result is None:
+                    continue
+                if result['order'] is None:
+                    outcomes.append(self._outcome(entry, OrderJournal.STATUS_FAILED, detail=result['detail']))
+                    continue
+                responses.append((
+                    keys[entry['ticket']],
+                    entry['payload'],
+                    201,
+                    OrderOut.from_orm(result['order']).dict(),
+                ))
+                outcomes.append(self._outcome(entry, OrderJournal.STATUS_COMPLETED, order_id=result['order'].id))
+            self.idempotency_service.store_responses(responses)
+        
+        for entry in entries:
+            if keys[entry['ticket']] in applied:
+                outcomes.append(self._outcome(
+                    entry, OrderJournal.STATUS_COMPLETED, order_id=applied[keys[entry['ticket']]]['id']
+                ))
+        self.journal.mark(outcomes)
+        return len(entries)
+    
+    def _create_orders(self, entries: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        エントリの注文を作成
+        
+        まず一括で作成し、失敗した場合は1件ずつセーブポイント内で作成して、
+        反映できないエントリが同じバッチの他のエントリを巻き込まないようにする
+        
+        Args:
+            entries: ジャーナルのエントリのリスト
+            
+        Returns:
+            エントリと同じ順序のOrderService.create_ordersの結果リスト（例外で作成できなかったものはNone）
+        """
+        try:
+            with transaction.atomic():
+                return self.order_service.create_orders([entry['payload'] for entry in entries])
+        except Exception:
+            if len(entries) == 1:
+                logger.exception('注文ジャーナルのエントリの反映に失敗しました: %s', entries[0]['ticket'])
+                return [None]
+        
+        results = []
+        for entry in entries:
+            try:
+                with transaction.atomic():
+                    results.extend(self.order_service.create_orders([entry['payload']]))
+            except Exception:
+                logger.exception('注文ジャーナルのエントリの反映に失敗しました: %s', entry['ticket'])
+                results.append(None)
+        return results
+    
+    def _outcome(
+        self, entry: Dict[str, Any], status: str, order_id: Optional[int] = None, detail: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        ジャーナルに記録する処理結果を組み立てる
+        
+        Args:
+            entry: ジャーナルのエントリ
+            status: 処理結果のステータス
+            order_id: 作成された注文ID
+            detail: 失敗理由
+            
+        Returns:
+            処理結果
+        """
+        return {'ticket': entry['ticket'], 'status': status, 'order_id': order_id, 'detail': detail}
+    
+    def _to_ticket(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ジャーナルのエントリを受付チケットの状態に変換
+        
+        Args:
+            entry: ジャーナルのエントリ
+            
+        Returns:
+            受付チケットの状態
+        """
+        return {
+            'ticket': entry['ticket'],
+            'status': entry['status'],
+            'order_id': entry['order_id'],
+            'detail': entry['detail'],
+        }
+
+
+class OrderIngestionWorker(threading.Thread):
+    """ジャーナルの注文を定期的にMySQLへ反映するバックグラウンドワーカー"""
+    
+    def __init__(self):
+        """コンストラクタ"""
+        super().__init__(name='order-ingestion-worker', daemon=True)
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        """未反映の注文がなくなるまで反映し、なくなれば古いエントリを削除して一定間隔で待機する"""
+        while not self._stop_event.is_set():
+            processed = 0
+            try:
+                close_old_connections()
+                service = OrderIngestionService()
+                processed = service.drain()
+                if not processed:
+                    service.journal.purge(settings.ORDER_JOURNAL_RETENTION_SECONDS)
+            except Exception:
+                logger.exception('注文ジャーナルの反映に失敗しました')
+            if not processed:
+                self._stop_event.wait(settings.ORDER_INGESTION_POLL_INTERVAL)
+        # 停止したスレッドのDB接続を残さない
+        connections.close_all()
+    
+    def stop(self):
+        """ワーカーを停止"""
+        self._stop_event.set()
+
+
+def start_ingestion_worker() -> 'OrderIngestionWorker':
+    """
+    このプロセスのバックグラウンドワーカーを起動（起動済みの場合は何もしない）
+    
+    起動時にジャーナルに残っている未反映の注文（クラッシュ前に受け付けたもの）も反映される
+    
+    Returns:
+        バックグラウンドワーカー
+    """
+    global _worker, _worker_pid
+    with _worker_lock:
+        # fork後の子プロセスでは親のスレッドが存在しないため起動し直す
+        if _worker is None or _worker_pid != os.getpid() or not _worker.is_alive():
+            _worker = OrderIngestionWorker()
+            _worker_pid = os.getpid()
+            _worker.start()
+        return _worker
+
+
+def start_ingestion_worker_on_startup() -> Optional['OrderIngestionWorker']:
+    """
+    ジャーナルモードで ORDER_INGESTION_START_WORKER が有効な場合にバックグラウンドワーカーを起動
+    
+    クラッシュや再起動の前に受け付けた未反映の注文を、新しい注文の受付を待たずに反映するため、
+    リクエストを処理するプロセスの起動時に呼び出す
+    
+    Returns:
+        バックグラウンドワーカー（起動しない設定の場合はNone）
+    """
+    if settings.ORDER_INGESTION_MODE != 'journal' or not settings.ORDER_INGESTION_START_WORKER:
+        return None
+    return start_ingestion_worker()
\ No newline at end of file
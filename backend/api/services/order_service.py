@@ -1,11 +1,25 @@
-from typing import List, Optional, Dict, Any
+import base64
+import binascii
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Union
+from django.conf import settings
 from django.db.models import QuerySet
 from django.db import transaction
+from django.http import Http404
+from django.utils import timezone
+from ninja.errors import HttpError
 
-from core.models import Order, OrderItem, Product
+from core.models import ArchivedOrder, Order, OrderItem, Product
+from api.dao.archived_order_dao import ArchivedOrderDAO
 from api.dao.order_dao import OrderDAO
 from api.dao.order_item_dao import OrderItemDAO
 from api.dao.product_dao import ProductDAO
+from api.serializers.order import OrderSerializer
+from api.services.order_event_service import OrderEventService
+from api.services.recommendation_service import RecommendationService
+from api.services.sales_rollup_service import SalesRollupService
 
 
 class OrderService:
@@ -16,8 +30,12 @@ class OrderService:
     def __init__(self):
         """コンストラクタ"""
         self.order_dao = OrderDAO()
+        self.archived_order_dao = ArchivedOrderDAO()
         self.order_item_dao = OrderItemDAO()
         self.product_dao = ProductDAO()
+        self.order_event_service = OrderEventService()
+        self.sales_rollup_service = SalesRollupService()
+        self.recommendation_service = RecommendationService()
     
     def get_all_orders(self) -> QuerySet[Order]:
         """
@@ -28,6 +46,219 @@ class OrderService:
         """
         return self.order_dao.get_orders_with_items()
     
+    def get_orders_page_data(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        table_number: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        条件に一致する注文を作成日時の新しい順にページ単位で、レスポンス用の辞書として取得
+        
+        注文はモデルインスタンスを作らずに values() から組み立てる
+        
+        Args:
+            statuses: 注文ステータスのリスト
+            table_number: テーブル番号
+            created_from: 作成日時の開始（この日時を含む）
+            created_to: 作成日時の終了（この日時を含まない）
+            cursor: 前ページのレスポンスで返されたカーソル
+            limit: 1ページの件数（ORDER_LIST_MAX_LIMITを上限とする）
+            
+        Returns:
+            (OrderOut と同じ構造の辞書のリスト, 次ページのカーソル。最終ページの場合はNone)
+            
+        Raises:
+            HttpError: カーソルが不正な場合
+        """
+        query = self._order_rows_query(statuses, table_number, created_from, created_to)
+        rows, last = self._paginate(query, cursor, limit)
+        return OrderSerializer().serialize(rows), last and self._encode_cursor(last['created_at'], last['id'])
+    
+    async def aget_orders_page_data(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        table_number: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        get_orders_page_data の非同期版（非同期ORMで取得する）
+        
+        Args:
+            statuses: 注文ステータスのリスト
+            table_number: テーブル番号
+            created_from: 作成日時の開始（この日時を含む）
+            created_to: 作成日時の終了（この日時を含まない）
+            cursor: 前ページのレスポンスで返されたカーソル
+            limit: 1ページの件数（ORDER_LIST_MAX_LIMITを上限とする）
+            
+        Returns:
+            (OrderOut と同じ構造の辞書のリスト, 次ページのカーソル。最終ページの場合はNone)
+            
+        Raises:
+            HttpError: カーソルが不正な場合
+        """
+        query = self._order_rows_query(statuses, table_number, created_from, created_to)
+        limit = self._page_limit(limit)
+        rows = [
+            row async for row in
+            self.order_dao.get_page_query(query, self._decode_cursor(cursor), limit + 1)
+        ]
+        rows, last = self._split_page(rows, limit)
+        return await OrderSerializer().aserialize(rows), last and self._encode_cursor(last['created_at'], last['id'])
+    
+    def _order_rows_query(
+        self,
+        statuses: Optional[Iterable[str]],
+        table_number: Optional[int],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime]
+    ) -> QuerySet:
+        """
+        条件に一致する注文を OrderSerializer.ORDER_FIELDS の値で取得するQuerySetを作成
+        
+        Returns:
+            注文の値のQuerySet
+        """
+        return self.order_dao.filter_orders(
+            statuses, table_number, created_from, created_to
+        ).prefetch_related(None).values(*OrderSerializer.ORDER_FIELDS)
+    
+    def _paginate(self, query: QuerySet, cursor: Optional[str], limit: Optional[int]) -> Tuple[list, Any]:
+        """
+        カーソルの位置から1ページ分の注文を取得
+        
+        Args:
+            query: 注文QuerySet
+            cursor: 前ページのレスポンスで返されたカーソル
+            limit: 1ページの件数（ORDER_LIST_MAX_LIMITを上限とする）
+            
+        Returns:
+            (注文のリスト, 次ページがある場合はページ最後の注文。最終ページの場合はNone)
+            
+        Raises:
+            HttpError: カーソルが不正な場合
+        """
+        limit = self._page_limit(limit)
+        # 次ページの有無を判定するため1件多く取得する
+        orders = self.order_dao.get_page_after(query, self._decode_cursor(cursor), limit + 1)
+        return self._split_page(orders, limit)
+    
+    def _page_limit(self, limit: Optional[int]) -> int:
+        """
+        1ページの件数を決定
+        
+        Args:
+            limit: 指定された件数
+            
+        Returns:
+            ORDER_LIST_MAX_LIMITを上限とした件数（未指定の場合はORDER_LIST_DEFAULT_LIMIT）
+        """
+        return min(limit or settings.ORDER_LIST_DEFAULT_LIMIT, settings.ORDER_LIST_MAX_LIMIT)
+    
+    def _split_page(self, orders: list, limit: int) -> Tuple[list, Any]:
+        """
+        1件多く取得した結果をページと次ページの有無に分ける
+        
+        Args:
+            orders: limit + 1 件まで取得した注文のリスト
+            limit: 1ページの件数
+            
+        Returns:
+            (注文のリスト, 次ページがある場合はページ最後の注文。最終ページの場合はNone)
+        """
+        if len(orders) <= limit:
+            return orders, None
+        orders = orders[:limit]
+        return orders, orders[-1]
+    
+    def get_order_changes(
+        self,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+        wait: Optional[float] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+        """
+        トークンの位置より後に作成・更新された注文を更新日時の古い順に取得（差分同期）
+        
+        waitを指定した場合は、変更があるかwait秒が経過するまで待機する（ロングポーリング）
+        
+        Args:
+            since: 前回のレスポンスで返されたトークン（省略時は最初から取得）
+            limit: 取得する最大件数（ORDER_LIST_MAX_LIMITを上限とする）
+            wait: 変更がない場合に待機する最大秒数（ORDER_CHANGES_MAX_WAITを上限とする）
+            
+        Returns:
+            (OrderOut と同じ構造の辞書のリスト, 次回のトークン, 続きがあるかどうか)
+            
+        Raises:
+            HttpError: トークンが不正な場合
+        """
+        after = self._decode_cursor(since, label='トークン')
+        limit = self._page_limit(limit)
+        deadline = time.monotonic() + min(wait or 0, settings.ORDER_CHANGES_MAX_WAIT)
+        
+        while True:
+            # コミット待ちのトランザクションの変更を読み飛ばさないよう、直近の更新は次回に回す
+            settled_before = timezone.now() - timedelta(seconds=settings.ORDER_CHANGES_SETTLE_SECONDS)
+            # 続きの有無を判定するため1件多く取得する
+            rows = list(
+                self.order_dao.get_changed_after(after, settled_before)
+                .values(*OrderSerializer.ORDER_FIELDS)[:limit + 1]
+            )
+            if rows or time.monotonic() >= deadline:
+                break
+            time.sleep(settings.ORDER_CHANGES_POLL_INTERVAL)
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not rows:
+            return [], since, False
+        return OrderSerializer().serialize(rows), self._encode_cursor(rows[-1]['updated_at'], rows[-1]['id']), has_more
+    
+    def _encode_cursor(self, timestamp: datetime, order_id: int) -> str:
+        """
+        注文の位置をカーソル文字列に変換
+        
+        Args:
+            timestamp: 最後の注文の日時（作成日時または更新日時）
+            order_id: 最後の注文のID
+            
+        Returns:
+            カーソル文字列
+        """
+        value = f'{timestamp.isoformat()}|{order_id}'
+        return base64.urlsafe_b64encode(value.encode('utf-8')).decode('ascii')
+    
+    def _decode_cursor(self, cursor: Optional[str], label: str = 'カーソル') -> Optional[Tuple[datetime, int]]:
+        """
+        カーソル文字列を注文の位置に変換
+        
+        Args:
+            cursor: カーソル文字列
+            label: エラーメッセージでの名前
+            
+        Returns:
+            (日時, 注文ID)。カーソルが指定されていない場合はNone
+            
+        Raises:
+            HttpError: カーソルが不正な場合
+        """
+        if not cursor:
+            return None
+        try:
+            value = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+            timestamp, order_id = value.split('|')
+            return datetime.fromisoformat(timestamp), int(order_id)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise HttpError(400, f"{label}が不正です")
+    
     def get_orders_by_table(self, table_number: int) -> QuerySet[Order]:
         """
         テーブル番号による注文の取得
@@ -40,23 +271,50 @@ class OrderService:
         """
         return self.order_dao.get_orders_by_table(table_number)
     
-    def get_order_by_id(self, order_id: int) -> Order:
+    def get_order_by_id(self, order_id: int) -> Union[Order, ArchivedOrder]:
         """
-        IDによる注文取得
+        IDによる注文取得（注文テーブルにない場合はアーカイブ済みの注文を探す）
         
         Args:
             order_id: 注文ID
             
         Returns:
-            指定されたIDの注文
+            指定されたIDの注文またはアーカイブ済み注文
+            
+        Raises:
+            Http404: 注文が存在しない場合
+        """
+        try:
+            return self.order_dao.get_order_with_items(order_id)
+        except Http404:
+            return self.archived_order_dao.get_order_with_items(order_id)
+    
+    async def aget_order_by_id(self, order_id: int) -> Union[Order, ArchivedOrder]:
+        """
+        IDによる注文取得（非同期版。注文テーブルにない場合はアーカイブ済みの注文を探す）
+        
+        Args:
+            order_id: 注文ID
+            
+        Returns:
+            指定されたIDの注文またはアーカイブ済み注文（注文明細と商品を取得済み）
+            
+        Raises:
+            Http404: 注文が存在しない場合
         """
-        return self.order_dao.get_order_with_items(order_id)
+        try:
+            return await self.order_dao.aget_order_with_items(order_id)
+        except Http404:
+            return await self.archived_order_dao.aget_order_with_items(order_id)
     
     @transaction.atomic
     def create_order(self, data: Dict[str, Any]) -> Order:
         """
         注文の作成
         
+        商品は1クエリでまとめて取得し、注文明細はbulk_createで一括登録する。
+        カートの明細数に関わらずDBへの往復回数は一定になる。
+        
         Args:
             data: 注文データ
             {
@@ -72,40 +330,181 @@ class OrderService:
             }
             
         Returns:
-            作成された注文
+            作成された注文（注文明細と商品を取得済み）
+            
+        Raises:
+            Http404: 存在しない商品が含まれる場合
+            HttpError: 販売停止中の商品が含まれる場合
         """
-        # 注文の作成
+        products = self.product_dao.get_by_ids(
+            item_data['product_id'] for item_data in data['items']
+        )
+        self._validate_items(data['items'], products)
+        
+        # 合計金額を確定させてから注文を作成
         order = self.order_dao.create_order(
             table_number=data['table_number'],
             status=data['status'],
-            total_price=0  # 初期値
+            total_price=self._calculate_total_price(data['items'], products)
+        )
+        
+        # 注文明細の一括作成
+        items = self.order_item_dao.bulk_create_order_items(
+            self._build_order_items(order, data['items'], products)
+        )
+        self._attach_items([order], items, products)
+        self.order_event_service.record_created([order])
+        self.sales_rollup_service.record_created([order])
+        self.recommendation_service.record_created([order])
+        return order
+    
+    @transaction.atomic
+    def create_orders(self, orders_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        複数注文の一括作成
+        
+        すべての注文の商品を1クエリで取得して検証し、
+        検証を通過した注文と注文明細を1トランザクションで一括登録する。
+        
+        Args:
+            orders_data: create_orderと同じ形式の注文データのリスト
+            
+        Returns:
+            注文データと同じ順序の結果リスト
+            [
+                {
+                    'order': Order or None,  # 作成された注文
+                    'detail': str or None,   # 作成できなかった理由
+                },
+                ...
+            ]
+        """
+        products = self.product_dao.get_by_ids(
+            item_data['product_id']
+            for data in orders_data
+            for item_data in data['items']
         )
         
-        # 注文明細の作成と合計金額の計算
-        total_price = 0
-        for item_data in data['items']:
-            product = self.product_dao.get_by_id(item_data['product_id'])
+        results = []
+        pending_orders = []
+        for data in orders_data:
+            try:
+                self._validate_items(data['items'], products)
+            except (Http404, HttpError) as exc:
+                results.append({'order': None, 'detail': str(exc)})
+                continue
             
-            # 注文明細の作成
-            self.order_item_dao.create_order_item(
+            order = Order(
+                table_number=data['table_number'],
+                status=data['status'],
+                total_price=self._calculate_total_price(data['items'], products)
+            )
+            results.append({'order': order, 'detail': None})
+            pending_orders.append((order, data['items']))
+        
+        if not pending_orders:
+            return results
+        
+        orders = self.order_dao.bulk_create_orders([order for order, _ in pending_orders])
+        items = self.order_item_dao.bulk_create_order_items([
+            item
+            for order, items_data in pending_orders
+            for item in self._build_order_items(order, items_data, products)
+        ])
+        self._attach_items(orders, items, products)
+        self.order_event_service.record_created(orders)
+        self.sales_rollup_service.record_created(orders)
+        self.recommendation_service.record_created(orders)
+        return results
+    
+    def _validate_items(self, items_data: List[Dict[str, Any]], products: Dict[int, Product]) -> None:
+        """
+        注文明細の商品を検証
+        
+        Args:
+            items_data: 注文明細データのリスト
+            products: 商品IDをキーとした商品の辞書
+            
+        Raises:
+            Http404: 存在しない商品が含まれる場合
+            HttpError: 販売停止中の商品が含まれる場合
+        """
+        product_ids = [item_data['product_id'] for item_data in items_data]
+        missing_ids = sorted({pid for pid in product_ids if pid not in products})
+        if missing_ids:
+            raise Http404(f"商品が見つかりません: {missing_ids}")
+        
+        unavailable_ids = sorted({pid for pid in product_ids if not products[pid].is_available})
+        if unavailable_ids:
+            raise HttpError(400, f"販売停止中の商品が含まれています: {unavailable_ids}")
+    
+    def _calculate_total_price(self, items_data: List[Dict[str, Any]], products: Dict[int, Product]) -> int:
+        """
+        合計金額の計算
+        
+        Args:
+            items_data: 注文明細データのリスト
+            products: 商品IDをキーとした商品の辞書
+            
+        Returns:
+            合計金額
+        """
+        return sum(
+            products[item_data['product_id']].price * item_data['quantity']
+            for item_data in items_data
+        )
+    
+    def _build_order_items(
+        self, order: Order, items_data: List[Dict[str, Any]], products: Dict[int, Product]
+    ) -> List[OrderItem]:
+        """
+        保存前の注文明細オブジェクトを組み立てる
+        
+        Args:
+            order: 注文オブジェクト
+            items_data: 注文明細データのリスト
+            products: 商品IDをキーとした商品の辞書
+            
+        Returns:
+            注文明細オブジェクトのリスト
+        """
+        return [
+            OrderItem(
                 order=order,
-                product=product,
+                product=products[item_data['product_id']],
                 quantity=item_data['quantity'],
-                price=product.price
+                price=products[item_data['product_id']].price
             )
-            
-            # 合計金額の計算
-            total_price += product.price * item_data['quantity']
+            for item_data in items_data
+        ]
+    
+    def _attach_items(self, orders: List[Order], items: List[OrderItem], products: Dict[int, Product]) -> None:
+        """
+        作成した注文明細を注文に紐付け、レスポンス生成時の再取得を不要にする
         
-        # 合計金額の更新
-        self.order_dao.update(order, total_price=total_price)
+        Args:
+            orders: 注文のリスト
+            items: bulk_createで作成した注文明細のリスト
+            products: 商品IDをキーとした商品の辞書
+        """
+        if any(item.pk is None for item in items):
+            # MySQLはbulk_createで主キーを返さないため、明細のみ1クエリで取得し直す
+            items = list(self.order_item_dao.get_items_by_orders(order.id for order in orders))
+            for item in items:
+                item.product = products[item.product_id]
         
-        # 最新の注文データを取得して返す
-        return self.order_dao.get_order_with_items(order.id)
+        items_by_order = defaultdict(list)
+        for item in items:
+            items_by_order[item.order_id].append(item)
+        for order in orders:
+            self.order_dao.set_prefetched_items(order, items_by_order[order.id])
     
+    @transaction.atomic
     def update_order(self, order_id: int, data: Dict[str, Any]) -> Order:
         """
-        注文の更新
+        注文の更新（ステータスが変わった場合はステータス変更イベントを記録し、売上集計に反映）
+        
+        同じ注文の同時の更新で売上が二重に集計されないよう、注文を行ロックして更新する。
         
         Args:
             order_id: 注文ID
@@ -114,15 +513,22 @@ class OrderService:
         Returns:
             更新された注文
         """
-        order = self.order_dao.get_by_id(order_id)
-        return self.order_dao.update(order, **data)
+        order = self.order_dao.get_for_update(order_id)
+        previous_status = order.status
+        order = self.order_dao.update(order, **data)
+        if order.status != previous_status:
+            self.order_event_service.record_status_changed(order, previous_status)
+            self.sales_rollup_service.record_status_changed(order, previous_status)
+        return order
     
+    @transaction.atomic
     def delete_order(self, order_id: int) -> None:
         """
-        注文の削除
+        注文の削除（完了済みの注文は売上集計から減算）
         
         Args:
             order_id: 注文ID
         """
-        order = self.order_dao.get_by_id(order_id)
+        order = self.order_dao.get_for_update(order_id)
+        self.sales_rollup_service.record_deleted(order)
         self.order_dao.delete(order)
\ No newline at end of file
@@ -1,9 +1,9 @@
 from typing import List, Optional, Dict, Any
-from django.db.models import QuerySet
 
 from core.models import Product
 from api.dao.product_dao import ProductDAO
 from api.dao.category_dao import CategoryDAO
+from api.services.menu_cache import menu_cache
 
 
 class ProductService:
@@ -16,34 +16,87 @@ class ProductService:
         self.product_dao = ProductDAO()
         self.category_dao = CategoryDAO()
     
-    def get_all_products(self, available_only: bool = True) -> QuerySet[Product]:
+    def get_all_products(self, available_only: bool = True) -> List[Product]:
         """
-        すべての商品を取得
+        すべての商品を取得（販売可能な商品のみの場合はメニューキャッシュを使用）
         
         Args:
             available_only: 販売可能な商品のみを取得するかどうか
             
         Returns:
-            商品のQuerySet
+            商品のリスト
         """
         if available_only:
-            return self.product_dao.get_available_products()
-        return self.product_dao.get_all()
+            return menu_cache.get(
+                'available_products',
+                lambda: list(self.product_dao.get_available_products())
+            )
+        return list(self.product_dao.get_all())
     
-    def get_products_by_category(self, category_id: int, available_only: bool = True) -> QuerySet[Product]:
+    async def aget_all_products(self, available_only: bool = True) -> List[Product]:
         """
-        カテゴリIDによる商品の取得
+        すべての商品を取得（非同期版、販売可能な商品のみの場合はメニューキャッシュを使用）
+        
+        Args:
+            available_only: 販売可能な商品のみを取得するかどうか
+            
+        Returns:
+            商品のリスト
+        """
+        async def load_products() -> List[Product]:
+            query = self.product_dao.get_available_products() if available_only else self.product_dao.get_all()
+            return [product async for product in query]
+        
+        if available_only:
+            return await menu_cache.aget('available_products', load_products)
+        return await load_products()
+    
+    def get_products_by_category(self, category_id: int, available_only: bool = True) -> List[Product]:
+        """
+        カテゴリIDによる商品の取得（販売可能な商品のみの場合はメニューキャッシュを使用）
         
         Args:
             category_id: カテゴリID
             available_only: 販売可能な商品のみを取得するかどうか
             
         Returns:
-            指定されたカテゴリの商品QuerySet
+            指定されたカテゴリの商品のリスト
         """
-        # カテゴリの存在確認
-        self.category_dao.get_by_id(category_id)
-        return self.product_dao.get_products_by_category(category_id, available_only)
+        def load_products() -> List[Product]:
+            products = list(self.product_dao.get_products_by_category(category_id, available_only))
+            if not products:
+                # 商品がない場合のみカテゴリの存在確認を行う
+                self.category_dao.get_by_id(category_id)
+            return products
+        
+        if available_only:
+            return menu_cache.get(('products', category_id), load_products)
+        return load_products()
+    
+    async def aget_products_by_category(self, category_id: int, available_only: bool = True) -> List[Product]:
+        """
+        カテゴリIDによる商品の取得（非同期版、販売可能な商品のみの場合はメニューキャッシュを使用）
+        
+        Args:
+            category_id: カテゴリID
+            available_only: 販売可能な商品のみを取得するかどうか
+            
+        Returns:
+            指定されたカテゴリの商品のリスト
+        """
+        async def load_products() -> List[Product]:
+            products = [
+                product async for product in
+                self.product_dao.get_products_by_category(category_id, available_only)
+            ]
+            if not products:
+                # 商品がない場合のみカテゴリの存在確認を行う
+                await self.category_dao.aget_by_id(category_id)
+            return products
+        
+        if available_only:
+            return await menu_cache.aget(('products', category_id), load_products)
+        return await load_products()
     
     def get_product_by_id(self, product_id: int) -> Product:
         """
@@ -57,6 +110,18 @@ class ProductService:
         """
         return self.product_dao.get_by_id(product_id)
     
+    async def aget_product_by_id(self, product_id: int) -> Product:
+        """
+        IDによる商品取得（非同期版）
+        
+        Args:
+            product_id: 商品ID
+            
+        Returns:
+            指定されたIDの商品
+        """
+        return await self.product_dao.aget_by_id(product_id)
+    
     def create_product(self, data: Dict[str, Any]) -> Product:
         """
         商品の作成
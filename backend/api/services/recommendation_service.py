@@ -0,0 +1,391 @@
+import heapq
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Order, Product
+from api.dao.recommendation_dao import RecommendationDAO
+from api.schemas.product import ProductOut
+from api.services.menu_cache import menu_cache
+from api.services.product_service import ProductService
+
+
+class ProductRecommender:
+    """
+    同時に注文された商品の件数のプロセス内インデックス
+    
+    商品ごとに「同じ注文に含まれた商品ID -> 注文数」の辞書を保持し、
+    上位の商品は初回の参照時に並べ替えて保持するため、2回目以降は辞書の参照のみで取得できる。
+    スナップショット（rebuild_recommendations コマンドで作成）を読み込み、
+    以降の注文は作成時（コミット後）と定期的な同期で追加する。
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self._lock = threading.Lock()
+        # 同期（スナップショットの読み込みと追加の集計）を同時に1スレッドのみで行うためのロック
+        self.sync_lock = threading.Lock()
+        self._counts: Dict[int, Dict[int, int]] = {}
+        self._ranked: Dict[int, List[Tuple[int, int]]] = {}
+        self._loaded = False
+        self._snapshot_id: Optional[int] = None
+        # この注文IDまでは集計済み（以降の注文は _applied で重複を除く）
+        self._watermark = 0
+        self._applied: Set[int] = set()
+        self._synced_at: Optional[float] = None
+    
+    @property
+    def watermark(self) -> int:
+        """集計済みの最後の注文ID"""
+        return self._watermark
+    
+    def is_loaded(self, snapshot_id: Optional[int]) -> bool:
+        """
+        指定したスナップショットを読み込み済みかどうか
+        
+        Args:
+            snapshot_id: スナップショットの作成記録のID（スナップショットがない場合はNone）
+        
+        Returns:
+            読み込み済みの場合はTrue
+        """
+        return self._loaded and self._snapshot_id == snapshot_id
+    
+    def is_sync_due(self) -> bool:
+        """前回の同期から RECOMMENDATION_SYNC_INTERVAL 秒以上経過しているかどうか"""
+        return self._synced_at is None or time.monotonic() - self._synced_at >= settings.RECOMMENDATION_SYNC_INTERVAL
+    
+    def mark_synced(self) -> None:
+        """同期した時刻を記録"""
+        self._synced_at = time.monotonic()
+    
+    def load(self, snapshot_id: Optional[int], pairs: Iterable[Tuple[int, int, int]], watermark: int) -> None:
+        """
+        スナップショットを読み込み、それまでの集計を置き換える
+        
+        Args:
+            snapshot_id: スナップショットの作成記録のID
+            pairs: (商品ID, 同時に注文された商品ID, 注文数) のリスト（1組につき1行）
+            watermark: スナップショットに含まれる最後の注文ID
+        """
+        counts: Dict[int, Dict[int, int]] = {}
+        for product_id, other_id, count in pairs:
+            counts.setdefault(product_id, {})[other_id] = count
+            counts.setdefault(other_id, {})[product_id] = count
+        with self._lock:
+            self._counts = counts
+            self._ranked = {}
+            self._loaded = True
+            self._snapshot_id = snapshot_id
+            self._watermark = watermark
+            self._applied = set()
+    
+    def add_orders(self, baskets: Iterable[Tuple[int, Iterable[int]]]) -> int:
+        """
+        注文の商品の組を集計に加える（集計済みの注文は除く）
+        
+        Args:
+            baskets: (注文ID, 商品IDのリスト) のリスト
+        
+        Returns:
+            加えた注文数
+        """
+        added = 0
+        with self._lock:
+            if not self._loaded:
+                # 読み込み前の注文は初回の同期で集計する
+                return 0
+            for order_id, product_ids in baskets:
+                if order_id <= self._watermark or order_id in self._applied:
+                    continue
+                self._applied.add(order_id)
+                added += 1
+                products = set(product_ids)
+                for product_id in products:
+                    row = self._counts.setdefault(product_id, {})
+                    for other_id in products:
+                        if other_id != product_id:
+                            row[other_id] = row.get(other_id, 0) + 1
+                    self._ranked.pop(product_id, None)
+        return added
+    
+    def advance(self, watermark: int) -> None:
+        """
+        集計済みの最後の注文IDを進める
+        
+        Args:
+            watermark: これ以前の注文はすべて集計済みとする注文ID
+        """
+        with self._lock:
+            if watermark > self._watermark:
+                self._watermark = watermark
+                self._applied = {order_id for order_id in self._applied if order_id > watermark}
+    
+    def top(self, product_id: int, limit: int) -> List[Tuple[int, int]]:
+        """
+        同時に注文された件数の多い商品を取得
+        
+        Args:
+            product_id: 商品ID
+            limit: 取得する最大件数（RECOMMENDATION_MAX_RESULTS まで）
+        
+        Returns:
+            (商品ID, 注文数) のリスト（注文数の多い順）
+        """
+        ranked = self._ranked.get(product_id)
+        if ranked is None:
+            with self._lock:
+                row = self._counts.get(product_id, {})
+                ranked = heapq.nsmallest(
+                    settings.RECOMMENDATION_MAX_RESULTS, row.items(), key=lambda item: (-item[1], item[0])
+                )
+                self._ranked[product_id] = ranked
+        return ranked[:limit]
+    
+    def reset(self) -> None:
+        """集計を破棄し、次回の参照時にスナップショットから読み込み直す"""
+        with self._lock:
+            self._counts = {}
+            self._ranked = {}
+            self._loaded = False
+            self._snapshot_id = None
+            self._watermark = 0
+            self._applied = set()
+            self._synced_at = None
+
+
+# プロセス全体で共有するおすすめ商品のインデックス
+recommender = ProductRecommender()
+
+
+class RecommendationService:
+    """
+    「一緒に注文されている商品」のおすすめを提供するサービスクラス
+    
+    おすすめはプロセス内のインデックス（recommender）から取得し、集計クエリは実行しない。
+    インデックスは RECOMMENDATION_SYNC_INTERVAL 秒ごとに、その時点のリクエストの処理中に
+    スナップショットの更新と他のプロセスで作成された注文を反映する（同期中の他のリクエストは待たない）。
+    販売可能な商品はメニューキャッシュから取得するため、メニューバージョンの確認でもDBを参照する。
+    """
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.recommendation_dao = RecommendationDAO()
+        self.product_service = ProductService()
+    
+    def record_created(self, orders: List[Order]) -> None:
+        """
+        作成された注文をコミット後にこのプロセスのインデックスへ加える
+        
+        Args:
+            orders: 作成された注文のリスト（注文明細を取得済み）
+        """
+        baskets = [(order.id, [item.product_id for item in order.items.all()]) for order in orders]
+        transaction.on_commit(lambda: recommender.add_orders(baskets))
+    
+    def get_recommendations(self, product_id: int, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        商品と一緒に注文されている販売可能な商品を取得
+        
+        Args:
+            product_id: 商品ID
+            limit: 取得する最大件数
+        
+        Returns:
+            ProductRecommendationOut と同じ構造の辞書のリスト（一緒に注文された件数の多い順）
+        
+        Raises:
+            Http404: 商品が存在しない場合
+        """
+        if recommender.is_sync_due():
+            self.sync()
+        products = menu_cache.get('recommendable_products', self._load_products)
+        if product_id not in products:
+            # 販売可能な商品のキャッシュにない場合のみ、商品が存在するかをDBで確認する
+            self.product_service.get_product_by_id(product_id)
+        return self._build(product_id, limit, products)
+    
+    async def aget_recommendations(self, product_id: int, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        商品と一緒に注文されている販売可能な商品を取得（非同期版）
+        
+        Args:
+            product_id: 商品ID
+            limit: 取得する最大件数
+        
+        Returns:
+            ProductRecommendationOut と同じ構造の辞書のリスト（一緒に注文された件数の多い順）
+        
+        Raises:
+            Http404: 商品が存在しない場合
+        """
+        if recommender.is_sync_due():
+            await sync_to_async(self.sync)()
+        
+        async def load_products() -> Dict[int, Dict[str, Any]]:
+            return self._serialize_products(await self.product_service.aget_all_products())
+        
+        products = await menu_cache.aget('recommendable_products', load_products)
+        if product_id not in products:
+            await self.product_service.aget_product_by_id(product_id)
+        return self._build(product_id, limit, products)
+    
+    def sync(self, force: bool = False) -> None:
+        """
+        スナップショットが更新されていれば読み込み直し、以降に作成された注文を加える
+        
+        他のスレッドが同期中の場合は待たずに戻る（同期前のインデックスでおすすめを返す）。
+        
+        Args:
+            force: 同期の間隔によらず同期するかどうか
+        """
+        if not recommender.sync_lock.acquire(blocking=False):
+            return
+        try:
+            if not force and not recommender.is_sync_due():
+                return
+            snapshot = self.recommendation_dao.get_snapshot()
+            snapshot_id = snapshot.id if snapshot else None
+            if not recommender.is_loaded(snapshot_id):
+                recommender.load(
+                    snapshot_id, self.recommendation_dao.get_pairs(), snapshot.last_order_id if snapshot else 0
+                )
+            self._catch_up()
+            recommender.mark_synced()
+        finally:
+            recommender.sync_lock.release()
+    
+    def rebuild(
+        self,
+        chunk_size: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        注文履歴（アーカイブ済みを含む）からスナップショットを作り直す
+        
+        注文を一定件数ずつ読み込んで商品の組を数えるため、メモリ使用量は商品の組の数のみに比例する。
+        IDの順にコミットされるとは限らないため、作成から RECOMMENDATION_SETTLE_SECONDS 秒以上経過した注文が
+        続く範囲までを集計し、以降の注文は各プロセスの同期で追加される。
+        
+        Args:
+            chunk_size: 1回に読み込む注文数（省略時はRECOMMENDATION_CHUNK_SIZE）
+            progress: チャンクごとに集計済みの注文数を受け取る関数
+        
+        Returns:
+            集計した注文数と商品の組の数
+        """
+        chunk_size = chunk_size or settings.RECOMMENDATION_CHUNK_SIZE
+        settled_before = timezone.now() - timedelta(seconds=settings.RECOMMENDATION_SETTLE_SECONDS)
+        last_order_id = self.recommendation_dao.get_settled_order_id(settled_before)
+        counts: Dict[Tuple[int, int], int] = defaultdict(int)
+        order_count = 0
+        for archived in (True, False):
+            for baskets in self._iter_baskets(archived, 0, chunk_size, last_order_id):
+                for _, _, product_ids in baskets:
+                    for pair in combinations(sorted(product_ids), 2):
+                        counts[pair] += 1
+                order_count += len(baskets)
+                if progress is not None:
+                    progress(order_count)
+        
+        with transaction.atomic():
+            self.recommendation_dao.replace_snapshot(
+                ((product_id, other_id, count) for (product_id, other_id), count in sorted(counts.items())),
+                last_order_id,
+                order_count,
+            )
+        return {'orders': order_count, 'pairs': len(counts)}
+    
+    def _catch_up(self) -> None:
+        """
+        インデックスの集計済みの注文より後の注文を加える
+        
+        作成から RECOMMENDATION_SETTLE_SECONDS 秒以上経過した注文までを集計済みとする
+        （IDの順にコミットされるとは限らないため、最近の注文は次回の同期でも確認する）。
+        """
+        settled_before = timezone.now() - timedelta(seconds=settings.RECOMMENDATION_SETTLE_SECONDS)
+        watermark = recommender.watermark
+        settled = True
+        for baskets in self._iter_baskets(False, watermark, settings.RECOMMENDATION_CHUNK_SIZE):
+            recommender.add_orders((order_id, product_ids) for order_id, _, product_ids in baskets)
+            for order_id, created_at, _ in baskets:
+                settled = settled and created_at < settled_before
+                if settled:
+                    watermark = order_id
+        recommender.advance(watermark)
+    
+    def _iter_baskets(
+        self, archived: bool, after_id: int, chunk_size: int, last_id: Optional[int] = None
+    ) -> Iterator[List[Tuple[int, Any, Set[int]]]]:
+        """
+        注文ごとの商品IDを chunk_size 件ずつ取得
+        
+        Args:
+            archived: アーカイブ済み注文から取得するかどうか
+            after_id: このIDより後の注文を取得する
+            chunk_size: 1回に読み込む注文数
+            last_id: このIDまでの注文を取得する（省略時は最後まで）
+        
+        Returns:
+            (注文ID, 作成日時, 商品IDの集合) のリストのイテレーター
+        """
+        while True:
+            orders = self.recommendation_dao.get_orders_after(archived, after_id, chunk_size)
+            if last_id is not None:
+                orders = [order for order in orders if order[0] <= last_id]
+            if not orders:
+                return
+            products: Dict[int, Set[int]] = defaultdict(set)
+            for order_id, product_id in self.recommendation_dao.get_order_products(
+                archived, orders[0][0], orders[-1][0]
+            ):
+                products[order_id].add(product_id)
+            yield [(order_id, created_at, products[order_id]) for order_id, created_at in orders]
+            if len(orders) < chunk_size:
+                return
+            after_id = orders[-1][0]
+    
+    def _load_products(self) -> Dict[int, Dict[str, Any]]:
+        """販売可能な商品を商品IDをキーとした辞書で取得"""
+        return self._serialize_products(self.product_service.get_all_products())
+    
+    def _serialize_products(self, products: Iterable[Product]) -> Dict[int, Dict[str, Any]]:
+        """
+        商品をレスポンスの形式に変換（キャッシュし、おすすめの取得ごとには変換しない）
+        
+        Args:
+            products: 販売可能な商品
+        
+        Returns:
+            商品IDをキーとした ProductOut と同じ構造の辞書
+        """
+        return {product.id: ProductOut.from_orm(product).dict() for product in products}
+    
+    def _build(self, product_id: int, limit: int, products: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        インデックスの上位の商品から販売可能な商品のみをレスポンスの形式に変換
+        
+        Args:
+            product_id: 商品ID
+            limit: 取得する最大件数
+            products: 販売可能な商品（ProductOut と同じ構造）の辞書
+        
+        Returns:
+            ProductRecommendationOut と同じ構造の辞書のリスト
+        """
+        recommendations = []
+        for other_id, count in recommender.top(product_id, settings.RECOMMENDATION_MAX_RESULTS):
+            product = products.get(other_id)
+            if product is None:
+                continue
+            recommendations.append({**product, 'order_count': count})
+            if len(recommendations) >= limit:
+                break
+        return recommendations
\ No newline at end of file
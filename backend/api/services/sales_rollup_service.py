@@ -0,0 +1,285 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from core.models import Order
+from api.dao.order_item_dao import OrderItemDAO
+from api.dao.sales_rollup_dao import SalesDeltas, SalesRollupDAO
+
+
+class SalesRollupService:
+    """
+    売上集計（時間帯・テーブル別、時間帯・商品別）の更新と売上レポートを提供するサービスクラス
+    
+    注文が完了になった時点で集計に加算し、完了から取り消された時点（キャンセルなど）で減算する。
+    集計は注文と同じトランザクションで更新するため、売上レポートは注文テーブルを走査せずに集計のみから作成できる。
+    """
+    
+    COMPLETED = 'completed'
+    
+    def __init__(self):
+        """コンストラクタ"""
+        self.sales_rollup_dao = SalesRollupDAO()
+        self.order_item_dao = OrderItemDAO()
+    
+    def record_created(self, orders: List[Order]) -> None:
+        """
+        完了として作成された注文を集計に加算
+        
+        Args:
+            orders: 作成された注文のリスト（注文明細を取得済み）
+        """
+        completed = [order for order in orders if order.status == self.COMPLETED]
+        if completed:
+            self._apply(
+                [self._order_row(order) for order in completed],
+                [self._item_row(item) for order in completed for item in order.items.all()],
+                1,
+            )
+    
+    def record_status_changed(self, order: Order, previous_status: str) -> None:
+        """
+        ステータスの変更を集計に反映（完了になった場合は加算、完了から変わった場合は減算）
+        
+        Args:
+            order: 更新された注文
+            previous_status: 変更前のステータス
+        """
+        if order.status == self.COMPLETED and previous_status != self.COMPLETED:
+            sign = 1
+        elif previous_status == self.COMPLETED and order.status != self.COMPLETED:
+            sign = -1
+        else:
+            return
+        items = self.order_item_dao.get_items_by_order(order.id).values(*SalesRollupDAO.ITEM_FIELDS)
+        self._apply([self._order_row(order)], list(items), sign)
+    
+    def record_deleted(self, order: Order) -> None:
+        """
+        削除する完了済みの注文を集計から減算（注文明細の削除前に呼び出す）
+        
+        Args:
+            order: 削除する注文
+        """
+        if order.status == self.COMPLETED:
+            items = self.order_item_dao.get_items_by_order(order.id).values(*SalesRollupDAO.ITEM_FIELDS)
+            self._apply([self._order_row(order)], list(items), -1)
+    
+    def rebuild(
+        self,
+        chunk_size: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        注文とアーカイブ済み注文から売上集計を作り直す
+        
+        完了した注文を一定件数ずつ読み込んで集計し、最後に1トランザクションで集計を置き換える。
+        実行中に完了・取り消しされた注文は反映されない場合があるため、営業時間外に実行する。
+        
+        Args:
+            chunk_size: 1回に読み込む注文数（省略時はSALES_ROLLUP_CHUNK_SIZE）
+            progress: チャンクごとに（集計済みの件数, 対象の件数）を受け取る関数
+        
+        Returns:
+            集計した注文数と作成した集計の行数
+        """
+        chunk_size = chunk_size or settings.SALES_ROLLUP_CHUNK_SIZE
+        hourly: SalesDeltas = defaultdict(lambda: {'order_count': 0, 'quantity': 0, 'revenue': 0})
+        product: SalesDeltas = defaultdict(lambda: {'quantity': 0, 'revenue': 0})
+        total = sum(self.sales_rollup_dao.count_completed_orders(archived) for archived in (False, True))
+        
+        processed = 0
+        for archived in (False, True):
+            after_id = 0
+            while True:
+                orders = self.sales_rollup_dao.get_completed_orders(archived, after_id, chunk_size)
+                if not orders:
+                    break
+                items = self.sales_rollup_dao.get_order_items(archived, [order['id'] for order in orders])
+                self._accumulate(orders, items, 1, hourly, product)
+                processed += len(orders)
+                after_id = orders[-1]['id']
+                if progress is not None:
+                    progress(processed, total)
+                if len(orders) < chunk_size:
+                    break
+        
+        with transaction.atomic():
+            self.sales_rollup_dao.replace_all(hourly, product)
+        return {'orders': processed, 'hourly_rows': len(hourly), 'product_rows': len(product)}
+    
+    def get_daily_sales(
+        self, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        日別の売上を取得
+        
+        Args:
+            date_from: 売上日の開始（この日を含む。省略時は今日）
+            date_to: 売上日の終了（この日を含む。省略時は date_from と同じ日）
+        
+        Returns:
+            sales_date・order_count・quantity・revenue の辞書のリスト（日付順）
+            
+        Raises:
+            HttpError: 開始が終了より後の場合
+        """
+        return self._get_sales_by('sales_date', date_from, date_to)
+    
+    def get_hourly_sales(
+        self, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        時間帯別の売上を取得（期間内の同じ時間帯を合計）
+        
+        Args:
+            date_from: 売上日の開始（この日を含む。省略時は今日）
+            date_to: 売上日の終了（この日を含む。省略時は date_from と同じ日）
+        
+        Returns:
+            hour・order_count・quantity・revenue の辞書のリスト（時間帯順）
+            
+        Raises:
+            HttpError: 開始が終了より後の場合
+        """
+        return self._get_sales_by('hour', date_from, date_to)
+    
+    def get_table_sales(
+        self, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        テーブル別の売上を取得
+        
+        Args:
+            date_from: 売上日の開始（この日を含む。省略時は今日）
+            date_to: 売上日の終了（この日を含む。省略時は date_from と同じ日）
+        
+        Returns:
+            table_number・order_count・quantity・revenue の辞書のリスト（テーブル番号順）
+            
+        Raises:
+            HttpError: 開始が終了より後の場合
+        """
+        return self._get_sales_by('table_number', date_from, date_to)
+    
+    def get_product_sales(
+        self, date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        商品別の売上を取得
+        
+        Args:
+            date_from: 売上日の開始（この日を含む。省略時は今日）
+            date_to: 売上日の終了（この日を含む。省略時は date_from と同じ日）
+        
+        Returns:
+            product_id・product_name・quantity・revenue の辞書のリスト（売上の多い順）
+            
+        Raises:
+            HttpError: 開始が終了より後の場合
+        """
+        date_from, date_to = self._date_range(date_from, date_to)
+        return list(self.sales_rollup_dao.get_product_sales(date_from, date_to))
+    
+    def _get_sales_by(
+        self, group_by: str, date_from: Optional[date], date_to: Optional[date]
+    ) -> List[Dict[str, Any]]:
+        """
+        時間帯・テーブル別の売上を指定した列で集計
+        
+        Args:
+            group_by: 集計する列
+            date_from: 売上日の開始
+            date_to: 売上日の終了
+        
+        Returns:
+            集計結果の辞書のリスト
+        """
+        date_from, date_to = self._date_range(date_from, date_to)
+        return list(self.sales_rollup_dao.get_sales_by(group_by, date_from, date_to))
+    
+    def _date_range(self, date_from: Optional[date], date_to: Optional[date]) -> Tuple[date, date]:
+        """
+        省略された期間を補う（開始の省略時は今日、終了の省略時は開始と同じ日）
+        
+        Args:
+            date_from: 売上日の開始
+            date_to: 売上日の終了
+        
+        Returns:
+            (開始, 終了)
+        
+        Raises:
+            HttpError: 開始が終了より後の場合
+        """
+        date_from = date_from or timezone.localdate()
+        date_to = date_to or date_from
+        if date_from > date_to:
+            raise HttpError(400, "date_fromはdate_to以前の日付を指定してください")
+        return date_from, date_to
+    
+    def _apply(self, orders: List[Dict[str, Any]], items: List[Dict[str, Any]], sign: int) -> None:
+        """
+        注文を集計に加算または減算
+        
+        Args:
+            orders: ORDER_FIELDS の辞書のリスト
+            items: ITEM_FIELDS の辞書のリスト
+            sign: 1（加算）または -1（減算）
+        """
+        hourly: SalesDeltas = defaultdict(lambda: {'order_count': 0, 'quantity': 0, 'revenue': 0})
+        product: SalesDeltas = defaultdict(lambda: {'quantity': 0, 'revenue': 0})
+        self._accumulate(orders, items, sign, hourly, product)
+        self.sales_rollup_dao.add_hourly_sales(hourly)
+        self.sales_rollup_dao.add_product_sales(product)
+    
+    def _accumulate(
+        self,
+        orders: List[Dict[str, Any]],
+        items: Iterable[Dict[str, Any]],
+        sign: int,
+        hourly: SalesDeltas,
+        product: SalesDeltas,
+    ) -> None:
+        """
+        注文と注文明細を集計のキーごとに合計
+        
+        Args:
+            orders: ORDER_FIELDS の辞書のリスト
+            items: ITEM_FIELDS の辞書のリスト
+            sign: 1（加算）または -1（減算）
+            hourly: 時間帯・テーブル別の合計（更新される）
+            product: 時間帯・商品別の合計（更新される）
+        """
+        # 注文IDごとの (売上日, 時)
+        periods = {}
+        for order in orders:
+            period = periods[order['id']] = self._period(order['created_at'])
+            totals = hourly[period + (order['table_number'],)]
+            totals['order_count'] += sign
+            totals['revenue'] += sign * int(order['total_price'])
+        tables = {order['id']: order['table_number'] for order in orders}
+        for item in items:
+            period = periods[item['order_id']]
+            quantity = sign * item['quantity']
+            hourly[period + (tables[item['order_id']],)]['quantity'] += quantity
+            totals = product[period + (item['product_id'],)]
+            totals['quantity'] += quantity
+            totals['revenue'] += quantity * int(item['price'])
+    
+    def _period(self, created_at: datetime) -> Tuple[date, int]:
+        """注文の作成日時を集計の (売上日, 時) に変換（TIME_ZONEの日付・時）"""
+        local = timezone.localtime(created_at)
+        return local.date(), local.hour
+    
+    def _order_row(self, order: Order) -> Dict[str, Any]:
+        """注文を集計用の辞書に変換"""
+        return {field: getattr(order, field) for field in SalesRollupDAO.ORDER_FIELDS}
+    
+    def _item_row(self, item: Any) -> Dict[str, Any]:
+        """注文明細を集計用の辞書に変換"""
+        return {field: getattr(item, field) for field in SalesRollupDAO.ITEM_FIELDS}
\ No newline at end of file
@@ -0,0 +1,24 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import Category, Product
+from api.dao.menu_version_dao import MenuVersionDAO
+from api.services.menu_cache import menu_cache
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_menu_cache(sender, **kwargs):
+    """
+    カテゴリ・商品の更新時にメニューバージョンを加算し、キャッシュを破棄する
+    
+    コミット前に他のスレッドが古いデータを読み込む可能性があるため、
+    コミット後にも再度破棄する。
+    QuerySet.update() などシグナルが送信されない一括更新では無効化されない点に注意。
+    """
+    MenuVersionDAO().increment()
+    menu_cache.invalidate()
+    transaction.on_commit(menu_cache.invalidate)
\ No newline at end of file
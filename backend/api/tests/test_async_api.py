@@ -0,0 +1,75 @@
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.urls import resolve
+from core.models import Category, Product, Order, OrderItem
+
+
+class AsyncAPITest(TestCase):
+    """非同期の読み取りエンドポイントのテストクラス（ASGIのリクエストで検証する）"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+        self.order = Order.objects.create(table_number=1, total_price=2000)
+        OrderItem.objects.create(order=self.order, product=self.product, quantity=2, price=1000)
+
+    def test_read_endpoints_are_async(self):
+        """読み取りエンドポイントが非同期ビューとして登録されていることのテスト"""
+        for path in ('/api/categories/', '/api/categories/1', '/api/products/', '/api/products/1',
+                     '/api/orders/', '/api/orders/1'):
+            with self.subTest(path=path):
+                self.assertTrue(resolve(path).func.__self__.is_async)
+
+    async def test_list_categories(self):
+        """カテゴリ一覧のテスト"""
+        response = await self.async_client.get('/api/categories/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([category['name'] for category in response.json()], ["テストカテゴリ"])
+        
+        # ETagによる条件付きGET
+        response = await self.async_client.get('/api/categories/', headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+    async def test_list_products_by_category(self):
+        """カテゴリ別の商品一覧のテスト"""
+        response = await self.async_client.get('/api/products/', {'category_id': self.category.id})
+        self.assertEqual([product['name'] for product in response.json()], ["テスト商品"])
+        
+        # 存在しないカテゴリ
+        response = await self.async_client.get('/api/products/', {'category_id': 999})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_get_product(self):
+        """商品詳細のテスト"""
+        response = await self.async_client.get(f'/api/products/{self.product.id}')
+        self.assertEqual(response.json()['price'], 1000)
+        
+        response = await self.async_client.get('/api/products/999')
+        self.assertEqual(response.status_code, 404)
+
+    async def test_orders(self):
+        """注文一覧・注文詳細のテスト"""
+        response = await self.async_client.get('/api/orders/', {'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['items'][0]['product']['name'], "テスト商品")
+        
+        response = await self.async_client.get(f'/api/orders/{self.order.id}')
+        self.assertEqual(response.json()['total_price'], 2000)
+        self.assertEqual(len(response.json()['items']), 1)
+        
+        response = await self.async_client.get('/api/orders/999')
+        self.assertEqual(response.status_code, 404)
+
+    async def test_write_endpoints_on_async_path(self):
+        """非同期のパスに同居する同期の更新エンドポイントも動作することのテスト"""
+        response = await self.async_client.put(
+            f'/api/orders/{self.order.id}',
+            data={"status": "completed"},
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        order = await sync_to_async(Order.objects.get)(id=self.order.id)
+        self.assertEqual(order.status, "completed")
\ No newline at end of file
@@ -0,0 +1,291 @@
+import os
+import tempfile
+import threading
+import time
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, Client
+from core.db import pool as pool_module
+from core.db.pool import ConnectionPool, PoolExhausted, close_pools, reset_pools_after_fork
+
+
+class FakeConnection:
+    """テスト用のDB-API接続"""
+
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def ping(connection):
+    """FakeConnectionの死活確認"""
+    if not connection.alive:
+        raise ConnectionError('切断されています')
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    """ConnectionPoolのテストクラス"""
+
+    def create_pool(self, **kwargs):
+        """テスト用のプールを作成"""
+        return ConnectionPool(name='test', connect=FakeConnection, ping=ping, **kwargs)
+
+    def test_reuse_connection(self):
+        """返却した接続が再利用されることのテスト"""
+        pool = self.create_pool()
+        conn = pool.acquire()
+        pool.release(conn)
+
+        self.assertIs(pool.acquire(), conn)
+        self.assertEqual(conn.rollbacks, 1)
+        stats = pool.stats()
+        self.assertEqual(stats['connections_created'], 1)
+        self.assertEqual(stats['checkouts'], 2)
+        self.assertEqual(stats['in_use'], 1)
+
+    def test_fill_min_size(self):
+        """min_size まで接続が作成されることのテスト"""
+        pool = self.create_pool(min_size=2)
+        pool.fill()
+
+        stats = pool.stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['idle'], 2)
+
+    def test_exhausted(self):
+        """上限に達して待機時間を過ぎた場合に例外となることのテスト"""
+        pool = self.create_pool(max_size=1, timeout=0.05)
+        pool.acquire()
+
+        with self.assertLogs('core.db.pool', 'WARNING'), self.assertRaises(PoolExhausted):
+            pool.acquire()
+        stats = pool.stats()
+        self.assertEqual(stats['exhaustions'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_wait_for_release(self):
+        """上限に達している場合は返却を待って接続を取得することのテスト"""
+        pool = self.create_pool(max_size=1, timeout=5)
+        conn = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=[conn])
+        timer.start()
+
+        self.assertIs(pool.acquire(), conn)
+        timer.join()
+        stats = pool.stats()
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['max_wait_ms'], 0)
+        self.assertEqual(stats['max_in_use'], 1)
+
+    def test_health_check_on_checkout(self):
+        """切断された接続は取得時に破棄されることのテスト"""
+        pool = self.create_pool()
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.alive = False
+
+        new_conn = pool.acquire()
+        self.assertIsNot(new_conn, conn)
+        self.assertTrue(conn.closed)
+        stats = pool.stats()
+        self.assertEqual(stats['health_check_failures'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_health_check_interval(self):
+        """確認間隔内に返却された接続は確認しないことのテスト"""
+        pool = self.create_pool(health_check_interval=60)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.alive = False
+
+        self.assertIs(pool.acquire(), conn)
+
+    def test_max_lifetime(self):
+        """max_lifetime を超えた接続は返却時に閉じることのテスト"""
+        pool = self.create_pool(max_lifetime=0)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.stats()['size'], 0)
+
+    def test_max_idle(self):
+        """下限を超えて待機している接続が閉じられることのテスト"""
+        pool = self.create_pool(min_size=1, max_idle=0)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        # 長く待機していた接続から閉じ、下限の1件は残す
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_discard(self):
+        """破棄した接続は再利用されないことのテスト"""
+        pool = self.create_pool()
+        conn = pool.acquire()
+        pool.discard(conn)
+
+        self.assertTrue(conn.closed)
+        self.assertIsNot(pool.acquire(), conn)
+        self.assertEqual(pool.stats()['in_use'], 1)
+
+    def test_release_unknown_connection(self):
+        """このプールが作成していない接続は閉じずに無視することのテスト"""
+        pool = self.create_pool()
+        conn = FakeConnection()
+        pool.release(conn)
+
+        self.assertFalse(conn.closed)
+        self.assertEqual(pool.stats()['idle'], 0)
+
+    def test_close(self):
+        """プールの終了後に返却された接続は閉じることのテスト"""
+        pool = self.create_pool()
+        idle, in_use = pool.acquire(), pool.acquire()
+        pool.release(idle)
+        pool.close()
+        pool.release(in_use)
+
+        self.assertTrue(idle.closed)
+        self.assertTrue(in_use.closed)
+        self.assertEqual(pool.stats()['size'], 0)
+
+
+class PooledBackendTest(SimpleTestCase):
+    """接続プールを使用するデータベースバックエンドのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        fd, self.path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(fd)
+        self.handler = ConnectionHandler({
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': self.path,
+            },
+            'pooled': {
+                'ENGINE': 'core.db.backends.latency_sqlite3',
+                'NAME': self.path,
+                'POOL': {'MIN_SIZE': 1, 'MAX_SIZE': 2, 'TIMEOUT': 1},
+                'LATENCY': {'CONNECT': 0.05},
+            },
+            'unpooled': {
+                'ENGINE': 'core.db.backends.latency_sqlite3',
+                'NAME': self.path,
+                'LATENCY': {'CONNECT': 0.05},
+            },
+        })
+
+    def tearDown(self):
+        """テスト後の後処理"""
+        self.handler.close_all()
+        close_pools('pooled')
+        os.remove(self.path)
+
+    def run_request(self, alias):
+        """リクエストと同様に接続してクエリを実行し、接続を閉じる"""
+        connection = self.handler[alias]
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            self.assertEqual(cursor.fetchone(), (1,))
+        connection.close()
+
+    def test_connection_reused(self):
+        """接続を閉じてもプールへ返却されて再利用されることのテスト"""
+        for _ in range(3):
+            self.run_request('pooled')
+
+        stats = self.handler['pooled'].pool.stats()
+        self.assertEqual(stats['connections_created'], 1)
+        self.assertEqual(stats['checkouts'], 3)
+        self.assertEqual(stats['idle'], 1)
+
+    def test_connect_latency_avoided(self):
+        """プールを使用すると接続の遅延が発生しないことのテスト"""
+        self.run_request('pooled')
+        started = time.monotonic()
+        self.run_request('pooled')
+        self.assertLess(time.monotonic() - started, 0.05)
+
+        started = time.monotonic()
+        self.run_request('unpooled')
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertIsNone(self.handler['unpooled'].pool)
+
+    def test_threads_share_pool(self):
+        """スレッドごとの接続が1つのプールを共有することのテスト"""
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(5):
+                    self.run_request('pooled')
+            except Exception as e:
+                errors.append(e)
+            finally:
+                self.handler.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        stats = self.handler['pooled'].pool.stats()
+        self.assertLessEqual(stats['connections_created'], 2)
+        self.assertEqual(stats['checkouts'], 20)
+        self.assertEqual(stats['in_use'], 0)
+
+    def test_close_in_atomic_block(self):
+        """トランザクションの途中で閉じた接続は再利用しないことのテスト"""
+        connection = self.handler['pooled']
+        connection.ensure_connection()
+        raw = connection.connection
+        pool = connection.pool
+
+        connection.in_atomic_block = True
+        try:
+            connection.close()
+        finally:
+            connection.in_atomic_block = False
+            connection.closed_in_transaction = False
+            connection.needs_rollback = False
+            connection.connection = None
+
+        stats = pool.stats()
+        self.assertEqual(stats['connections_closed'], 1)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertNotIn(raw, [conn for conn, _ in pool._idle])
+
+    def test_reset_after_fork(self):
+        """fork後はプールが作り直されることのテスト"""
+        self.run_request('pooled')
+        parent_pool = self.handler['pooled'].pool
+
+        reset_pools_after_fork()
+        try:
+            self.assertIsNot(self.handler['pooled'].pool, parent_pool)
+            # 親プロセスの接続は閉じない
+            self.assertEqual(parent_pool.stats()['connections_closed'], 0)
+        finally:
+            pool_module._inherited_pools.remove(parent_pool)
+            parent_pool.close()
+
+    def test_metrics(self):
+        """プールの統計情報を取得できることのテスト"""
+        self.run_request('pooled')
+
+        response = Client().get('/api/metrics/db-pool')
+        self.assertEqual(response.status_code, 200)
+        stats = {item['alias']: item for item in response.json()}
+        self.assertEqual(stats['pooled']['checkouts'], 1)
+        self.assertEqual(stats['pooled']['max_size'], 2)
\ No newline at end of file
@@ -0,0 +1,79 @@
+import json
+import statistics
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import LiveServerTestCase, SimpleTestCase
+from core.models import Category, Product, Order
+from benchmarks.dining_room import DiningRoom, ENDPOINTS
+from benchmarks.http_load import summarize_latencies
+
+
+class DiningRoomTest(SimpleTestCase):
+    """負荷試験の集計と操作間隔のテストクラス"""
+
+    def test_summarize_latencies(self):
+        """レイテンシの統計のテスト"""
+        summary = summarize_latencies([i / 1000 for i in range(100, 0, -1)], elapsed=2.0, errors=3)
+        
+        self.assertEqual(summary['requests'], 100)
+        self.assertEqual(summary['rps'], 50.0)
+        self.assertAlmostEqual(summary['p50_ms'], 51.0)
+        self.assertAlmostEqual(summary['p95_ms'], 96.0)
+        self.assertAlmostEqual(summary['p99_ms'], 100.0)
+        self.assertEqual(summary['errors'], 3)
+        self.assertEqual(summarize_latencies([], elapsed=1.0)['p99_ms'], 0.0)
+
+    def test_think_time(self):
+        """操作間隔の平均が平均値 × 倍率になることのテスト"""
+        dining_room = DiningRoom('127.0.0.1', 80, think_scale=0.5, seed=1)
+        samples = [dining_room.think_time(10.0) for _ in range(20000)]
+        
+        self.assertAlmostEqual(statistics.mean(samples), 5.0, delta=0.15)
+        self.assertTrue(all(sample > 0 for sample in samples))
+
+
+class LoadTestCommandTest(LiveServerTestCase):
+    """loadtest コマンドのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        for i in range(2):
+            category = Category.objects.create(name=f"カテゴリ{i}", order=i)
+            for j in range(3):
+                Product.objects.create(name=f"商品{i}-{j}", price=100 * (j + 1), category=category)
+
+    def run_loadtest(self, tables, kitchens):
+        """起動済みのサーバー（live_server_url）に負荷をかけてJSONの結果を取得"""
+        out = StringIO()
+        call_command(
+            'loadtest', url=self.live_server_url, tables=tables, kitchens=kitchens, duration=1.0,
+            think_scale=0.0005, poll_interval=0.05, ramp_up=0, seed=1, json=True, stdout=out,
+        )
+        return json.loads(out.getvalue())
+
+    def test_run_against_url(self):
+        """起動済みのサーバーに負荷をかけ、エンドポイントごとの統計を出力することのテスト"""
+        # テスト用のサーバーはスレッド間でメモリ上のDBの接続を共有するため、クライアントを1台ずつ動かす
+        tables = self.run_loadtest(tables=1, kitchens=0)
+        kitchens = self.run_loadtest(tables=0, kitchens=1)
+        
+        self.assertEqual(list(tables['endpoints']), list(ENDPOINTS))
+        for label, summary in tables['endpoints'].items():
+            expected = kitchens['endpoints'][label] if label == 'GET /api/orders/changes' else summary
+            self.assertGreater(expected['requests'], 0, label)
+            self.assertEqual(summary['errors'] + kitchens['endpoints'][label]['errors'], 0, label)
+            self.assertLessEqual(summary['p50_ms'], summary['p95_ms'])
+            self.assertLessEqual(summary['p95_ms'], summary['p99_ms'])
+        self.assertEqual(
+            tables['total']['requests'], sum(summary['requests'] for summary in tables['endpoints'].values())
+        )
+        self.assertGreater(tables['orders_placed'], 0)
+        self.assertEqual(Order.objects.count(), tables['orders_placed'])
+
+    def test_invalid_options(self):
+        """不正なオプションのテスト"""
+        with self.assertRaises(CommandError):
+            call_command('loadtest', url='https://example.com', stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('loadtest', url=self.live_server_url, tables=0, kitchens=0, stdout=StringIO())
\ No newline at end of file
@@ -0,0 +1,86 @@
+from django.test import TestCase, Client
+from core.models import Category, Product
+from api.services.menu_cache import menu_cache
+
+
+class MenuAPITest(TestCase):
+    """メニューAPIのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        
+        # テスト用のカテゴリを作成
+        self.category1 = Category.objects.create(name="テストカテゴリ1", order=2)
+        self.category2 = Category.objects.create(name="テストカテゴリ2", order=1)
+        self.inactive_category = Category.objects.create(name="無効カテゴリ", order=3, is_active=False)
+        
+        # テスト用の商品を作成
+        self.product1 = Product.objects.create(
+            name="テスト商品1",
+            description="テスト商品説明1",
+            price=1000,
+            category=self.category1,
+            order=2
+        )
+        self.product2 = Product.objects.create(
+            name="テスト商品2",
+            price=2000,
+            category=self.category1,
+            order=1
+        )
+        Product.objects.create(
+            name="販売停止商品",
+            price=3000,
+            category=self.category2,
+            is_available=False
+        )
+        Product.objects.create(
+            name="無効カテゴリの商品",
+            price=4000,
+            category=self.inactive_category
+        )
+        menu_cache.invalidate()
+
+    def test_get_menu(self):
+        """メニュー取得APIのテスト"""
+        # メニューバージョンの確認とカテゴリ・商品の取得のみで組み立てられることを確認
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/menu/')
+        
+        # レスポンスの検証
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        
+        # 有効なカテゴリのみが表示順に返されることを確認
+        self.assertEqual([category['name'] for category in data], ["テストカテゴリ2", "テストカテゴリ1"])
+        
+        # 販売可能な商品のみが表示順に入れ子で返されることを確認
+        self.assertEqual(data[0]['products'], [])
+        self.assertEqual(
+            data[1]['products'],
+            [
+                {
+                    "id": self.product2.id,
+                    "name": "テスト商品2",
+                    "description": "",
+                    "price": 2000,
+                    "image": "",
+                },
+                {
+                    "id": self.product1.id,
+                    "name": "テスト商品1",
+                    "description": "テスト商品説明1",
+                    "price": 1000,
+                    "image": "",
+                },
+            ]
+        )
+
+    def test_get_menu_not_modified(self):
+        """ETagが一致する場合に304が返されることのテスト"""
+        etag = self.client.get('/api/menu/')['ETag']
+        
+        response = self.client.get('/api/menu/', HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, 304)
\ No newline at end of file
@@ -0,0 +1,119 @@
+import gzip
+from django.test import TestCase, Client, override_settings
+from django.db.models import F
+from core.models import Category, Product, MenuVersion
+from api.services.menu_cache import menu_cache
+
+
+@override_settings(MENU_CACHE_VERSION_CHECK_INTERVAL=0)
+class MenuCacheTest(TestCase):
+    """メニューキャッシュのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        
+        # テスト用のカテゴリと商品を作成
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(
+            name="テスト商品",
+            price=1000,
+            category=self.category
+        )
+        menu_cache.invalidate()
+        menu_cache.reset_stats()
+
+    def test_list_categories_cached(self):
+        """カテゴリ一覧がキャッシュから返されることのテスト"""
+        # 初回はDBから取得
+        self.assertEqual(len(self.client.get('/api/categories/').json()), 1)
+        
+        # 2回目はメニューバージョンの確認のみ
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/categories/')
+        self.assertEqual(response.json()[0]['name'], "テストカテゴリ")
+        
+        # ヒット・ミスの件数を確認（初回はレスポンスとカテゴリ一覧の2件がミス）
+        stats = self.client.get('/api/metrics/menu-cache').json()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+    @override_settings(MENU_CACHE_VERSION_CHECK_INTERVAL=60)
+    def test_version_check_interval(self):
+        """確認間隔内はメニューバージョンも確認しないことのテスト"""
+        self.client.get(f'/api/products/?category_id={self.category.id}')
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(f'/api/products/?category_id={self.category.id}')
+        self.assertEqual(response.json()[0]['name'], "テスト商品")
+
+    def test_invalidated_by_signal(self):
+        """商品の更新時にキャッシュが破棄されることのテスト"""
+        self.client.get('/api/products/')
+        version = MenuVersion.objects.get().version
+        
+        # 商品を更新
+        self.client.put(
+            f'/api/products/{self.product.id}',
+            data={"name": "更新商品"},
+            content_type='application/json'
+        )
+        
+        # メニューバージョンが加算され、更新後のデータが返されることを確認
+        self.assertGreater(MenuVersion.objects.get().version, version)
+        self.assertEqual(self.client.get('/api/products/').json()[0]['name'], "更新商品")
+
+    def test_invalidated_by_other_process(self):
+        """他のプロセスでメニューが更新された場合にキャッシュが破棄されることのテスト"""
+        self.client.get('/api/products/')
+        
+        # シグナルを送信せずに更新し、メニューバージョンのみ加算（他のプロセスでの更新を再現）
+        Product.objects.filter(id=self.product.id).update(name="他プロセスで更新")
+        MenuVersion.objects.update(version=F('version') + 1)
+        
+        self.assertEqual(self.client.get('/api/products/').json()[0]['name'], "他プロセスで更新")
+
+    @override_settings(MENU_CACHE_VERSION_CHECK_INTERVAL=60)
+    def test_not_modified(self):
+        """ETagが一致する場合に304が返されることのテスト"""
+        response = self.client.get('/api/categories/')
+        etag = response['ETag']
+        
+        # 同じETagで再リクエストすると本文なしの304が返されることを確認
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        
+        # メニューが更新されると200が返されることを確認
+        self.category.name = "更新カテゴリ"
+        self.category.save()
+        response = self.client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()[0]['name'], "更新カテゴリ")
+
+    def test_etag_depends_on_query(self):
+        """クエリパラメータごとに異なるETagが返されることのテスト"""
+        all_products = self.client.get('/api/products/')
+        category_products = self.client.get(f'/api/products/?category_id={self.category.id}')
+        
+        self.assertNotEqual(all_products['ETag'], category_products['ETag'])
+
+    def test_gzip_response(self):
+        """gzip圧縮されたレスポンスのテスト"""
+        plain = self.client.get('/api/products/')
+        compressed = self.client.get('/api/products/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertNotEqual(compressed['ETag'], plain['ETag'])
+
+    def test_gzip_refused(self):
+        """q=0でgzipを拒否した場合や別のトークンの場合は圧縮しないことのテスト"""
+        for accept_encoding in ('gzip;q=0', 'deflate, gzip; q=0.0', 'x-gzip-foo', 'br'):
+            response = self.client.get('/api/products/', HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertFalse(response.has_header('Content-Encoding'), accept_encoding)
+        
+        response = self.client.get('/api/products/', HTTP_ACCEPT_ENCODING='br, GZIP;q=0.5')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
\ No newline at end of file
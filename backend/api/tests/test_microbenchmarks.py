@@ -0,0 +1,60 @@
+from django.test import SimpleTestCase, TestCase
+from benchmarks.micro import build_benchmarks, compare_results, measure_benchmark, run_benchmarks
+
+
+def result(**medians):
+    """比較用の結果（ベンチマーク名と中央値のみ）"""
+    return {'benchmarks': {name.replace('_', '.'): {'median_us': median} for name, median in medians.items()}}
+
+
+class MicroBenchmarkTest(SimpleTestCase):
+    """マイクロベンチマークの計測と比較のテストクラス"""
+
+    def test_measure_benchmark(self):
+        """1回の計測が min_time 以上になる回数で計測し、1回あたりの時間を返すことのテスト"""
+        calls = []
+        
+        def time_func(loops):
+            calls.append(loops)
+            return loops * 0.001
+        
+        measured = measure_benchmark(time_func, repeat=3, min_time=0.05)
+        
+        self.assertGreaterEqual(measured['loops'] * 0.001, 0.05)
+        self.assertEqual(calls[-3:], [measured['loops']] * 3)
+        self.assertAlmostEqual(measured['median_us'], 1000.0)
+        self.assertAlmostEqual(measured['stdev_us'], 0.0)
+        self.assertEqual(measured['repeat'], 3)
+
+    def test_compare_results(self):
+        """中央値が閾値を超えて遅くなったベンチマークを検出することのテスト"""
+        base = result(dao_create=100.0, dao_update=200.0, dao_delete=300.0)
+        head = result(dao_create=125.0, dao_update=210.0, menu_http=50.0)
+        
+        comparisons = {item['name']: item for item in compare_results(base, head, threshold=0.2)}
+        
+        # 比較元にないベンチマークは比較しない
+        self.assertEqual(set(comparisons), {'dao.create', 'dao.update'})
+        self.assertAlmostEqual(comparisons['dao.create']['change'], 0.25)
+        self.assertTrue(comparisons['dao.create']['regression'])
+        self.assertFalse(comparisons['dao.update']['regression'])
+        self.assertFalse(any(item['regression'] for item in compare_results(base, head, threshold=0.3)))
+
+
+class RunBenchmarksTest(TestCase):
+    """ベンチマークの実行のテストクラス"""
+
+    def test_run_benchmarks(self):
+        """各ベンチマークを空のデータベースから実行できることのテスト"""
+        benchmarks = [
+            benchmark for benchmark in build_benchmarks()
+            if benchmark.name in ('dao.delete', 'service.create_order[cart=5]', 'menu.products.http[catalog=10]')
+        ]
+        reported = []
+        
+        results = run_benchmarks(benchmarks, repeat=2, min_time=0.001, progress=lambda name, _: reported.append(name))
+        
+        self.assertEqual(list(results), [benchmark.name for benchmark in benchmarks])
+        self.assertEqual(reported, list(results))
+        for measured in results.values():
+            self.assertGreater(measured['median_us'], 0)
\ No newline at end of file
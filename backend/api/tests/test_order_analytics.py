@@ -0,0 +1,171 @@
+import json
+from collections import Counter
+from datetime import datetime, timedelta
+from io import StringIO
+from zoneinfo import ZoneInfo
+import numpy as np
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from core.models import Category, Product, Order, OrderItem
+from api.services.order_archive_service import OrderArchiveService
+from api.services.order_analytics_service import DemandAccumulator, OrderAnalyticsService, OrderItemColumns
+
+
+def columns(rows):
+    """(商品ID, 数量, 価格, 作成日時) のリストから注文明細の列を作成"""
+    return OrderItemColumns.from_rows([row + (index,) for index, row in enumerate(rows)])
+
+
+class DemandAccumulatorTest(SimpleTestCase):
+    """DemandAccumulatorのテストクラス"""
+
+    def test_ranking_and_hour_of_week(self):
+        """商品別の集計と曜日・時間帯の振り分けのテスト"""
+        tokyo = ZoneInfo('Asia/Tokyo')
+        monday_noon = datetime(2024, 1, 1, 12, tzinfo=tokyo)
+        sunday_night = datetime(2024, 1, 7, 23, 30, tzinfo=tokyo)
+        accumulator = DemandAccumulator(tokyo)
+        accumulator.add(columns([(1, 2, 400, monday_noon), (5, 1, 600, sunday_night)]))
+        accumulator.add(columns([(1, 1, 400, sunday_night)]))
+        
+        self.assertEqual(accumulator.item_count, 3)
+        self.assertEqual(accumulator.ranking(), [(1, 3, 1200), (5, 1, 600)])
+        self.assertEqual(accumulator.ranking(top=1), [(1, 3, 1200)])
+        self.assertEqual(accumulator.hour_of_week[0, 12], 2)
+        self.assertEqual(accumulator.hour_of_week[6, 23], 2)
+        self.assertEqual(accumulator.hour_of_week.sum(), 4)
+        self.assertEqual(accumulator.revenue_by_group({1: 10, 5: 20}), {10: 1200, 20: 600})
+
+    def test_daylight_saving_time(self):
+        """夏時間のあるタイムゾーンでも現地の時間帯に振り分けられることのテスト"""
+        new_york = ZoneInfo('America/New_York')
+        winter = datetime(2024, 1, 3, 9, tzinfo=new_york)
+        summer = datetime(2024, 7, 3, 9, tzinfo=new_york)
+        accumulator = DemandAccumulator(new_york)
+        accumulator.add(columns([(1, 1, 100, winter), (1, 1, 100, summer)]))
+        
+        # どちらも水曜日の9時
+        self.assertEqual(accumulator.hour_of_week[2, 9], 2)
+
+    def test_matches_python_loop(self):
+        """行ごとに集計した結果と一致することのテスト"""
+        tokyo = ZoneInfo('Asia/Tokyo')
+        rng = np.random.default_rng(0)
+        start = datetime(2024, 1, 1, tzinfo=tokyo)
+        rows = [
+            (int(product_id), int(quantity), int(price), start + timedelta(minutes=int(minutes)))
+            for product_id, quantity, price, minutes in zip(
+                rng.integers(1, 30, 2000), rng.integers(1, 5, 2000),
+                rng.integers(1, 20, 2000) * 100, rng.integers(0, 60 * 24 * 60, 2000),
+            )
+        ]
+        accumulator = DemandAccumulator(tokyo)
+        for offset in range(0, len(rows), 300):
+            accumulator.add(columns(rows[offset:offset + 300]))
+        
+        quantity, revenue, slots = Counter(), Counter(), Counter()
+        for product_id, item_quantity, price, created_at in rows:
+            quantity[product_id] += item_quantity
+            revenue[product_id] += item_quantity * price
+            slots[(created_at.weekday(), created_at.hour)] += item_quantity
+        self.assertEqual({row[0]: (row[1], row[2]) for row in accumulator.ranking()}, {
+            product_id: (quantity[product_id], revenue[product_id]) for product_id in quantity
+        })
+        self.assertEqual(
+            {(day, hour): int(accumulator.hour_of_week[day, hour]) for day, hour in slots}, dict(slots)
+        )
+
+
+class OrderAnalyticsTest(TestCase):
+    """需要分析のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        drinks = Category.objects.create(name="ドリンク", order=1)
+        desserts = Category.objects.create(name="デザート", order=2)
+        self.coffee = Product.objects.create(name="コーヒー", price=400, category=drinks)
+        self.tea = Product.objects.create(name="紅茶", price=500, category=drinks)
+        self.cake = Product.objects.create(name="ケーキ", price=600, category=desserts)
+        
+        # 2024-01-01（月）12時（日本時間）の注文
+        self.create_order('completed', [(self.coffee, 3), (self.cake, 1)], datetime(2024, 1, 1, 12))
+        self.create_order('pending', [(self.tea, 1)], datetime(2024, 1, 2, 9))
+        # キャンセルされた注文は除く
+        self.create_order('cancelled', [(self.cake, 10)], datetime(2024, 1, 1, 12))
+        # 40日以上前の注文はアーカイブする
+        self.create_order('completed', [(self.cake, 2)], datetime(2023, 11, 1, 18))
+        OrderArchiveService().archive(older_than_days=30, pause=0)
+
+    def create_order(self, status, items, created_at):
+        """作成日時を指定して注文を作成"""
+        created_at = timezone.make_aware(created_at)
+        order = Order.objects.create(table_number=1, status=status, total_price=0)
+        for product, quantity in items:
+            OrderItem.objects.create(order=order, product=product, quantity=quantity, price=product.price)
+        Order.objects.filter(id=order.id).update(created_at=created_at)
+        OrderItem.objects.filter(order=order).update(created_at=created_at)
+        return order
+
+    @override_settings(ORDER_ANALYTICS_MAX_DAYS=100)
+    def test_analytics_api(self):
+        """需要分析APIのテスト"""
+        response = self.client.get('/api/reports/analytics?date_from=2023-11-01&date_to=2024-01-31')
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        
+        self.assertEqual(result['item_count'], 4)
+        self.assertEqual(result['total_quantity'], 7)
+        self.assertEqual(result['total_revenue'], 3500)
+        self.assertEqual(
+            [(product['rank'], product['product_name'], product['quantity']) for product in result['products']],
+            # 数量が同じ場合は売上の多い順
+            [(1, "ケーキ", 3), (2, "コーヒー", 3), (3, "紅茶", 1)],
+        )
+        self.assertEqual(
+            [(category['category_name'], category['revenue'], category['share']) for category in result['categories']],
+            [("デザート", 1800, 0.5143), ("ドリンク", 1700, 0.4857)],
+        )
+        self.assertEqual(result['weekdays'][0], "月")
+        self.assertEqual(result['hour_of_week'][0][12], 4)
+        self.assertEqual(result['hour_of_week'][1][9], 1)
+        self.assertEqual(result['hour_of_week'][2][18], 2)
+
+    def test_date_range(self):
+        """期間を指定した需要分析のテスト"""
+        result = self.client.get('/api/reports/analytics?date_from=2024-01-01&date_to=2024-01-01&top=1').json()
+        self.assertEqual(result['item_count'], 2)
+        self.assertEqual([product['product_name'] for product in result['products']], ["コーヒー"])
+        
+        response = self.client.get('/api/reports/analytics?date_from=2024-01-02&date_to=2024-01-01')
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(ORDER_ANALYTICS_MAX_DAYS=31)
+    def test_date_range_limit(self):
+        """期間の省略時は直近の期間だけを分析し、長すぎる期間を拒否することのテスト"""
+        self.create_order('completed', [(self.tea, 2)], timezone.localtime().replace(tzinfo=None) - timedelta(days=30))
+        
+        result = self.client.get('/api/reports/analytics').json()
+        self.assertEqual([(product['product_name'], product['quantity']) for product in result['products']], [("紅茶", 2)])
+        
+        response = self.client.get('/api/reports/analytics?date_from=2024-01-01&date_to=2024-02-01')
+        self.assertEqual(response.status_code, 422)
+        response = self.client.get('/api/reports/analytics?date_from=2024-01-01')
+        self.assertEqual(response.status_code, 422)
+
+    def test_chunks(self):
+        """チャンクの大きさによらず同じ結果になることのテスト"""
+        service = OrderAnalyticsService()
+        self.assertEqual(service.analyze(chunk_size=1), service.analyze())
+        self.assertEqual(len(list(service.iter_columns(chunk_size=2))), 3)
+
+    def test_command(self):
+        """analyze_demand コマンドのテスト"""
+        out = StringIO()
+        call_command('analyze_demand', '--top', '2', stdout=out)
+        self.assertIn('1. ケーキ', out.getvalue())
+        self.assertNotIn('紅茶', out.getvalue())
+        
+        out = StringIO()
+        call_command('analyze_demand', '--json', '--from', '2024-01-02', stdout=out)
+        self.assertEqual(json.loads(out.getvalue())['total_revenue'], 500)
\ No newline at end of file
@@ -1,9 +1,14 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
-from core.models import Category, Product, Order, OrderItem
+from django.utils import timezone
+from core.models import Category, Product, Order, OrderItem, IdempotencyKey
 import json
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 class OrderAPITest(TestCase):
@@ -100,6 +105,23 @@ class OrderAPITest(TestCase):
         self.assertIn(self.order1.id, order_ids)
         self.assertIn(self.order2.id, order_ids)
 
+    def test_list_orders_matches_schema_output(self):
+        """注文一覧のレスポンスがOrderOut.from_ormと同じJSONになることのテスト"""
+        from api.api_config import api
+        from api.schemas.order import OrderOut
+        
+        orders = Order.objects.prefetch_related('items__product').order_by('-created_at', '-id')
+        expected = api.create_response(
+            None, [OrderOut.from_orm(order).dict() for order in orders], status=200
+        ).content
+        
+        # 注文・注文明細・商品の3クエリで取得されることを確認
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/orders/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected)
+
     def test_list_orders_by_table(self):
         """テーブル番号でフィルタリングした注文一覧取得APIのテスト"""
         # テーブル1でフィルタリング
@@ -128,6 +150,71 @@ class OrderAPITest(TestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]['id'], self.order2.id)
 
+    def test_list_orders_pagination(self):
+        """カーソルによる注文一覧のページ送りのテスト"""
+        # 作成日時が同じ注文を含めて追加で作成
+        created_at = timezone.now() - timedelta(hours=1)
+        for table_number in range(3, 8):
+            order = Order.objects.create(table_number=table_number, total_price=0)
+            Order.objects.filter(id=order.id).update(created_at=created_at)
+        
+        # 2件ずつ全ページを取得
+        order_ids = []
+        cursor = None
+        for _ in range(10):
+            url = '/api/orders/?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.json()), 2)
+            order_ids += [order['id'] for order in response.json()]
+            cursor = response.get('X-Next-Cursor')
+            if not cursor:
+                break
+        
+        # すべての注文が新しい順に重複なく返されることを確認
+        expected_ids = list(Order.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(order_ids, expected_ids)
+
+    @override_settings(ORDER_LIST_MAX_LIMIT=1)
+    def test_list_orders_limit_cap(self):
+        """1ページの件数が上限に切り詰められることのテスト"""
+        response = self.client.get('/api/orders/?limit=100')
+        
+        self.assertEqual(len(response.json()), 1)
+        self.assertIn('X-Next-Cursor', response)
+
+    def test_list_orders_invalid_cursor(self):
+        """不正なカーソルでの注文一覧取得APIのテスト"""
+        response = self.client.get('/api/orders/?cursor=invalid')
+        
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_orders_filters(self):
+        """ステータス・期間で絞り込んだ注文一覧取得APIのテスト"""
+        cancelled = Order.objects.create(table_number=1, status="cancelled", total_price=0)
+        
+        # 複数のステータスで絞り込み
+        response = self.client.get('/api/orders/?status=pending&status=cancelled')
+        self.assertEqual(
+            {order['id'] for order in response.json()},
+            {self.order1.id, cancelled.id}
+        )
+        
+        # テーブル番号とステータスで絞り込み
+        response = self.client.get('/api/orders/?table_number=1&status=cancelled')
+        self.assertEqual([order['id'] for order in response.json()], [cancelled.id])
+        
+        # 作成日時の範囲で絞り込み
+        Order.objects.filter(id=self.order2.id).update(created_at=timezone.now() - timedelta(days=2))
+        created_from = (timezone.now() - timedelta(days=1)).isoformat()
+        response = self.client.get('/api/orders/', {'created_from': created_from})
+        self.assertEqual(
+            {order['id'] for order in response.json()},
+            {self.order1.id, cancelled.id}
+        )
+        response = self.client.get('/api/orders/', {'created_to': created_from})
+        self.assertEqual([order['id'] for order in response.json()], [self.order2.id])
+
     def test_get_order(self):
         """注文詳細取得APIのテスト"""
         # APIリクエスト
@@ -255,6 +342,216 @@ class OrderAPITest(TestCase):
         # エラーが返されることを確認
         self.assertEqual(response.status_code, 404)
 
+    def test_create_order_unavailable_product(self):
+        """販売停止中の商品を含む注文作成APIのテスト"""
+        # 販売停止中の商品を作成
+        unavailable_product = Product.objects.create(
+            name="販売停止商品",
+            price=500,
+            category=self.category,
+            is_available=False
+        )
+        order_count = Order.objects.count()
+        
+        order_data = {
+            "table_number": 3,
+            "items": [
+                {"product_id": self.product1.id, "quantity": 1},
+                {"product_id": unavailable_product.id, "quantity": 1}
+            ]
+        }
+        
+        # APIリクエスト
+        response = self.client.post(
+            '/api/orders/',
+            data=json.dumps(order_data),
+            content_type='application/json'
+        )
+        
+        # エラーが返され、注文が作成されていないことを確認
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Order.objects.count(), order_count)
+
+    def test_create_order_query_count_is_constant(self):
+        """明細数に関わらず注文作成APIのクエリ数が一定であることのテスト"""
+        products = [
+            Product.objects.create(
+                name=f"クエリ数テスト商品{i}",
+                price=100 * (i + 1),
+                category=self.category
+            )
+            for i in range(12)
+        ]
+        
+        def post_order(cart_products):
+            order_data = {
+                "table_number": 5,
+                "items": [
+                    {"product_id": product.id, "quantity": 2}
+                    for product in cart_products
+                ]
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    '/api/orders/',
+                    data=json.dumps(order_data),
+                    content_type='application/json'
+                )
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(len(response.json()['items']), len(cart_products))
+            return len(queries)
+        
+        # 1明細と12明細でクエリ数が変わらないことを確認
+        self.assertEqual(post_order(products[:1]), post_order(products))
+
+    def test_create_order_idempotency_key(self):
+        """Idempotency-Key付きで再送された注文作成APIのテスト"""
+        order_count = Order.objects.count()
+        order_data = {
+            "table_number": 3,
+            "items": [{"product_id": self.product1.id, "quantity": 2}]
+        }
+        
+        def post_order():
+            return self.client.post(
+                '/api/orders/',
+                data=json.dumps(order_data),
+                content_type='application/json',
+                HTTP_IDEMPOTENCY_KEY='tablet-3-0001'
+            )
+        
+        # 初回リクエスト
+        first_response = post_order()
+        self.assertEqual(first_response.status_code, 201)
+        
+        # 再送時は冪等キーの検索のみで保存済みのレスポンスが返されることを確認
+        with self.assertNumQueries(1):
+            second_response = post_order()
+        self.assertEqual(second_response.status_code, 201)
+        self.assertEqual(second_response.json(), first_response.json())
+        
+        # 注文は1件のみ作成されていることを確認
+        self.assertEqual(Order.objects.count(), order_count + 1)
+
+    def test_create_order_idempotency_key_mismatch(self):
+        """同じIdempotency-Keyで異なる内容の注文作成APIのテスト"""
+        for quantity, expected_status in ((1, 201), (2, 422)):
+            response = self.client.post(
+                '/api/orders/',
+                data=json.dumps({
+                    "table_number": 3,
+                    "items": [{"product_id": self.product1.id, "quantity": quantity}]
+                }),
+                content_type='application/json',
+                HTTP_IDEMPOTENCY_KEY='tablet-3-0002'
+            )
+            self.assertEqual(response.status_code, expected_status)
+
+    def test_create_order_idempotency_key_expired(self):
+        """有効期限切れのIdempotency-Keyで注文作成APIのテスト"""
+        order_data = {
+            "table_number": 3,
+            "items": [{"product_id": self.product1.id, "quantity": 1}]
+        }
+        IdempotencyKey.objects.create(
+            key='tablet-3-0003',
+            request_hash='',
+            status_code=201,
+            response_body={},
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        order_count = Order.objects.count()
+        
+        response = self.client.post(
+            '/api/orders/',
+            data=json.dumps(order_data),
+            content_type='application/json',
+            HTTP_IDEMPOTENCY_KEY='tablet-3-0003'
+        )
+        
+        # 期限切れのキーは破棄され、新しい注文が作成されることを確認
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Order.objects.count(), order_count + 1)
+        self.assertEqual(IdempotencyKey.objects.get(key='tablet-3-0003').response_body['id'], response.json()['id'])
+
+    def test_create_order_keeps_other_expired_keys(self):
+        """注文作成時には他の期限切れのキーを削除せず、定期実行のコマンドで削除することのテスト"""
+        IdempotencyKey.objects.create(
+            key='tablet-3-0004',
+            request_hash='',
+            status_code=201,
+            response_body={},
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        
+        response = self.client.post(
+            '/api/orders/',
+            data=json.dumps({"table_number": 3, "items": [{"product_id": self.product1.id, "quantity": 1}]}),
+            content_type='application/json',
+            HTTP_IDEMPOTENCY_KEY='tablet-3-0005'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(IdempotencyKey.objects.filter(key='tablet-3-0004').exists())
+        
+        out = StringIO()
+        call_command('purge_idempotency_keys', stdout=out)
+        self.assertIn('1件削除', out.getvalue())
+        self.assertEqual(list(IdempotencyKey.objects.values_list('key', flat=True)), ['tablet-3-0005'])
+
+    def test_create_orders_batch(self):
+        """注文一括作成APIのテスト"""
+        order_count = Order.objects.count()
+        
+        # 2件目のみ存在しない商品を含む
+        batch_data = {
+            "orders": [
+                {
+                    "table_number": 3,
+                    "items": [
+                        {"product_id": self.product1.id, "quantity": 2},
+                        {"product_id": self.product2.id, "quantity": 1}
+                    ]
+                },
+                {
+                    "table_number": 4,
+                    "items": [{"product_id": 999, "quantity": 1}]
+                },
+                {
+                    "table_number": 5,
+                    "status": "processing",
+                    "items": [{"product_id": self.product2.id, "quantity": 3}]
+                }
+            ]
+        }
+        
+        # APIリクエスト
+        response = self.client.post(
+            '/api/orders/batch',
+            data=json.dumps(batch_data),
+            content_type='application/json'
+        )
+        
+        # レスポンスの検証
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([result['index'] for result in data], [0, 1, 2])
+        self.assertEqual([result['success'] for result in data], [True, False, True])
+        
+        # 成功した注文の内容を確認
+        self.assertEqual(data[0]['order']['table_number'], 3)
+        self.assertEqual(data[0]['order']['total_price'], 4000)
+        self.assertEqual(len(data[0]['order']['items']), 2)
+        self.assertEqual(data[2]['order']['status'], "processing")
+        self.assertEqual(data[2]['order']['total_price'], 6000)
+        
+        # 失敗した注文には理由が返されることを確認
+        self.assertIsNone(data[1]['order'])
+        self.assertIn("999", data[1]['detail'])
+        
+        # 成功した2件のみ作成されていることを確認
+        self.assertEqual(Order.objects.count(), order_count + 2)
+        self.assertEqual(Order.objects.get(id=data[2]['order']['id']).items.count(), 1)
+
     def test_update_order(self):
         """注文更新APIのテスト"""
         # 更新する注文データ
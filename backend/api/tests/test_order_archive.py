@@ -0,0 +1,90 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from core.models import Category, Product, Order, OrderItem, ArchivedOrder, ArchivedOrderItem
+from api.dao.archived_order_dao import ArchivedOrderDAO
+from api.services.order_archive_service import OrderArchiveService
+
+
+class OrderArchiveTest(TestCase):
+    """注文のアーカイブのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+        
+        # 40日前の完了・キャンセル・処理中の注文と、当日の完了済みの注文
+        self.old_completed = self.create_order('completed', days_ago=40)
+        self.old_cancelled = self.create_order('cancelled', days_ago=40)
+        self.old_processing = self.create_order('processing', days_ago=40)
+        self.recent_completed = self.create_order('completed', days_ago=0)
+
+    def create_order(self, status, days_ago):
+        """作成日時を指定して注文を作成"""
+        order = Order.objects.create(table_number=1, status=status, total_price=2000)
+        OrderItem.objects.create(order=order, product=self.product, quantity=2, price=1000)
+        Order.objects.filter(id=order.id).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return order
+
+    def test_archive(self):
+        """完了・キャンセル済みの古い注文のみ移動されることのテスト"""
+        progress = []
+        archived = OrderArchiveService().archive(
+            older_than_days=30, chunk_size=1, pause=0,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+        
+        self.assertEqual(archived, 2)
+        self.assertEqual(progress, [(1, 2), (2, 2)])
+        self.assertEqual(
+            set(ArchivedOrder.objects.values_list('id', flat=True)),
+            {self.old_completed.id, self.old_cancelled.id},
+        )
+        self.assertEqual(
+            set(Order.objects.values_list('id', flat=True)),
+            {self.old_processing.id, self.recent_completed.id},
+        )
+        # 注文明細も移動される
+        self.assertEqual(ArchivedOrderItem.objects.count(), 2)
+        self.assertEqual(OrderItem.objects.count(), 2)
+
+    def test_skip_changed_orders(self):
+        """IDの取得後にステータスが変わった注文は移動しないことのテスト"""
+        moved = ArchivedOrderDAO().move_orders(
+            [self.old_completed.id, self.old_processing.id],
+            OrderArchiveService.ARCHIVABLE_STATUSES,
+            timezone.now() - timedelta(days=30),
+        )
+        
+        self.assertEqual(moved, 1)
+        self.assertTrue(Order.objects.filter(id=self.old_processing.id).exists())
+
+    def test_get_archived_order(self):
+        """アーカイブ済みの注文も詳細を取得できることのテスト"""
+        before = self.client.get(f'/api/orders/{self.old_completed.id}').json()
+        OrderArchiveService().archive(older_than_days=30, pause=0)
+        
+        response = self.client.get(f'/api/orders/{self.old_completed.id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), before)
+        
+        # 一覧には含まれない
+        order_ids = [order['id'] for order in self.client.get('/api/orders/').json()]
+        self.assertNotIn(self.old_completed.id, order_ids)
+        
+        self.assertEqual(self.client.get('/api/orders/99999').status_code, 404)
+
+    def test_command(self):
+        """archive_orders コマンドのテスト"""
+        out = StringIO()
+        call_command('archive_orders', '--days', '30', '--dry-run', stdout=out)
+        self.assertIn('アーカイブ対象の注文: 2件', out.getvalue())
+        self.assertEqual(ArchivedOrder.objects.count(), 0)
+        
+        out = StringIO()
+        call_command('archive_orders', '--days', '30', '--chunk-size', '1', '--pause', '0', stdout=out)
+        self.assertIn('1/2件を移動しました（50%）', out.getvalue())
+        self.assertIn('注文のアーカイブが完了しました（2件）', out.getvalue())
\ No newline at end of file
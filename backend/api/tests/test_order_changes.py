@@ -0,0 +1,110 @@
+import json
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase, Client, override_settings
+from django.utils import timezone
+from core.models import Category, Product, Order, OrderItem
+
+
+@override_settings(ORDER_CHANGES_SETTLE_SECONDS=0, ORDER_CHANGES_POLL_INTERVAL=0.01)
+class OrderChangesAPITest(TestCase):
+    """注文の差分同期APIのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        
+        # テスト用のカテゴリと商品を作成
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+        
+        # テスト用の注文を作成
+        self.orders = []
+        for table_number in range(1, 4):
+            order = Order.objects.create(table_number=table_number, total_price=1000)
+            OrderItem.objects.create(order=order, product=self.product, quantity=1, price=1000)
+            self.orders.append(order)
+
+    def get_changes(self, **params) -> dict:
+        """差分同期APIを呼び出す"""
+        response = self.client.get('/api/orders/changes', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_initial_sync(self):
+        """トークンなしの場合はすべての注文を更新日時の古い順に返すことのテスト"""
+        data = self.get_changes()
+        
+        self.assertEqual([order['id'] for order in data['orders']], [order.id for order in self.orders])
+        self.assertEqual(len(data['orders'][0]['items']), 1)
+        self.assertFalse(data['has_more'])
+        self.assertIsNotNone(data['next_token'])
+
+    def test_only_changed_orders(self):
+        """トークン以降に更新された注文のみを返すことのテスト"""
+        token = self.get_changes()['next_token']
+        
+        # 変更がない場合は同じトークンを返す
+        data = self.get_changes(since=token)
+        self.assertEqual(data['orders'], [])
+        self.assertEqual(data['next_token'], token)
+        
+        # ステータスを変更した注文のみが返される
+        self.client.put(
+            f'/api/orders/{self.orders[0].id}',
+            data=json.dumps({"status": "completed"}),
+            content_type='application/json'
+        )
+        data = self.get_changes(since=token)
+        self.assertEqual([order['id'] for order in data['orders']], [self.orders[0].id])
+        self.assertEqual(data['orders'][0]['status'], "completed")
+        self.assertNotEqual(data['next_token'], token)
+
+    def test_same_updated_at_paging(self):
+        """更新日時が同じ注文もIDで区別してページングされることのテスト"""
+        Order.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+        
+        first = self.get_changes(limit=2)
+        second = self.get_changes(since=first['next_token'], limit=2)
+        
+        self.assertTrue(first['has_more'])
+        self.assertFalse(second['has_more'])
+        self.assertEqual(
+            [order['id'] for order in first['orders'] + second['orders']],
+            [order.id for order in self.orders]
+        )
+
+    def test_settle_window(self):
+        """直近の更新は次回の取得に回されることのテスト"""
+        with override_settings(ORDER_CHANGES_SETTLE_SECONDS=60):
+            data = self.get_changes()
+        
+        self.assertEqual(data['orders'], [])
+        self.assertIsNone(data['next_token'])
+
+    def test_long_poll(self):
+        """変更がない場合にwait秒まで待機することのテスト"""
+        token = self.get_changes()['next_token']
+        
+        with mock.patch('api.services.order_service.time.sleep') as sleep:
+            data = self.get_changes(since=token, wait=0.05)
+        
+        self.assertEqual(data['orders'], [])
+        self.assertTrue(sleep.called)
+
+    @override_settings(ORDER_CHANGES_MAX_WAIT=0)
+    def test_long_poll_max_wait(self):
+        """待機時間がORDER_CHANGES_MAX_WAITで制限されることのテスト"""
+        token = self.get_changes()['next_token']
+        
+        with mock.patch('api.services.order_service.time.sleep') as sleep:
+            self.get_changes(since=token, wait=60)
+        
+        sleep.assert_not_called()
+
+    def test_invalid_token(self):
+        """不正なトークンのテスト"""
+        response = self.client.get('/api/orders/changes', {'since': 'invalid'})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['detail'], "トークンが不正です")
\ No newline at end of file
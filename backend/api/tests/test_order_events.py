@@ -0,0 +1,172 @@
+import json
+import time
+from django.test import TestCase, Client, override_settings
+from core.models import Category, Product, OrderEvent
+from api.services.order_event_service import OrderEventService
+
+
+def parse_events(content: str) -> list:
+    """Server-Sent Eventsの本文をイベントのリストに変換"""
+    events = []
+    for block in content.split('\n\n'):
+        fields = dict(
+            line.split(': ', 1) for line in block.split('\n')
+            if line and not line.startswith(':') and ': ' in line
+        )
+        if 'event' in fields:
+            events.append({
+                'id': int(fields['id']),
+                'event': fields['event'],
+                'data': json.loads(fields['data']),
+            })
+    return events
+
+
+@override_settings(
+    ORDER_EVENT_STREAM_TIMEOUT=0.05,
+    ORDER_EVENT_POLL_INTERVAL=0.01,
+    ORDER_EVENT_HEARTBEAT_INTERVAL=0.02,
+    ORDER_CHANGES_SETTLE_SECONDS=0,
+)
+class OrderEventTest(TestCase):
+    """注文イベントのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        
+        # テスト用のカテゴリと商品を作成
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+
+    def create_order(self, table_number: int = 1) -> dict:
+        """注文作成APIで注文を作成"""
+        response = self.client.post(
+            '/api/orders/',
+            data=json.dumps({
+                "table_number": table_number,
+                "items": [{"product_id": self.product.id, "quantity": 2}]
+            }),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.json()
+
+    def read_stream(self, **headers) -> tuple:
+        """イベントストリームを最後まで読み込む"""
+        response = self.client.get('/api/orders/events', **headers)
+        content = b''.join(response.streaming_content).decode('utf-8')
+        return response, content
+
+    def test_events_recorded(self):
+        """注文作成とステータス変更でイベントが記録されることのテスト"""
+        order = self.create_order()
+        
+        # 同じステータスへの更新ではイベントは記録されない
+        for status in ("pending", "processing"):
+            self.client.put(
+                f'/api/orders/{order["id"]}',
+                data=json.dumps({"status": status}),
+                content_type='application/json'
+            )
+        
+        events = list(OrderEvent.objects.order_by('id'))
+        self.assertEqual(
+            [event.event_type for event in events],
+            [OrderEvent.EVENT_CREATED, OrderEvent.EVENT_STATUS_CHANGED]
+        )
+        
+        # 作成イベントの内容は注文作成APIのレスポンスと同じ
+        self.assertEqual(events[0].payload, order)
+        self.assertEqual(events[1].payload['status'], "processing")
+        self.assertEqual(events[1].payload['previous_status'], "pending")
+
+    def test_stream_resume_from_last_event_id(self):
+        """Last-Event-IDの次のイベントから配信されることのテスト"""
+        first = self.create_order(table_number=1)
+        second = self.create_order(table_number=2)
+        first_event_id = OrderEvent.objects.get(order_id=first['id']).id
+        
+        response, content = self.read_stream(HTTP_LAST_EVENT_ID=str(first_event_id))
+        
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertTrue(content.startswith('retry: '))
+        events = parse_events(content)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['event'], OrderEvent.EVENT_CREATED)
+        self.assertEqual(events[0]['data']['id'], second['id'])
+        self.assertIn(': keep-alive', content)
+
+    def test_stream_new_connection_skips_past_events(self):
+        """新規接続では接続前のイベントが配信されないことのテスト"""
+        self.create_order()
+        
+        _, content = self.read_stream()
+        
+        self.assertEqual(parse_events(content), [])
+
+    def test_stream_resync_when_events_purged(self):
+        """未受信のイベントが削除済みの場合に再同期イベントが送られることのテスト"""
+        for table_number in range(1, 4):
+            self.create_order(table_number=table_number)
+        event_ids = list(OrderEvent.objects.order_by('id').values_list('id', flat=True))
+        OrderEvent.objects.filter(id__in=event_ids[:2]).delete()
+        
+        _, content = self.read_stream(HTTP_LAST_EVENT_ID=str(event_ids[0]))
+        
+        self.assertEqual(
+            [(event['event'], event['id']) for event in parse_events(content)],
+            [('resync', event_ids[2])]
+        )
+
+    @override_settings(ORDER_CHANGES_SETTLE_SECONDS=60)
+    def test_stream_delivers_late_committed_event(self):
+        """IDの小さいイベントが後からコミットされても配信されることのテスト"""
+        stream = OrderEventService().open_stream()
+        stream._open()
+        
+        # ID 2 のイベントが先にコミットされ、ID 1 のイベントのコミットが遅れた場合
+        OrderEvent.objects.create(id=2, order_id=2, event_type=OrderEvent.EVENT_CREATED, payload={'id': 2})
+        self.assertEqual([event['id'] for event in parse_events(''.join(stream._poll()))], [2])
+        OrderEvent.objects.create(id=1, order_id=1, event_type=OrderEvent.EVENT_CREATED, payload={'id': 1})
+        self.assertEqual([event['id'] for event in parse_events(''.join(stream._poll()))], [1])
+        
+        # 送信済みのイベントは再送されない
+        self.assertEqual(stream._poll(), [])
+
+    @override_settings(ORDER_CHANGES_SETTLE_SECONDS=60)
+    def test_stream_resume_resends_unsettled_events(self):
+        """再接続時にLast-Event-IDの直前の確定していないイベントも読み直すことのテスト"""
+        OrderEvent.objects.create(id=2, order_id=2, event_type=OrderEvent.EVENT_CREATED, payload={'id': 2})
+        OrderEvent.objects.create(id=1, order_id=1, event_type=OrderEvent.EVENT_CREATED, payload={'id': 1})
+        
+        _, content = self.read_stream(HTTP_LAST_EVENT_ID='2')
+        
+        self.assertEqual([event['id'] for event in parse_events(content)], [1, 2])
+
+    @override_settings(ORDER_EVENT_STREAM_TIMEOUT=60, ORDER_EVENT_WSGI_STREAM_TIMEOUT=0.05)
+    def test_wsgi_stream_timeout(self):
+        """WSGIではORDER_EVENT_WSGI_STREAM_TIMEOUT秒で接続を終了することのテスト"""
+        started = time.monotonic()
+        
+        self.read_stream()
+        
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_stream_invalid_last_event_id(self):
+        """不正なLast-Event-IDのテスト"""
+        response = self.client.get('/api/orders/events', HTTP_LAST_EVENT_ID='abc')
+        
+        self.assertEqual(response.status_code, 400)
+
+    async def test_async_stream(self):
+        """ASGI用の非同期イテレーターで配信されることのテスト"""
+        stream = OrderEventService().open_stream(0)
+        await OrderEvent.objects.acreate(
+            order_id=1, event_type=OrderEvent.EVENT_STATUS_CHANGED, payload={'id': 1}
+        )
+        
+        chunks = [chunk async for chunk in stream]
+        
+        events = parse_events(''.join(chunks))
+        self.assertEqual([event['data'] for event in events], [{'id': 1}])
\ No newline at end of file
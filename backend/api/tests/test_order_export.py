@@ -0,0 +1,124 @@
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from core.models import Category, Product, Order, OrderItem
+from api.services.order_archive_service import OrderArchiveService
+from api.services.order_export_service import OrderExportService
+
+
+class OrderExportTest(TestCase):
+    """注文履歴のエクスポートのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+        
+        # 2024-01-01〜01-03（日本時間）の正午に1件ずつ作成
+        self.orders = [
+            self.create_order(timezone.make_aware(datetime(2024, 1, day, 12)), status='completed')
+            for day in (1, 2, 3)
+        ]
+
+    def create_order(self, created_at, status='pending'):
+        """作成日時を指定して注文を作成"""
+        order = Order.objects.create(table_number=1, status=status, total_price=3000)
+        OrderItem.objects.create(order=order, product=self.product, quantity=1, price=1000)
+        OrderItem.objects.create(order=order, product=self.product, quantity=2, price=1000)
+        Order.objects.filter(id=order.id).update(created_at=created_at)
+        return order
+
+    def read(self, response):
+        """ストリーミングレスポンスの本文を取得"""
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content)
+
+    def test_export_ndjson(self):
+        """gzip圧縮したNDJSONで出力されることのテスト"""
+        response = self.client.get('/api/orders/export?date_from=2024-01-02&date_to=2024-01-03')
+        
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertEqual(
+            response['Content-Disposition'], 'attachment; filename="orders_20240102-20240103.ndjson.gz"'
+        )
+        lines = gzip.decompress(self.read(response)).decode().splitlines()
+        orders = [json.loads(line) for line in lines]
+        
+        # 作成日の範囲（両端を含む）の注文が古い順に出力される
+        self.assertEqual([order['id'] for order in orders], [self.orders[1].id, self.orders[2].id])
+        # 注文一覧と同じ構造
+        detail = self.client.get(f'/api/orders/{self.orders[1].id}').json()
+        self.assertEqual(orders[0], detail)
+
+    def test_export_csv(self):
+        """CSV（注文明細1件を1行）で出力されることのテスト"""
+        response = self.client.get('/api/orders/export?format=csv&gzip=false&date_from=2024-01-01&date_to=2024-01-01')
+        
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = list(csv.DictReader(io.StringIO(self.read(response).decode('utf-8-sig'))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['order_id'], str(self.orders[0].id))
+        self.assertEqual(rows[0]['created_at'], '2024-01-01T12:00:00+09:00')
+        self.assertEqual(rows[0]['product_name'], "テスト商品")
+        self.assertEqual(rows[1]['subtotal'], '2000')
+
+    def test_export_includes_archived_orders(self):
+        """アーカイブ済みの注文も作成日時の順に出力されることのテスト"""
+        pending = self.create_order(timezone.make_aware(datetime(2024, 1, 2, 18)))
+        OrderArchiveService().archive(older_than_days=1, pause=0)
+        
+        service = OrderExportService()
+        orders = list(service.iter_orders(chunk_size=1))
+        self.assertEqual(
+            [order['id'] for order in orders],
+            [self.orders[0].id, self.orders[1].id, pending.id, self.orders[2].id],
+        )
+        self.assertEqual(len(orders[0]['items']), 2)
+
+    def test_chunked_queries(self):
+        """注文をchunk_size件ずつ取得することのテスト"""
+        for day in range(10):
+            self.create_order(timezone.now() - timedelta(days=day))
+        
+        service = OrderExportService()
+        # 注文（13件を5件ずつ: 3回）× 3クエリ（注文・注文明細・商品）＋ アーカイブ済み注文（0件: 1回）
+        with self.assertNumQueries(10):
+            self.assertEqual(len(list(service.iter_orders(chunk_size=5))), 13)
+
+    def test_invalid_parameters(self):
+        """不正なパラメータのテスト"""
+        response = self.client.get('/api/orders/export?date_from=2024-01-03&date_to=2024-01-01')
+        self.assertEqual(response.status_code, 400)
+        
+        response = self.client.get('/api/orders/export?format=xml')
+        self.assertEqual(response.status_code, 422)
+
+    async def test_export_asgi(self):
+        """ASGIでは非同期イテレーターで出力されることのテスト"""
+        response = await self.async_client.get('/api/orders/export?gzip=false')
+        
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(body.splitlines()), 3)
+
+    def test_command(self):
+        """export_orders コマンドのテスト"""
+        fd, path = tempfile.mkstemp(suffix='.csv.gz')
+        os.close(fd)
+        try:
+            call_command(
+                'export_orders', '--format', 'csv', '--from', '2024-01-02', '--output', path,
+                stdout=io.StringIO(),
+            )
+            with gzip.open(path, 'rt', encoding='utf-8-sig') as f:
+                rows = list(csv.DictReader(f))
+        finally:
+            os.remove(path)
+        self.assertEqual({row['order_id'] for row in rows}, {str(self.orders[1].id), str(self.orders[2].id)})
\ No newline at end of file
@@ -0,0 +1,259 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+from django.db import DatabaseError
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, Client, override_settings
+from core.models import Category, Product, Order, IdempotencyKey
+from api.dao.order_journal import OrderJournal
+from api.apps import serves_requests
+from api.services.order_ingestion_service import (
+    OrderIngestionService, get_order_journal, start_ingestion_worker_on_startup,
+)
+from api.services.order_service import OrderService
+
+
+class OrderIngestionAPITest(TestCase):
+    """注文の非同期取り込み（ジャーナルモード）のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        
+        # テストごとに一時的なジャーナルを使う
+        self.journal_dir = tempfile.mkdtemp()
+        settings_override = override_settings(
+            ORDER_INGESTION_MODE='journal',
+            ORDER_JOURNAL_PATH=os.path.join(self.journal_dir, 'order_journal.sqlite3'),
+            ORDER_INGESTION_START_WORKER=False,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.journal_dir)
+        
+        # テスト用のカテゴリと商品を作成
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(
+            name="テスト商品",
+            price=1000,
+            category=self.category
+        )
+
+    def post_order(self, product_id, **extra):
+        """注文作成APIを呼び出す"""
+        return self.client.post(
+            '/api/orders/',
+            data=json.dumps({
+                "table_number": 1,
+                "items": [{"product_id": product_id, "quantity": 2}]
+            }),
+            content_type='application/json',
+            **extra
+        )
+
+    def test_create_order_returns_ticket(self):
+        """ジャーナルモードでの注文作成APIのテスト"""
+        order_count = Order.objects.count()
+        
+        # APIリクエスト
+        response = self.post_order(self.product.id)
+        
+        # 受付チケットが返され、この時点では注文が作成されていないことを確認
+        self.assertEqual(response.status_code, 202)
+        ticket = response.json()['ticket']
+        self.assertEqual(response.json()['status'], 'accepted')
+        self.assertEqual(Order.objects.count(), order_count)
+        
+        # ジャーナルを反映
+        self.assertEqual(OrderIngestionService().drain(), 1)
+        
+        # チケットの状態と作成された注文を確認
+        response = self.client.get(f'/api/orders/tickets/{ticket}')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['status'], 'completed')
+        order = Order.objects.get(id=data['order_id'])
+        self.assertEqual(order.total_price, 2000)
+        self.assertEqual(order.items.count(), 1)
+
+    def test_create_order_retry_with_same_key(self):
+        """同じIdempotency-Keyで再送された場合に同じチケットが返されることのテスト"""
+        first = self.post_order(self.product.id, HTTP_IDEMPOTENCY_KEY='tablet-1-0001')
+        second = self.post_order(self.product.id, HTTP_IDEMPOTENCY_KEY='tablet-1-0001')
+        
+        self.assertEqual(first.json()['ticket'], 'tablet-1-0001')
+        self.assertEqual(second.json()['ticket'], 'tablet-1-0001')
+        self.assertEqual(OrderIngestionService().drain(), 1)
+
+    def test_create_order_reused_key_with_different_order(self):
+        """同じIdempotency-Keyで異なる注文が送られた場合のテスト"""
+        self.post_order(self.product.id, HTTP_IDEMPOTENCY_KEY='tablet-1-0001')
+        
+        response = self.post_order(999, HTTP_IDEMPOTENCY_KEY='tablet-1-0001')
+        
+        # 422エラーが返され、最初の注文だけが反映されることを確認
+        self.assertEqual(response.status_code, 422)
+        OrderIngestionService().drain()
+        self.assertEqual(Order.objects.get().items.get().product_id, self.product.id)
+
+    def test_create_order_key_too_long(self):
+        """冪等キーに保存できない長さのIdempotency-Keyのテスト"""
+        max_length = OrderIngestionService.MAX_TICKET_LENGTH
+        
+        response = self.post_order(self.product.id, HTTP_IDEMPOTENCY_KEY='k' * (max_length + 1))
+        self.assertEqual(response.status_code, 422)
+        
+        # 上限の長さのチケットは反映できることを確認
+        ticket = self.post_order(self.product.id, HTTP_IDEMPOTENCY_KEY='k' * max_length).json()['ticket']
+        OrderIngestionService().drain()
+        self.assertEqual(self.client.get(f'/api/orders/tickets/{ticket}').json()['status'], 'completed')
+
+    @override_settings(ORDER_INGESTION_LEASE_SECONDS=0, ORDER_INGESTION_MAX_ATTEMPTS=2)
+    def test_drain_dead_letter(self):
+        """反映時に例外が発生するエントリが他のエントリを巻き込まず、上限回数で失敗になることのテスト"""
+        poison = self.post_order(self.product.id, HTTP_IDEMPOTENCY_KEY='poison').json()['ticket']
+        ticket = self.post_order(999).json()['ticket']
+        valid = self.client.post(
+            '/api/orders/',
+            data=json.dumps({"table_number": 2, "items": [{"product_id": self.product.id, "quantity": 1}]}),
+            content_type='application/json'
+        ).json()['ticket']
+        
+        create_orders = OrderService.create_orders
+        
+        def failing_create_orders(service, orders_data):
+            if any(data['table_number'] == 1 and data['items'][0]['product_id'] == self.product.id
+                   for data in orders_data):
+                raise DatabaseError('poison')
+            return create_orders(service, orders_data)
+        
+        with mock.patch.object(OrderService, 'create_orders', failing_create_orders):
+            with self.assertLogs('api.services.order_ingestion_service', 'ERROR'):
+                self.assertEqual(OrderIngestionService().drain(), 3)
+            
+            # 同じバッチの他のエントリは反映され、例外が発生したエントリは未反映のまま残る
+            statuses = {
+                key: self.client.get(f'/api/orders/tickets/{key}').json()['status']
+                for key in (poison, ticket, valid)
+            }
+            self.assertEqual(statuses, {poison: 'accepted', ticket: 'failed', valid: 'completed'})
+            
+            with self.assertLogs('api.services.order_ingestion_service', 'ERROR'):
+                self.assertEqual(OrderIngestionService().drain(), 1)
+            
+            # 試行回数が上限に達したエントリは再取得されず、失敗として記録される
+            self.assertEqual(OrderIngestionService().drain(), 0)
+        
+        data = self.client.get(f'/api/orders/tickets/{poison}').json()
+        self.assertEqual(data['status'], 'failed')
+        self.assertIn('上限', data['detail'])
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_drain_invalid_product(self):
+        """存在しない商品を含む注文の反映のテスト"""
+        ticket = self.post_order(999).json()['ticket']
+        
+        OrderIngestionService().drain()
+        
+        # 反映に失敗し、理由が記録されていることを確認
+        data = self.client.get(f'/api/orders/tickets/{ticket}').json()
+        self.assertEqual(data['status'], 'failed')
+        self.assertIsNone(data['order_id'])
+        self.assertIn('999', data['detail'])
+
+    @override_settings(ORDER_INGESTION_LEASE_SECONDS=0)
+    def test_drain_replay_after_crash(self):
+        """反映後のクラッシュから再実行しても注文が重複しないことのテスト"""
+        ticket = self.post_order(self.product.id).json()['ticket']
+        
+        # MySQLへの反映後、ジャーナルへの記録前にクラッシュした状態を再現
+        with mock.patch.object(OrderJournal, 'mark'):
+            OrderIngestionService().drain()
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertTrue(IdempotencyKey.objects.filter(key=f'journal:{ticket}').exists())
+        
+        # 再起動後の反映
+        self.assertEqual(OrderIngestionService().drain(), 1)
+        
+        # 注文は重複せず、チケットは反映済みになることを確認
+        self.assertEqual(Order.objects.count(), 1)
+        data = self.client.get(f'/api/orders/tickets/{ticket}').json()
+        self.assertEqual(data['status'], 'completed')
+        self.assertEqual(data['order_id'], Order.objects.get().id)
+
+    def test_get_ticket_not_found(self):
+        """存在しないチケットの状態取得APIのテスト"""
+        response = self.client.get('/api/orders/tickets/unknown')
+        
+        # 404エラーが返されることを確認
+        self.assertEqual(response.status_code, 404)
+
+
+class OrderIngestionStartupTest(TransactionTestCase):
+    """
+    起動時のバックグラウンドワーカーのテストクラス
+    
+    ワーカーは別スレッド（別のDB接続）で反映するため、TransactionTestCaseで検証する
+    """
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.journal_dir = tempfile.mkdtemp()
+        settings_override = override_settings(
+            ORDER_INGESTION_MODE='journal',
+            ORDER_JOURNAL_PATH=os.path.join(self.journal_dir, 'order_journal.sqlite3'),
+            ORDER_INGESTION_START_WORKER=True,
+            ORDER_INGESTION_POLL_INTERVAL=0.01,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.journal_dir)
+        
+        category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=category)
+
+    def test_drain_pending_on_startup(self):
+        """再起動前に受け付けた未反映の注文が、新しい注文の受付なしに反映されることのテスト"""
+        # 再起動前にジャーナルへ追記され、反映されずに残った注文
+        journal = get_order_journal()
+        journal.append('before-restart', {
+            'table_number': 1,
+            'status': 'pending',
+            'items': [{'product_id': self.product.id, 'quantity': 1}],
+        })
+        
+        worker = start_ingestion_worker_on_startup()
+        self.addCleanup(worker.join)
+        self.addCleanup(worker.stop)
+        
+        deadline = time.monotonic() + 5
+        while journal.get('before-restart')['status'] == 'accepted' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        entry = journal.get('before-restart')
+        self.assertEqual(entry['status'], 'completed')
+        self.assertEqual(Order.objects.get().id, entry['order_id'])
+
+    @override_settings(ORDER_INGESTION_MODE='sync')
+    def test_not_started_in_sync_mode(self):
+        """同期モードではワーカーを起動しないことのテスト"""
+        self.assertIsNone(start_ingestion_worker_on_startup())
+
+
+class ServesRequestsTest(SimpleTestCase):
+    """起動時にワーカーを起動するプロセスの判定のテストクラス"""
+
+    def test_serves_requests(self):
+        """WSGI・ASGIサーバーと開発サーバーでは起動し、管理コマンドでは起動しないことのテスト"""
+        self.assertTrue(serves_requests(['/usr/local/bin/gunicorn', 'config.wsgi:application']))
+        self.assertTrue(serves_requests(['manage.py', 'runserver', '--noreload']))
+        self.assertFalse(serves_requests(['manage.py', 'migrate']))
+        self.assertFalse(serves_requests(['manage.py', 'drain_order_journal']))
+        # manage.py serve はfork後の各ワーカーで起動する
+        self.assertFalse(serves_requests(['manage.py', 'serve']))
+        with mock.patch.dict(os.environ, {'RUN_MAIN': 'true'}):
+            self.assertTrue(serves_requests(['manage.py', 'runserver']))
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(serves_requests(['manage.py', 'runserver']))
\ No newline at end of file
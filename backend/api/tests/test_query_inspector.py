@@ -0,0 +1,95 @@
+from unittest import mock
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpResponse
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.urls import resolve
+from core.models import Category, Product, Order
+from api.middleware import QueryInspectorMiddleware, get_view_name, normalize_sql
+
+
+@override_settings(QUERY_INSPECTOR_ENABLED=True, QUERY_INSPECTOR_THRESHOLD=3)
+class QueryInspectorTest(TestCase):
+    """N+1クエリ検出ミドルウェアのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        self.factory = RequestFactory()
+        
+        # テスト用のカテゴリと商品を作成
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.products = [
+            Product.objects.create(name=f"テスト商品{i}", price=100 * (i + 1), category=self.category)
+            for i in range(3)
+        ]
+
+    def test_normalize_sql(self):
+        """パラメータの値やIN句の件数によらず同じ形に正規化されることのテスト"""
+        self.assertEqual(
+            normalize_sql('SELECT *  FROM "t" WHERE "id" = 1 AND "name" = \'a\''),
+            normalize_sql('SELECT * FROM "t" WHERE "id" = 25 AND "name" = \'bb\''),
+        )
+        self.assertEqual(
+            normalize_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s)'),
+            normalize_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s, %s)'),
+        )
+
+    def test_repeated_queries_logged(self):
+        """同じ形のクエリがしきい値以上実行された場合に報告されることのテスト"""
+        def view(request):
+            # 商品ごとにカテゴリを取得するN+1パターン
+            for product in Product.objects.all():
+                Category.objects.get(id=product.category_id)
+            return HttpResponse()
+        
+        middleware = QueryInspectorMiddleware(view)
+        request = self.factory.get('/api/products/')
+        middleware.process_view(request, view, (), {})
+        with self.assertLogs('api.middleware', level='WARNING') as logs:
+            response = middleware(request)
+        
+        self.assertEqual(response['X-Query-Count'], '4')
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('3回', logs.output[0])
+        self.assertIn('test_repeated_queries_logged.<locals>.view', logs.output[0])
+
+    async def test_async_view(self):
+        """非同期のビューでもスレッドで実行し直さずにクエリを記録することのテスト"""
+        async def view(request):
+            async for product in Product.objects.all():
+                await Category.objects.aget(id=product.category_id)
+            return HttpResponse()
+        
+        middleware = QueryInspectorMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        with self.assertLogs('api.middleware', level='WARNING'):
+            response = await middleware(self.factory.get('/api/products/'))
+        
+        self.assertEqual(response['X-Query-Count'], '4')
+
+    def test_view_name_resolved_from_router(self):
+        """ninjaのビューからHTTPメソッドに対応するルーター関数名が取得されることのテスト"""
+        view_func = resolve('/api/orders/1').func
+        
+        self.assertEqual(get_view_name(self.factory.get('/api/orders/1'), view_func), 'api.routers.order.get_order')
+        self.assertEqual(get_view_name(self.factory.delete('/api/orders/1'), view_func), 'api.routers.order.delete_order')
+
+    def test_order_endpoints_without_n_plus_one(self):
+        """注文のエンドポイントで繰り返しクエリが発生しないことのテスト"""
+        for _ in range(3):
+            order = Order.objects.create(table_number=1, total_price=0)
+            for product in self.products:
+                order.items.create(product=product, quantity=1, price=product.price)
+        
+        with override_settings(MIDDLEWARE=['api.middleware.QueryInspectorMiddleware']):
+            with mock.patch('api.middleware.logger') as logger:
+                self.assertEqual(self.client.get('/api/orders/', {'table_number': 1}).status_code, 200)
+                self.assertEqual(self.client.get(f'/api/orders/{order.id}').status_code, 200)
+        logger.warning.assert_not_called()
+
+    @override_settings(QUERY_INSPECTOR_ENABLED=False)
+    def test_disabled(self):
+        """無効な場合はミドルウェアが使用されないことのテスト"""
+        from django.core.exceptions import MiddlewareNotUsed
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryInspectorMiddleware(lambda request: HttpResponse())
\ No newline at end of file
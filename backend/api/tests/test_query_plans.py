@@ -0,0 +1,70 @@
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase
+from api.dao.category_dao import CategoryDAO
+from api.dao.order_dao import OrderDAO
+from api.dao.product_dao import ProductDAO
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLiteの実行計画でのみ検証する')
+class QueryPlanTest(TestCase):
+    """主要なクエリが複合インデックスを使用することのテストクラス"""
+
+    def assertUsesIndex(self, queryset, table, index_name):
+        """EXPLAINの結果で、テーブルがフルスキャンではなく指定したインデックスで検索されることを確認"""
+        plan = queryset.explain()
+        self.assertRegex(plan, rf'(SEARCH|SCAN) {table} USING (COVERING )?INDEX {index_name}\b', plan)
+        self.assertNotRegex(plan, rf'SCAN {table}(?! USING)', plan)
+        return plan
+
+    def test_get_orders_by_table(self):
+        """テーブル別の注文一覧のテスト"""
+        plan = self.assertUsesIndex(
+            OrderDAO().get_orders_by_table(1), 'core_order', 'order_table_created_idx'
+        )
+        # 並び替えもインデックスで行われることを確認
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_list_orders_page(self):
+        """注文一覧のページ取得のテスト"""
+        query = OrderDAO().filter_orders().order_by('-created_at', '-id')[:50]
+        plan = self.assertUsesIndex(query, 'core_order', 'order_created_id_idx')
+        self.assertNotIn('TEMP B-TREE', plan)
+        
+        query = OrderDAO().filter_orders(statuses=['pending']).order_by('-created_at', '-id')[:50]
+        plan = self.assertUsesIndex(query, 'core_order', 'order_status_created_idx')
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_get_changed_after(self):
+        """差分同期の注文取得のテスト"""
+        from django.utils import timezone
+        now = timezone.now()
+        query = OrderDAO().get_changed_after((now, 1), now)[:50]
+        plan = self.assertUsesIndex(query, 'core_order', 'order_updated_id_idx')
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_get_available_products(self):
+        """販売可能な商品一覧のテスト"""
+        self.assertUsesIndex(
+            ProductDAO().get_available_products(), 'core_product', 'product_avail_category_idx'
+        )
+
+    def test_get_products_by_category(self):
+        """カテゴリ別の商品一覧のテスト"""
+        plan = self.assertUsesIndex(
+            ProductDAO().get_products_by_category(1), 'core_product', 'product_avail_category_idx'
+        )
+        self.assertRegex(plan, r'is_available=\? AND category_id=\?')
+
+    def test_get_menu_products(self):
+        """メニューの商品一覧のテスト"""
+        self.assertUsesIndex(
+            ProductDAO().get_menu_products(), 'core_product', 'product_avail_category_idx'
+        )
+
+    def test_get_active_categories(self):
+        """有効なカテゴリ一覧のテスト"""
+        plan = self.assertUsesIndex(
+            CategoryDAO().get_active_categories(), 'core_category', 'category_active_order_idx'
+        )
+        self.assertNotIn('TEMP B-TREE', plan)
\ No newline at end of file
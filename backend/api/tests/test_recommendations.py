@@ -0,0 +1,182 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from core.models import Category, Product, Order, OrderItem, ProductPair, RecommendationSnapshot
+from api.services.menu_cache import menu_cache
+from api.services.order_archive_service import OrderArchiveService
+from api.services.recommendation_service import ProductRecommender, RecommendationService, recommender
+
+
+class ProductRecommenderTest(SimpleTestCase):
+    """ProductRecommenderのテストクラス"""
+
+    def test_load_and_add(self):
+        """スナップショットの読み込みと注文の追加のテスト"""
+        index = ProductRecommender()
+        # 読み込み前の注文は加えない
+        self.assertEqual(index.add_orders([(1, [1, 2])]), 0)
+        
+        index.load(snapshot_id=1, pairs=[(1, 2, 3), (1, 3, 5)], watermark=10)
+        self.assertEqual(index.top(1, 5), [(3, 5), (2, 3)])
+        self.assertEqual(index.top(2, 5), [(1, 3)])
+        
+        # 集計済みの注文（watermark以前・追加済み）は加えない
+        self.assertEqual(index.add_orders([(10, [1, 2]), (11, [1, 2, 2]), (11, [1, 2])]), 1)
+        self.assertEqual(index.top(1, 1), [(3, 5)])
+        self.assertEqual(index.top(2, 5), [(1, 4)])
+        self.assertEqual(index.add_orders([(12, [1, 2]), (13, [1, 2])]), 2)
+        self.assertEqual(index.top(1, 5), [(2, 6), (3, 5)])
+
+    def test_advance(self):
+        """集計済みの注文IDを進めると、それ以前の注文は加えないことのテスト"""
+        index = ProductRecommender()
+        index.load(snapshot_id=None, pairs=[], watermark=0)
+        index.add_orders([(5, [1, 2])])
+        index.advance(5)
+        
+        self.assertEqual(index.watermark, 5)
+        self.assertEqual(index.add_orders([(4, [1, 2]), (5, [1, 2])]), 0)
+        self.assertEqual(index.top(1, 5), [(2, 1)])
+
+
+@override_settings(RECOMMENDATION_SYNC_INTERVAL=3600, RECOMMENDATION_SETTLE_SECONDS=0)
+class RecommendationServiceTest(TestCase):
+    """おすすめ商品のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        recommender.reset()
+        menu_cache.invalidate()
+        self.addCleanup(recommender.reset)
+        category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.coffee = Product.objects.create(name="コーヒー", price=400, category=category)
+        self.cake = Product.objects.create(name="ケーキ", price=600, category=category)
+        self.cookie = Product.objects.create(name="クッキー", price=200, category=category)
+        self.tea = Product.objects.create(name="紅茶", price=500, category=category, is_available=False)
+        self.service = RecommendationService()
+
+    def create_order(self, *products, days_ago=0):
+        """他のプロセスで作成された注文と同様に、コミット後の処理を通さずに注文を作成"""
+        order = Order.objects.create(table_number=1, status='completed', total_price=0)
+        for product in products:
+            OrderItem.objects.create(order=order, product=product, quantity=1, price=product.price)
+        if days_ago:
+            Order.objects.filter(id=order.id).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return order
+
+    def recommendations(self, product, limit=5):
+        """おすすめ商品APIを呼び出して商品名のリストを取得"""
+        response = self.client.get(f'/api/products/{product.id}/recommendations?limit={limit}')
+        self.assertEqual(response.status_code, 200)
+        return [(item['name'], item['order_count']) for item in response.json()]
+
+    def test_recommendations(self):
+        """一緒に注文された件数の多い販売可能な商品を返すことのテスト"""
+        self.create_order(self.coffee, self.cake)
+        self.create_order(self.coffee, self.cake, self.tea)
+        self.create_order(self.coffee, self.cookie)
+        self.create_order(self.coffee, self.tea)
+        self.create_order(self.coffee, self.tea)
+        
+        # 販売停止中の紅茶は含まない
+        self.assertEqual(self.recommendations(self.coffee), [("ケーキ", 2), ("クッキー", 1)])
+        self.assertEqual(self.recommendations(self.coffee, limit=1), [("ケーキ", 2)])
+        self.assertEqual(self.recommendations(self.cookie), [("コーヒー", 1)])
+
+    def test_unknown_product(self):
+        """存在しない商品のおすすめを取得した場合のテスト"""
+        response = self.client.get('/api/products/999/recommendations')
+        
+        # 404エラーが返されることを確認（販売中止の商品は存在するため200）
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.client.get(f'/api/products/{self.tea.id}/recommendations').status_code, 200)
+
+    def test_incremental_on_commit(self):
+        """作成した注文がコミット後にインデックスへ加えられることのテスト"""
+        self.service.sync(force=True)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/orders/', data=json.dumps({
+                'table_number': 1,
+                'status': 'pending',
+                'items': [{'product_id': self.cake.id, 'quantity': 1}, {'product_id': self.cookie.id, 'quantity': 2}],
+            }), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        
+        # 同期の間隔内でもすぐに反映され、インデックスの参照にDBを使用しない
+        self.recommendations(self.cake)
+        with self.assertNumQueries(0):
+            recommendations = self.service.get_recommendations(self.cake.id)
+        self.assertEqual([(item['name'], item['order_count']) for item in recommendations], [("クッキー", 1)])
+
+    def test_sync_other_process_orders(self):
+        """他のプロセスで作成された注文が同期で加えられることのテスト"""
+        self.service.sync(force=True)
+        self.create_order(self.coffee, self.cake)
+        self.assertEqual(self.recommendations(self.coffee), [])
+        
+        self.service.sync(force=True)
+        self.assertEqual(self.recommendations(self.coffee), [("ケーキ", 1)])
+        self.assertEqual(recommender.watermark, Order.objects.latest('id').id)
+        
+        # 最近の注文はコミットの遅れを考慮して集計済みとしない（重複しては加えない）
+        with override_settings(RECOMMENDATION_SETTLE_SECONDS=60):
+            order = self.create_order(self.coffee, self.cake)
+            self.service.sync(force=True)
+            self.service.sync(force=True)
+        self.assertLess(recommender.watermark, order.id)
+        self.assertEqual(self.recommendations(self.coffee), [("ケーキ", 2)])
+
+    def test_rebuild(self):
+        """注文履歴（アーカイブ済みを含む）からスナップショットを作り直すことのテスト"""
+        self.create_order(self.coffee, self.cake, days_ago=40)
+        self.create_order(self.coffee, self.cake, self.cookie)
+        self.create_order(self.cake)
+        OrderArchiveService().archive(older_than_days=30, pause=0)
+        
+        progress = []
+        result = self.service.rebuild(chunk_size=1, progress=progress.append)
+        self.assertEqual(result, {'orders': 3, 'pairs': 3})
+        self.assertEqual(progress, [1, 2, 3])
+        self.assertEqual(
+            set(ProductPair.objects.values_list('product_id', 'other_product_id', 'order_count')),
+            {(self.coffee.id, self.cake.id, 2), (self.coffee.id, self.cookie.id, 1), (self.cake.id, self.cookie.id, 1)},
+        )
+        snapshot = RecommendationSnapshot.objects.get()
+        self.assertEqual(snapshot.last_order_id, Order.objects.latest('id').id)
+        
+        # 同期でスナップショットを読み込み、以降の注文を加える
+        self.create_order(self.cake, self.cookie)
+        self.service.sync(force=True)
+        self.assertEqual(self.recommendations(self.cookie), [("ケーキ", 2), ("コーヒー", 1)])
+        
+        # 作り直すと各プロセスは新しいスナップショットを読み込み直す
+        self.service.rebuild()
+        self.assertNotEqual(RecommendationSnapshot.objects.get().id, snapshot.id)
+        self.service.sync(force=True)
+        self.assertEqual(self.recommendations(self.cookie), [("ケーキ", 2), ("コーヒー", 1)])
+
+    def test_rebuild_excludes_unsettled_orders(self):
+        """最近の注文はスナップショットに含めず、同期で重複せずに加えられることのテスト"""
+        settled = self.create_order(self.coffee, self.cake, days_ago=1)
+        recent = self.create_order(self.coffee, self.cake)
+        
+        with override_settings(RECOMMENDATION_SETTLE_SECONDS=60):
+            self.assertEqual(self.service.rebuild(), {'orders': 1, 'pairs': 1})
+            self.assertEqual(RecommendationSnapshot.objects.get().last_order_id, settled.id)
+            self.assertLess(settled.id, recent.id)
+            
+            self.service.sync(force=True)
+            self.service.sync(force=True)
+        self.assertEqual(self.recommendations(self.coffee), [("ケーキ", 2)])
+
+    def test_command(self):
+        """rebuild_recommendations コマンドのテスト"""
+        self.create_order(self.coffee, self.cake)
+        
+        out = StringIO()
+        call_command('rebuild_recommendations', stdout=out)
+        self.assertIn('注文 1件、商品の組 1件', out.getvalue())
\ No newline at end of file
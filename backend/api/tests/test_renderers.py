@@ -0,0 +1,94 @@
+import json
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+from django.test import TestCase, Client, RequestFactory
+from ninja.renderers import JSONRenderer
+from core.models import Category, Product, Order
+from api.renderers import FastRenderer
+from api.services.menu_cache import menu_cache
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class FastRendererTest(TestCase):
+    """レンダラーのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        self.factory = RequestFactory()
+        self.renderer = FastRenderer()
+        self.data = [{
+            'id': 1,
+            'name': "テスト",
+            'price': Decimal('1000'),
+            'created_at': datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+        }]
+        
+        # テスト用のカテゴリと商品を作成
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+        menu_cache.invalidate()
+
+    def test_json_matches_default_renderer(self):
+        """標準のJSONRendererと同じ値（日時の表記を含む）にエンコードされることのテスト"""
+        request = self.factory.get('/')
+        expected = JSONRenderer().render(request, self.data, response_status=200)
+        
+        content = self.renderer.render(request, self.data, response_status=200)
+        
+        self.assertEqual(json.loads(content), json.loads(expected))
+        self.assertEqual(json.loads(content)[0]['created_at'], '2024-01-02T03:04:05.678Z')
+
+    def test_fallback_without_orjson(self):
+        """orjsonがない場合は標準のJSONRendererと同じ出力になることのテスト"""
+        request = self.factory.get('/')
+        with mock.patch('api.renderers.orjson', None):
+            content = self.renderer.render(request, self.data, response_status=200)
+        
+        self.assertEqual(content, JSONRenderer().render(request, self.data, response_status=200))
+
+    @skipUnless(msgpack, "msgpackがインストールされていない")
+    def test_msgpack_response(self):
+        """AcceptヘッダーでMessagePackが要求された場合のテスト"""
+        order = Order.objects.create(table_number=1, total_price=1000)
+        order.items.create(product=self.product, quantity=1, price=1000)
+        
+        response = self.client.get('/api/orders/', HTTP_ACCEPT='application/msgpack')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertIn('Accept', response['Vary'])
+        self.assertEqual(msgpack.unpackb(response.content), self.client.get('/api/orders/').json())
+
+    @skipUnless(msgpack, "msgpackがインストールされていない")
+    def test_msgpack_error_response(self):
+        """エラーレスポンスもMessagePackで返されることのテスト"""
+        response = self.client.get('/api/orders/999', HTTP_ACCEPT='application/msgpack')
+        
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content), {'detail': "リソースが見つかりません"})
+
+    @skipUnless(msgpack, "msgpackがインストールされていない")
+    def test_msgpack_menu_etag(self):
+        """メニューのETagが形式ごとに区別されることのテスト"""
+        json_response = self.client.get('/api/categories/')
+        msgpack_response = self.client.get('/api/categories/', HTTP_ACCEPT='application/msgpack')
+        
+        self.assertNotEqual(json_response['ETag'], msgpack_response['ETag'])
+        self.assertEqual(msgpack.unpackb(msgpack_response.content), json_response.json())
+        
+        # 同じ形式のETagでのみ304が返される
+        response = self.client.get(
+            '/api/categories/',
+            HTTP_ACCEPT='application/msgpack',
+            HTTP_IF_NONE_MATCH=msgpack_response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get('/api/categories/', HTTP_IF_NONE_MATCH=msgpack_response['ETag'])
+        self.assertEqual(response.status_code, 200)
\ No newline at end of file
@@ -0,0 +1,134 @@
+import time
+from django.db import transaction
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpResponse
+from django.test import TransactionTestCase, AsyncClient, Client, override_settings
+from api.middleware import ReplicaPinningMiddleware
+from api.services.menu_cache import menu_cache
+from core.db.routers import PrimaryReplicaRouter, primary_reads, replica_reads, routing_request
+from core.models import Category, Product, Order, MenuVersion
+
+
+@override_settings(DATABASE_REPLICAS=['replica'], DATABASE_REPLICA_PIN_SECONDS=5)
+class ReplicaRouterTest(TransactionTestCase):
+    """
+    読み取りレプリカへのルーティングのテストクラス（2つのSQLiteをプライマリとレプリカとして使用する）
+    
+    トランザクション内の読み取りはプライマリへ振り分けるため、TransactionTestCaseで検証する
+    """
+
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.client = Client()
+        
+        # プライマリとレプリカで異なるデータを作成し、どちらから読み取ったかを判別する
+        self.category = Category.objects.create(name="プライマリのカテゴリ", order=1)
+        self.product = Product.objects.create(name="テスト商品", price=1000, category=self.category)
+        Category.objects.using('replica').create(id=self.category.id, name="レプリカのカテゴリ", order=1)
+        # レプリカはプライマリのメニューの更新まで反映済みとする
+        self.menu_version = MenuVersion.objects.get()
+        MenuVersion.objects.using('replica').create(id=self.menu_version.id, version=self.menu_version.version)
+        menu_cache.invalidate()
+
+    def test_list_reads_from_replica(self):
+        """一覧系のエンドポイントはレプリカから読み取ることのテスト"""
+        response = self.client.get('/api/categories/')
+        self.assertEqual([category['name'] for category in response.json()], ["レプリカのカテゴリ"])
+        
+        # 詳細はプライマリから読み取る
+        response = self.client.get(f'/api/categories/{self.category.id}')
+        self.assertEqual(response.json()['name'], "プライマリのカテゴリ")
+
+    def test_menu_cache_skips_lagging_replica(self):
+        """レプリカがメニューの更新に追いついていない場合はプライマリのメニューをキャッシュすることのテスト"""
+        version = self.menu_version.version + 1
+        MenuVersion.objects.filter(id=self.menu_version.id).update(version=version)
+        
+        # メニューバージョンとデータをプライマリから読み込む
+        response = self.client.get('/api/categories/')
+        self.assertEqual([category['name'] for category in response.json()], ["プライマリのカテゴリ"])
+        self.assertTrue(response['ETag'].startswith(f'"menu-{version}-'))
+        response = self.client.get('/api/categories/')
+        self.assertEqual([category['name'] for category in response.json()], ["プライマリのカテゴリ"])
+        
+        # レプリカが追いついた後はレプリカから読み込む
+        MenuVersion.objects.using('replica').filter(id=self.menu_version.id).update(version=version)
+        menu_cache.invalidate()
+        response = self.client.get('/api/categories/')
+        self.assertEqual([category['name'] for category in response.json()], ["レプリカのカテゴリ"])
+
+    def test_get_all_reads_from_replica(self):
+        """BaseDAO.get_all() はレプリカから読み取ることのテスト"""
+        from api.dao.category_dao import CategoryDAO
+        
+        self.assertEqual([category.name for category in CategoryDAO().get_all()], ["レプリカのカテゴリ"])
+        self.assertEqual(Category.objects.get().name, "プライマリのカテゴリ")
+
+    def test_read_your_writes(self):
+        """注文を作成したクライアントは一定時間プライマリから読み取ることのテスト"""
+        response = self.client.post(
+            '/api/orders/',
+            data={"table_number": 1, "items": [{"product_id": self.product.id, "quantity": 1}]},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertIn('db_primary_until', response.cookies)
+        self.assertEqual(response.cookies['db_primary_until']['max-age'], 5)
+        
+        # 作成したクライアントは自分の注文を参照できる
+        response = self.client.get('/api/orders/?table_number=1')
+        self.assertEqual([order['id'] for order in response.json()], [Order.objects.get().id])
+        
+        # 他のクライアントはレプリカから読み取る（レプリカにはまだ反映されていない）
+        response = Client().get('/api/orders/?table_number=1')
+        self.assertEqual(response.json(), [])
+
+    async def test_async_view(self):
+        """非同期のビューをスレッドで実行し直さずに処理し、プライマリへの固定も機能することのテスト"""
+        async def view(request):
+            return HttpResponse()
+        
+        self.assertTrue(iscoroutinefunction(ReplicaPinningMiddleware(view)))
+        
+        order = await Order.objects.acreate(table_number=1, total_price=0)
+        client = AsyncClient()
+        response = await client.get('/api/orders/?table_number=1')
+        self.assertEqual(response.json(), [])
+        
+        client.cookies['db_primary_until'] = str(time.time() + 5)
+        response = await client.get('/api/orders/?table_number=1')
+        self.assertEqual([item['id'] for item in response.json()], [order.id])
+
+    def test_expired_pin(self):
+        """固定の期限を過ぎた場合はレプリカから読み取ることのテスト"""
+        self.client.cookies['db_primary_until'] = str(time.time() - 1)
+        response = self.client.get('/api/categories/')
+        self.assertEqual(response.json()[0]['name'], "レプリカのカテゴリ")
+        self.assertNotIn('db_primary_until', response.cookies)
+
+    def test_router(self):
+        """ルーターの振り分けのテスト"""
+        router = PrimaryReplicaRouter()
+        
+        # ヒントや一覧系の処理以外の読み取りはデフォルトの動作（None）
+        self.assertIsNone(router.db_for_read(Category))
+        self.assertEqual(router.db_for_read(Category, read_replica=True), 'replica')
+        with replica_reads():
+            self.assertEqual(router.db_for_read(Category), 'replica')
+            
+            # トランザクション内と書き込み後はプライマリ
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(Category), 'default')
+            with routing_request() as state:
+                self.assertEqual(router.db_for_write(Category), 'default')
+                self.assertTrue(state.wrote)
+                self.assertEqual(router.db_for_read(Category), 'default')
+            with routing_request(pinned=True):
+                self.assertEqual(router.db_for_read(Category), 'default')
+            with primary_reads():
+                self.assertEqual(router.db_for_read(Category, read_replica=True), 'default')
+        
+        with override_settings(DATABASE_REPLICAS=[]), replica_reads():
+            self.assertIsNone(router.db_for_read(Category))
\ No newline at end of file
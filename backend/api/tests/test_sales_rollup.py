@@ -0,0 +1,172 @@
+import json
+from datetime import datetime, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from core.models import Category, Product, Order, HourlySales, ProductSales
+from api.services.order_archive_service import OrderArchiveService
+from api.services.order_service import OrderService
+from api.services.sales_rollup_service import SalesRollupService
+
+
+class SalesRollupTest(TestCase):
+    """売上集計のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.category = Category.objects.create(name="テストカテゴリ", order=1)
+        self.coffee = Product.objects.create(name="コーヒー", price=400, category=self.category)
+        self.cake = Product.objects.create(name="ケーキ", price=600, category=self.category)
+        self.service = OrderService()
+
+    def create_order(self, table_number=1, status='pending', items=None):
+        """注文を作成（既定はコーヒー2杯とケーキ1個）"""
+        return self.service.create_order({
+            'table_number': table_number,
+            'status': status,
+            'items': items or [
+                {'product_id': self.coffee.id, 'quantity': 2},
+                {'product_id': self.cake.id, 'quantity': 1},
+            ],
+        })
+
+    def update_status(self, order, status):
+        """注文ステータス更新APIを呼び出す"""
+        response = self.client.put(
+            f'/api/orders/{order.id}', data=json.dumps({'status': status}), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def snapshot(self):
+        """集計の内容を比較用に取得"""
+        return (
+            sorted(HourlySales.objects.values_list(
+                'sales_date', 'hour', 'table_number', 'order_count', 'quantity', 'revenue'
+            )),
+            sorted(ProductSales.objects.values_list('sales_date', 'hour', 'product_id', 'quantity', 'revenue')),
+        )
+
+    def test_completed_order_added(self):
+        """注文が完了になった時点で集計に加算されることのテスト"""
+        order = self.create_order(table_number=3)
+        self.update_status(order, 'processing')
+        self.assertFalse(HourlySales.objects.exists())
+        
+        self.update_status(order, 'completed')
+        now = timezone.localtime()
+        hourly = HourlySales.objects.get()
+        self.assertEqual((hourly.sales_date, hourly.hour, hourly.table_number), (now.date(), now.hour, 3))
+        self.assertEqual((hourly.order_count, hourly.quantity, hourly.revenue), (1, 3, 1400))
+        products = {row.product_id: (row.quantity, row.revenue) for row in ProductSales.objects.all()}
+        self.assertEqual(products, {self.coffee.id: (2, 800), self.cake.id: (1, 600)})
+        
+        # 完了のまま更新しても二重に加算されない
+        self.update_status(order, 'completed')
+        self.assertEqual(HourlySales.objects.get().order_count, 1)
+
+    def test_cancelled_order_reversed(self):
+        """完了した注文がキャンセルされると集計から減算されることのテスト"""
+        first = self.create_order()
+        second = self.create_order(items=[{'product_id': self.coffee.id, 'quantity': 1}])
+        self.update_status(first, 'completed')
+        self.update_status(second, 'completed')
+        
+        self.update_status(first, 'cancelled')
+        hourly = HourlySales.objects.get()
+        self.assertEqual((hourly.order_count, hourly.quantity, hourly.revenue), (1, 1, 400))
+        # 0になった行は削除される
+        self.assertEqual(list(ProductSales.objects.values_list('product_id', 'quantity')), [(self.coffee.id, 1)])
+        
+        self.update_status(second, 'cancelled')
+        self.assertEqual(self.snapshot(), ([], []))
+
+    def test_created_and_deleted(self):
+        """完了として作成・一括作成された注文の加算と、削除時の減算のテスト"""
+        order = self.create_order(status='completed')
+        self.service.create_orders([
+            {'table_number': 2, 'status': 'completed', 'items': [{'product_id': self.cake.id, 'quantity': 2}]},
+            {'table_number': 2, 'status': 'pending', 'items': [{'product_id': self.cake.id, 'quantity': 5}]},
+        ])
+        self.assertEqual(sum(HourlySales.objects.values_list('order_count', flat=True)), 2)
+        self.assertEqual(ProductSales.objects.get(product=self.cake).quantity, 3)
+        
+        self.service.delete_order(order.id)
+        self.assertEqual(list(HourlySales.objects.values_list('table_number', 'revenue')), [(2, 1200)])
+
+    def test_rebuild(self):
+        """作り直した集計が逐次更新した集計と一致することのテスト（アーカイブ済みの注文を含む）"""
+        orders = [self.create_order(table_number=number % 3 + 1) for number in range(5)]
+        for order in orders[:4]:
+            self.update_status(order, 'completed')
+        self.update_status(orders[3], 'cancelled')
+        # 40日前の完了済みの注文はアーカイブする
+        Order.objects.filter(id=orders[0].id).update(created_at=timezone.now() - timedelta(days=40))
+        incremental = self.snapshot()
+        OrderArchiveService().archive(older_than_days=30, pause=0)
+        
+        HourlySales.objects.all().delete()
+        ProductSales.objects.all().delete()
+        progress = []
+        result = SalesRollupService().rebuild(chunk_size=1, progress=lambda done, total: progress.append(done))
+        
+        self.assertEqual(result['orders'], 3)
+        self.assertEqual(progress, [1, 2, 3])
+        hourly, products = self.snapshot()
+        # アーカイブした注文は40日前の売上になる
+        self.assertEqual(len(hourly), 3)
+        self.assertEqual(sum(row[3] for row in hourly), 3)
+        self.assertEqual(sum(row[5] for row in hourly), sum(row[5] for row in incremental[0]))
+        
+        # 作り直した後に再度実行しても同じ結果になる
+        SalesRollupService().rebuild()
+        self.assertEqual(self.snapshot(), (hourly, products))
+
+    def test_reports(self):
+        """売上レポートAPIのテスト"""
+        self.update_status(self.create_order(table_number=1), 'completed')
+        self.update_status(self.create_order(table_number=2), 'completed')
+        self.create_order(table_number=3)
+        today = timezone.localdate().isoformat()
+        
+        # 集計のみを読み込む（注文テーブルは走査しない）
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/reports/sales/hourly')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [
+            {'hour': timezone.localtime().hour, 'order_count': 2, 'quantity': 6, 'revenue': 2800},
+        ])
+        
+        response = self.client.get(f'/api/reports/sales/daily?date_from={today}&date_to={today}')
+        self.assertEqual(response.json(), [{'sales_date': today, 'order_count': 2, 'quantity': 6, 'revenue': 2800}])
+        
+        response = self.client.get('/api/reports/sales/tables')
+        self.assertEqual([row['table_number'] for row in response.json()], [1, 2])
+        
+        response = self.client.get('/api/reports/sales/products')
+        self.assertEqual(response.json(), [
+            {'product_id': self.coffee.id, 'product_name': "コーヒー", 'quantity': 4, 'revenue': 1600},
+            {'product_id': self.cake.id, 'product_name': "ケーキ", 'quantity': 2, 'revenue': 1200},
+        ])
+
+    def test_report_period(self):
+        """売上レポートの期間指定のテスト"""
+        HourlySales.objects.create(
+            sales_date=datetime(2024, 1, 1).date(), hour=12, table_number=1, order_count=1, quantity=1, revenue=400
+        )
+        
+        self.assertEqual(self.client.get('/api/reports/sales/daily').json(), [])
+        response = self.client.get('/api/reports/sales/daily?date_from=2023-12-31&date_to=2024-01-01')
+        self.assertEqual(len(response.json()), 1)
+        response = self.client.get('/api/reports/sales/daily?date_from=2024-01-02&date_to=2024-01-01')
+        self.assertEqual(response.status_code, 400)
+
+    def test_command(self):
+        """rebuild_sales_rollups コマンドのテスト"""
+        self.create_order(status='completed')
+        HourlySales.objects.all().delete()
+        
+        out = StringIO()
+        call_command('rebuild_sales_rollups', stdout=out)
+        self.assertIn('1/1件を集計しました（100%）', out.getvalue())
+        self.assertEqual(HourlySales.objects.get().order_count, 1)
\ No newline at end of file
@@ -0,0 +1,62 @@
+from unittest import mock
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from config import server
+
+
+class ServerConfigTest(SimpleTestCase):
+    """本番用アプリケーションサーバーの設定のテストクラス"""
+
+    def test_default_workers(self):
+        """CPUコア数からワーカー数が決定されることのテスト"""
+        with mock.patch('os.sched_getaffinity', return_value={0, 1, 2, 3}, create=True):
+            self.assertEqual(server.default_workers('gthread'), 9)
+            self.assertEqual(server.default_workers('uvicorn'), 4)
+
+    def test_build_options(self):
+        """gunicornの設定が作成されることのテスト"""
+        options = server.build_options(
+            bind='127.0.0.1:8000', worker_class='gthread', workers=3, threads=8, preload=True,
+            max_requests=1000, max_requests_jitter=100, timeout=30, graceful_timeout=30,
+            keepalive=5, access_log=False,
+        )
+        
+        self.assertEqual(options['worker_class'], 'gthread')
+        self.assertEqual(options['workers'], 3)
+        self.assertEqual(options['threads'], 8)
+        self.assertTrue(options['preload_app'])
+        self.assertEqual(options['max_requests_jitter'], 100)
+        self.assertIs(options['pre_fork'], server.pre_fork)
+        self.assertNotIn('accesslog', options)
+
+    def test_post_fork_starts_ingestion_worker(self):
+        """fork後の各ワーカーで注文ジャーナルのワーカーを起動することのテスト"""
+        with mock.patch('api.services.order_ingestion_service.start_ingestion_worker_on_startup') as start:
+            server.post_fork(mock.Mock(), mock.Mock(pid=1))
+        
+        start.assert_called_once_with()
+
+    def test_build_options_uvicorn(self):
+        """ASGIワーカーではスレッド数を指定しないことのテスト"""
+        options = server.build_options(
+            bind='127.0.0.1:8000', worker_class='uvicorn', workers=0, threads=8, preload=False,
+            max_requests=0, max_requests_jitter=100, timeout=30, graceful_timeout=30,
+            keepalive=5, access_log=True,
+        )
+        
+        self.assertEqual(options['worker_class'], 'uvicorn.workers.UvicornWorker')
+        self.assertGreater(options['workers'], 0)
+        self.assertNotIn('threads', options)
+        # 入れ替えを行わない場合はばらつきも付けない
+        self.assertEqual(options['max_requests_jitter'], 0)
+        self.assertEqual(options['accesslog'], '-')
+
+    def test_serve_command(self):
+        """serveコマンドがアプリケーションと設定を渡してサーバーを起動することのテスト"""
+        with mock.patch('config.server.run') as run:
+            call_command('serve', '--bind', '127.0.0.1:9000', '--workers', '2', '--worker-class', 'uvicorn', stdout=mock.Mock())
+        
+        app_uri, options = run.call_args[0]
+        self.assertEqual(app_uri, server.ASGI_APPLICATION)
+        self.assertEqual(options['bind'], '127.0.0.1:9000')
+        self.assertEqual(options['workers'], 2)
\ No newline at end of file
@@ -0,0 +1 @@
+# ベンチマークパッケージ
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+同期（WSGI）と非同期（ASGI）のサーバーのスループット比較ベンチマーク
+
+同じSQLiteのデータで、WSGIサーバー（runserver または gunicorn）と
+ASGIサーバー（uvicorn）を1プロセスずつ起動し、同時接続数を変えて読み取りAPIに負荷をかける。
+--think-time を指定すると、接続を保持したまま操作間隔を空ける低速なタブレットを模擬する。
+
+Django 4.2の非同期ORMは内部でスレッドに処理を委譲するため、待機のないCPU律速の負荷では
+WSGIの方がスループットが高くなる。ASGIの効果が出るのは、接続を保持したまま待機する
+クライアントが多い場合（--think-time を指定した計測）である。
+
+実行例:
+    python -m benchmarks.asgi_vs_wsgi --concurrency 10 100 500 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+from benchmarks.common import free_port, prepare_server_database, run_server, server_env
+from benchmarks.http_load import run_http_load
+
+READ_PATHS = [
+    '/api/categories/',
+    '/api/products/',
+    '/api/orders/?limit=20',
+    '/api/orders/1',
+]
+
+
+def server_commands(port: int, wsgi_server: str, threads: int) -> dict:
+    """
+    比較するサーバーの起動コマンドを作成
+    
+    Args:
+        port: 待ち受けるポート
+        wsgi_server: WSGIサーバーの種類（runserver / gunicorn）
+        threads: gunicornのスレッド数
+        
+    Returns:
+        サーバー名をキーとした起動コマンドの辞書
+    """
+    if wsgi_server == 'gunicorn':
+        wsgi = [
+            sys.executable, '-m', 'gunicorn', 'config.wsgi:application',
+            '--bind', f'127.0.0.1:{port}', '--workers', '1', '--threads', str(threads),
+            '--log-level', 'warning',
+        ]
+    else:
+        wsgi = [sys.executable, 'manage.py', 'runserver', f'127.0.0.1:{port}', '--noreload']
+    return {
+        f'WSGI ({wsgi_server})': wsgi,
+        'ASGI (uvicorn)': [
+            sys.executable, '-m', 'uvicorn', 'config.asgi:application',
+            '--host', '127.0.0.1', '--port', str(port), '--workers', '1',
+            '--log-level', 'warning', '--no-access-log',
+        ],
+    }
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='WSGIとASGIのスループット比較')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 100, 500], help='同時接続数')
+    parser.add_argument('--duration', type=float, default=10, help='1回の計測時間（秒）')
+    parser.add_argument('--think-time', type=float, default=0.0, help='1リクエストごとの待機時間（秒）')
+    parser.add_argument('--orders', type=int, default=1000, help='注文数')
+    parser.add_argument('--wsgi-server', choices=['runserver', 'gunicorn'], default='gunicorn')
+    parser.add_argument('--threads', type=int, default=8, help='gunicornのスレッド数')
+    args = parser.parse_args()
+    
+    db_path = os.path.join(tempfile.gettempdir(), 'self_order_asgi_benchmark.sqlite3')
+    prepare_server_database(db_path, args.orders)
+    env = server_env(db_path)
+    
+    print(f'{"サーバー":<20}{"同時接続":>8}{"req/s":>10}{"p50":>10}{"p95":>10}{"p99":>10}{"エラー":>8}')
+    port = free_port()
+    for name, command in server_commands(port, args.wsgi_server, args.threads).items():
+        with run_server(command, port, env):
+            for concurrency in args.concurrency:
+                result = asyncio.run(run_http_load(
+                    '127.0.0.1', port, READ_PATHS, concurrency, args.duration, args.think_time
+                ))
+                print(
+                    f'{name:<20}{concurrency:>8}{result["rps"]:>10.1f}'
+                    f'{result["p50_ms"]:>8.1f}ms{result["p95_ms"]:>8.1f}ms{result["p99_ms"]:>8.1f}ms'
+                    f'{result["errors"]:>8}'
+                )
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
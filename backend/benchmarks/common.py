@@ -0,0 +1,273 @@
+"""
+ベンチマーク共通の処理
+
+ベンチマークはテスト用の設定（SQLite）で一時的なテストデータベースを作成して実行する。
+backend ディレクトリで `python -m benchmarks.<モジュール名>` の形式で実行すること。
+"""
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import django
+
+
+def setup_django(settings_module: str = 'config.sqlite_test_settings') -> None:
+    """
+    Djangoを初期化
+    
+    Args:
+        settings_module: 使用する設定モジュール（DJANGO_SETTINGS_MODULEが優先される）
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+@contextmanager
+def test_database(sqlite_path: Optional[str] = None) -> Iterator[None]:
+    """
+    一時的なテストデータベースを作成し、終了時に削除するコンテキストマネージャ
+    
+    Args:
+        sqlite_path: SQLiteの場合にテストデータベースを作成するファイル
+            （省略時はメモリ上。複数のスレッドから書き込む場合に指定する）
+    """
+    from django.db import connection
+    
+    old_name = connection.settings_dict['NAME']
+    old_test = dict(connection.settings_dict['TEST'])
+    if sqlite_path and connection.vendor == 'sqlite':
+        connection.settings_dict['TEST']['NAME'] = sqlite_path
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        connection.settings_dict['TEST'] = old_test
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> Dict[str, float]:
+    """
+    関数の実行時間を計測
+    
+    Args:
+        func: 計測する関数
+        repeat: 実行回数
+        
+    Returns:
+        最小・中央値・最大の実行時間（ミリ秒）
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'min_ms': min(timings),
+        'median_ms': statistics.median(timings),
+        'max_ms': max(timings),
+    }
+
+
+def seed_menu(product_count: int = 20, category_count: int = 1) -> List[Any]:
+    """
+    ベンチマーク用のメニュー（カテゴリと商品）を作成
+    
+    Args:
+        product_count: 商品数
+        category_count: カテゴリ数（商品は順に振り分ける）
+        
+    Returns:
+        作成した商品のリスト
+    """
+    from core.models import Category, Product
+    
+    categories = [
+        Category.objects.create(name='ベンチマーク' if category_count == 1 else f'ベンチマーク{i + 1}', order=i + 1)
+        for i in range(category_count)
+    ]
+    return Product.objects.bulk_create([
+        Product(
+            name=f'商品{i}', description=f'商品{i}の説明', price=100 * (i + 1),
+            category=categories[i % category_count], order=i,
+        )
+        for i in range(product_count)
+    ])
+
+
+def seed_orders(order_count: int, items_per_order: int = 3, product_count: int = 20) -> None:
+    """
+    ベンチマーク用の注文データを作成
+    
+    Args:
+        order_count: 注文数
+        items_per_order: 1注文あたりの注文明細数
+        product_count: 商品数
+    """
+    from core.models import Order, OrderItem
+    
+    products = seed_menu(product_count)
+    
+    orders = Order.objects.bulk_create([
+        Order(table_number=i % 30 + 1, status='pending', total_price=0)
+        for i in range(order_count)
+    ], batch_size=1000)
+    OrderItem.objects.bulk_create([
+        OrderItem(
+            order=order,
+            product=products[(order.id + j) % product_count],
+            quantity=j + 1,
+            price=products[(order.id + j) % product_count].price,
+        )
+        for order in orders
+        for j in range(items_per_order)
+    ], batch_size=1000)
+
+
+def print_result(label: str, result: Dict[str, float]) -> None:
+    """
+    計測結果を表示
+    
+    Args:
+        label: 計測対象の名前
+        result: measure の戻り値
+    """
+    print(
+        f"{label:<40} min {result['min_ms']:9.1f}ms"
+        f"  median {result['median_ms']:9.1f}ms  max {result['max_ms']:9.1f}ms"
+    )
+
+
+@contextmanager
+def run_server_thread(host: str = '127.0.0.1') -> Iterator[int]:
+    """
+    このプロセスのスレッドでDjangoのWSGIサーバー（runserverと同じ、1接続1スレッド）を起動する
+    コンテキストマネージャ
+    
+    Args:
+        host: 待ち受けるホスト
+        
+    Yields:
+        待ち受けているポート
+    """
+    from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+    from django.core.wsgi import get_wsgi_application
+    
+    class QuietRequestHandler(WSGIRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+    
+    server = ThreadedWSGIServer((host, 0), QuietRequestHandler)
+    server.set_app(get_wsgi_application())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+# サーバーを起動するベンチマークで使用する設定
+SERVER_SETTINGS_MODULE = 'benchmarks.settings'
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def server_env(db_path: str, **extra: str) -> Dict[str, str]:
+    """
+    ベンチマーク用サーバーの環境変数を作成
+    
+    Args:
+        db_path: SQLiteファイルのパス
+        **extra: 追加の環境変数
+        
+    Returns:
+        環境変数
+    """
+    env = dict(os.environ)
+    env.update({
+        'DJANGO_SETTINGS_MODULE': SERVER_SETTINGS_MODULE,
+        'BENCHMARK_DB_PATH': db_path,
+        'PYTHONPATH': BACKEND_DIR,
+    })
+    env.update(extra)
+    return env
+
+
+def prepare_server_database(db_path: str, order_count: int) -> None:
+    """
+    サーバー用のSQLiteファイルを作成してマイグレーションとデータ作成を行う
+    
+    Args:
+        db_path: SQLiteファイルのパス
+        order_count: 注文数
+    """
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    script = (
+        'import django; django.setup(); '
+        'from django.core.management import call_command; '
+        'call_command("migrate", verbosity=0); '
+        'from benchmarks.common import seed_orders; '
+        f'seed_orders({order_count})'
+    )
+    subprocess.run([sys.executable, '-c', script], cwd=BACKEND_DIR, env=server_env(db_path), check=True)
+
+
+def free_port() -> int:
+    """
+    空いているTCPポートを取得
+    
+    Returns:
+        ポート番号
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_server(command: List[str], port: int, env: Dict[str, str], timeout: float = 30) -> Iterator[subprocess.Popen]:
+    """
+    サーバーを起動し、ポートで接続を受け付けるまで待機するコンテキストマネージャ
+    
+    Args:
+        command: 起動コマンド
+        port: サーバーが待ち受けるポート
+        env: 環境変数
+        timeout: 起動を待機する最大秒数
+    """
+    # アクセスログでパイプが詰まらないよう、出力は一時ファイルに書き出す
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            if process.poll() is not None:
+                log.seek(0)
+                raise RuntimeError(f'サーバーの起動に失敗しました: {log.read().decode(errors="replace")}')
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError('サーバーの起動がタイムアウトしました')
+                time.sleep(0.1)
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        log.close()
\ No newline at end of file
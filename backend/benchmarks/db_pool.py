@@ -0,0 +1,123 @@
+"""
+DB接続プールの有無による応答時間の比較ベンチマーク
+
+接続に遅延を加えるSQLiteバックエンド（core.db.backends.latency_sqlite3）で
+MySQLへの接続（TCP・認証のハンドシェイク）を再現し、gthreadワーカーと同じく
+複数のスレッドで「接続 → クエリ → リクエスト終了時に close()」を繰り返す。
+プールなし（CONN_MAX_AGE=0 と同じ）とプールありで1リクエストあたりの時間を比較する。
+
+実行例:
+    python -m benchmarks.db_pool --threads 4 --requests 200 --connect-latency 0.005
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from benchmarks.common import setup_django
+
+
+def run_requests(handler: Any, alias: str, threads: int, requests: int, queries: int) -> Dict[str, float]:
+    """
+    スレッドごとにリクエストを模擬して応答時間を計測
+
+    Args:
+        handler: ConnectionHandler
+        alias: 使用するデータベースのエイリアス
+        threads: スレッド数
+        requests: スレッドあたりのリクエスト数
+        queries: 1リクエストあたりのクエリ数
+
+    Returns:
+        リクエスト数・スループット・レイテンシ（ミリ秒）
+    """
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        connection = handler[alias]
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            with connection.cursor() as cursor:
+                for _ in range(queries):
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+            connection.close()
+            timings.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(timings)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        'mean_ms': statistics.mean(latencies) * 1000,
+    }
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='DB接続プールの有無による応答時間の比較')
+    parser.add_argument('--threads', type=int, default=4, help='スレッド数（gthreadワーカーのスレッド数）')
+    parser.add_argument('--requests', type=int, default=200, help='スレッドあたりのリクエスト数')
+    parser.add_argument('--queries', type=int, default=3, help='1リクエストあたりのクエリ数')
+    parser.add_argument('--connect-latency', type=float, default=0.005, help='接続の遅延（秒）')
+    parser.add_argument('--query-latency', type=float, default=0.0002, help='クエリの遅延（秒）')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.utils import ConnectionHandler
+    from core.db.pool import close_pools
+
+    fd, path = tempfile.mkstemp(suffix='.sqlite3')
+    os.close(fd)
+    latency = {'CONNECT': args.connect_latency, 'QUERY': args.query_latency}
+    handler = ConnectionHandler({
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': path},
+        'unpooled': {'ENGINE': 'core.db.backends.latency_sqlite3', 'NAME': path, 'LATENCY': latency},
+        'pooled': {
+            'ENGINE': 'core.db.backends.latency_sqlite3',
+            'NAME': path,
+            'LATENCY': latency,
+            'POOL': {'MIN_SIZE': 1, 'MAX_SIZE': args.threads},
+        },
+    })
+    try:
+        print(
+            f'スレッド数: {args.threads}, 接続の遅延: {args.connect_latency * 1000:.1f}ms, '
+            f'クエリの遅延: {args.query_latency * 1000:.1f}ms × {args.queries}'
+        )
+        for label, alias in [('プールなし', 'unpooled'), ('プールあり', 'pooled')]:
+            result = run_requests(handler, alias, args.threads, args.requests, args.queries)
+            print(
+                f"  {label:<10} {result['rps']:8.0f} req/s  mean {result['mean_ms']:6.2f}ms"
+                f"  p50 {result['p50_ms']:6.2f}ms  p99 {result['p99_ms']:6.2f}ms"
+            )
+        stats = handler['pooled'].pool.stats()
+        print(
+            f"  プールの接続数: {stats['connections_created']}, 取得回数: {stats['checkouts']}, "
+            f"待機回数: {stats['waits']}"
+        )
+    finally:
+        handler.close_all()
+        close_pools()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
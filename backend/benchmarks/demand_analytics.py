@@ -0,0 +1,93 @@
+"""
+需要分析（DemandAccumulator）の集計時間のベンチマーク
+
+1年分・数百商品の合成データ（既定で1,000万件の注文明細）をチャンクごとにNumPyの配列で生成し、
+商品の人気順位・曜日と時間帯別の需要・カテゴリ別の売上を集計する時間を計測する。
+比較のため、一部の行を行ごとのPythonのループで集計した時間から全件の時間を推定する。
+--db-items を指定した場合は、テストデータベースの注文明細を読み込む時間を含めた分析の時間も計測する。
+
+実行例:
+    python -m benchmarks.demand_analytics --items 10000000 --chunk-size 1000000
+"""
+
+import argparse
+import time
+from collections import Counter
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from benchmarks.common import seed_orders, setup_django, test_database
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='需要分析の集計時間')
+    parser.add_argument('--items', type=int, default=10_000_000, help='合成データの注文明細数')
+    parser.add_argument('--chunk-size', type=int, default=1_000_000, help='1回に集計する注文明細数')
+    parser.add_argument('--products', type=int, default=300, help='商品数')
+    parser.add_argument('--loop-sample', type=int, default=200_000, help='Pythonのループで集計する注文明細数')
+    parser.add_argument('--db-items', type=int, default=0, help='データベースから読み込んで分析する注文明細数')
+    args = parser.parse_args()
+    
+    setup_django()
+    from api.services.order_analytics_service import DemandAccumulator, OrderAnalyticsService, OrderItemColumns
+    
+    tz = ZoneInfo('Asia/Tokyo')
+    start = int(datetime(2024, 1, 1, tzinfo=tz).timestamp())
+    rng = np.random.default_rng(0)
+    prices = rng.integers(3, 30, args.products + 1) * 100
+    
+    def generate(size: int) -> OrderItemColumns:
+        product_id = rng.integers(1, args.products + 1, size)
+        return OrderItemColumns(
+            product_id=product_id,
+            quantity=rng.integers(1, 4, size),
+            price=prices[product_id],
+            created_at=start + rng.integers(0, 365 * 86400, size),
+        )
+    
+    accumulator = DemandAccumulator(tz)
+    elapsed = 0.0
+    remaining = args.items
+    while remaining > 0:
+        columns = generate(min(args.chunk_size, remaining))
+        remaining -= len(columns.product_id)
+        started = time.perf_counter()
+        accumulator.add(columns)
+        elapsed += time.perf_counter() - started
+    started = time.perf_counter()
+    accumulator.ranking(20)
+    accumulator.revenue_by_group({product_id: product_id % 8 for product_id in range(1, args.products + 1)})
+    elapsed += time.perf_counter() - started
+    print(f'NumPy（{args.chunk_size:,}件ずつ）  {args.items:>12,}件  {elapsed:8.2f}秒')
+    
+    # 比較: 行ごとのPythonのループ（タイムゾーンの変換を含む）
+    sample = generate(args.loop_sample)
+    started = time.perf_counter()
+    quantity, revenue, slots = Counter(), Counter(), Counter()
+    for product_id, item_quantity, price, created_at in zip(
+        sample.product_id.tolist(), sample.quantity.tolist(), sample.price.tolist(), sample.created_at.tolist()
+    ):
+        local = datetime.fromtimestamp(created_at, tz)
+        quantity[product_id] += item_quantity
+        revenue[product_id] += item_quantity * price
+        slots[(local.weekday(), local.hour)] += item_quantity
+    loop_elapsed = (time.perf_counter() - started) * args.items / args.loop_sample
+    print(f'Pythonのループ（推定）        {args.items:>12,}件  {loop_elapsed:8.2f}秒')
+    print(f'速度比: {loop_elapsed / elapsed:.0f}倍')
+    
+    if args.db_items:
+        with test_database():
+            seed_orders(args.db_items // 3, items_per_order=3)
+            started = time.perf_counter()
+            result = OrderAnalyticsService().analyze(top=20)
+            print(
+                f"データベースからの分析        {result['item_count']:>12,}件  "
+                f'{time.perf_counter() - started:8.2f}秒（読み込みを含む）'
+            )
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+客席全体を模擬する負荷試験
+
+テーブル（タブレット）とキッチン画面をasyncioのタスクとして動かし、実際の利用と同じ順序と間隔で
+APIへリクエストを送り、エンドポイントごとのスループットとレイテンシを集計する。
+
+- テーブル: 来店するとメニュー（カテゴリ・商品一覧）を読み込み、商品詳細を見ながら選んで注文する。
+  食事の後に追加注文するか、退店して次の客の来店を待つ。メニューはETagで条件付きGETを行う。
+- キッチン画面: 差分同期（/api/orders/changes）で一定間隔ごとに注文を取得する。
+
+人の操作間隔（思考時間）は平均の周りに右に裾の長い対数正規分布とし、think_scale で
+全体を縮めると短い試験時間で多くの来店を再現できる。
+
+実行は manage.py loadtest コマンドから行う。
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+
+from benchmarks.http_load import HttpConnection, summarize_latencies
+
+# 集計するエンドポイント（表示順）
+ENDPOINTS = (
+    'GET /api/categories/',
+    'GET /api/products/',
+    'GET /api/products/{id}',
+    'POST /api/orders/',
+    'GET /api/orders/changes',
+)
+
+
+class ThinkTimes(NamedTuple):
+    """テーブルの操作間隔の平均（秒）"""
+    
+    # 商品詳細を開くまで
+    detail: float = 6.0
+    # 商品を選び終えて注文するまで
+    browse: float = 20.0
+    # 注文してから追加注文するか退店するまで（食事）
+    meal: float = 600.0
+    # 退店から次の客の来店まで
+    vacancy: float = 120.0
+
+
+class DiningRoom:
+    """
+    テーブルとキッチン画面の負荷を生成するクラス
+    """
+    
+    # 対数正規分布のばらつき（σ）
+    THINK_TIME_SIGMA = 0.6
+    # 食事の後に追加注文する確率
+    REORDER_PROBABILITY = 0.4
+    # 1回の注文で選ぶ商品数と数量の範囲
+    ITEMS_PER_ORDER = (1, 4)
+    QUANTITY = (1, 2)
+    # キッチン画面が1回に取得する注文数
+    CHANGES_LIMIT = 100
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        think_times: ThinkTimes = ThinkTimes(),
+        think_scale: float = 1.0,
+        poll_interval: float = 2.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        コンストラクタ
+        
+        Args:
+            host: APIサーバーのホスト
+            port: APIサーバーのポート
+            think_times: テーブルの操作間隔の平均
+            think_scale: 操作間隔に掛ける倍率（0.1 なら10倍の速さで来店・注文する）
+            poll_interval: キッチン画面のポーリング間隔（秒、think_scale は掛けない）
+            seed: 乱数のシード（同じ値なら同じ順序で操作する）
+        """
+        self.host = host
+        self.port = port
+        self.think_times = think_times
+        self.think_scale = think_scale
+        self.poll_interval = poll_interval
+        self.rng = random.Random(seed)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.orders_placed = 0
+        self._deadline = 0.0
+    
+    async def run(self, tables: int, kitchens: int, duration: float, ramp_up: float = 0.0) -> Dict[str, Any]:
+        """
+        負荷試験を実行
+        
+        Args:
+            tables: テーブル数
+            kitchens: キッチン画面の数
+            duration: 試験時間（秒）
+            ramp_up: テーブルの来店を分散させる時間（秒）
+            
+        Returns:
+            試験の条件・作成した注文数・エンドポイントごとと全体の統計
+        """
+        start = time.monotonic()
+        self._deadline = start + duration
+        await asyncio.gather(
+            *[self._table(table_number, self.rng.uniform(0, ramp_up)) for table_number in range(1, tables + 1)],
+            *[self._kitchen() for _ in range(kitchens)],
+        )
+        elapsed = time.monotonic() - start
+        
+        endpoints = {}
+        for label in ENDPOINTS:
+            errors = dict(self.errors[label])
+            endpoints[label] = {
+                **summarize_latencies(self.latencies[label], elapsed, sum(errors.values())),
+                'error_details': errors,
+            }
+        all_latencies = [latency for label in ENDPOINTS for latency in self.latencies[label]]
+        return {
+            'tables': tables,
+            'kitchens': kitchens,
+            'duration': elapsed,
+            'think_scale': self.think_scale,
+            'orders_placed': self.orders_placed,
+            'endpoints': endpoints,
+            'total': summarize_latencies(
+                all_latencies, elapsed, sum(summary['errors'] for summary in endpoints.values())
+            ),
+        }
+    
+    def think_time(self, mean: float) -> float:
+        """
+        操作間隔を抽選（平均が mean × think_scale の対数正規分布）
+        
+        Args:
+            mean: 平均（秒）
+            
+        Returns:
+            待機する秒数
+        """
+        sigma = self.THINK_TIME_SIGMA
+        return self.rng.lognormvariate(math.log(mean * self.think_scale) - sigma ** 2 / 2, sigma)
+    
+    async def _table(self, table_number: int, arrival: float) -> None:
+        """
+        1テーブル分のタブレットの操作を試験時間が終わるまで繰り返す
+        
+        Args:
+            table_number: テーブル番号
+            arrival: 最初の来店までの秒数
+        """
+        connection = HttpConnection(self.host, self.port)
+        etags: Dict[str, str] = {}
+        products: List[Dict[str, Any]] = []
+        try:
+            await self._sleep(arrival)
+            while not self._expired():
+                # 来店: メニューを読み込む（変更がなければ304で前回の内容を使う）
+                await self._get_menu(connection, etags, 'GET /api/categories/', '/api/categories/')
+                products = await self._get_menu(connection, etags, 'GET /api/products/', '/api/products/') or products
+                while products and not self._expired():
+                    await self._place_order(connection, table_number, products)
+                    await self._sleep(self.think_time(self.think_times.meal))
+                    if self.rng.random() >= self.REORDER_PROBABILITY:
+                        break
+                # 退店して次の客の来店を待つ
+                await self._sleep(self.think_time(self.think_times.vacancy))
+        finally:
+            connection.close()
+    
+    async def _place_order(self, connection: HttpConnection, table_number: int, products: List[Dict[str, Any]]) -> None:
+        """
+        商品詳細を見ながら商品を選んで注文
+        
+        Args:
+            connection: テーブルの接続
+            table_number: テーブル番号
+            products: 商品一覧のレスポンス
+        """
+        chosen = self.rng.sample(products, min(len(products), self.rng.randint(*self.ITEMS_PER_ORDER)))
+        for product in chosen:
+            await self._sleep(self.think_time(self.think_times.detail))
+            if self._expired():
+                return
+            await self._request(connection, 'GET /api/products/{id}', 'GET', f"/api/products/{product['id']}")
+        await self._sleep(self.think_time(self.think_times.browse))
+        if self._expired():
+            return
+        body = json.dumps({
+            'table_number': table_number,
+            'status': 'pending',
+            'items': [
+                {'product_id': product['id'], 'quantity': self.rng.randint(*self.QUANTITY)} for product in chosen
+            ],
+        }).encode()
+        response = await self._request(connection, 'POST /api/orders/', 'POST', '/api/orders/', body)
+        if response is not None and response[0] in (201, 202):
+            self.orders_placed += 1
+    
+    async def _kitchen(self) -> None:
+        """キッチン画面の差分同期のポーリングを試験時間が終わるまで繰り返す"""
+        connection = HttpConnection(self.host, self.port)
+        token: Optional[str] = None
+        try:
+            await self._sleep(self.rng.uniform(0, self.poll_interval))
+            while not self._expired():
+                path = f'/api/orders/changes?limit={self.CHANGES_LIMIT}'
+                if token:
+                    path += f'&since={quote(token)}'
+                response = await self._request(connection, 'GET /api/orders/changes', 'GET', path)
+                if response is not None and response[0] == 200:
+                    changes = json.loads(response[2])
+                    token = changes['next_token'] or token
+                    if changes['has_more']:
+                        continue
+                await self._sleep(self.poll_interval * self.rng.uniform(0.9, 1.1))
+        finally:
+            connection.close()
+    
+    async def _get_menu(
+        self, connection: HttpConnection, etags: Dict[str, str], label: str, path: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        メニューを条件付きGETで取得
+        
+        Returns:
+            変更があった場合はレスポンスの一覧、304・エラーの場合はNone
+        """
+        headers = {'If-None-Match': etags[path]} if path in etags else None
+        response = await self._request(connection, label, 'GET', path, headers=headers)
+        if response is None or response[0] != 200:
+            return None
+        _, response_headers, body = response
+        if 'etag' in response_headers:
+            etags[path] = response_headers['etag']
+        return json.loads(body)
+    
+    async def _request(
+        self,
+        connection: HttpConnection,
+        label: str,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """
+        リクエストを送信してレイテンシとエラーを記録
+        
+        Returns:
+            (ステータスコード, ヘッダー, 本文)、通信に失敗した場合はNone
+        """
+        start = time.monotonic()
+        try:
+            response = await connection.request(method, path, body, headers)
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            self.errors[label][type(exc).__name__] += 1
+            return None
+        self.latencies[label].append(time.monotonic() - start)
+        if response[0] >= 400:
+            self.errors[label][str(response[0])] += 1
+        return response
+    
+    async def _sleep(self, seconds: float) -> None:
+        """試験時間の終了を超えない範囲で待機"""
+        remaining = self._deadline - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(min(seconds, remaining))
+    
+    def _expired(self) -> bool:
+        """試験時間が終了したかどうか"""
+        return time.monotonic() >= self._deadline
\ No newline at end of file
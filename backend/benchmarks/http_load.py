@@ -0,0 +1,223 @@
+"""
+ベンチマーク用のHTTP負荷生成
+
+asyncioで同時接続数分のクライアントを動かし、Keep-AliveのHTTP/1.1でリクエストを送り続ける。
+外部のツールに依存せず、起動したサーバーのスループットとレイテンシを計測する。
+HttpConnection はシナリオに沿ってリクエストを送る負荷試験（benchmarks.dining_room）でも使用する。
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple:
+    """
+    HTTPレスポンスを1件読み込む
+    
+    Args:
+        reader: 接続のストリーム
+        
+    Returns:
+        (ステータスコード, 接続を閉じる必要があるかどうか, ヘッダー（小文字の名前）, 本文)
+    """
+    header = await reader.readuntil(b'\r\n\r\n')
+    lines = header.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+    
+    if 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    elif headers.get('transfer-encoding') == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            chunks.append((await reader.readexactly(size + 2))[:size])
+            if size == 0:
+                break
+        body = b''.join(chunks)
+    elif status != 304:
+        return status, True, headers, await reader.read()
+    else:
+        body = b''
+    return status, headers.get('connection', '').lower() == 'close', headers, body
+
+
+class HttpConnection:
+    """
+    Keep-AliveのHTTP/1.1接続（切断された場合は次のリクエストで接続し直す）
+    """
+    
+    def __init__(self, host: str, port: int):
+        """
+        コンストラクタ
+        
+        Args:
+            host: ホスト
+            port: ポート
+        """
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+    
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        リクエストを送信してレスポンスを読み込む
+        
+        Args:
+            method: HTTPメソッド
+            path: パス（クエリ文字列を含む）
+            body: リクエストの本文（JSON）
+            headers: 追加のヘッダー
+            
+        Returns:
+            (ステータスコード, ヘッダー（小文字の名前）, 本文)
+            
+        Raises:
+            OSError, asyncio.IncompleteReadError, ValueError: 通信に失敗した場合（接続は閉じる）
+        """
+        lines = [
+            f'{method} {path} HTTP/1.1', f'Host: {self.host}:{self.port}',
+            'Accept: application/json', 'Connection: keep-alive',
+        ]
+        if body is not None:
+            lines += ['Content-Type: application/json', f'Content-Length: {len(body)}']
+        lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+        try:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('ascii') + (body or b''))
+            await self._writer.drain()
+            status, close, response_headers, response_body = await _read_response(self._reader)
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self.close()
+            raise
+        if close:
+            self.close()
+        return status, response_headers, response_body
+    
+    def close(self) -> None:
+        """接続を閉じる"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def summarize_latencies(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, float]:
+    """
+    レイテンシの統計を計算
+    
+    Args:
+        latencies: リクエストごとのレイテンシ（秒）
+        elapsed: 計測時間（秒）
+        errors: エラー数
+        
+    Returns:
+        リクエスト数・スループット・レイテンシ（ミリ秒）・エラー数
+    """
+    latencies = sorted(latencies)
+    
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+    
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'mean_ms': statistics.mean(latencies) * 1000 if latencies else 0.0,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'errors': errors,
+    }
+
+
+async def _client(
+    host: str,
+    port: int,
+    paths: Sequence[str],
+    deadline: float,
+    think_time: float,
+    latencies: List[float],
+    errors: Dict[str, int],
+    offset: int,
+) -> None:
+    """1接続分のクライアント（期限までリクエストを送り続ける）"""
+    reader: Optional[asyncio.StreamReader] = None
+    writer: Optional[asyncio.StreamWriter] = None
+    index = offset
+    while time.monotonic() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            request = (
+                f'GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n'
+                f'Accept: application/json\r\nConnection: keep-alive\r\n\r\n'
+            )
+            start = time.monotonic()
+            writer.write(request.encode('ascii'))
+            await writer.drain()
+            status, close, _, _ = await _read_response(reader)
+            latencies.append(time.monotonic() - start)
+            if status >= 400:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            errors[type(exc).__name__] = errors.get(type(exc).__name__, 0) + 1
+            close = True
+        if close and writer is not None:
+            writer.close()
+            writer = None
+        if think_time:
+            # タブレットの操作間隔を模して、接続を保持したまま待機する
+            await asyncio.sleep(think_time)
+    if writer is not None:
+        writer.close()
+
+
+async def run_http_load(
+    host: str,
+    port: int,
+    paths: Sequence[str],
+    concurrency: int,
+    duration: float,
+    think_time: float = 0.0,
+) -> Dict[str, float]:
+    """
+    同時接続数を指定してHTTPの負荷をかける
+    
+    Args:
+        host: ホスト
+        port: ポート
+        paths: リクエストするパスのリスト（接続ごとに順番に使用する）
+        concurrency: 同時接続数
+        duration: 計測時間（秒）
+        think_time: 1リクエストごとの待機時間（秒）
+        
+    Returns:
+        リクエスト数・スループット・レイテンシ（ミリ秒）・エラー数
+    """
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    start = time.monotonic()
+    deadline = start + duration
+    await asyncio.gather(*[
+        _client(host, port, paths, deadline, think_time, latencies, errors, i)
+        for i in range(concurrency)
+    ])
+    elapsed = time.monotonic() - start
+    return summarize_latencies(latencies, elapsed, sum(errors.values()))
\ No newline at end of file
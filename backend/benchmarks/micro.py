@@ -0,0 +1,388 @@
+"""
+DAO・サービス・スキーマのマイクロベンチマーク
+
+api/tests とは別に、リクエストのホットパスの1回あたりの処理時間を計測する。
+
+- BaseDAO のCRUD（OrderDAO）
+- OrderService.create_order（カートの明細数別）
+- OrderOut.from_orm（注文明細数別）
+- メニュー一覧（商品数別。キャッシュなしの取得・変換と、キャッシュ済みのAPIレスポンス）
+
+ベンチマークごとに1回の計測が --min-time 秒以上になる回数を決めて --repeat 回計測し、
+1回あたりの時間の中央値などをJSONに保存する。2つのコミットの結果を比較し、
+中央値が --threshold（既定値は環境変数 BENCHMARK_REGRESSION_THRESHOLD、未設定の場合は0.2）を
+超えて遅くなったベンチマークがあれば終了コード1で終了する。
+比較する2つの結果は同じマシンで、他の負荷がない状態で計測すること。
+
+実行例:
+    python -m benchmarks.micro run --output before.json
+    python -m benchmarks.micro run --output after.json --compare before.json
+    python -m benchmarks.micro compare before.json after.json --threshold 0.1
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from benchmarks.common import BACKEND_DIR, seed_menu, setup_django, test_database
+
+# 結果のJSONの形式のバージョン
+RESULT_VERSION = 1
+DEFAULT_THRESHOLD = float(os.environ.get('BENCHMARK_REGRESSION_THRESHOLD', 0.2))
+
+CART_SIZES = (1, 5, 20, 50)
+ORDER_ITEM_COUNTS = (1, 10, 50)
+CATALOG_SIZES = (10, 100, 1000)
+
+# loops 回の処理にかかった秒数を返す関数
+TimeFunc = Callable[[int], float]
+
+
+class Benchmark(NamedTuple):
+    """ベンチマークの定義"""
+    
+    # 名前（例: service.create_order[cart=5]）
+    name: str
+    # 計測用のデータを作成し、計測する関数を返す（データベースは空の状態で呼び出す）
+    setup: Callable[[], TimeFunc]
+
+
+def loop(operation: Callable[[], Any]) -> TimeFunc:
+    """
+    引数のない処理を loops 回繰り返す計測関数を作成
+    
+    Args:
+        operation: 計測する処理
+        
+    Returns:
+        計測関数
+    """
+    def time_func(loops: int) -> float:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        return time.perf_counter() - start
+    return time_func
+
+
+def build_benchmarks() -> List[Benchmark]:
+    """
+    ベンチマークの一覧を作成（Djangoの初期化後に呼び出す）
+    
+    Returns:
+        ベンチマークのリスト
+    """
+    from django.test import Client
+    from api.dao.order_dao import OrderDAO
+    from api.schemas.order import OrderOut
+    from api.schemas.product import ProductOut
+    from api.services.menu_cache import menu_cache
+    from api.services.order_service import OrderService
+    from api.services.product_service import ProductService
+    
+    def order_data(products: List[Any], cart_size: int) -> Dict[str, Any]:
+        return {
+            'table_number': 1,
+            'status': 'pending',
+            'items': [
+                {'product_id': products[i % len(products)].id, 'quantity': i % 3 + 1} for i in range(cart_size)
+            ],
+        }
+    
+    def dao_create() -> TimeFunc:
+        dao = OrderDAO()
+        return loop(lambda: dao.create(table_number=1, status='pending', total_price=0))
+    
+    def dao_get_by_id() -> TimeFunc:
+        dao = OrderDAO()
+        order_id = dao.create(table_number=1, total_price=0).id
+        return loop(lambda: dao.get_by_id(order_id))
+    
+    def dao_get_all() -> TimeFunc:
+        dao = OrderDAO()
+        for _ in range(100):
+            dao.create(table_number=1, total_price=0)
+        return loop(lambda: list(dao.get_all()))
+    
+    def dao_update() -> TimeFunc:
+        dao = OrderDAO()
+        order = dao.create(table_number=1, total_price=0)
+        return loop(lambda: dao.update(order, status='preparing', total_price=100))
+    
+    def dao_delete() -> TimeFunc:
+        dao = OrderDAO()
+        
+        def time_func(loops: int) -> float:
+            orders = [dao.create(table_number=1, total_price=0) for _ in range(loops)]
+            start = time.perf_counter()
+            for order in orders:
+                dao.delete(order)
+            return time.perf_counter() - start
+        return time_func
+    
+    def create_order(cart_size: int) -> Callable[[], TimeFunc]:
+        def setup() -> TimeFunc:
+            service = OrderService()
+            data = order_data(seed_menu(50), cart_size)
+            return loop(lambda: service.create_order(data))
+        return setup
+    
+    def order_from_orm(item_count: int) -> Callable[[], TimeFunc]:
+        def setup() -> TimeFunc:
+            order = OrderService().create_order(order_data(seed_menu(50), item_count))
+            order = OrderDAO().get_orders_with_items().get(id=order.id)
+            return loop(lambda: OrderOut.from_orm(order).dict())
+        return setup
+    
+    def menu_uncached(catalog_size: int) -> Callable[[], TimeFunc]:
+        def setup() -> TimeFunc:
+            seed_menu(catalog_size, category_count=5)
+            service = ProductService()
+            
+            def operation() -> None:
+                menu_cache.invalidate()
+                [ProductOut.from_orm(product).dict() for product in service.get_all_products()]
+            return loop(operation)
+        return setup
+    
+    def menu_http(catalog_size: int) -> Callable[[], TimeFunc]:
+        def setup() -> TimeFunc:
+            seed_menu(catalog_size, category_count=5)
+            client = Client()
+            client.get('/api/products/')
+            return loop(lambda: client.get('/api/products/'))
+        return setup
+    
+    return [
+        Benchmark('dao.create', dao_create),
+        Benchmark('dao.get_by_id', dao_get_by_id),
+        Benchmark('dao.get_all[rows=100]', dao_get_all),
+        Benchmark('dao.update', dao_update),
+        Benchmark('dao.delete', dao_delete),
+        *[Benchmark(f'service.create_order[cart={size}]', create_order(size)) for size in CART_SIZES],
+        *[Benchmark(f'schema.OrderOut.from_orm[items={count}]', order_from_orm(count)) for count in ORDER_ITEM_COUNTS],
+        *[Benchmark(f'menu.products.uncached[catalog={size}]', menu_uncached(size)) for size in CATALOG_SIZES],
+        *[Benchmark(f'menu.products.http[catalog={size}]', menu_http(size)) for size in CATALOG_SIZES],
+    ]
+
+
+def measure_benchmark(time_func: TimeFunc, repeat: int, min_time: float) -> Dict[str, Any]:
+    """
+    1回の計測が min_time 秒以上になる回数を決めて repeat 回計測
+    
+    計測中はGCを止める（timeit と同じ）。
+    
+    Args:
+        time_func: 計測関数
+        repeat: 計測回数
+        min_time: 1回の計測の最小秒数
+        
+    Returns:
+        1回あたりの時間（マイクロ秒）の中央値・最小・平均・標準偏差と計測の条件
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops = 1
+        while True:
+            elapsed = time_func(loops)
+            if elapsed >= min_time or loops >= 1_000_000:
+                break
+            # 経過時間から必要な回数を見積もる（急に増やしすぎないよう最大10倍）
+            loops = min(loops * 10, max(loops + 1, int(loops * min_time / max(elapsed, 1e-9) * 1.2)))
+        timings = [time_func(loops) / loops * 1_000_000 for _ in range(repeat)]
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return {
+        'median_us': statistics.median(timings),
+        'min_us': min(timings),
+        'mean_us': statistics.mean(timings),
+        'stdev_us': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'loops': loops,
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    repeat: int,
+    min_time: float,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    ベンチマークを順に実行（それぞれ空のデータベースから始める）
+    
+    Args:
+        benchmarks: 実行するベンチマーク
+        repeat: 計測回数
+        min_time: 1回の計測の最小秒数
+        progress: ベンチマークごとに名前と結果を受け取る関数
+        
+    Returns:
+        ベンチマーク名をキーとした結果
+    """
+    from django.core.management import call_command
+    from api.services.menu_cache import menu_cache
+    from api.services.recommendation_service import recommender
+    
+    results = {}
+    for benchmark in benchmarks:
+        call_command('flush', interactive=False, verbosity=0)
+        menu_cache.invalidate()
+        recommender.reset()
+        results[benchmark.name] = measure_benchmark(benchmark.setup(), repeat, min_time)
+        if progress is not None:
+            progress(benchmark.name, results[benchmark.name])
+    return results
+
+
+def compare_results(
+    base: Dict[str, Any], head: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    2つの結果の中央値を比較
+    
+    Args:
+        base: 比較元（変更前）の結果
+        head: 比較先（変更後）の結果
+        threshold: 遅くなった割合の閾値（0.2 なら20%）
+        
+    Returns:
+        両方にあるベンチマークの比較（名前・中央値・変化率・閾値を超えたかどうか）のリスト
+    """
+    comparisons = []
+    for name, result in head['benchmarks'].items():
+        if name not in base['benchmarks']:
+            continue
+        base_us = base['benchmarks'][name]['median_us']
+        change = result['median_us'] / base_us - 1 if base_us else 0.0
+        comparisons.append({
+            'name': name,
+            'base_us': base_us,
+            'head_us': result['median_us'],
+            'change': change,
+            'regression': change > threshold,
+        })
+    return comparisons
+
+
+def environment() -> Dict[str, Any]:
+    """結果を比較する際に確認する実行環境（コミット・Python・Django・データベース）"""
+    import django
+    from django.db import connection
+    
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(
+                ['git', *args], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ''
+    
+    return {
+        'commit': git('rev-parse', 'HEAD'),
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'platform': platform.platform(),
+    }
+
+
+def print_comparison(comparisons: List[Dict[str, Any]], threshold: float) -> None:
+    """比較結果を表示"""
+    print(f"{'ベンチマーク':<34}{'比較元':>12}{'比較先':>12}{'変化':>9}")
+    for item in comparisons:
+        mark = '  ← 閾値超過' if item['regression'] else ''
+        print(
+            f"{item['name']:<40}{item['base_us']:>10.1f}us{item['head_us']:>10.1f}us"
+            f"{item['change'] * 100:>+8.1f}%{mark}"
+        )
+    regressions = [item for item in comparisons if item['regression']]
+    print(f'閾値 {threshold * 100:.0f}% を超えて遅くなったベンチマーク: {len(regressions)}件')
+
+
+def load_result(path: str) -> Dict[str, Any]:
+    """
+    保存した結果を読み込む
+    
+    Raises:
+        SystemExit: 形式のバージョンが異なる場合
+    """
+    with open(path, encoding='utf-8') as f:
+        result = json.load(f)
+    if result.get('version') != RESULT_VERSION:
+        sys.exit(f'{path} の形式のバージョンが異なります')
+    return result
+
+
+def main() -> None:
+    """ベンチマークの実行・比較"""
+    parser = argparse.ArgumentParser(description='DAO・サービス・スキーマのマイクロベンチマーク')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='ベンチマークを実行して結果を保存')
+    run_parser.add_argument('--output', help='結果を保存するJSONファイル')
+    run_parser.add_argument('--filter', action='append', default=[], help='名前にこの文字列を含むベンチマークのみ実行')
+    run_parser.add_argument('--repeat', type=int, default=7, help='計測回数')
+    run_parser.add_argument('--min-time', type=float, default=0.1, help='1回の計測の最小秒数')
+    run_parser.add_argument('--compare', help='比較元の結果のJSONファイル（閾値を超えた場合は終了コード1）')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='遅くなった割合の閾値')
+    
+    compare_parser = subparsers.add_parser('compare', help='2つの結果を比較')
+    compare_parser.add_argument('base', help='比較元（変更前）の結果のJSONファイル')
+    compare_parser.add_argument('head', help='比較先（変更後）の結果のJSONファイル')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='遅くなった割合の閾値')
+    args = parser.parse_args()
+    
+    if args.command == 'compare':
+        base, head = load_result(args.base), load_result(args.head)
+    else:
+        base = load_result(args.compare) if args.compare else None
+        setup_django()
+        benchmarks = [
+            benchmark for benchmark in build_benchmarks()
+            if not args.filter or any(pattern in benchmark.name for pattern in args.filter)
+        ]
+        
+        def report(name: str, result: Dict[str, Any]) -> None:
+            print(
+                f"{name:<40} median {result['median_us']:10.1f}us  min {result['min_us']:10.1f}us"
+                f"  ±{result['stdev_us']:8.1f}us  ({result['loops']}回 × {result['repeat']})"
+            )
+        
+        with test_database():
+            head = {
+                'version': RESULT_VERSION,
+                'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'environment': environment(),
+                'options': {'repeat': args.repeat, 'min_time': args.min_time},
+                'benchmarks': run_benchmarks(benchmarks, args.repeat, args.min_time, report),
+            }
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(head, f, ensure_ascii=False, indent=2)
+            print(f'結果を {args.output} に保存しました')
+        if base is None:
+            return
+    
+    for key in ('python', 'django', 'database', 'platform'):
+        if base['environment'].get(key) != head['environment'].get(key):
+            print(f"警告: 実行環境の {key} が異なります（{base['environment'].get(key)} / {head['environment'].get(key)}）")
+    comparisons = compare_results(base, head, args.threshold)
+    print_comparison(comparisons, args.threshold)
+    if any(item['regression'] for item in comparisons):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
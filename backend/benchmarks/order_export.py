@@ -0,0 +1,77 @@
+"""
+注文履歴のエクスポートのメモリ使用量の比較ベンチマーク
+
+注文数を変えて、全件を読み込んでからJSONにする方式（注文一覧と同じ）と、
+OrderExportService のストリーミング出力（gzip圧縮したNDJSON）のメモリ使用量のピーク（tracemalloc）を比較する。
+ストリーミング出力は注文数によらずほぼ一定になる。
+
+実行例:
+    python -m benchmarks.order_export --orders 1000 10000 50000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from benchmarks.common import seed_orders, setup_django, test_database
+
+
+def trace_peak(func: Callable[[], Any]) -> Tuple[float, float]:
+    """
+    関数の実行時間とメモリ使用量のピークを計測
+    
+    Args:
+        func: 計測する関数
+        
+    Returns:
+        (実行時間（ミリ秒）, メモリ使用量のピーク（MB）)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='注文履歴のエクスポートのメモリ使用量の比較')
+    parser.add_argument('--orders', type=int, nargs='+', default=[1000, 10000, 50000], help='注文数')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='1回に取得する注文数')
+    args = parser.parse_args()
+    
+    setup_django()
+    from api.renderers import encode_json
+    from api.serializers.order import OrderSerializer
+    from api.services.order_export_service import OrderExportService
+    from core.models import Order
+    
+    def load_all():
+        rows = list(Order.objects.order_by('created_at', 'id').values(*OrderSerializer.ORDER_FIELDS))
+        return encode_json(OrderSerializer().serialize(rows))
+    
+    def stream():
+        size = 0
+        for chunk in OrderExportService().export('ndjson', chunk_size=args.chunk_size):
+            size += len(chunk)
+        return size
+    
+    print(f"{'注文数':>8}  {'全件読み込み':>22}  {'ストリーミング（gzip NDJSON）':>22}")
+    for order_count in args.orders:
+        with test_database():
+            seed_orders(order_count)
+            load_ms, load_mb = trace_peak(load_all)
+            stream_ms, stream_mb = trace_peak(stream)
+            print(
+                f'{order_count:>8}  {load_mb:8.1f}MB {load_ms:9.0f}ms'
+                f'  {stream_mb:8.1f}MB {stream_ms:9.0f}ms'
+            )
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
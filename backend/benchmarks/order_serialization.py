@@ -0,0 +1,58 @@
+"""
+注文一覧のシリアライズ方式の比較ベンチマーク
+
+OrderOut.from_orm（モデルインスタンスとpydanticオブジェクトを経由）と、
+OrderSerializer（values() から辞書を組み立てる）で、取得からJSONのレンダリングまでの時間を比較する。
+
+実行例:
+    python -m benchmarks.order_serialization --orders 1000 10000
+"""
+
+import argparse
+
+from benchmarks.common import measure, print_result, seed_orders, setup_django, test_database
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='注文一覧のシリアライズ方式の比較')
+    parser.add_argument('--orders', type=int, nargs='+', default=[1000, 10000], help='注文数')
+    parser.add_argument('--repeat', type=int, default=5, help='計測回数')
+    args = parser.parse_args()
+    
+    setup_django()
+    from api.api_config import api
+    from api.dao.order_dao import OrderDAO
+    from api.schemas.order import OrderOut
+    from api.serializers.order import OrderSerializer
+    from core.models import Order
+    
+    def render(data):
+        return api.renderer.render(None, data, response_status=200)
+    
+    def from_orm_path():
+        orders = OrderDAO().get_orders_with_items().order_by('-created_at', '-id')
+        return render([OrderOut.from_orm(order).dict() for order in orders])
+    
+    def values_path():
+        rows = list(
+            Order.objects.order_by('-created_at', '-id').values(*OrderSerializer.ORDER_FIELDS)
+        )
+        return render(OrderSerializer().serialize(rows))
+    
+    for order_count in args.orders:
+        with test_database():
+            seed_orders(order_count)
+            # 両方式が同じJSONを返すことを確認してから計測する
+            assert from_orm_path() == values_path(), 'シリアライズ結果が一致しません'
+            
+            print(f'注文数: {order_count}')
+            from_orm = measure(from_orm_path, args.repeat)
+            values = measure(values_path, args.repeat)
+            print_result('  OrderOut.from_orm', from_orm)
+            print_result('  OrderSerializer (values)', values)
+            print(f"  速度比: {from_orm['median_ms'] / values['median_ms']:.1f}倍")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+おすすめ商品（同時に注文された商品）の取得時間のベンチマーク
+
+テストデータベースに注文を作成してスナップショットを作り直し、
+プロセス内のインデックスから取得する時間と、リクエストごとに注文明細を
+自己結合して集計する場合の時間を比較する。
+
+実行例:
+    python -m benchmarks.recommendations --orders 20000 --items-per-order 4 --products 100
+"""
+
+import argparse
+import time
+
+from benchmarks.common import measure, print_result, seed_orders, setup_django, test_database
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='おすすめ商品の取得時間')
+    parser.add_argument('--orders', type=int, default=20000, help='注文数')
+    parser.add_argument('--items-per-order', type=int, default=4, help='1注文あたりの注文明細数')
+    parser.add_argument('--products', type=int, default=100, help='商品数')
+    parser.add_argument('--lookups', type=int, default=1000, help='インデックスから取得する回数')
+    parser.add_argument('--repeat', type=int, default=5, help='計測の繰り返し回数')
+    args = parser.parse_args()
+    
+    setup_django()
+    from django.db.models import Count
+    from core.models import OrderItem, Product
+    from api.services.recommendation_service import RecommendationService, recommender
+    
+    with test_database():
+        seed_orders(args.orders, args.items_per_order, args.products)
+        product_ids = list(Product.objects.values_list('id', flat=True))
+        service = RecommendationService()
+        
+        started = time.perf_counter()
+        result = service.rebuild()
+        print(
+            f"スナップショットの作成: 注文 {result['orders']}件、商品の組 {result['pairs']}件、"
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        recommender.reset()
+        service.sync(force=True)
+        
+        def lookup() -> None:
+            for i in range(args.lookups):
+                service.get_recommendations(product_ids[i % len(product_ids)])
+        
+        def query() -> None:
+            for i in range(args.lookups // 100 or 1):
+                product_id = product_ids[i % len(product_ids)]
+                list(
+                    OrderItem.objects.filter(order__items__product_id=product_id)
+                    .exclude(product_id=product_id)
+                    .values('product_id')
+                    .annotate(order_count=Count('order_id', distinct=True))
+                    .order_by('-order_count')[:5]
+                )
+        
+        lookup()
+        print_result(f'インデックスから取得（{args.lookups}回）', measure(lookup, args.repeat))
+        print_result(f'注文明細の集計クエリ（{args.lookups // 100 or 1}回）', measure(query, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+レスポンスのエンコード方式の比較ベンチマーク
+
+大量の注文一覧（OrderSerializer の出力）を、ninja標準のJSONRenderer、
+FastRenderer（orjson）、FastRenderer（MessagePack）でエンコードする時間を比較する。
+
+実行例:
+    python -m benchmarks.renderers --orders 1000 10000
+"""
+
+import argparse
+
+from benchmarks.common import measure, print_result, seed_orders, setup_django, test_database
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='レスポンスのエンコード方式の比較')
+    parser.add_argument('--orders', type=int, nargs='+', default=[1000, 10000], help='注文数')
+    parser.add_argument('--repeat', type=int, default=5, help='計測回数')
+    args = parser.parse_args()
+    
+    setup_django()
+    from django.test import RequestFactory
+    from ninja.renderers import JSONRenderer
+    from api import renderers
+    from api.serializers.order import OrderSerializer
+    from core.models import Order
+    
+    factory = RequestFactory()
+    json_request = factory.get('/api/orders/')
+    msgpack_request = factory.get('/api/orders/', HTTP_ACCEPT='application/msgpack')
+    default_renderer = JSONRenderer()
+    fast_renderer = renderers.FastRenderer()
+    
+    for order_count in args.orders:
+        with test_database():
+            seed_orders(order_count)
+            data = OrderSerializer().serialize(list(
+                Order.objects.order_by('-created_at', '-id').values(*OrderSerializer.ORDER_FIELDS)
+            ))
+            
+            candidates = [('JSONRenderer (json)', default_renderer, json_request)]
+            if renderers.orjson is not None:
+                candidates.append(('FastRenderer (orjson)', fast_renderer, json_request))
+            if renderers.msgpack is not None:
+                candidates.append(('FastRenderer (msgpack)', fast_renderer, msgpack_request))
+            
+            print(f'注文数: {order_count}')
+            baseline = None
+            for label, renderer, request in candidates:
+                size = len(renderer.render(request, data, response_status=200))
+                result = measure(lambda: renderer.render(request, data, response_status=200), args.repeat)
+                baseline = baseline or result['median_ms']
+                print_result(f'  {label}', result)
+                print(f"    {size / 1024:.0f}KiB, 速度比: {baseline / result['median_ms']:.1f}倍")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
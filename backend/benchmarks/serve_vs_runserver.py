@@ -0,0 +1,57 @@
+"""
+本番用サーバー（manage.py serve）と開発用サーバー（manage.py runserver）のスループット比較ベンチマーク
+
+同じマシン・同じSQLiteのデータで両サーバーを起動し、同時接続数を変えて読み取りAPIに負荷をかける。
+
+実行例:
+    python -m benchmarks.serve_vs_runserver --concurrency 10 50 200 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+from benchmarks.asgi_vs_wsgi import READ_PATHS
+from benchmarks.common import free_port, prepare_server_database, run_server, server_env
+from benchmarks.http_load import run_http_load
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    parser = argparse.ArgumentParser(description='manage.py serve と runserver のスループット比較')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 50, 200], help='同時接続数')
+    parser.add_argument('--duration', type=float, default=10, help='1回の計測時間（秒）')
+    parser.add_argument('--orders', type=int, default=1000, help='注文数')
+    parser.add_argument('--workers', type=int, default=0, help='serveのワーカー数（0の場合はCPUコア数から決定）')
+    parser.add_argument('--threads', type=int, default=4, help='serveのワーカーあたりのスレッド数')
+    args = parser.parse_args()
+    
+    db_path = os.path.join(tempfile.gettempdir(), 'self_order_serve_benchmark.sqlite3')
+    prepare_server_database(db_path, args.orders)
+    env = server_env(db_path)
+    
+    port = free_port()
+    commands = {
+        'runserver': [sys.executable, 'manage.py', 'runserver', f'127.0.0.1:{port}', '--noreload'],
+        'serve': [
+            sys.executable, 'manage.py', 'serve', '--bind', f'127.0.0.1:{port}',
+            '--workers', str(args.workers), '--threads', str(args.threads),
+        ],
+    }
+    
+    print(f'{"サーバー":<12}{"同時接続":>8}{"req/s":>10}{"p50":>10}{"p95":>10}{"p99":>10}{"エラー":>8}')
+    for name, command in commands.items():
+        with run_server(command, port, env):
+            for concurrency in args.concurrency:
+                result = asyncio.run(run_http_load('127.0.0.1', port, READ_PATHS, concurrency, args.duration))
+                print(
+                    f'{name:<12}{concurrency:>8}{result["rps"]:>10.1f}'
+                    f'{result["p50_ms"]:>8.1f}ms{result["p95_ms"]:>8.1f}ms{result["p99_ms"]:>8.1f}ms'
+                    f'{result["errors"]:>8}'
+                )
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
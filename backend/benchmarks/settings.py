@@ -0,0 +1,24 @@
+"""
+サーバーを起動して計測するベンチマーク用のDjango設定
+
+テスト用の設定をもとに、BENCHMARK_DB_PATH のSQLiteファイルを使用する
+"""
+
+import os
+import tempfile
+
+from config.sqlite_test_settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get(
+            'BENCHMARK_DB_PATH', os.path.join(tempfile.gettempdir(), 'self_order_benchmark.sqlite3')
+        ),
+    }
+}
+
+# 計測に影響する開発用の機能は無効化
+DEBUG = False
+QUERY_INSPECTOR_ENABLED = False
+ORDER_INGESTION_START_WORKER = False
\ No newline at end of file
@@ -1,5 +1,10 @@
 """
 ASGI config for self-order-system project.
+
+注文イベントのストリーム（GET /api/orders/events）は、ASGIサーバーで起動すると
+待機中にワーカーを占有しない非同期イテレーターで配信される。
+
+    uvicorn config.asgi:application --host 0.0.0.0 --port 8000
 """
 
 import os
@@ -0,0 +1,146 @@
+"""
+本番用アプリケーションサーバー（gunicorn）の設定
+
+manage.py serve から使用する。マスタープロセスでアプリケーションを読み込んでから
+ワーカーをforkし（preload）、一定数のリクエストを処理したワーカーは順次入れ替える。
+"""
+
+import logging
+import os
+from typing import Any, Callable, Dict
+
+from django.db import connections
+
+from core.db.pool import close_pools
+
+logger = logging.getLogger(__name__)
+
+WSGI_APPLICATION = 'config.wsgi:application'
+ASGI_APPLICATION = 'config.asgi:application'
+
+# ワーカーの種類（gthread: WSGI・スレッド、uvicorn: ASGI・非同期）
+WORKER_CLASSES = {
+    'gthread': 'gthread',
+    'uvicorn': 'uvicorn.workers.UvicornWorker',
+}
+
+
+def default_workers(worker_class: str) -> int:
+    """
+    CPUコア数からワーカー数の既定値を決定
+    
+    Args:
+        worker_class: ワーカーの種類
+        
+    Returns:
+        ワーカー数（gthreadは 2 × コア数 + 1、uvicornはコア数）
+    """
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+    if worker_class == 'uvicorn':
+        return cores
+    return cores * 2 + 1
+
+
+def pre_fork(server: Any, worker: Any) -> None:
+    """
+    ワーカーをforkする前にマスタープロセスのDB接続を閉じる（子プロセスと接続を共有しないため）
+    
+    接続プールに返却された接続も閉じる。子プロセスのプールはfork後に作り直される
+    （core.db.pool.reset_pools_after_fork）。
+    """
+    connections.close_all()
+    close_pools()
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """
+    fork後のワーカープロセスの初期化
+    
+    マスタープロセスは管理コマンドのため起動しない、注文ジャーナルのバックグラウンドワーカーを起動する
+    """
+    from api.services.order_ingestion_service import start_ingestion_worker_on_startup
+    
+    logger.info('ワーカーを起動しました (pid: %s)', worker.pid)
+    start_ingestion_worker_on_startup()
+
+
+def build_options(
+    bind: str,
+    worker_class: str,
+    workers: int,
+    threads: int,
+    preload: bool,
+    max_requests: int,
+    max_requests_jitter: int,
+    timeout: int,
+    graceful_timeout: int,
+    keepalive: int,
+    access_log: bool,
+) -> Dict[str, Any]:
+    """
+    gunicornの設定を作成
+    
+    Args:
+        bind: 待ち受けるアドレス（host:port）
+        worker_class: ワーカーの種類（gthread / uvicorn）
+        workers: ワーカー数（0の場合はCPUコア数から決定）
+        threads: ワーカーあたりのスレッド数（gthreadのみ）
+        preload: fork前にアプリケーションを読み込むかどうか
+        max_requests: ワーカーを入れ替えるまでのリクエスト数（0の場合は入れ替えない）
+        max_requests_jitter: 入れ替えが同時に起きないようにするためのばらつき
+        timeout: 応答しないワーカーを再起動するまでの秒数
+        graceful_timeout: 入れ替え時に処理中のリクエストの完了を待つ秒数
+        keepalive: Keep-Alive接続を保持する秒数
+        access_log: アクセスログを標準出力に出すかどうか
+        
+    Returns:
+        gunicornの設定
+    """
+    options: Dict[str, Any] = {
+        'bind': bind,
+        'worker_class': WORKER_CLASSES[worker_class],
+        'workers': workers or default_workers(worker_class),
+        'preload_app': preload,
+        'max_requests': max_requests,
+        'max_requests_jitter': max_requests_jitter if max_requests else 0,
+        'timeout': timeout,
+        'graceful_timeout': graceful_timeout,
+        'keepalive': keepalive,
+        'pre_fork': pre_fork,
+        'post_fork': post_fork,
+        'errorlog': '-',
+    }
+    if worker_class == 'gthread':
+        options['threads'] = threads
+    if access_log:
+        options['accesslog'] = '-'
+    return options
+
+
+def run(app_uri: str, options: Dict[str, Any]) -> None:
+    """
+    gunicornを起動（終了するまで戻らない）
+    
+    Args:
+        app_uri: アプリケーションのパス（module:attribute）
+        options: build_options で作成した設定
+    """
+    from gunicorn.app.base import BaseApplication
+    from gunicorn.util import import_app
+    
+    class ProductionServer(BaseApplication):
+        """設定を直接渡してgunicornを起動するアプリケーション"""
+        
+        def load_config(self) -> None:
+            for key, value in options.items():
+                self.cfg.set(key, value)
+        
+        def load(self) -> Callable:
+            application = import_app(app_uri)
+            if options.get('preload_app'):
+                # URL設定（NinjaAPIのルーターとスキーマ）もfork前に構築しておく
+                from django.urls import get_resolver
+                get_resolver().url_patterns
+            return application
+    
+    ProductionServer().run()
\ No newline at end of file
@@ -43,6 +43,10 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # N+1クエリ検出（QUERY_INSPECTOR_ENABLED が有効な場合のみ動作）
+    'api.middleware.QueryInspectorMiddleware',
+    # 書き込み後の読み取りをプライマリに固定（DATABASE_REPLICAS を設定した場合のみ動作）
+    'api.middleware.ReplicaPinningMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -68,9 +72,24 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# 接続プール（core.db.backends.mysql）の設定。リクエストの終了時に接続を切断せずにプールへ返却する
+# MAX_SIZEはワーカープロセスあたりの上限（gthreadワーカーのスレッド数以上にする）
+DATABASE_POOL = {
+    'MIN_SIZE': int(os.environ.get('DATABASE_POOL_MIN_SIZE', 1)),
+    'MAX_SIZE': int(os.environ.get('DATABASE_POOL_MAX_SIZE', 10)),
+    # 上限に達している場合に返却を待つ最大秒数
+    'TIMEOUT': float(os.environ.get('DATABASE_POOL_TIMEOUT', 10)),
+    # MySQLのwait_timeoutより短くする
+    'MAX_LIFETIME': float(os.environ.get('DATABASE_POOL_MAX_LIFETIME', 60 * 60)),
+    'MAX_IDLE': float(os.environ.get('DATABASE_POOL_MAX_IDLE', 5 * 60)),
+    # 最後の使用からこの秒数以上経過した接続は取得時に死活確認する
+    'HEALTH_CHECK_INTERVAL': float(os.environ.get('DATABASE_POOL_HEALTH_CHECK_INTERVAL', 1)),
+}
+DATABASE_POOL_ENABLED = os.environ.get('DATABASE_POOL_ENABLED', 'True') == 'True'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': 'core.db.backends.mysql',
         'NAME': os.environ.get('DATABASE_NAME', 'self_order_db'),
         'USER': os.environ.get('DATABASE_USER', 'self_order_user'),
         'PASSWORD': os.environ.get('DATABASE_PASSWORD', 'self_order_password'),
@@ -79,9 +98,27 @@ DATABASES = {
         'OPTIONS': {
             'charset': 'utf8mb4',
         },
+        'POOL': DATABASE_POOL if DATABASE_POOL_ENABLED else None,
     }
 }
 
+# 読み取りレプリカ（DATABASE_REPLICA_HOST を指定した場合のみ使用）
+# 一覧系のエンドポイントとBaseDAO.get_all()の読み取りをレプリカへ振り分ける（core.db.routers）
+DATABASE_REPLICA_HOST = os.environ.get('DATABASE_REPLICA_HOST')
+DATABASE_REPLICAS = []
+if DATABASE_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': DATABASE_REPLICA_HOST,
+        'PORT': os.environ.get('DATABASE_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append('replica')
+DATABASE_ROUTERS = ['core.db.routers.PrimaryReplicaRouter']
+# 書き込みを行ったクライアントの読み取りをプライマリに固定する秒数（レプリカの遅延より長くする）
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get('DATABASE_REPLICA_PIN_SECONDS', 5))
+DATABASE_REPLICA_PIN_COOKIE = 'db_primary_until'
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -124,4 +161,100 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # CORS設定
 CORS_ALLOW_ALL_ORIGINS = True
-CORS_ALLOW_CREDENTIALS = True
\ No newline at end of file
+CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['X-Next-Cursor', 'Content-Disposition']
+
+# 冪等キー（Idempotency-Key）の保持期間（秒）
+IDEMPOTENCY_KEY_TTL = int(os.environ.get('IDEMPOTENCY_KEY_TTL', 60 * 60 * 24))
+
+# 注文の取り込みモード
+#   sync: リクエスト内でMySQLへ書き込む
+#   journal: ローカルジャーナルに追記して受付チケットを返し、バックグラウンドでMySQLへ反映する
+ORDER_INGESTION_MODE = os.environ.get('ORDER_INGESTION_MODE', 'sync')
+ORDER_JOURNAL_PATH = os.environ.get('ORDER_JOURNAL_PATH', os.path.join(BASE_DIR, 'order_journal.sqlite3'))
+# リクエスト処理プロセス内でバックグラウンドワーカーを起動するかどうか
+# （drain_order_journalコマンドで別プロセスから反映する場合はFalseにする）
+ORDER_INGESTION_START_WORKER = os.environ.get('ORDER_INGESTION_START_WORKER', 'True') == 'True'
+ORDER_INGESTION_BATCH_SIZE = int(os.environ.get('ORDER_INGESTION_BATCH_SIZE', 100))
+ORDER_INGESTION_POLL_INTERVAL = float(os.environ.get('ORDER_INGESTION_POLL_INTERVAL', 0.2))
+ORDER_INGESTION_LEASE_SECONDS = float(os.environ.get('ORDER_INGESTION_LEASE_SECONDS', 30))
+# 反映を試行する最大回数（超えたエントリは失敗として記録し、再試行しない）
+ORDER_INGESTION_MAX_ATTEMPTS = int(os.environ.get('ORDER_INGESTION_MAX_ATTEMPTS', 10))
+ORDER_JOURNAL_RETENTION_SECONDS = int(os.environ.get('ORDER_JOURNAL_RETENTION_SECONDS', 60 * 60 * 24))
+
+# メニューキャッシュがDBのメニューバージョンを確認する間隔（秒）
+# 他のプロセスでの更新は最大この秒数だけ遅れて反映される
+MENU_CACHE_VERSION_CHECK_INTERVAL = float(os.environ.get('MENU_CACHE_VERSION_CHECK_INTERVAL', 1.0))
+
+# メニューのレスポンスをgzip圧縮してキャッシュするかどうか（Accept-Encodingにgzipを含む場合のみ）
+MENU_RESPONSE_GZIP = os.environ.get('MENU_RESPONSE_GZIP', 'True') == 'True'
+MENU_RESPONSE_GZIP_LEVEL = int(os.environ.get('MENU_RESPONSE_GZIP_LEVEL', 6))
+
+# 注文一覧の1ページの件数（上限を超える指定は上限に切り詰める）
+ORDER_LIST_DEFAULT_LIMIT = int(os.environ.get('ORDER_LIST_DEFAULT_LIMIT', 50))
+ORDER_LIST_MAX_LIMIT = int(os.environ.get('ORDER_LIST_MAX_LIMIT', 200))
+
+# リクエストごとのSQLを集計してN+1クエリを検出するかどうか（開発・検証環境用、既定はDEBUGと同じ）
+QUERY_INSPECTOR_ENABLED = os.environ.get('QUERY_INSPECTOR_ENABLED', str(DEBUG)) == 'True'
+# 同じ形のSQLがこの回数以上実行された場合に報告する
+QUERY_INSPECTOR_THRESHOLD = int(os.environ.get('QUERY_INSPECTOR_THRESHOLD', 5))
+
+# 注文イベント（Server-Sent Events）の配信設定
+ORDER_EVENT_POLL_INTERVAL = float(os.environ.get('ORDER_EVENT_POLL_INTERVAL', 0.5))
+ORDER_EVENT_HEARTBEAT_INTERVAL = float(os.environ.get('ORDER_EVENT_HEARTBEAT_INTERVAL', 15))
+# 接続を維持する最大秒数（クライアントはLast-Event-IDを付けて自動で再接続する）
+ORDER_EVENT_STREAM_TIMEOUT = float(os.environ.get('ORDER_EVENT_STREAM_TIMEOUT', 300))
+# WSGIで配信する場合の最大秒数（待機中もワーカーを占有するため短くし、再接続によるロングポーリングとする）
+ORDER_EVENT_WSGI_STREAM_TIMEOUT = float(os.environ.get('ORDER_EVENT_WSGI_STREAM_TIMEOUT', 5))
+ORDER_EVENT_RETRY_MILLISECONDS = int(os.environ.get('ORDER_EVENT_RETRY_MILLISECONDS', 3000))
+ORDER_EVENT_BATCH_SIZE = int(os.environ.get('ORDER_EVENT_BATCH_SIZE', 100))
+ORDER_EVENT_RETENTION_SECONDS = int(os.environ.get('ORDER_EVENT_RETENTION_SECONDS', 24 * 60 * 60))
+
+# 注文の差分同期（GET /api/orders/changes）のロングポーリング設定
+ORDER_CHANGES_MAX_WAIT = float(os.environ.get('ORDER_CHANGES_MAX_WAIT', 30))
+ORDER_CHANGES_POLL_INTERVAL = float(os.environ.get('ORDER_CHANGES_POLL_INTERVAL', 0.5))
+# この秒数より新しい更新は次回に回す（コミットが遅れたトランザクションの変更を読み飛ばさないため）
+ORDER_CHANGES_SETTLE_SECONDS = float(os.environ.get('ORDER_CHANGES_SETTLE_SECONDS', 1))
+
+# 注文のアーカイブ（archive_orders コマンド）の設定
+# 完了・キャンセル済みでこの日数より前の注文をアーカイブテーブルへ移動する
+ORDER_ARCHIVE_DAYS = int(os.environ.get('ORDER_ARCHIVE_DAYS', 30))
+# 1トランザクションで移動する注文数（ロックの保持時間を短くするため小さく保つ）
+ORDER_ARCHIVE_CHUNK_SIZE = int(os.environ.get('ORDER_ARCHIVE_CHUNK_SIZE', 500))
+ORDER_ARCHIVE_PAUSE = float(os.environ.get('ORDER_ARCHIVE_PAUSE', 0.1))
+
+# 注文履歴のエクスポート（GET /api/orders/export、export_orders コマンド）の設定
+# 1回に取得する注文数（メモリ使用量はこの件数に比例し、期間の長さによらない）
+ORDER_EXPORT_CHUNK_SIZE = int(os.environ.get('ORDER_EXPORT_CHUNK_SIZE', 1000))
+ORDER_EXPORT_GZIP_LEVEL = int(os.environ.get('ORDER_EXPORT_GZIP_LEVEL', 6))
+
+# 売上集計の作り直し（rebuild_sales_rollups コマンド）で1回に読み込む注文数
+SALES_ROLLUP_CHUNK_SIZE = int(os.environ.get('SALES_ROLLUP_CHUNK_SIZE', 1000))
+
+# 需要分析（GET /api/reports/analytics、analyze_demand コマンド）で1回に読み込む注文明細数
+ORDER_ANALYTICS_CHUNK_SIZE = int(os.environ.get('ORDER_ANALYTICS_CHUNK_SIZE', 50000))
+# 需要分析APIで指定できる最大日数（期間の省略時は今日までのこの日数。長い期間は analyze_demand コマンドで分析する）
+ORDER_ANALYTICS_MAX_DAYS = int(os.environ.get('ORDER_ANALYTICS_MAX_DAYS', 31))
+
+# おすすめ商品（一緒に注文されている商品）の設定
+# 各プロセスがスナップショットの更新と他のプロセスで作成された注文を反映する間隔（秒）
+RECOMMENDATION_SYNC_INTERVAL = float(os.environ.get('RECOMMENDATION_SYNC_INTERVAL', 30))
+# 作成からこの秒数が経過した注文までを集計済みとする（コミットの遅れた注文を取りこぼさないため）
+RECOMMENDATION_SETTLE_SECONDS = float(os.environ.get('RECOMMENDATION_SETTLE_SECONDS', 10))
+# スナップショットの作成（rebuild_recommendations コマンド）と同期で1回に読み込む注文数
+RECOMMENDATION_CHUNK_SIZE = int(os.environ.get('RECOMMENDATION_CHUNK_SIZE', 1000))
+# 商品ごとに保持するおすすめの最大件数
+RECOMMENDATION_MAX_RESULTS = int(os.environ.get('RECOMMENDATION_MAX_RESULTS', 20))
+
+# 本番用アプリケーションサーバー（manage.py serve）の設定
+SERVER_BIND = os.environ.get('SERVER_BIND', '0.0.0.0:8000')
+SERVER_WORKER_CLASS = os.environ.get('SERVER_WORKER_CLASS', 'gthread')
+# 0の場合はCPUコア数から決定する
+SERVER_WORKERS = int(os.environ.get('SERVER_WORKERS', 0))
+SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 4))
+# メモリの増加を抑えるため、一定数のリクエストを処理したワーカーを順次入れ替える
+SERVER_MAX_REQUESTS = int(os.environ.get('SERVER_MAX_REQUESTS', 1000))
+SERVER_MAX_REQUESTS_JITTER = int(os.environ.get('SERVER_MAX_REQUESTS_JITTER', 100))
+SERVER_TIMEOUT = int(os.environ.get('SERVER_TIMEOUT', 30))
+SERVER_GRACEFUL_TIMEOUT = int(os.environ.get('SERVER_GRACEFUL_TIMEOUT', 30))
+SERVER_KEEPALIVE = int(os.environ.get('SERVER_KEEPALIVE', 5))
\ No newline at end of file
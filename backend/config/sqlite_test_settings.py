@@ -10,8 +10,14 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'test_db.sqlite3'),
-    }
+    },
+    # 読み取りレプリカの代わりのデータベース（DATABASE_REPLICAS を上書きしたテストでのみ使用する）
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'test_replica.sqlite3'),
+    },
 }
+DATABASE_REPLICAS = []
 
 # テスト高速化のための設定
 PASSWORD_HASHERS = [
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from core.models import Category, Product, Order, OrderItem
+from core.models import (
+    Category, Product, Order, OrderItem, ArchivedOrder, ArchivedOrderItem, HourlySales, ProductSales,
+)
 
 
 @admin.register(Category)
@@ -38,4 +40,33 @@ class OrderItemAdmin(admin.ModelAdmin):
     list_display = ('order', 'product', 'quantity', 'price', 'created_at')
     list_filter = ('order__status',)
     search_fields = ('order__id', 'product__name')
-    ordering = ('-created_at',)
\ No newline at end of file
+    ordering = ('-created_at',)
+
+
+class ArchivedOrderItemInline(admin.TabularInline):
+    model = ArchivedOrderItem
+    extra = 0
+    readonly_fields = ('product', 'quantity', 'price')
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_display = ('id', 'table_number', 'status', 'total_price', 'created_at', 'archived_at')
+    list_filter = ('status', 'table_number')
+    search_fields = ('id', 'table_number')
+    ordering = ('-created_at',)
+    inlines = [ArchivedOrderItemInline]
+
+
+@admin.register(HourlySales)
+class HourlySalesAdmin(admin.ModelAdmin):
+    list_display = ('sales_date', 'hour', 'table_number', 'order_count', 'quantity', 'revenue')
+    list_filter = ('sales_date', 'table_number')
+    ordering = ('-sales_date', 'hour', 'table_number')
+
+
+@admin.register(ProductSales)
+class ProductSalesAdmin(admin.ModelAdmin):
+    list_display = ('sales_date', 'hour', 'product', 'quantity', 'revenue')
+    list_filter = ('sales_date', 'product')
+    ordering = ('-sales_date', 'hour', 'product')
\ No newline at end of file
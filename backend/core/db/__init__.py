@@ -0,0 +1 @@
+# データベース接続関連（接続プールとプールを使用するバックエンド）
\ No newline at end of file
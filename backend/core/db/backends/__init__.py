@@ -0,0 +1 @@
+# 接続プールを使用するデータベースバックエンド
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+接続とクエリに遅延を加えるSQLiteバックエンド（テスト・ベンチマーク用）
+
+ネットワーク越しのMySQLの接続（TCP・認証のハンドシェイク）とクエリの往復時間を再現する。
+ENGINE に 'core.db.backends.latency_sqlite3' を指定し、LATENCY で遅延（秒）を設定する。
+
+    'LATENCY': {'CONNECT': 0.02, 'QUERY': 0.0005}
+"""
+
+import time
+from typing import Any, Dict
+
+from django.db.backends.sqlite3.base import SQLiteCursorWrapper
+from django.utils.functional import cached_property
+
+from core.db.backends.sqlite3 import base
+
+
+class LatencyCursorWrapper(SQLiteCursorWrapper):
+    """クエリの実行前に遅延を加えるカーソル"""
+
+    query_latency = 0.0
+
+    def execute(self, query, params=None):
+        time.sleep(self.query_latency)
+        return super().execute(query, params)
+
+    def executemany(self, query, param_list):
+        time.sleep(self.query_latency)
+        return super().executemany(query, param_list)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """接続とクエリに遅延を加えるSQLiteのDatabaseWrapper"""
+
+    def latency(self, name: str) -> float:
+        """
+        LATENCY の設定値を取得
+
+        Args:
+            name: 設定項目（CONNECT / QUERY）
+
+        Returns:
+            遅延（秒）
+        """
+        return float(self.settings_dict.get('LATENCY', {}).get(name, 0))
+
+    def create_connection(self, conn_params: Dict[str, Any]) -> Any:
+        time.sleep(self.latency('CONNECT'))
+        return super().create_connection(conn_params)
+
+    @cached_property
+    def cursor_class(self) -> type:
+        """QUERY の遅延を設定したカーソルのクラス"""
+        return type('LatencyCursor', (LatencyCursorWrapper,), {'query_latency': self.latency('QUERY')})
+
+    def create_cursor(self, name=None):
+        return self.connection.cursor(factory=self.cursor_class)
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+接続プールを使用するMySQLバックエンド
+
+ENGINE に 'core.db.backends.mysql' を指定し、POOL で接続プールを設定する。
+"""
+
+from typing import Any
+
+from django.db.backends.mysql import base
+
+from core.db.backends.pooling import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    """接続プールを使用するMySQLのDatabaseWrapper"""
+
+    def ping_connection(self, connection: Any) -> None:
+        connection.ping()
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+接続プールを使用するDatabaseWrapperの共通処理
+"""
+
+from typing import Any, Dict, Optional
+
+from core.db.pool import ConnectionPool, get_pool
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    DATABASES の POOL に設定があるデータベースの接続をプールから取得する
+
+    Djangoはリクエストの終了時に接続を閉じる（CONN_MAX_AGE=0）が、
+    close() では切断せずにプールへ返却し、次のリクエストで再利用する。
+    POOL の設定がない場合は通常のバックエンドと同じく毎回接続する。
+
+    POOL の設定項目:
+        MIN_SIZE: 保持する接続数の下限（既定値 0）
+        MAX_SIZE: プロセスあたりの接続数の上限（既定値 10）
+        TIMEOUT: 上限に達している場合に返却を待つ最大秒数（既定値 10）
+        MAX_LIFETIME: 接続を作り直すまでの秒数（既定値 None: 無期限）
+        MAX_IDLE: 下限を超える待機中の接続を閉じるまでの秒数（既定値 None: 閉じない）
+        HEALTH_CHECK_INTERVAL: 最後の使用からこの秒数以上経過した接続を取得時に確認する（既定値 0: 毎回）
+    """
+
+    @property
+    def pool(self) -> Optional[ConnectionPool]:
+        """このデータベースの接続プール（POOL の設定がない場合はNone）"""
+        options: Optional[Dict[str, Any]] = self.settings_dict.get('POOL')
+        if not options:
+            return None
+        return get_pool(self.alias, lambda: self._create_pool(options))
+
+    def create_connection(self, conn_params: Dict[str, Any]) -> Any:
+        """
+        データベースに新しく接続
+
+        Args:
+            conn_params: get_connection_params() の戻り値
+
+        Returns:
+            DB-API接続
+        """
+        return super().get_new_connection(conn_params)
+
+    def ping_connection(self, connection: Any) -> None:
+        """
+        接続の死活確認（切断されている場合は例外を送出する）
+
+        既定では SELECT 1 を実行する。ドライバーに専用の確認方法がある場合は上書きする。
+
+        Args:
+            connection: プールで待機していたDB-API接続
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+        finally:
+            cursor.close()
+
+    def get_new_connection(self, conn_params: Dict[str, Any]) -> Any:
+        pool = self.pool
+        if pool is None:
+            return self.create_connection(conn_params)
+        return pool.acquire()
+
+    def _close(self) -> None:
+        pool = self.pool
+        if pool is None or self.connection is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            if self.in_atomic_block:
+                # トランザクションの途中で閉じられた接続は再利用しない
+                pool.discard(self.connection)
+            else:
+                pool.release(self.connection)
+
+    def _create_pool(self, options: Dict[str, Any]) -> ConnectionPool:
+        """
+        POOL の設定から接続プールを作成
+
+        Args:
+            options: POOL の設定
+
+        Returns:
+            接続プール
+        """
+        conn_params = self.get_connection_params()
+        return ConnectionPool(
+            name=self.alias,
+            connect=lambda: self.create_connection(conn_params),
+            ping=self.ping_connection,
+            min_size=options.get('MIN_SIZE', 0),
+            max_size=options.get('MAX_SIZE', 10),
+            timeout=options.get('TIMEOUT', 10.0),
+            max_lifetime=options.get('MAX_LIFETIME'),
+            max_idle=options.get('MAX_IDLE'),
+            health_check_interval=options.get('HEALTH_CHECK_INTERVAL', 0.0),
+        )
\ No newline at end of file
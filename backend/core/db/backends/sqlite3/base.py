@@ -0,0 +1,19 @@
+"""
+接続プールを使用するSQLiteバックエンド（テスト・検証用）
+
+ENGINE に 'core.db.backends.sqlite3' を指定し、POOL で接続プールを設定する。
+TRANSACTION_MODE に 'IMMEDIATE' を指定すると、トランザクションの開始時に書き込みのロックを取得する
+（複数のスレッドから書き込む場合に、読み取り後の書き込みでロックの昇格に失敗しないようにする）。
+"""
+
+from django.db.backends.sqlite3 import base
+
+from core.db.backends.pooling import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    """接続プールを使用するSQLiteのDatabaseWrapper"""
+
+    def _start_transaction_under_autocommit(self) -> None:
+        mode = self.settings_dict.get('TRANSACTION_MODE')
+        self.cursor().execute(f'BEGIN {mode}' if mode else 'BEGIN')
\ No newline at end of file
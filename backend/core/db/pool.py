@@ -0,0 +1,419 @@
+"""
+データベース接続プール
+
+CONN_MAX_AGE=0 ではリクエストのたびにDBへ接続・切断するため、TCPと認証のハンドシェイクが
+応答時間に加わる。プールはプロセス内で接続を保持し、リクエストの終了時には切断せずに返却して
+別のスレッドのリクエストで再利用する。
+
+プールはプロセスごとに作成する。fork後の子プロセスでは親プロセスのプールを破棄して作り直す
+（親プロセスの接続はソケットを共有しているため子プロセスでは使用しない）。
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.db.utils import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhausted(OperationalError):
+    """接続数が上限に達し、待機時間内に接続を取得できなかった場合の例外"""
+
+
+class ConnectionPool:
+    """
+    DB-API接続のプール（スレッドセーフ）
+
+    取得時には一定時間使用されていなかった接続の死活確認を行い、
+    切断されていた接続は破棄して新しく接続する。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect: Callable[[], Any],
+        ping: Callable[[Any], None],
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_lifetime: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        health_check_interval: float = 0.0,
+    ):
+        """
+        コンストラクタ
+
+        Args:
+            name: プール名（データベースのエイリアス）
+            connect: 新しい接続を作成する関数
+            ping: 接続の死活確認を行う関数（切断されている場合は例外を送出する）
+            min_size: 保持する接続数の下限
+            max_size: 接続数の上限（使用中と待機中の合計）
+            timeout: 上限に達している場合に返却を待つ最大秒数
+            max_lifetime: 接続を作り直すまでの秒数（Noneの場合は無期限）
+            max_idle: 下限を超える待機中の接続を閉じるまでの秒数（Noneの場合は閉じない）
+            health_check_interval: 最後の使用からこの秒数以上経過した接続を取得時に確認する（0の場合は毎回）
+        """
+        if max_size < 1 or min_size > max_size:
+            raise ValueError('接続プールのサイズが不正です')
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._ping = ping
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        # 待機中の接続と返却時刻（末尾から取り出し、直前に使用した接続を優先する）
+        self._idle: List[Tuple[Any, float]] = []
+        # このプールが作成した接続の作成時刻（id(接続) -> 時刻）
+        self._created_at: Dict[int, float] = {}
+        # 作成済みと作成中の接続数
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time_total = 0.0
+        self.max_wait_time = 0.0
+        self.exhaustions = 0
+        self.health_check_failures = 0
+        self.max_in_use = 0
+
+    def acquire(self) -> Any:
+        """
+        接続を取得（待機中の接続がなく上限に達している場合は返却を待つ）
+
+        Returns:
+            DB-API接続
+
+        Raises:
+            PoolExhausted: timeout 秒以内に接続を取得できなかった場合
+            OperationalError: プールが終了している場合
+        """
+        deadline = time.monotonic() + self.timeout
+        wait_started: Optional[float] = None
+        while True:
+            with self._available:
+                entry = self._take(deadline, wait_started is not None)
+                if entry is None:
+                    wait_started = time.monotonic()
+                    entry = self._take(deadline, True)
+            if not entry:
+                conn = self._open()
+            else:
+                conn, returned_at = entry
+                if not self._is_usable(conn, returned_at):
+                    self._close_connection(conn, in_use=False)
+                    continue
+            with self._lock:
+                self._in_use += 1
+                self.max_in_use = max(self.max_in_use, self._in_use)
+                self.checkouts += 1
+                if wait_started is not None:
+                    waited = time.monotonic() - wait_started
+                    self.waits += 1
+                    self.wait_time_total += waited
+                    self.max_wait_time = max(self.max_wait_time, waited)
+            return conn
+
+    def release(self, conn: Any) -> None:
+        """
+        使用を終えた接続を返却
+
+        未完了のトランザクションはロールバックする。
+        このプールが作成していない接続（fork前に取得した接続など）は何もしない。
+
+        Args:
+            conn: acquire() で取得した接続
+        """
+        if not self._owns(conn):
+            return
+        try:
+            conn.rollback()
+        except Exception:
+            self._close_connection(conn, in_use=True)
+            return
+        expired: List[Any] = []
+        with self._available:
+            if self._closed or self._is_expired(conn, time.monotonic()):
+                expired.append(conn)
+            else:
+                self._in_use -= 1
+                self._idle.append((conn, time.monotonic()))
+                expired.extend(self._pop_idle_expired())
+                self._available.notify()
+        for expired_conn in expired:
+            self._close_connection(expired_conn, in_use=expired_conn is conn)
+
+    def discard(self, conn: Any) -> None:
+        """
+        使用中の接続を再利用せずに閉じる（トランザクションの途中で閉じられた場合など）
+
+        Args:
+            conn: acquire() で取得した接続
+        """
+        if self._owns(conn):
+            self._close_connection(conn, in_use=True)
+
+    def fill(self) -> None:
+        """接続数が min_size になるまで接続を作成して待機させる"""
+        while True:
+            with self._lock:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            conn = self._open()
+            with self._available:
+                self._idle.append((conn, time.monotonic()))
+                self._available.notify()
+
+    def close(self) -> None:
+        """待機中の接続を閉じてプールを終了（使用中の接続は返却時に閉じる）"""
+        with self._available:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle = []
+            self._available.notify_all()
+        for conn in idle:
+            self._close_connection(conn, in_use=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        プールの統計情報を取得
+
+        Returns:
+            接続数・取得回数・待機回数・上限到達回数などの統計情報
+        """
+        with self._lock:
+            return {
+                'alias': self.name,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'max_in_use': self.max_in_use,
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'wait_time_total_ms': round(self.wait_time_total * 1000, 3),
+                'max_wait_ms': round(self.max_wait_time * 1000, 3),
+                'exhaustions': self.exhaustions,
+                'connections_created': self.connections_created,
+                'connections_closed': self.connections_closed,
+                'health_check_failures': self.health_check_failures,
+            }
+
+    def _take(self, deadline: float, wait: bool) -> Optional[Any]:
+        """
+        待機中の接続を取り出すか、新しい接続の枠を確保（ロックを取得した状態で呼び出す）
+
+        Args:
+            deadline: 待機の期限（time.monotonic() の値）
+            wait: 空きがない場合に返却を待つかどうか
+
+        Returns:
+            (接続, 返却時刻)、新しく接続する場合は ()、
+            wait=False で空きがない場合は None
+
+        Raises:
+            PoolExhausted: 期限までに空きができなかった場合
+        """
+        while True:
+            if self._closed:
+                raise OperationalError(f'接続プール {self.name} は終了しています')
+            if self._idle:
+                return self._idle.pop()
+            if self._size < self.max_size:
+                self._size += 1
+                return ()
+            if not wait:
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.exhaustions += 1
+                logger.warning(
+                    '接続プール %s の接続数が上限（%s）に達しています', self.name, self.max_size
+                )
+                raise PoolExhausted(
+                    f'接続プール {self.name} から {self.timeout} 秒以内に接続を取得できませんでした'
+                )
+            self._available.wait(remaining)
+
+    def _open(self) -> Any:
+        """
+        新しく接続（枠は確保済み）
+
+        Returns:
+            DB-API接続
+        """
+        try:
+            conn = self._connect()
+        except BaseException:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        with self._lock:
+            self._created_at[id(conn)] = time.monotonic()
+            self.connections_created += 1
+        return conn
+
+    def _is_usable(self, conn: Any, returned_at: float) -> bool:
+        """
+        待機中だった接続を使用できるかどうかを確認
+
+        Args:
+            conn: 接続
+            returned_at: 返却された時刻
+
+        Returns:
+            使用できる場合はTrue
+        """
+        now = time.monotonic()
+        if self._is_expired(conn, now):
+            return False
+        if now - returned_at < self.health_check_interval:
+            return True
+        try:
+            self._ping(conn)
+        except Exception:
+            with self._lock:
+                self.health_check_failures += 1
+            logger.info('接続プール %s の切断された接続を破棄しました', self.name)
+            return False
+        return True
+
+    def _is_expired(self, conn: Any, now: float) -> bool:
+        """接続が max_lifetime を超えているかどうか"""
+        if self.max_lifetime is None:
+            return False
+        return now - self._created_at.get(id(conn), now) >= self.max_lifetime
+
+    def _pop_idle_expired(self) -> List[Any]:
+        """
+        下限を超えて max_idle 秒以上待機している接続を取り出す（ロックを取得した状態で呼び出す）
+
+        Returns:
+            閉じる接続のリスト
+        """
+        if self.max_idle is None:
+            return []
+        expired = []
+        now = time.monotonic()
+        # 先頭ほど長く待機している
+        while self._idle and self._size - len(expired) > self.min_size:
+            conn, returned_at = self._idle[0]
+            if now - returned_at < self.max_idle:
+                break
+            self._idle.pop(0)
+            expired.append(conn)
+        return expired
+
+    def _owns(self, conn: Any) -> bool:
+        """このプールが作成した接続かどうか"""
+        with self._lock:
+            return id(conn) in self._created_at
+
+    def _close_connection(self, conn: Any, in_use: bool) -> None:
+        """
+        接続を閉じて接続数から除く
+
+        Args:
+            conn: 接続
+            in_use: 使用中の接続かどうか
+        """
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._available:
+            if self._created_at.pop(id(conn), None) is None:
+                return
+            self._size -= 1
+            if in_use:
+                self._in_use -= 1
+            self.connections_closed += 1
+            self._available.notify()
+
+
+# プロセス内のプール（データベースのエイリアス -> プール）
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+# fork前のプール（接続オブジェクトの破棄時に親プロセスの接続が切断されないように参照を保持する）
+_inherited_pools: List[ConnectionPool] = []
+
+
+def get_pool(alias: str, factory: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """
+    データベースのプールを取得（存在しない場合は作成して min_size まで接続する）
+
+    Args:
+        alias: データベースのエイリアス
+        factory: プールを作成する関数
+
+    Returns:
+        接続プール
+    """
+    pool = _pools.get(alias)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(alias)
+        if pool is None:
+            pool = _pools[alias] = factory()
+            created = True
+        else:
+            created = False
+    if created:
+        pool.fill()
+    return pool
+
+
+def all_pools() -> List[ConnectionPool]:
+    """
+    このプロセスのプールの一覧を取得
+
+    Returns:
+        エイリアス順のプールのリスト
+    """
+    return [pool for _, pool in sorted(_pools.items())]
+
+
+def close_pools(alias: Optional[str] = None) -> None:
+    """
+    プールを閉じて破棄（次回の接続時に作り直す）
+
+    Args:
+        alias: 閉じるデータベースのエイリアス（Noneの場合はすべて）
+    """
+    with _pools_lock:
+        aliases = list(_pools) if alias is None else [alias]
+        pools = [_pools.pop(name) for name in aliases if name in _pools]
+    for pool in pools:
+        pool.close()
+
+
+def reset_pools_after_fork() -> None:
+    """
+    fork後の子プロセスで親プロセスのプールを破棄
+
+    親プロセスの接続はソケットを共有しているため、閉じずに使用対象から外す。
+    """
+    global _pools_lock
+    _pools_lock = threading.Lock()
+    _inherited_pools.extend(_pools.values())
+    _pools.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_pools_after_fork)
\ No newline at end of file
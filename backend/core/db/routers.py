@@ -0,0 +1,142 @@
+"""
+読み取りレプリカへのデータベースルーター
+
+書き込みはすべてプライマリ（default）で行い、読み取りは次の場合のみレプリカへ振り分ける。
+
+- BaseDAO.get_all() など、read_replica ヒントを付けたクエリ
+- reads_from_replica を付けた一覧系のエンドポイントの処理中
+
+ただし、書き込みを行ったクライアント（タブレット）は自分の注文をすぐに参照できるよう、
+DATABASE_REPLICA_PIN_SECONDS 秒の間はプライマリから読み取る（ReplicaPinningMiddleware）。
+また、primary_reads の処理中（レプリカが遅れている場合のメニューキャッシュの読み込みなど）はプライマリから読み取る。
+"""
+
+import asyncio
+import functools
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class RoutingState:
+    """リクエスト内のルーティングの状態"""
+
+    def __init__(self, pinned: bool = False):
+        """
+        コンストラクタ
+
+        Args:
+            pinned: プライマリから読み取るかどうか（直前に書き込みを行ったクライアントの場合）
+        """
+        self.pinned = pinned
+        # リクエスト内で書き込みを行ったかどうか
+        self.wrote = False
+
+
+_routing_state: ContextVar[Optional[RoutingState]] = ContextVar('db_routing_state', default=None)
+_replica_reads: ContextVar[bool] = ContextVar('db_replica_reads', default=False)
+_primary_reads: ContextVar[bool] = ContextVar('db_primary_reads', default=False)
+
+
+@contextmanager
+def routing_request(pinned: bool = False) -> Iterator[RoutingState]:
+    """
+    リクエストのルーティングの状態を設定するコンテキストマネージャ
+
+    Args:
+        pinned: プライマリから読み取るかどうか
+
+    Yields:
+        ルーティングの状態（書き込みの有無を確認するために使用する）
+    """
+    state = RoutingState(pinned)
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """処理中の読み取りをレプリカへ振り分けるコンテキストマネージャ"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """処理中の読み取りをレプリカへ振り分けず、プライマリで行うコンテキストマネージャ"""
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+def reads_from_replica(func: Callable) -> Callable:
+    """
+    エンドポイントの読み取りをレプリカへ振り分けるデコレータ（同期・非同期の関数に対応）
+
+    一覧系のエンドポイントにのみ付ける。ルーターのデコレータの内側に記述すること。
+
+    Args:
+        func: エンドポイントの関数
+
+    Returns:
+        デコレートされた関数
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with replica_reads():
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with replica_reads():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    """
+    プライマリ・レプリカ構成のデータベースルーター
+
+    DATABASE_REPLICAS が空の場合はすべてdefaultを使用する。
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or not (hints.get('read_replica') or _replica_reads.get()):
+            return None
+        if _primary_reads.get():
+            return DEFAULT_DB_ALIAS
+        state = _routing_state.get()
+        if state is not None and (state.pinned or state.wrote):
+            return DEFAULT_DB_ALIAS
+        # トランザクション内の読み取りはプライマリで行う
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        # レプリカはプライマリの複製のため、どちらから読み取ったオブジェクトも関連付けられる
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
\ No newline at end of file
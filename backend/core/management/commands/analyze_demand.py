@@ -0,0 +1,71 @@
+import json
+import time
+from datetime import date
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from api.services.order_analytics_service import OrderAnalyticsService
+
+
+class Command(BaseCommand):
+    """注文明細の需要分析を表示するコマンド"""
+
+    help = (
+        '商品の人気順位・曜日と時間帯別の需要・カテゴリ別の売上構成比を表示します'
+        '（アーカイブ済みの注文を含み、キャンセルされた注文を除きます）'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='date_from', type=date.fromisoformat, help='作成日の開始（YYYY-MM-DD）')
+        parser.add_argument('--to', dest='date_to', type=date.fromisoformat, help='作成日の終了（YYYY-MM-DD）')
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='人気順位に表示する商品数',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.ORDER_ANALYTICS_CHUNK_SIZE,
+            help='1回に読み込む注文明細数',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='APIと同じ構造のJSONで出力します',
+        )
+
+    def handle(self, *args, **options):
+        if options['date_from'] and options['date_to'] and options['date_from'] > options['date_to']:
+            raise CommandError('--from は --to 以前の日付を指定してください')
+
+        started = time.perf_counter()
+        result = OrderAnalyticsService().analyze(
+            options['date_from'], options['date_to'], top=options['top'], chunk_size=options['chunk_size']
+        )
+        elapsed = time.perf_counter() - started
+        if options['json']:
+            self.stdout.write(json.dumps(result, cls=DjangoJSONEncoder, ensure_ascii=False))
+            return
+
+        self.stdout.write(
+            f"注文明細 {result['item_count']:,}件、数量 {result['total_quantity']:,}、"
+            f"売上 {result['total_revenue']:,}円（{elapsed:.2f}秒）"
+        )
+        self.stdout.write('\n商品の人気順位')
+        for product in result['products']:
+            self.stdout.write(
+                f"{product['rank']:>4}. {product['product_name']}  "
+                f"数量 {product['quantity']:,}  売上 {product['revenue']:,}円"
+            )
+        self.stdout.write('\nカテゴリ別の売上構成比')
+        for category in result['categories']:
+            self.stdout.write(
+                f"  {category['category_name']}  {category['share'] * 100:5.1f}%  {category['revenue']:,}円"
+            )
+        self.stdout.write('\n曜日・時間帯別の数量')
+        self.stdout.write('    ' + ''.join(f'{hour:>6}' for hour in range(24)))
+        for weekday, counts in zip(result['weekdays'], result['hour_of_week']):
+            self.stdout.write(f'  {weekday} ' + ''.join(f'{count:>6}' for count in counts))
\ No newline at end of file
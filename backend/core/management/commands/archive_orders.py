@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.services.order_archive_service import OrderArchiveService
+
+
+class Command(BaseCommand):
+    """古い注文をアーカイブテーブルへ移動するコマンド"""
+
+    help = (
+        '完了・キャンセル済みで指定日数より前の注文を、注文明細とともにアーカイブテーブルへ移動します'
+        '（一定件数ずつの短いトランザクションで移動するため、営業中も実行できます）'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.ORDER_ARCHIVE_DAYS,
+            help='この日数より前に作成された注文を対象にします',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.ORDER_ARCHIVE_CHUNK_SIZE,
+            help='1トランザクションで移動する注文数',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=settings.ORDER_ARCHIVE_PAUSE,
+            help='チャンクごとの待機秒数',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='対象の件数のみ表示します',
+        )
+
+    def handle(self, *args, **options):
+        service = OrderArchiveService()
+        if options['dry_run']:
+            count = service.count_archivable(options['days'])
+            self.stdout.write(f'アーカイブ対象の注文: {count}件')
+            return
+
+        def report(archived, total):
+            percent = archived * 100 // total if total else 100
+            self.stdout.write(f'{archived}/{total}件を移動しました（{percent}%）')
+
+        archived = service.archive(
+            older_than_days=options['days'],
+            chunk_size=options['chunk_size'],
+            pause=options['pause'],
+            progress=report,
+        )
+        self.stdout.write(self.style.SUCCESS(f'注文のアーカイブが完了しました（{archived}件）'))
\ No newline at end of file
@@ -0,0 +1,42 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.services.order_ingestion_service import OrderIngestionService
+
+
+class Command(BaseCommand):
+    """注文ジャーナルの未反映の注文をMySQLへ反映するコマンド"""
+
+    help = '注文ジャーナルの未反映の注文をMySQLへ反映します（起動時にクラッシュ前の注文も再反映します）'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='未反映の注文をすべて反映したら終了します',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.ORDER_INGESTION_BATCH_SIZE,
+            help='1回で反映する最大件数',
+        )
+
+    def handle(self, *args, **options):
+        service = OrderIngestionService()
+        self.stdout.write(f'未反映の注文: {service.journal.count_pending()}件')
+
+        total = 0
+        while True:
+            processed = service.drain(options['batch_size'])
+            total += processed
+            if processed:
+                self.stdout.write(f'{total}件を処理しました')
+                continue
+            if options['once']:
+                break
+            service.journal.purge(settings.ORDER_JOURNAL_RETENTION_SECONDS)
+            time.sleep(settings.ORDER_INGESTION_POLL_INTERVAL)
+
+        self.stdout.write(self.style.SUCCESS(f'注文ジャーナルの反映が完了しました（{total}件）'))
\ No newline at end of file
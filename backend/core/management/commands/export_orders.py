@@ -0,0 +1,67 @@
+import sys
+from datetime import date
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.order_export_service import OrderExportService
+
+
+class Command(BaseCommand):
+    """注文履歴をNDJSONまたはCSVで出力するコマンド"""
+
+    help = (
+        '注文履歴（アーカイブ済みの注文を含む）をgzip圧縮したNDJSONまたはCSVで出力します'
+        '（一定件数ずつ取得して書き出すため、期間が長くてもメモリ使用量は増えません）'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            choices=[OrderExportService.FORMAT_NDJSON, OrderExportService.FORMAT_CSV],
+            default=OrderExportService.FORMAT_NDJSON,
+            help='出力形式',
+        )
+        parser.add_argument('--from', dest='date_from', type=date.fromisoformat, help='作成日の開始（YYYY-MM-DD、この日を含む）')
+        parser.add_argument('--to', dest='date_to', type=date.fromisoformat, help='作成日の終了（YYYY-MM-DD、この日を含む）')
+        parser.add_argument('--status', action='append', help='注文ステータス（複数指定可）')
+        parser.add_argument(
+            '--output',
+            help='出力先のファイル（省略時は標準出力）',
+        )
+        parser.add_argument(
+            '--no-gzip',
+            action='store_true',
+            help='gzip圧縮せずに出力します',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.ORDER_EXPORT_CHUNK_SIZE,
+            help='1回に取得する注文数',
+        )
+
+    def handle(self, *args, **options):
+        if options['date_from'] and options['date_to'] and options['date_from'] > options['date_to']:
+            raise CommandError('--from は --to 以前の日付を指定してください')
+
+        service = OrderExportService()
+        stream = service.export(
+            options['format'],
+            date_from=options['date_from'],
+            date_to=options['date_to'],
+            statuses=options['status'],
+            compress=not options['no_gzip'],
+            chunk_size=options['chunk_size'],
+        )
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        try:
+            size = 0
+            for chunk in stream:
+                output.write(chunk)
+                size += len(chunk)
+        finally:
+            if options['output']:
+                output.close()
+
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(f"{options['output']} に出力しました（{size:,}バイト）"))
\ No newline at end of file
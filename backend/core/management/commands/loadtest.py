@@ -0,0 +1,166 @@
+import asyncio
+import json
+import os
+import tempfile
+import unicodedata
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from benchmarks.common import run_server_thread, seed_menu, seed_orders, test_database
+from benchmarks.dining_room import DiningRoom, ENDPOINTS
+
+
+def ljust(text, width):
+    """全角文字を2文字分の幅として左寄せ"""
+    display_width = sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+    return text + ' ' * max(width - display_width, 0)
+
+
+class Command(BaseCommand):
+    """客席全体（テーブルのタブレットとキッチン画面）を模擬してAPIに負荷をかけるコマンド"""
+
+    help = (
+        'テーブルがメニューを見て注文し、キッチン画面が注文をポーリングする負荷をかけ、'
+        'エンドポイントごとのスループットとレイテンシ（p50/p95/p99）を表示します。'
+        '--url を省略した場合は一時的なテストデータベースを作成し、このプロセス内でAPIを起動します'
+        '（オフラインでは --settings=config.sqlite_test_settings を指定してください）'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            help='負荷をかける起動済みのAPIサーバー（例: http://127.0.0.1:8000）',
+        )
+        parser.add_argument('--tables', type=int, default=20, help='テーブル数')
+        parser.add_argument('--kitchens', type=int, default=2, help='キッチン画面の数')
+        parser.add_argument('--duration', type=float, default=60.0, help='試験時間（秒）')
+        parser.add_argument(
+            '--think-scale',
+            type=float,
+            default=1.0,
+            help='テーブルの操作間隔（商品詳細 6秒・注文 20秒・食事 10分・次の来店 2分の平均）に掛ける倍率',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='キッチン画面のポーリング間隔（秒）',
+        )
+        parser.add_argument(
+            '--ramp-up',
+            type=float,
+            default=5.0,
+            help='テーブルの最初の来店を分散させる時間（秒）',
+        )
+        parser.add_argument('--seed', type=int, help='乱数のシード')
+        parser.add_argument(
+            '--products',
+            type=int,
+            default=40,
+            help='プロセス内で起動する場合に作成する商品数',
+        )
+        parser.add_argument(
+            '--categories',
+            type=int,
+            default=5,
+            help='プロセス内で起動する場合に作成するカテゴリ数',
+        )
+        parser.add_argument(
+            '--orders',
+            type=int,
+            default=0,
+            help='プロセス内で起動する場合に事前に作成する注文数（注文履歴のある状態で試験する場合）',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='結果をJSONで出力します',
+        )
+
+    def handle(self, *args, **options):
+        if options['tables'] < 0 or options['kitchens'] < 0 or options['tables'] + options['kitchens'] == 0:
+            raise CommandError('--tables と --kitchens の合計を1以上にしてください')
+        if options['duration'] <= 0 or options['think_scale'] <= 0 or options['poll_interval'] <= 0:
+            raise CommandError('--duration・--think-scale・--poll-interval には正の値を指定してください')
+
+        if options['url']:
+            url = urlsplit(options['url'])
+            if url.scheme != 'http' or not url.hostname:
+                raise CommandError('--url には http://host:port の形式で指定してください')
+            result = self.run_load(url.hostname, url.port or 80, options)
+        else:
+            result = self.run_in_process(options)
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False))
+            return
+        self.write_result(result)
+
+    def run_in_process(self, options):
+        """一時的なテストデータベースとこのプロセス内のAPIサーバーで負荷試験を行う"""
+        # テーブルの各スレッドから書き込むため、SQLiteの場合はメモリ上ではなくファイルに作成する
+        directory = tempfile.mkdtemp()
+        try:
+            with test_database(os.path.join(directory, 'loadtest.sqlite3')):
+                if options['orders']:
+                    seed_orders(options['orders'], product_count=options['products'])
+                else:
+                    seed_menu(options['products'], options['categories'])
+                with self.immediate_sqlite_transactions(), run_server_thread() as port:
+                    return self.run_load('127.0.0.1', port, options)
+        finally:
+            os.rmdir(directory)
+
+    @contextmanager
+    def immediate_sqlite_transactions(self):
+        """
+        SQLiteの場合、サーバーのスレッドの接続はトランザクションの開始時に書き込みのロックを取得する
+
+        SQLiteは読み取り後の書き込みで他の書き込みと競合すると待たずに失敗するため、
+        MySQLの行ロックと同様にロックの解放を待つようにする（サーバーのスレッドは新しく接続する）。
+        """
+        settings_dict = connection.settings_dict
+        if connection.vendor != 'sqlite':
+            yield
+            return
+        original = {key: settings_dict.get(key) for key in ('ENGINE', 'TRANSACTION_MODE')}
+        settings_dict.update(ENGINE='core.db.backends.sqlite3', TRANSACTION_MODE='IMMEDIATE')
+        try:
+            yield
+        finally:
+            settings_dict.update(original)
+
+    def run_load(self, host, port, options):
+        """DiningRoom で負荷をかけて結果を返す"""
+        dining_room = DiningRoom(
+            host,
+            port,
+            think_scale=options['think_scale'],
+            poll_interval=options['poll_interval'],
+            seed=options['seed'],
+        )
+        return asyncio.run(dining_room.run(
+            options['tables'], options['kitchens'], options['duration'], ramp_up=options['ramp_up']
+        ))
+
+    def write_result(self, result):
+        self.stdout.write(
+            f"テーブル {result['tables']}台、キッチン画面 {result['kitchens']}台、{result['duration']:.1f}秒"
+            f"（操作間隔 ×{result['think_scale']}、注文 {result['orders_placed']:,}件）"
+        )
+        self.stdout.write(
+            f"{ljust('エンドポイント', 28)}{'件数':>6}{'req/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'エラー':>4}"
+        )
+        rows = [(label, result['endpoints'][label]) for label in ENDPOINTS]
+        for label, summary in rows + [('合計', result['total'])]:
+            self.stdout.write(
+                f"{ljust(label, 28)}{summary['requests']:>8,}{summary['rps']:>9.1f}"
+                f"{summary['p50_ms']:>8.1f}ms{summary['p95_ms']:>8.1f}ms{summary['p99_ms']:>8.1f}ms"
+                f"{summary['errors']:>7,}"
+            )
+        for label, summary in rows:
+            if summary['error_details']:
+                details = '、'.join(f'{name}: {count}件' for name, count in summary['error_details'].items())
+                self.stderr.write(f'{label} のエラー: {details}')
\ No newline at end of file
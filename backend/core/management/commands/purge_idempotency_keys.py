@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from api.services.idempotency_service import IdempotencyService
+
+
+class Command(BaseCommand):
+    """有効期限切れの冪等キーを削除するコマンド"""
+
+    help = 'IDEMPOTENCY_KEY_TTL を過ぎた冪等キー（Idempotency-Key）を削除します（定期実行用）'
+
+    def handle(self, *args, **options):
+        deleted = IdempotencyService().purge_expired()
+        self.stdout.write(self.style.SUCCESS(f'冪等キーを{deleted}件削除しました'))
\ No newline at end of file
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from api.services.order_event_service import OrderEventService
+
+
+class Command(BaseCommand):
+    """保持期間を過ぎた注文イベントを削除するコマンド"""
+
+    help = 'ORDER_EVENT_RETENTION_SECONDS を過ぎた注文イベントを削除します（定期実行用）'
+
+    def handle(self, *args, **options):
+        deleted = OrderEventService().purge()
+        self.stdout.write(self.style.SUCCESS(f'注文イベントを{deleted}件削除しました'))
\ No newline at end of file
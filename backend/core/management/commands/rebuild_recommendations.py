@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.services.recommendation_service import RecommendationService
+
+
+class Command(BaseCommand):
+    """おすすめ商品のスナップショットを作り直すコマンド"""
+
+    help = (
+        '注文履歴（アーカイブ済みの注文を含む）から、同じ注文に含まれた商品の組の件数を集計し直します'
+        '（一定件数ずつ読み込むため、履歴が長くてもメモリ使用量は増えません。毎晩の実行を想定しています）'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.RECOMMENDATION_CHUNK_SIZE,
+            help='1回に読み込む注文数',
+        )
+
+    def handle(self, *args, **options):
+        def report(processed):
+            self.stdout.write(f'{processed}件の注文を集計しました')
+
+        result = RecommendationService().rebuild(chunk_size=options['chunk_size'], progress=report)
+        self.stdout.write(self.style.SUCCESS(
+            f"おすすめ商品のスナップショットを作成しました（注文 {result['orders']}件、商品の組 {result['pairs']}件）"
+        ))
\ No newline at end of file
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.services.sales_rollup_service import SalesRollupService
+
+
+class Command(BaseCommand):
+    """売上集計を作り直すコマンド"""
+
+    help = (
+        '完了した注文（アーカイブ済みを含む）から時間帯・テーブル別と時間帯・商品別の売上集計を作り直します'
+        '（初回の導入時や集計の修正時に、営業時間外に実行してください）'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.SALES_ROLLUP_CHUNK_SIZE,
+            help='1回に読み込む注文数',
+        )
+
+    def handle(self, *args, **options):
+        def report(processed, total):
+            percent = processed * 100 // total if total else 100
+            self.stdout.write(f'{processed}/{total}件を集計しました（{percent}%）')
+
+        result = SalesRollupService().rebuild(chunk_size=options['chunk_size'], progress=report)
+        self.stdout.write(self.style.SUCCESS(
+            f"売上集計を作り直しました（注文 {result['orders']}件、"
+            f"時間帯・テーブル別 {result['hourly_rows']}行、時間帯・商品別 {result['product_rows']}行）"
+        ))
\ No newline at end of file
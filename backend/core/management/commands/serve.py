@@ -0,0 +1,109 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config import server
+
+
+class Command(BaseCommand):
+    """本番用のアプリケーションサーバー（gunicorn）を起動するコマンド"""
+
+    help = (
+        '本番用のアプリケーションサーバー（gunicorn）を起動します。'
+        '注文イベントのストリーミング配信を行う場合は --worker-class uvicorn を指定してください'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--bind',
+            default=settings.SERVER_BIND,
+            help='待ち受けるアドレス（host:port）',
+        )
+        parser.add_argument(
+            '--worker-class',
+            choices=sorted(server.WORKER_CLASSES),
+            default=settings.SERVER_WORKER_CLASS,
+            help='ワーカーの種類（gthread: WSGI・スレッド、uvicorn: ASGI・非同期）',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.SERVER_WORKERS,
+            help='ワーカー数（0の場合はCPUコア数から決定）',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=settings.SERVER_THREADS,
+            help='ワーカーあたりのスレッド数（gthreadのみ）',
+        )
+        parser.add_argument(
+            '--no-preload',
+            action='store_true',
+            help='fork前にアプリケーションを読み込まずにワーカーごとに読み込みます',
+        )
+        parser.add_argument(
+            '--max-requests',
+            type=int,
+            default=settings.SERVER_MAX_REQUESTS,
+            help='ワーカーを入れ替えるまでのリクエスト数（0の場合は入れ替えない）',
+        )
+        parser.add_argument(
+            '--max-requests-jitter',
+            type=int,
+            default=settings.SERVER_MAX_REQUESTS_JITTER,
+            help='ワーカーの入れ替えが同時に起きないようにするためのばらつき',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=int,
+            default=settings.SERVER_TIMEOUT,
+            help='応答しないワーカーを再起動するまでの秒数',
+        )
+        parser.add_argument(
+            '--graceful-timeout',
+            type=int,
+            default=settings.SERVER_GRACEFUL_TIMEOUT,
+            help='ワーカーの入れ替え時に処理中のリクエストの完了を待つ秒数',
+        )
+        parser.add_argument(
+            '--keepalive',
+            type=int,
+            default=settings.SERVER_KEEPALIVE,
+            help='Keep-Alive接続を保持する秒数',
+        )
+        parser.add_argument(
+            '--access-log',
+            action='store_true',
+            help='アクセスログを標準出力に出力します',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import gunicorn  # noqa: F401
+        except ImportError:
+            raise CommandError('gunicornがインストールされていません（pip install gunicorn）')
+        if options['worker_class'] == 'uvicorn':
+            try:
+                import uvicorn  # noqa: F401
+            except ImportError:
+                raise CommandError('uvicornがインストールされていません（pip install uvicorn）')
+
+        server_options = server.build_options(
+            bind=options['bind'],
+            worker_class=options['worker_class'],
+            workers=options['workers'],
+            threads=options['threads'],
+            preload=not options['no_preload'],
+            max_requests=options['max_requests'],
+            max_requests_jitter=options['max_requests_jitter'],
+            timeout=options['timeout'],
+            graceful_timeout=options['graceful_timeout'],
+            keepalive=options['keepalive'],
+            access_log=options['access_log'],
+        )
+        app_uri = server.ASGI_APPLICATION if options['worker_class'] == 'uvicorn' else server.WSGI_APPLICATION
+        self.stdout.write(
+            f"{app_uri} を起動します（{server_options['worker_class']} × {server_options['workers']}ワーカー, "
+            f"{server_options['bind']}）"
+        )
+        server.run(app_uri, server_options)
\ No newline at end of file
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:07
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(max_length=255, unique=True, verbose_name="冪等キー"),
+                ),
+                (
+                    "request_hash",
+                    models.CharField(max_length=64, verbose_name="リクエストハッシュ"),
+                ),
+                ("status_code", models.IntegerField(verbose_name="ステータスコード")),
+                (
+                    "response_body",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="レスポンス",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="作成日時"),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(db_index=True, verbose_name="有効期限"),
+                ),
+            ],
+            options={
+                "verbose_name": "冪等キー",
+                "verbose_name_plural": "冪等キー",
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+def create_menu_version(apps, schema_editor):
+    MenuVersion = apps.get_model("core", "MenuVersion")
+    MenuVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0002_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MenuVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.BigIntegerField(default=0, verbose_name="バージョン")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="更新日時"),
+                ),
+            ],
+            options={
+                "verbose_name": "メニューバージョン",
+                "verbose_name_plural": "メニューバージョン",
+            },
+        ),
+        migrations.RunPython(create_menu_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0003_menuversion"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["created_at", "id"], name="order_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["table_number", "created_at", "id"],
+                name="order_table_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["status", "created_at", "id"], name="order_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0004_order_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["is_active", "order", "id"], name="category_active_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["is_available", "category", "order", "id"],
+                name="product_avail_category_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:21
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0005_menu_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("order_id", models.IntegerField(db_index=True, verbose_name="注文ID")),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("order.created", "注文作成"),
+                            ("order.status_changed", "ステータス変更"),
+                        ],
+                        max_length=32,
+                        verbose_name="イベント種別",
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="内容",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="作成日時"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "注文イベント",
+                "verbose_name_plural": "注文イベント",
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0006_orderevent"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["updated_at", "id"], name="order_updated_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0007_order_updated_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedOrder",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        primary_key=True, serialize=False, verbose_name="注文ID"
+                    ),
+                ),
+                ("table_number", models.IntegerField(verbose_name="テーブル番号")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "保留中"),
+                            ("processing", "処理中"),
+                            ("completed", "完了"),
+                            ("cancelled", "キャンセル"),
+                        ],
+                        max_length=20,
+                        verbose_name="ステータス",
+                    ),
+                ),
+                (
+                    "total_price",
+                    models.DecimalField(
+                        decimal_places=0, max_digits=10, verbose_name="合計金額"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(verbose_name="作成日時")),
+                ("updated_at", models.DateTimeField(verbose_name="更新日時")),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="アーカイブ日時"),
+                ),
+            ],
+            options={
+                "verbose_name": "アーカイブ済み注文",
+                "verbose_name_plural": "アーカイブ済み注文",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedOrderItem",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        primary_key=True, serialize=False, verbose_name="注文明細ID"
+                    ),
+                ),
+                ("quantity", models.IntegerField(verbose_name="数量")),
+                (
+                    "price",
+                    models.DecimalField(
+                        decimal_places=0, max_digits=10, verbose_name="価格"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(verbose_name="作成日時")),
+                (
+                    "order",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="items",
+                        to="core.archivedorder",
+                        verbose_name="注文",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_order_items",
+                        to="core.product",
+                        verbose_name="商品",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "アーカイブ済み注文明細",
+                "verbose_name_plural": "アーカイブ済み注文明細",
+            },
+        ),
+    ]
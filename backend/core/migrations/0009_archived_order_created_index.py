@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0008_archivedorder"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archivedorder",
+            index=models.Index(
+                fields=["created_at", "id"], name="archived_order_created_id_idx"
+            ),
+        ),
+    ]
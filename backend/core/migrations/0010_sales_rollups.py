@@ -0,0 +1,90 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0009_archived_order_created_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HourlySales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sales_date", models.DateField(verbose_name="売上日")),
+                ("hour", models.PositiveSmallIntegerField(verbose_name="時")),
+                ("table_number", models.IntegerField(verbose_name="テーブル番号")),
+                ("order_count", models.IntegerField(default=0, verbose_name="注文数")),
+                ("quantity", models.IntegerField(default=0, verbose_name="数量")),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=0, default=0, max_digits=12, verbose_name="売上"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "時間帯別売上",
+                "verbose_name_plural": "時間帯別売上",
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductSales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sales_date", models.DateField(verbose_name="売上日")),
+                ("hour", models.PositiveSmallIntegerField(verbose_name="時")),
+                ("quantity", models.IntegerField(default=0, verbose_name="数量")),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=0, default=0, max_digits=12, verbose_name="売上"
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sales",
+                        to="core.product",
+                        verbose_name="商品",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "商品別売上",
+                "verbose_name_plural": "商品別売上",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="hourlysales",
+            constraint=models.UniqueConstraint(
+                fields=("sales_date", "hour", "table_number"), name="hourly_sales_key"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productsales",
+            constraint=models.UniqueConstraint(
+                fields=("sales_date", "hour", "product"), name="product_sales_key"
+            ),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_sales_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecommendationSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("last_order_id", models.BigIntegerField(verbose_name="集計済みの最後の注文ID")),
+                ("order_count", models.IntegerField(verbose_name="集計した注文数")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="作成日時"),
+                ),
+            ],
+            options={
+                "verbose_name": "おすすめ商品のスナップショット",
+                "verbose_name_plural": "おすすめ商品のスナップショット",
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductPair",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("order_count", models.IntegerField(verbose_name="注文数")),
+                (
+                    "other_product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core.product",
+                        verbose_name="同時に注文された商品",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core.product",
+                        verbose_name="商品",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "同時に注文された商品",
+                "verbose_name_plural": "同時に注文された商品",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="productpair",
+            constraint=models.UniqueConstraint(
+                fields=("product", "other_product"), name="product_pair_key"
+            ),
+        ),
+    ]
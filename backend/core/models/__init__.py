@@ -2,5 +2,15 @@ from .category import Category
 from .product import Product
 from .order import Order
 from .order_item import OrderItem
+from .idempotency_key import IdempotencyKey
+from .menu_version import MenuVersion
+from .order_event import OrderEvent
+from .archived_order import ArchivedOrder, ArchivedOrderItem
+from .sales_rollup import HourlySales, ProductSales
+from .product_pair import ProductPair, RecommendationSnapshot
 
-__all__ = ['Category', 'Product', 'Order', 'OrderItem']
\ No newline at end of file
+__all__ = [
+    'Category', 'Product', 'Order', 'OrderItem', 'IdempotencyKey', 'MenuVersion', 'OrderEvent',
+    'ArchivedOrder', 'ArchivedOrderItem', 'HourlySales', 'ProductSales', 'ProductPair',
+    'RecommendationSnapshot',
+]
\ No newline at end of file
@@ -0,0 +1,58 @@
+from django.db import models
+from .order import Order
+from .product import Product
+
+
+class ArchivedOrder(models.Model):
+    """
+    アーカイブ済み注文モデル
+    
+    一定期間を過ぎた完了・キャンセル済みの注文を注文テーブルから移動して保存する。
+    IDは移動前の注文IDをそのまま使用する（archive_orders コマンドで作成）。
+    """
+    id = models.BigIntegerField('注文ID', primary_key=True)
+    table_number = models.IntegerField('テーブル番号')
+    status = models.CharField('ステータス', max_length=20, choices=Order.STATUS_CHOICES)
+    total_price = models.DecimalField('合計金額', max_digits=10, decimal_places=0)
+    created_at = models.DateTimeField('作成日時')
+    updated_at = models.DateTimeField('更新日時')
+    archived_at = models.DateTimeField('アーカイブ日時', auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'アーカイブ済み注文'
+        verbose_name_plural = 'アーカイブ済み注文'
+        ordering = ['-created_at']
+        indexes = [
+            # 注文履歴のエクスポート（created_at, id の昇順）用
+            models.Index(fields=['created_at', 'id'], name='archived_order_created_id_idx'),
+        ]
+
+    def __str__(self):
+        return f'アーカイブ済み注文 #{self.id} (テーブル {self.table_number})'
+
+
+class ArchivedOrderItem(models.Model):
+    """アーカイブ済み注文明細モデル"""
+    id = models.BigIntegerField('注文明細ID', primary_key=True)
+    order = models.ForeignKey(
+        ArchivedOrder,
+        on_delete=models.CASCADE,
+        related_name='items',
+        verbose_name='注文'
+    )
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='archived_order_items',
+        verbose_name='商品'
+    )
+    quantity = models.IntegerField('数量')
+    price = models.DecimalField('価格', max_digits=10, decimal_places=0)
+    created_at = models.DateTimeField('作成日時')
+
+    class Meta:
+        verbose_name = 'アーカイブ済み注文明細'
+        verbose_name_plural = 'アーカイブ済み注文明細'
+
+    def __str__(self):
+        return f'{self.product.name} x {self.quantity}'
\ No newline at end of file
@@ -15,6 +15,10 @@ class Category(models.Model):
         verbose_name = 'カテゴリ'
         verbose_name_plural = 'カテゴリ'
         ordering = ['order', 'id']
+        indexes = [
+            # 有効なカテゴリ一覧（get_active_categories）用
+            models.Index(fields=['is_active', 'order', 'id'], name='category_active_order_idx'),
+        ]
 
     def __str__(self):
         return self.name
\ No newline at end of file
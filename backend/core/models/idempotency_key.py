@@ -0,0 +1,19 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """冪等キーモデル（再送されたリクエストに保存済みのレスポンスを返すためのストア）"""
+    key = models.CharField('冪等キー', max_length=255, unique=True)
+    request_hash = models.CharField('リクエストハッシュ', max_length=64)
+    status_code = models.IntegerField('ステータスコード')
+    response_body = models.JSONField('レスポンス', encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField('作成日時', auto_now_add=True)
+    expires_at = models.DateTimeField('有効期限', db_index=True)
+
+    class Meta:
+        verbose_name = '冪等キー'
+        verbose_name_plural = '冪等キー'
+
+    def __str__(self):
+        return self.key
\ No newline at end of file
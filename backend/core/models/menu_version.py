@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class MenuVersion(models.Model):
+    """メニューバージョンモデル（カテゴリ・商品が更新されるたびに加算されるカウンタ）"""
+    version = models.BigIntegerField('バージョン', default=0)
+    updated_at = models.DateTimeField('更新日時', auto_now=True)
+
+    class Meta:
+        verbose_name = 'メニューバージョン'
+        verbose_name_plural = 'メニューバージョン'
+
+    def __str__(self):
+        return f'メニューバージョン {self.version}'
\ No newline at end of file
@@ -20,6 +20,14 @@ class Order(models.Model):
         verbose_name = '注文'
         verbose_name_plural = '注文'
         ordering = ['-created_at']
+        indexes = [
+            # 注文一覧のキーセットページネーション（created_at, id の降順）用
+            models.Index(fields=['created_at', 'id'], name='order_created_id_idx'),
+            models.Index(fields=['table_number', 'created_at', 'id'], name='order_table_created_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='order_status_created_idx'),
+            # 差分同期（updated_at, id の昇順）用
+            models.Index(fields=['updated_at', 'id'], name='order_updated_id_idx'),
+        ]
 
     def __str__(self):
         return f'注文 #{self.id} (テーブル {self.table_number})'
\ No newline at end of file
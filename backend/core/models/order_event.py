@@ -0,0 +1,25 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class OrderEvent(models.Model):
+    """注文イベントモデル（注文の作成・ステータス変更をキッチン画面へ配信するための送信記録）"""
+    EVENT_CREATED = 'order.created'
+    EVENT_STATUS_CHANGED = 'order.status_changed'
+    EVENT_TYPE_CHOICES = (
+        (EVENT_CREATED, '注文作成'),
+        (EVENT_STATUS_CHANGED, 'ステータス変更'),
+    )
+    
+    # 注文のアーカイブ・削除後もイベントを残すため外部キーにしない
+    order_id = models.IntegerField('注文ID', db_index=True)
+    event_type = models.CharField('イベント種別', max_length=32, choices=EVENT_TYPE_CHOICES)
+    payload = models.JSONField('内容', encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField('作成日時', auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = '注文イベント'
+        verbose_name_plural = '注文イベント'
+
+    def __str__(self):
+        return f'{self.event_type} (注文ID: {self.order_id})'
\ No newline at end of file
@@ -23,6 +23,11 @@ class Product(models.Model):
         verbose_name = '商品'
         verbose_name_plural = '商品'
         ordering = ['category__order', 'order', 'id']
+        indexes = [
+            # 販売可能な商品一覧（get_available_products / get_menu_products）と
+            # カテゴリ別の商品一覧（get_products_by_category）用
+            models.Index(fields=['is_available', 'category', 'order', 'id'], name='product_avail_category_idx'),
+        ]
 
     def __str__(self):
         return self.name
\ No newline at end of file
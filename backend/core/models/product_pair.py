@@ -0,0 +1,53 @@
+from django.db import models
+from .product import Product
+
+
+class ProductPair(models.Model):
+    """
+    同じ注文に含まれた商品の組の件数モデル（おすすめ商品のスナップショット）
+    
+    rebuild_recommendations コマンドで注文履歴から作成する。
+    商品IDの小さい方を product、大きい方を other_product として1組につき1行を保存する。
+    """
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='商品'
+    )
+    other_product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='同時に注文された商品'
+    )
+    order_count = models.IntegerField('注文数')
+
+    class Meta:
+        verbose_name = '同時に注文された商品'
+        verbose_name_plural = '同時に注文された商品'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'other_product'], name='product_pair_key'),
+        ]
+
+    def __str__(self):
+        return f'{self.product_id} - {self.other_product_id} ({self.order_count})'
+
+
+class RecommendationSnapshot(models.Model):
+    """
+    おすすめ商品のスナップショットの作成記録モデル
+    
+    各プロセスは最新の記録のIDが変わった場合にスナップショットを読み込み直し、
+    last_order_id より後の注文を追加で集計する。
+    """
+    last_order_id = models.BigIntegerField('集計済みの最後の注文ID')
+    order_count = models.IntegerField('集計した注文数')
+    created_at = models.DateTimeField('作成日時', auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'おすすめ商品のスナップショット'
+        verbose_name_plural = 'おすすめ商品のスナップショット'
+
+    def __str__(self):
+        return f'スナップショット #{self.id} (注文ID {self.last_order_id} まで)'
\ No newline at end of file
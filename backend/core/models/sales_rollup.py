@@ -0,0 +1,59 @@
+from django.db import models
+from .product import Product
+
+
+class HourlySales(models.Model):
+    """
+    時間帯・テーブル別の売上集計モデル
+    
+    完了した注文を作成日時（TIME_ZONEの日付・時）とテーブル番号ごとに集計する。
+    注文のステータスが完了に変わった時点で加算し、完了から変わった時点で減算する（SalesRollupService）。
+    """
+    sales_date = models.DateField('売上日')
+    hour = models.PositiveSmallIntegerField('時')
+    table_number = models.IntegerField('テーブル番号')
+    order_count = models.IntegerField('注文数', default=0)
+    quantity = models.IntegerField('数量', default=0)
+    revenue = models.DecimalField('売上', max_digits=12, decimal_places=0, default=0)
+
+    class Meta:
+        verbose_name = '時間帯別売上'
+        verbose_name_plural = '時間帯別売上'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sales_date', 'hour', 'table_number'], name='hourly_sales_key'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.sales_date} {self.hour}時 テーブル {self.table_number}'
+
+
+class ProductSales(models.Model):
+    """
+    時間帯・商品別の売上集計モデル
+    
+    完了した注文の注文明細を作成日時（TIME_ZONEの日付・時）と商品ごとに集計する。
+    """
+    sales_date = models.DateField('売上日')
+    hour = models.PositiveSmallIntegerField('時')
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='sales',
+        verbose_name='商品'
+    )
+    quantity = models.IntegerField('数量', default=0)
+    revenue = models.DecimalField('売上', max_digits=12, decimal_places=0, default=0)
+
+    class Meta:
+        verbose_name = '商品別売上'
+        verbose_name_plural = '商品別売上'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sales_date', 'hour', 'product'], name='product_sales_key'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.sales_date} {self.hour}時 {self.product_id}'
\ No newline at end of file
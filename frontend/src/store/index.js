@@ -3,6 +3,7 @@ import axios from 'axios'
 
 export default createStore({
   state: {
+    menu: null,
     categories: [],
     products: [],
     cart: [],
@@ -21,6 +22,9 @@ export default createStore({
     }
   },
   mutations: {
+    setMenu(state, menu) {
+      state.menu = menu
+    },
     setCategories(state, categories) {
       state.categories = categories
     },
@@ -61,22 +65,30 @@ export default createStore({
     }
   },
   actions: {
-    async fetchCategories({ commit }) {
+    async fetchMenu({ commit, state }) {
+      // メニューはセッション中に1回だけ取得し、以降はストアの内容を使う
+      if (state.menu) {
+        return state.menu
+      }
+      const response = await axios.get('/api/menu/')
+      commit('setMenu', response.data)
+      return response.data
+    },
+    async fetchCategories({ commit, dispatch }) {
       try {
-        const response = await axios.get('/api/categories/')
-        commit('setCategories', response.data)
+        const menu = await dispatch('fetchMenu')
+        commit('setCategories', menu)
       } catch (error) {
         console.error('カテゴリの取得に失敗しました', error)
       }
     },
-    async fetchProducts({ commit }, categoryId = null) {
+    async fetchProducts({ commit, dispatch }, categoryId = null) {
       try {
-        let url = '/api/products/'
-        if (categoryId) {
-          url += `?category_id=${categoryId}`
-        }
-        const response = await axios.get(url)
-        commit('setProducts', response.data)
+        const menu = await dispatch('fetchMenu')
+        const categories = categoryId
+          ? menu.filter(category => category.id === categoryId)
+          : menu
+        commit('setProducts', categories.flatMap(category => category.products))
       } catch (error) {
         console.error('商品の取得に失敗しました', error)
       }